@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Benchmark the update of the constraints of a container when the
+visibility of one of its children is toggled.
+
+A container with 500 push buttons of the null toolkit laid out by the
+default vertical box is created, and the visibility of the middle 
+button is toggled. After each toggle the layout manager is updated 
+either by rebuilding its solver from scratch, as was done before the
+constraints were diffed, or by the incremental update_constraints. 
+Rebuilding the solver for 500 children takes tens of seconds per 
+toggle, so each strategy is run once for a pair of toggles.
+
+Usage: python -m benchmarks.bench_constraints [children]
+"""
+import argparse
+import gc
+import time
+
+from enaml.widgets.null.utils import get_app_null
+
+from .util import build, make
+
+
+def buttons(toolkit, count):
+    """ A container of 'count' push buttons laid out by the default 
+    vertical box.
+
+    """
+    root = make(toolkit, 'Container')
+    children = [make(toolkit, 'PushButton', text=u'Button %d' % i)
+                for i in xrange(count)]
+    root.children.extend(children)
+    return root, children[count // 2]
+
+
+def rebuild(layout):
+    layout._initialized = False
+    layout.initialize()
+
+
+def update(layout):
+    layout.update_constraints()
+
+
+def run(count, func, toggles=2):
+    app = get_app_null()
+    root, target = build(buttons, count)
+    layout = root.layout
+    layout.initialize()
+    gc.collect()
+    t0 = time.time()
+    for i in xrange(toggles):
+        target.visible = not target.visible
+        func(layout)
+    elapsed = (time.time() - t0) / toggles
+    # Run the relayouts which the toggles scheduled, outside the timing.
+    app.flush()
+    return elapsed, root.abstract_obj.min_size()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the update of the constraints of a container.')
+    parser.add_argument('children', nargs='?', type=int, default=500,
+        help='the number of children of the container')
+    args = parser.parse_args()
+
+    count = args.children
+    sizes = set()
+    for name, func in (('rebuild solver', rebuild),
+                       ('diff constraints', update)):
+        elapsed, min_size = run(count, func)
+        sizes.add(min_size)
+        print '%s: %.2fms per toggle of %d children' % (
+            name, elapsed * 1e3, count)
+    assert len(sizes) == 1
+
+
+if __name__ == '__main__':
+    main()
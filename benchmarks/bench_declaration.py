@@ -0,0 +1,91 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Benchmark the instantiation of a compiled enaml declaration.
+
+The components in the toolkit are replaced with lightweight stand-ins
+so that the timings reflect the cost of the code generated by the enaml
+compiler (name resolution, operator calls and child assembly) rather 
+than the cost of creating the widgets.
+
+Usage: python -m benchmarks.bench_declaration [file.enaml] [count]
+"""
+import argparse
+import os
+import time
+
+from enaml.import_hooks import compile_enaml
+from enaml.operators import OPERATORS
+from enaml.toolkit import Toolkit
+from enaml.widgets.layout.layout_helpers import LAYOUT_HELPERS
+
+
+DEFAULT_FILE = os.path.join(
+    os.path.dirname(__file__), os.pardir, 'examples', 'constrained',
+    'find_replace.enaml',
+)
+
+
+class StubComponent(object):
+    """ A minimal object which supports what the generated code needs
+    from a component.
+
+    """
+    parent = None
+
+    def __init__(self):
+        self.setup_hooks = []
+        self.children = []
+
+    def add_child(self, child):
+        self.children.append(child)
+        child.parent = self
+
+
+def stub_constructor(identifiers=None, toolkit=None):
+    return StubComponent()
+
+
+def make_toolkit():
+    toolkit = Toolkit(OPERATORS)
+    toolkit.update(LAYOUT_HELPERS)
+    for name in ('Window', 'MainWindow', 'Container', 'PushButton', 'Field',
+                 'Label', 'CheckBox', 'Form', 'Html', 'GroupBox'):
+        toolkit[name] = stub_constructor
+    return toolkit
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the instantiation of enaml declarations.')
+    parser.add_argument('enaml_file', nargs='?', default=DEFAULT_FILE,
+        help='the .enaml file whose declarations are instantiated')
+    parser.add_argument('count', nargs='?', type=int, default=1000,
+        help='the number of instantiations of each declaration')
+    args = parser.parse_args()
+
+    enaml_file = args.enaml_file
+    count = args.count
+    ns = {}
+    exec compile_enaml(enaml_file) in ns
+    declarations = [
+        value for key, value in ns.iteritems()
+        if not key.startswith('__') and callable(value)
+    ]
+    with make_toolkit():
+        for factory in declarations:
+            best = None
+            for _ in range(3):
+                t0 = time.time()
+                for _ in xrange(count):
+                    factory()
+                elapsed = time.time() - t0
+                if best is None or elapsed < best:
+                    best = elapsed
+            print '%s: %d instantiations in %.3fs (%.1fus each)' % (
+                factory.__name__, count, best, best / count * 1e6)
+
+
+if __name__ == '__main__':
+    main()
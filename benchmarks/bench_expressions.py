@@ -0,0 +1,137 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Benchmark the re-evaluation of '<<' bindings under a high frequency
+stream of model updates.
+
+The bindings are those of the stocks example (examples/stocks), plus a
+quote label which reads its values through the attribute space of the
+component tree. A stream of quotes is pushed into the model and each
+change re-evaluates the dependent bindings synchronously. The bindings
+are evaluated both as compiled functions, and with eval against the
+locals mapping for comparison.
+
+Usage: python -m benchmarks.bench_expressions [count]
+"""
+import argparse
+import ast
+import datetime
+import time
+
+from traits.api import Any, HasTraits, Date, Float, Int, List, Str
+
+from enaml.expressions import UpdatingExpression
+from enaml.parsing.analyzer import Dependencies, analyze_dependencies
+from enaml.toolkit import Toolkit
+from enaml.widgets.base_component import BaseComponent
+
+
+#: The (attribute, expression) pairs bound on the window and its child.
+WINDOW_BINDINGS = [
+    ('title', '("Enaml Stock Viewer - %s - %s - %s" % '
+              '(model.symbol, model.start_date, model.end_date))'),
+]
+
+LABEL_BINDINGS = [
+    ('items', 'model.available_symbols'),
+    ('text', "'%s: %.2f (%d points)' % (symbol, price, num_points)"),
+    ('value', 'price if price > threshold else threshold'),
+]
+
+
+class HistoricData(HasTraits):
+
+    available_symbols = List(Str)
+
+    symbol = Str
+
+    start_date = Date
+
+    end_date = Date
+
+    num_points = Int(500)
+
+
+class MappingExpression(UpdatingExpression):
+    """ An updating expression which is always evaluated with eval
+    against the locals mapping.
+
+    """
+    __slots__ = ()
+
+    def eval_expression(self):
+        return eval(self.code, self.get_globals(), self.get_locals())
+
+
+def bind(component, attr, source, f_globals, toolkit, expr_class):
+    expr_ast = ast.parse(source, mode='eval')
+    code = compile(expr_ast, 'Enaml', mode='eval')
+    deps = Dependencies(*analyze_dependencies(expr_ast))
+    component.add_trait(attr, Any())
+    expr = expr_class(component, attr, deps, code, f_globals, toolkit, {})
+    setattr(component, attr, expr.eval_expression())
+    expr.bind()
+    return expr
+
+
+def build(expr_class):
+    """ Builds the tree of components and binds the expressions. Returns
+    the model, the window, the label and the expressions.
+
+    """
+    model = HistoricData(
+        available_symbols=['AAPL', 'GOOG', 'MSFT'], symbol='AAPL',
+        start_date=datetime.date(2011, 1, 1),
+        end_date=datetime.date(2011, 6, 1),
+    )
+    toolkit = Toolkit()
+    f_globals = {'model': model}
+    window = BaseComponent()
+    window.add_trait('price', Float(0.0))
+    window.add_trait('threshold', Float(10.0))
+    window.add_trait('symbol', Str('AAPL'))
+    window.add_trait('num_points', Int(500))
+    label = BaseComponent()
+    label.parent = window
+    exprs = []
+    for attr, source in WINDOW_BINDINGS:
+        exprs.append(bind(window, attr, source, f_globals, toolkit,
+                          expr_class))
+    for attr, source in LABEL_BINDINGS:
+        exprs.append(bind(label, attr, source, f_globals, toolkit,
+                          expr_class))
+    return model, window, label, exprs
+
+
+def run(expr_class, count):
+    model, window, label, exprs = build(expr_class)
+    symbols = model.available_symbols
+    t0 = time.time()
+    for i in xrange(count):
+        window.price = 10.0 + (i % 100) * 0.01
+        if i % 50 == 0:
+            symbol = symbols[(i // 50) % len(symbols)]
+            window.symbol = symbol
+            model.symbol = symbol
+    elapsed = time.time() - t0
+    return elapsed, label.text
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the re-evaluation of the bindings.')
+    parser.add_argument('count', nargs='?', type=int, default=20000,
+        help='the number of quotes pushed into the model')
+    args = parser.parse_args()
+
+    count = args.count
+    for name, expr_class in (('eval with mapping', MappingExpression),
+                             ('function', UpdatingExpression)):
+        best = min(run(expr_class, count)[0] for _ in range(3))
+        print '%s: %d quotes in %.3fs (%.1fus per quote)' % (
+            name, count, best, best / count * 1e6)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,354 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Benchmark the constraints layout of generated component trees.
+
+The trees are built from the widgets of the headless null toolkit, so
+the size hints are deterministic and no gui library is needed. For
+each scenario the following phases of the ConstraintsLayout of the
+root container are timed:
+
+    initialize
+        A fresh initialize of the layout manager, which builds the
+        solver and computes the minimum size.
+
+    calc_min_size
+        A solve for the minimum size of the unchanged system.
+
+    resize
+        A sweep of resizes of the root from its minimum size to twice
+        its minimum size, each of which runs a layout().
+
+    toggle
+        Toggling the visibility of a child in the middle of the tree,
+        with the event loop flushed after each toggle so that the
+        layout scheduler updates the constraints and lays out again.
+
+The time spent in the casuarius solver is reported separately from the
+total time of each phase, along with the number of constraints in the
+solver. The cost of the solver grows quickly with the size of the tree,
+so the default sizes are modest; use --scale to grow them. The results
+are printed and, if an output file is given, saved as JSON so that they
+can be compared across commits.
+
+Usage: python -m benchmarks.bench_layout [-o results.json] [--scale N]
+           [--steps N] [--toggles N] [scenario ...]
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import time
+
+from enaml.widgets.layout.constraints_layout import ConstraintsLayout
+from enaml.widgets.layout.layout_helpers import align, hbox, vbox
+from enaml.widgets.null.utils import get_app_null
+
+from .util import build, make
+
+
+class TimedSolver(object):
+    """ A proxy for a casuarius solver which accumulates the time spent
+    in its methods.
+
+    """
+    def __init__(self, solver):
+        self.__dict__['_solver'] = solver
+        self.__dict__['elapsed'] = 0.0
+
+    def _timed(self, func, *args, **kwds):
+        t0 = time.time()
+        try:
+            return func(*args, **kwds)
+        finally:
+            self.__dict__['elapsed'] += time.time() - t0
+
+    def add_constraint(self, cn):
+        return self._timed(self._solver.add_constraint, cn)
+
+    def remove_constraint(self, cn):
+        return self._timed(self._solver.remove_constraint, cn)
+
+    def suggest_values(self, *args, **kwds):
+        return TimedContext(self, self._solver.suggest_values(*args, **kwds))
+
+    def __getattr__(self, name):
+        return getattr(self._solver, name)
+
+    def __setattr__(self, name, value):
+        # Turning on autosolve solves the pending edits.
+        self._timed(setattr, self._solver, name, value)
+
+
+class TimedContext(object):
+    """ A proxy for the context manager of TimedSolver.suggest_values
+    which times the solves on entry and exit, but not the body.
+
+    """
+    def __init__(self, solver, context):
+        self.solver = solver
+        self.context = context
+
+    def __enter__(self):
+        return self.solver._timed(self.context.__enter__)
+
+    def __exit__(self, *exc_info):
+        return self.solver._timed(self.context.__exit__, *exc_info)
+
+
+class TimedLayout(ConstraintsLayout):
+    """ A ConstraintsLayout which times the calls into its solver.
+
+    """
+    def __setattr__(self, name, value):
+        if name == 'solver' and value is not None:
+            value = TimedSolver(value)
+        super(TimedLayout, self).__setattr__(name, value)
+
+    def solver_time(self):
+        """ Returns the time spent in the solver since the last call to
+        reset_solver_time.
+
+        """
+        return self.solver.elapsed if self.solver is not None else 0.0
+
+    def reset_solver_time(self):
+        if self.solver is not None:
+            self.solver.__dict__['elapsed'] = 0.0
+
+
+#------------------------------------------------------------------------------
+# Scenarios
+#------------------------------------------------------------------------------
+# Each builder creates an unset tree of the given size, and returns the
+# root container and the child whose visibility is toggled.
+def nested_containers(toolkit, depth):
+    """ Containers nested 'depth' deep, each holding a label and the
+    next container, with a button in the innermost one. The layouts
+    of the nested containers are merged into that of the root.
+
+    """
+    root = parent = make(toolkit, 'Container')
+    target = None
+    for i in xrange(depth):
+        label = make(toolkit, 'Label', text=u'Level %d' % i)
+        child = make(toolkit, 'Container')
+        parent.children.extend([label, child])
+        if i == depth // 2:
+            target = label
+        parent = child
+    parent.children.append(make(toolkit, 'PushButton', text=u'Leaf'))
+    return root, target
+
+
+def form(toolkit, rows):
+    """ A Form of 'rows' label and field pairs.
+
+    """
+    root = make(toolkit, 'Form')
+    target = None
+    for i in xrange(rows):
+        label = make(toolkit, 'Label', text=u'Row %d' % i)
+        field = make(toolkit, 'Field')
+        root.children.extend([label, field])
+        if i == rows // 2:
+            target = field
+    return root, target
+
+
+def grid(toolkit, size):
+    """ A 'size' by 'size' grid of buttons, laid out as a vbox of hbox
+    rows with the columns aligned on their left edges.
+
+    """
+    root = make(toolkit, 'Container')
+    rows = []
+    for i in xrange(size):
+        row = [make(toolkit, 'PushButton', text=u'%d, %d' % (i, j))
+               for j in xrange(size)]
+        root.children.extend(row)
+        rows.append(row)
+    cns = [vbox(*[hbox(*row) for row in rows])]
+    for column in zip(*rows):
+        cns.append(align('left', *column))
+    root.constraints = cns
+    return root, rows[size // 2][size // 2]
+
+
+def nested_boxes(toolkit, depth):
+    """ A single container laid out by LinearBoxHelpers nested 'depth'
+    deep, alternating between hbox and vbox, with a button at each
+    level.
+
+    """
+    root = make(toolkit, 'Container')
+    buttons = [make(toolkit, 'PushButton', text=u'Button %d' % i)
+               for i in xrange(depth + 1)]
+    root.children.extend(buttons)
+    box = buttons[-1]
+    for i in reversed(xrange(depth)):
+        helper = hbox if i % 2 == 0 else vbox
+        box = helper(buttons[i], box)
+    root.constraints = [box]
+    return root, buttons[depth // 2]
+
+
+#: The builders of the scenarios and their default sizes.
+SCENARIOS = [
+    ('nested_containers', nested_containers, 16),
+    ('form', form, 40),
+    ('grid', grid, 6),
+    ('nested_boxes', nested_boxes, 16),
+]
+
+
+#------------------------------------------------------------------------------
+# Benchmark
+#------------------------------------------------------------------------------
+def timed(layout, func, *args):
+    """ Returns the (total, solver) seconds taken by a call.
+
+    """
+    layout.reset_solver_time()
+    gc.collect()
+    t0 = time.time()
+    func(*args)
+    total = time.time() - t0
+    return total, layout.solver_time()
+
+
+def run(builder, size, steps, toggles):
+    """ Runs the phases of a scenario and returns a dict of results.
+
+    """
+    app = get_app_null()
+    root, target = build(builder, size, TimedLayout)
+    layout = root.layout
+    widget = root.abstract_obj
+    res = {'size': size, 'components': len(list(root.traverse()))}
+
+    total, solver = timed(layout, layout.initialize)
+    min_width, min_height = widget.min_size()
+    res['initialize'] = {
+        'time': total,
+        'solver_time': solver,
+        'constraints': layout.constraint_count(),
+        'min_size': [min_width, min_height],
+    }
+
+    total, solver = timed(layout, layout.calc_min_size)
+    res['calc_min_size'] = {'time': total, 'solver_time': solver}
+
+    # The sweep grows the root from its minimum size to twice that,
+    # so that the geometry of every step is different.
+    sizes = []
+    for i in xrange(steps):
+        scale = 1.0 + float(i + 1) / steps
+        sizes.append((int(min_width * scale), int(min_height * scale)))
+
+    def sweep():
+        for width, height in sizes:
+            widget.resize(width, height)
+
+    updates = layout.geometry_updates
+    skips = layout.geometry_skips
+    total, solver = timed(layout, sweep)
+    res['resize'] = {
+        'steps': steps,
+        'time': total / steps,
+        'solver_time': solver / steps,
+        'geometry_updates': layout.geometry_updates - updates,
+        'geometry_skips': layout.geometry_skips - skips,
+    }
+
+    scheduler = root.layout_scheduler
+    before = scheduler.counters()
+    rebuilds = layout.rebuilds
+    counts = []
+
+    def toggle():
+        for i in xrange(toggles):
+            target.visible = not target.visible
+            app.flush()
+            counts.append(layout.constraint_count())
+
+    total, solver = timed(layout, toggle)
+    after = scheduler.counters()
+    res['toggle'] = {
+        'toggles': toggles,
+        'time': total / toggles,
+        'solver_time': solver / toggles,
+        'constraints': [min(counts), max(counts)],
+        'rebuilds': layout.rebuilds - rebuilds,
+        'scheduler': dict((key, after[key] - before[key])
+                          for key in after),
+    }
+    if toggles % 2 == 0:
+        assert widget.min_size() == (min_width, min_height)
+    return res
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.STDOUT).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(name, res):
+    init = res['initialize']
+    print '%s (size %d, %d components, %d constraints)' % (
+        name, res['size'], res['components'], init['constraints'])
+    for phase in ('initialize', 'calc_min_size', 'resize', 'toggle'):
+        data = res[phase]
+        print '    %-14s %9.2fms  (solver %9.2fms)' % (
+            phase, data['time'] * 1e3, data['solver_time'] * 1e3)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the constraints layout.')
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+        help='the scenarios to run, from: %s' % ', '.join(
+            name for name, _, _ in SCENARIOS))
+    parser.add_argument('-o', '--output',
+        help='the JSON file in which to save the results')
+    parser.add_argument('--scale', type=float, default=1.0,
+        help='a factor applied to the default size of each scenario')
+    parser.add_argument('--steps', type=int, default=10,
+        help='the number of resizes in the resize sweep')
+    parser.add_argument('--toggles', type=int, default=4,
+        help='the number of visibility toggles')
+    args = parser.parse_args()
+
+    known = dict((name, (builder, size)) for name, builder, size in SCENARIOS)
+    names = args.scenarios or [name for name, _, _ in SCENARIOS]
+    for name in names:
+        if name not in known:
+            parser.error('unknown scenario %r' % name)
+
+    results = {}
+    for name in names:
+        builder, size = known[name]
+        size = max(1, int(round(size * args.scale)))
+        results[name] = run(builder, size, args.steps, args.toggles)
+        report(name, results[name])
+
+    if args.output:
+        data = {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'scale': args.scale,
+            'scenarios': results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        print 'results saved to %s' % args.output
+
+
+if __name__ == '__main__':
+    main()
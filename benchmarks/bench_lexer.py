@@ -0,0 +1,74 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Benchmark the throughput of the filtered and fused enaml lexers on a
+large synthetic .enaml source.
+
+Usage: python -m benchmarks.bench_lexer [repeats]
+"""
+import argparse
+import time
+
+from enaml.parsing.lexer import EnamlLexer
+
+
+BLOCK = '''\
+Form%(i)d(Form):
+    """ A generated form number %(i)d.
+
+    """
+    model = None
+    Label:
+        text = 'Name %(i)d'
+    Field:
+        value := model.name
+        enabled << model.enabled and (model.count > %(i)d)
+    PushButton:
+        text = u"Apply"
+        clicked >> model.apply(%(i)d, [1, 2, 3], {'a': 0x1F})
+
+:: python ::
+def helper_%(i)d(x):
+    return x * %(i)d
+:: end ::
+
+'''
+
+
+def make_source(n_blocks):
+    return ''.join(BLOCK % {'i': i} for i in range(n_blocks))
+
+
+def time_lexer(source, fused, repeats):
+    best = None
+    count = 0
+    for _ in range(repeats):
+        lexer = EnamlLexer(fused=fused)
+        t0 = time.time()
+        lexer.input(source)
+        count = sum(1 for tok in lexer)
+        elapsed = time.time() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    return count, best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the throughput of the enaml lexers.')
+    parser.add_argument('repeats', nargs='?', type=int, default=5,
+        help='the number of runs of each lexer, of which the best is kept')
+    args = parser.parse_args()
+
+    repeats = args.repeats
+    source = make_source(2000)
+    print 'Source: %d lines' % source.count('\n')
+    for label, fused in (('filtered', False), ('fused', True)):
+        count, best = time_lexer(source, fused, repeats)
+        print '%-10s %8d tokens %8.3fs %10.0f tokens/s' % (
+            label, count, best, count / best)
+
+
+if __name__ == '__main__':
+    main()
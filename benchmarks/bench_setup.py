@@ -0,0 +1,105 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Benchmark the initialization of the default values of the bound
+expressions during the setup of a component tree.
+
+A tree of components with 5,000 bindings is created, and the default
+values are computed both lazily through the temporary instance traits
+of the setup hooks, and by the dependency ordered pass of
+evaluate_defaults. The bindings of each child depend upon each other,
+upon an attribute of the root, and upon the class traits 'enabled' and
+'visible'. Only the setup passes which compute the defaults are timed,
+since the others do not depend upon the strategy.
+
+Usage: python -m benchmarks.bench_setup [children]
+"""
+import argparse
+import ast
+import gc
+import time
+
+from enaml.operators import OPERATORS
+from enaml.parsing.analyzer import Dependencies, analyze_dependencies
+from enaml.toolkit import Toolkit
+from enaml.widgets.base_component import BaseComponent, SetupContext
+from enaml.widgets.setup_hooks import evaluate_defaults
+
+
+#: The (attribute, expression) pairs bound on each child, listed out of
+#: dependency order.
+CHILD_BINDINGS = [
+    ('t', 'v + u'),
+    ('v', 'u + w'),
+    ('u', 'z - y'),
+    ('label', "'item %d' % x"),
+    ('visible', 'enabled'),
+    ('enabled', 'z > 0'),
+    ('z', 'y + x'),
+    ('y', 'x * 2'),
+    ('x', 'base + 1'),
+    ('w', 'root.base'),
+]
+
+
+def compile_bindings(bindings):
+    res = []
+    for attr, source in bindings:
+        expr_ast = ast.parse(source, mode='eval')
+        code = compile(expr_ast, 'Enaml', mode='eval')
+        deps = Dependencies(*analyze_dependencies(expr_ast))
+        res.append((attr, deps, code))
+    return res
+
+
+def build(count, compiled):
+    toolkit = Toolkit()
+    operator = OPERATORS['__operator_Equal__']
+    f_globals = {}
+    root = BaseComponent()
+    f_locals = {'root': root}
+    operator(root, 'base', Dependencies((), (), False, 1),
+             compile('1', 'Enaml', mode='eval'), f_globals, toolkit,
+             f_locals)
+    for i in xrange(count):
+        child = BaseComponent()
+        for attr, deps, code in compiled:
+            operator(child, attr, deps, code, f_globals, toolkit, f_locals)
+        root.children.append(child)
+    root.set_parent_refs()
+    return root
+
+
+def run(count, ordered):
+    compiled = compile_bindings(CHILD_BINDINGS)
+    root = build(count, compiled)
+    gc.collect()
+    t0 = time.time()
+    if ordered:
+        evaluate_defaults(root)
+    with SetupContext('create')(root):
+        pass
+    elapsed = time.time() - t0
+    assert root.children[-1].t == 5
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the initialization of the default values.')
+    parser.add_argument('children', nargs='?', type=int, default=500,
+        help='the number of children of the root')
+    args = parser.parse_args()
+
+    count = args.children
+    bindings = count * len(CHILD_BINDINGS)
+    for name, ordered in (('lazy instance traits', False),
+                          ('dependency ordered', True)):
+        best = min(run(count, ordered) for _ in range(3))
+        print '%s: %d bindings in %.3fs (%.1fus per binding)' % (
+            name, bindings, best, best / bindings * 1e6)
+
+
+if __name__ == '__main__':
+    main()
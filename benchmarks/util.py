@@ -0,0 +1,44 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Helpers shared by the benchmarks which build component trees from
+the widgets of the headless null toolkit.
+
+"""
+from enaml.toolkit import null_toolkit
+from enaml.widgets.layout.constraints_layout import ConstraintsLayout
+
+
+def make(toolkit, name, **attrs):
+    """ Creates a component of the toolkit and sets the given attributes
+    on it.
+
+    """
+    component = toolkit[name]()
+    for attr, value in attrs.iteritems():
+        setattr(component, attr, value)
+    return component
+
+
+def build(builder, size, layout_class=ConstraintsLayout):
+    """ Builds and sets up the tree of a scenario.
+
+    The builder is called with the null toolkit and the size, and must
+    return the root container of an unset tree and a child of interest.
+    The layouts of the nested containers are left to the root, which is
+    given an instance of layout_class that is not yet initialized.
+
+    """
+    toolkit = null_toolkit()
+    with toolkit:
+        root, target = builder(toolkit, size)
+    stack = [root]
+    while stack:
+        component = stack.pop()
+        if hasattr(component, 'layout'):
+            component.layout = None
+        stack.extend(component.children)
+    root.setup()
+    root.layout = layout_class(root)
+    return root, target
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+""" Command-line tool to precompile the .enaml files in a directory tree.
+
+The compiled code is written to the same cache files which are used by
+the enaml import hook, so that applications start without having to
+parse and compile their .enaml files.
+"""
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from enaml.import_hooks import (compile_enaml, make_cache_path, write_cache, 
+                                CACHE_DIR)
+
+
+def find_enaml_files(roots):
+    """ Yields the paths of the .enaml files in the given files and
+    directory trees, in sorted order.
+
+    """
+    suffix = os.path.extsep + 'enaml'
+    for root in roots:
+        if os.path.isfile(root):
+            yield root
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d != CACHE_DIR)
+            for name in sorted(filenames):
+                if name.endswith(suffix):
+                    yield os.path.join(dirpath, name)
+
+
+def compile_file(enaml_path):
+    """ Compiles a single .enaml file with the compiler of the import
+    hook and writes its cache file. This is the function run by the 
+    worker processes.
+
+    Returns
+    -------
+    result : tuple
+        A tuple of (enaml_path, elapsed, error) where elapsed is the 
+        time taken to parse and compile the file, and error is None on
+        success, or a string describing the failure.
+
+    """
+    elapsed = 0.0
+    try:
+        source_stat = os.stat(enaml_path)
+        t0 = time.time()
+        code = compile_enaml(enaml_path)
+        elapsed = time.time() - t0
+    except Exception as e:
+        error = '%s: %s' % (type(e).__name__, e)
+        return (enaml_path, elapsed, error)
+    if not write_cache(make_cache_path(enaml_path), code, source_stat):
+        error = 'unable to write the cache file'
+        return (enaml_path, elapsed, error)
+    return (enaml_path, elapsed, None)
+
+
+def compile_all(roots, jobs=None, quiet=False, stream=sys.stdout):
+    """ Compiles the .enaml files in the given paths using a process
+    pool, stopping at the first failure.
+
+    Parameters
+    ----------
+    roots : list of strings
+        The files and directories to compile.
+
+    jobs : int, optional
+        The number of worker processes. Defaults to the cpu count. A
+        value of 1 compiles in the current process.
+
+    quiet : bool, optional
+        If True, only failures are reported.
+
+    stream : file-like, optional
+        The stream on which to report progress.
+
+    Returns
+    -------
+    result : bool
+        True if every file was compiled successfully.
+
+    """
+    paths = list(find_enaml_files(roots))
+    if jobs == 1 or len(paths) <= 1:
+        pool = None
+        results = (compile_file(path) for path in paths)
+    else:
+        pool = Pool(jobs)
+        results = pool.imap_unordered(compile_file, paths)
+
+    success = True
+    try:
+        for path, elapsed, error in results:
+            if error is not None:
+                stream.write('Error compiling %s: %s\n' % (path, error))
+                success = False
+                break
+            if not quiet:
+                stream.write('%s: %.1fms\n' % (path, elapsed * 1e3))
+    finally:
+        if pool is not None:
+            if success:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+    return success
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description=__doc__,
+    )
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+        help='The number of worker processes. Defaults to the cpu count.')
+    parser.add_argument('-q', '--quiet', action='store_true',
+        help='Only report errors.')
+    parser.add_argument('paths', nargs='+',
+        help='The .enaml files and directories to compile.')
+
+    args = parser.parse_args()
+
+    if not compile_all(args.paths, args.jobs, args.quiet):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A profiler which records the time spent evaluating the expressions
+bound to the components.
+
+The evaluation methods of the expression classes are marked with 
+`expressions._profiled`. While a profiler is enabled they are replaced
+on their classes by wrappers which hand their calls to the profiler to
+be timed, and they are restored when it is disabled, so there is no 
+overhead when profiling is not in use. See `expressions.set_profiler`.
+
+"""
+import json
+from timeit import default_timer
+
+from . import expressions
+
+
+def _location(expression):
+    """ Returns the (filename, lineno) of the binding which created the
+    expression.
+
+    """
+    filename = expression.f_globals.get('__file__')
+    if filename is None:
+        filename = expression.code.co_filename
+    lineno = getattr(expression.deps, 'lineno', None)
+    if lineno is None:
+        lineno = expression.code.co_firstlineno
+    return (filename, lineno)
+
+
+class ExpressionStats(object):
+    """ The statistics recorded for a method of a single binding.
+
+    """
+    __slots__ = ('filename', 'lineno', 'attr', 'method', 'calls', 'total',
+                 'max')
+
+    def __init__(self, filename, lineno, attr, method):
+        self.filename = filename
+        self.lineno = lineno
+        self.attr = attr
+        self.method = method
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def as_dict(self):
+        """ Returns the statistics as a dictionary.
+
+        """
+        return dict((name, getattr(self, name)) for name in self.__slots__)
+
+
+class ExpressionProfiler(object):
+    """ Records the call counts and the cumulative and maximum wall time
+    of the evaluation of each binding.
+
+    The statistics are keyed on the location of the binding in the
+    source, so the expressions created by all of the instances of a
+    component defined in an .enaml file are reported together.
+
+    """
+    #: The profiler which is currently enabled, if any.
+    _active = None
+
+    def __init__(self):
+        #: A dictionary mapping (filename, lineno, attr, method) to the
+        #: ExpressionStats for that key.
+        self.stats = {}
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.disable()
+
+    def enable(self):
+        """ Starts timing the expressions. Only one profiler may be
+        enabled at a time.
+
+        """
+        if ExpressionProfiler._active is not None:
+            raise RuntimeError('An expression profiler is already enabled')
+        ExpressionProfiler._active = self
+        expressions.set_profiler(self)
+
+    def disable(self):
+        """ Stops timing the expressions.
+
+        """
+        if ExpressionProfiler._active is self:
+            ExpressionProfiler._active = None
+            expressions.set_profiler(None)
+
+    def call(self, expression, cls, func, *args):
+        """ Calls the function of the given method of the expression
+        class with the expression and the arguments, and records its
+        timing.
+
+        """
+        t0 = default_timer()
+        try:
+            return func(expression, *args)
+        finally:
+            elapsed = default_timer() - t0
+            label = '%s.%s' % (cls.__name__, func.__name__)
+            filename, lineno = _location(expression)
+            key = (filename, lineno, expression.attr, label)
+            stats = self.stats
+            try:
+                item = stats[key]
+            except KeyError:
+                item = stats[key] = ExpressionStats(*key)
+            item.calls += 1
+            item.total += elapsed
+            if elapsed > item.max:
+                item.max = elapsed
+
+    def sorted_stats(self, key='total'):
+        """ Returns the list of ExpressionStats sorted in descending
+        order of the given attribute: 'total', 'max' or 'calls'.
+
+        """
+        return sorted(self.stats.itervalues(),
+                      key=lambda item: getattr(item, key), reverse=True)
+
+    def report(self, stream, key='total', limit=None):
+        """ Writes a table of the statistics to the stream, sorted in
+        descending order of the given attribute.
+
+        """
+        stream.write('%8s %12s %12s  %s\n' % ('calls', 'total (ms)',
+                                              'max (ms)', 'binding'))
+        items = self.sorted_stats(key)
+        if limit is not None:
+            items = items[:limit]
+        for item in items:
+            binding = '%s:%s %s (%s)' % (item.filename, item.lineno,
+                                         item.attr, item.method)
+            stream.write('%8d %12.3f %12.3f  %s\n' % (item.calls,
+                         item.total * 1e3, item.max * 1e3, binding))
+
+    def dump_json(self, stream, key='total'):
+        """ Writes the statistics to the stream as a JSON list, sorted
+        in descending order of the given attribute. Times are given in
+        seconds.
+
+        """
+        data = [item.as_dict() for item in self.sorted_stats(key)]
+        json.dump(data, stream, indent=2)
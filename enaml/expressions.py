@@ -2,27 +2,172 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-import ast
 from abc import ABCMeta, abstractmethod
+import __builtin__
 from collections import namedtuple
+from functools import partial
+from itertools import count
+from types import CodeType, FunctionType
 import weakref
 
-from traits.api import HasTraits
+from traits.api import (HasTraits, TraitListObject, TraitDictObject, 
+                        TraitSetObject)
 
-from .parsing.analyzer import AttributeVisitor
 from .guard import guard
+from .parsing.code_tracing import TRACER_NAME, inject_tracing
+from .parsing.expression_functions import code_names, function_code
+from .rate_limiting import Throttle, Debounce
+from .update_scheduler import cancel_update, schedule_update
 
 
 # XXX clean up the expression binders. We need more powerful visitors which
 # perform more intelligent binding.
 
+#: Creates a tuple subclass instance from a tuple without the Python 
+#: level __new__ of a namedtuple.
+_tuple_new = tuple.__new__
+
+
+#------------------------------------------------------------------------------
+# Scope Invalidation
+#------------------------------------------------------------------------------
+#: A counter which is incremented by `invalidate_scopes` when a change
+#: may change the object which resolves a name in any expression, such
+#: as a change to a toolkit. Expressions discard their cache of the 
+#: objects which own their free names when this value changes.
+_scope_generation = 0
+
+#: The source of the scope generations of the components. See 
+#: `invalidate_component_scopes`.
+_component_generations = count(1)
+
+
+def invalidate_scopes():
+    """ Invalidates the cached scopes of every expression. This must be
+    called when a toolkit is changed. A change to the component tree 
+    only invalidates the expressions bound to the affected components,
+    see `invalidate_component_scopes`.
+
+    """
+    global _scope_generation
+    _scope_generation += 1
+
+
+def invalidate_component_scopes(components):
+    """ Invalidates the cached scopes of the expressions bound to the 
+    given components. This must be called with a component and all of
+    its descendants when the component is given a new parent, or when
+    a trait is added to or removed from it.
+
+    Each component is given a new value for its `_scope_generation` 
+    attribute, which the expressions bound to it compare against the 
+    value at the time their scope was cached. The expressions bound to
+    other components keep their caches.
+
+    """
+    generation = next(_component_generations)
+    for component in components:
+        component._scope_generation = generation
+
+
+#------------------------------------------------------------------------------
+# Profiling
+#------------------------------------------------------------------------------
+#: The ExpressionProfiler which is enabled, if any.
+_profiler = None
+
+
+#: The (cls, name, func) of the methods which are replaced by timing
+#: wrappers while a profiler is set.
+_profiled_methods = []
+
+
+def _profiled(func):
+    """ A decorator which marks a method of an expression class to be 
+    timed while a profiler is set.
+
+    The method itself is returned unchanged, so that the expressions
+    pay nothing for the profiling while it is disabled.
+
+    """
+    func._profiled = True
+    return func
+
+
+def _expression_classes(cls):
+    """ Yields the given expression class and all of its subclasses.
+
+    """
+    yield cls
+    for subclass in cls.__subclasses__():
+        for item in _expression_classes(subclass):
+            yield item
+
+
+def _timing_wrapper(cls, func):
+    """ Returns a method which hands the calls of the given method of 
+    an expression class to the profiler.
+
+    Traits gives a notification handler as many of the arguments of a
+    change as it accepts, so the wrapper takes the same number of
+    arguments as the method it wraps.
+
+    """
+    def timed(self, *args):
+        profiler = _profiler
+        if profiler is None:
+            return func(self, *args)
+        return profiler.call(self, cls, func, *args)
+
+    nargs = func.func_code.co_argcount
+    if nargs == 1:
+        def wrapper(self):
+            return timed(self)
+    elif nargs == 2:
+        def wrapper(self, arg):
+            return timed(self, arg)
+    elif nargs == 5:
+        def wrapper(self, obj, name, old, new):
+            return timed(self, obj, name, old, new)
+    else:
+        wrapper = timed
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def set_profiler(profiler):
+    """ Sets the ExpressionProfiler which times the evaluation of the 
+    expressions, or disables the timing if it is None.
+
+    The marked methods of the expression classes are replaced by timing
+    wrappers when profiling is enabled, and restored when it is 
+    disabled. The notifiers of traits look up their handler by name on
+    each change, so that expressions which are already bound switch
+    between the wrappers and the methods along with their classes.
+
+    """
+    global _profiler
+    if profiler is not None and not _profiled_methods:
+        for cls in _expression_classes(AbstractExpression):
+            for name, func in cls.__dict__.items():
+                if getattr(func, '_profiled', False):
+                    _profiled_methods.append((cls, name, func))
+                    setattr(cls, name, _timing_wrapper(cls, func))
+    elif profiler is None:
+        for cls, name, func in _profiled_methods:
+            setattr(cls, name, func)
+        del _profiled_methods[:]
+    _profiler = profiler
+
+
 #------------------------------------------------------------------------------
 # Express Locals
 #------------------------------------------------------------------------------
 class ExpressionLocals(object):
     """ A mapping object that will first look in the provided locals
-    dictionary and finally by walking up the tree of components looking
-    for attributes.
+    dictionary, then by walking up the tree of components looking
+    for attributes, and finally in the toolkit.
 
     Notes
     -----
@@ -32,15 +177,30 @@ class ExpressionLocals(object):
     locals. However, we must support assignment since that's required
     to make list comprehensions work.
 
+    If an `owners` dictionary is provided, the object in the tree 
+    which resolves each name is recorded in it as a weak reference (or 
+    None if no object in the tree has the attribute), and subsequent
+    lookups of the name fetch the attribute directly from that object.
+    The dictionary must be discarded when the scopes are invalidated,
+    see `invalidate_scopes` and `invalidate_component_scopes`.
+
+    The toolkit is consulted only for names which are not defined in
+    the module globals. This allows the expression to be evaluated 
+    with the module globals as its global namespace while giving the
+    module names precedence over the toolkit names, without needing to
+    merge the two namespaces into a new dictionary.
+
     Strong references are kept to all objects passed to the constructor,
     so care should be taken in managing the lifetime of these scope
     objects since their use is likely to create reference cycles.
     (It's probably best to create these objects on-the-fly when needed)
 
     """
-    __slots__ = ('obj', 'f_locals', 'overrides', 'temp_locals')
+    __slots__ = ('obj', 'f_locals', 'overrides', 'temp_locals', 'f_globals',
+                 'toolkit', 'owners')
 
-    def __init__(self, obj, f_locals, overrides=None):
+    def __init__(self, obj, f_locals, overrides=None, f_globals=None, 
+                 toolkit=None, owners=None):
         """ Initialize an expression locals instance.
 
         Parameters
@@ -55,18 +215,35 @@ class ExpressionLocals(object):
         overrides : dict or None
             A dictionary of override values to check before locals.
 
+        f_globals : dict or None
+            The globals dict of the module in which the expression is
+            evaluated. Names in this dict are never taken from the 
+            toolkit.
+
+        toolkit : Toolkit or None
+            The toolkit to check after the attribute space of the 
+            object.
+
+        owners : dict or None
+            A dictionary in which to cache the objects which own the 
+            names found in the attribute space of the tree.
+
         """
         self.obj = obj
         self.f_locals = f_locals
         self.overrides = overrides
         self.temp_locals = {}
+        self.f_globals = f_globals
+        self.toolkit = toolkit
+        self.owners = owners
 
     def __getitem__(self, name):
         """ Lookup an item from the namespace.
 
         Returns the named item from the namespace by first looking in
-        the provided locals namespace, and finally the attribute space 
-        of the object. If the value is not found, a KeyError is raised.
+        the provided locals namespace, then the attribute space of the
+        object, and finally the toolkit. If the value is not found, a
+        KeyError is raised.
 
         Parameters
         ----------
@@ -99,16 +276,39 @@ class ExpressionLocals(object):
         except KeyError:
             pass
 
-        # Finally, walk up the ancestor tree starting at self.obj
-        # looking for attributes of the given name.
+        # Next, walk up the ancestor tree starting at self.obj
+        # looking for attributes of the given name. If the owner of
+        # the name has been cached, it is used directly instead.
         parent = self.obj
-        while True:
+        owners = self.owners
+        if owners is not None and name in owners:
+            owner_ref = owners[name]
+            if owner_ref is None:
+                parent = None
+            else:
+                owner = owner_ref()
+                if owner is not None:
+                    return getattr(owner, name)
+        while parent is not None:
             try:
-                return getattr(parent, name)
+                value = getattr(parent, name)
             except AttributeError:
                 parent = parent.parent
-                if parent is None:
-                    raise KeyError(name)
+            else:
+                if owners is not None:
+                    owners[name] = weakref.ref(parent)
+                return value
+        if owners is not None:
+            owners[name] = None
+
+        # Finally, check the toolkit unless the name will be found in 
+        # the module globals, which take precedence.
+        toolkit = self.toolkit
+        if toolkit is not None and name in toolkit:
+            f_globals = self.f_globals
+            if f_globals is None or name not in f_globals:
+                return toolkit[name]
+        raise KeyError(name)
 
     def __setitem__(self, name, val):
         """ Stores the value in the internal locals dictionary. This
@@ -119,21 +319,39 @@ class ExpressionLocals(object):
 
 
 #------------------------------------------------------------------------------
-# Ast walking helpers
+# Dependency helpers
 #------------------------------------------------------------------------------
-def parse_attr_names(py_ast, obj, f_locals):
-    """ Parses an expression ast, looking for attributes references in
-    the objects attribute space.
+def find_owner(obj, name):
+    """ Returns the first object in the ancestry of obj, starting with
+    obj itself, which has an attribute of the given name, or None if 
+    there is no such object.
+
+    """
+    parent = obj
+    while parent is not None:
+        try:
+            getattr(parent, name)
+        except AttributeError:
+            parent = parent.parent
+        else:
+            return parent
+    return None
+
+
+def parse_attr_names(names, obj, f_locals):
+    """ Finds the names referenced by an expression which refer to 
+    attributes in the objects attribute space.
 
-    Given an ast.Expression node and an objet, returns the set of tuples
-    which are (name, object) parents. The name is an attribute name an
-    the object is the object which contains the trait attribute and is
-    either 'obj' itself or some ancestor of obj.
+    Given the names referenced by an expression and an objet, returns 
+    the set of tuples which are (name, object) parents. The name is an 
+    attribute name an the object is the object which contains the trait
+    attribute and is either 'obj' itself or some ancestor of obj.
 
     Parameters
     ----------
-    py_ast : Instance(ast.Expresssion)
-        The ast Expression node to parse.
+    names : iterable of strings
+        The names referenced by the expression, as computed by the 
+        compiler.
 
     obj : HasTraits object
         The HasTraits instance object we are querrying for attributes.
@@ -150,23 +368,20 @@ def parse_attr_names(py_ast, obj, f_locals):
 
     """
     pairs = set()
-    name_node = ast.Name
-    for node in ast.walk(py_ast):
-        if isinstance(node, name_node):
-            name = node.id
-            if name not in f_locals:
-                parent = obj
-                while parent is not None:
-                    # XXX I don't particularly like this way of testing
-                    # whether or not an object has a trait defined.
-                    # Calling obj.trait(name) doesn't work because the
-                    # parent class is HasStrictTraits, so we get a trait
-                    # returned which is the Disallow trait type.
-                    if (name in parent._instance_traits() or 
-                        name in parent.class_traits()):
-                        pairs.add((name, parent))
-                        break
-                    parent = parent.parent
+    for name in names:
+        if name not in f_locals:
+            parent = obj
+            while parent is not None:
+                # XXX I don't particularly like this way of testing
+                # whether or not an object has a trait defined.
+                # Calling obj.trait(name) doesn't work because the
+                # parent class is HasStrictTraits, so we get a trait
+                # returned which is the Disallow trait type.
+                if (name in parent._instance_traits() or 
+                    name in parent.class_traits()):
+                    pairs.add((name, parent))
+                    break
+                parent = parent.parent
     return pairs
 
 
@@ -177,10 +392,10 @@ class AbstractExpression(object):
 
     __metaclass__ = ABCMeta
 
-    __slots__ = ('obj_ref', 'attr', 'expr_ast', 'code', 'f_globals',
+    __slots__ = ('obj_ref', 'attr', 'deps', 'code', 'f_globals',
                  'toolkit', 'f_locals', '__weakref__')
 
-    def __init__(self, obj, attr, expr_ast, code, f_globals, toolkit, f_locals):
+    def __init__(self, obj, attr, deps, code, f_globals, toolkit, f_locals):
         """ Initializes and expression object.
 
         Parameters
@@ -191,11 +406,12 @@ class AbstractExpression(object):
         attr : string
             The attribute name on `obj` to which this expression is bound.
 
-        expr_ast : ast.Expression instance
-            An ast.Expression node instance which is the rhs expression.
+        deps : Dependencies
+            The static dependencies of the rhs expression, as computed
+            by enaml.parsing.analyzer.analyze_dependencies.
 
         code : types.CodeType object
-            The compiled code object for the provided ast node.
+            The compiled code object for the rhs expression.
 
         f_globals : dict
             The globals dictionary in which the expression should execute.
@@ -212,7 +428,7 @@ class AbstractExpression(object):
         # We keep a weakref to obj to avoid ref cycles
         self.obj_ref = weakref.ref(obj)
         self.attr = attr
-        self.expr_ast = expr_ast
+        self.deps = deps
         self.code = code
         self.f_globals = f_globals
         self.toolkit = toolkit
@@ -241,6 +457,14 @@ class AbstractExpression(object):
         """
         raise NotImplementedError
 
+    def unbind(self):
+        """ Removes the notifiers attached by `bind`. This is called 
+        when the component is destroyed, after which the expression is
+        not used again. The default implementation does nothing.
+
+        """
+        pass
+
 
 #------------------------------------------------------------------------------
 # Standard Expression Classes
@@ -254,7 +478,8 @@ class SimpleExpression(AbstractExpression):
     AbstractExpression
 
     """
-    __slots__ = ()
+    __slots__ = ('nested_scopes', 'owners', 'func', 'nested_globals',
+                 'generation', 'global_generation')
 
     def bind(self):
         """ Bind the expression to the `name` attribute on `object`.
@@ -263,33 +488,174 @@ class SimpleExpression(AbstractExpression):
         # Nothing to do for simple expression
         pass
 
+    @_profiled
     def eval_expression(self):
         """ Evaluates and returns the results of the expression.
 
         """
-        f_globals = self.get_globals()
-        f_locals = self.get_locals()
-        val = eval(self.code, f_globals, f_locals)
-        return val
+        func = self.get_function()
+        if func is None:
+            f_globals = self.get_globals()
+            f_locals = self.get_locals()
+            return eval(self.code, f_globals, f_locals)
+        return func()
+
+    def get_function(self, overrides=()):
+        """ Returns a function which evaluates the expression, or None
+        if the expression contains nested scopes and must be evaluated
+        with `eval` using the namespaces returned by `get_globals` and 
+        `get_locals`.
+
+        The function is cached until the scopes are invalidated. See
+        `make_function`.
+
+        """
+        self.validate_scope()
+        func = self.func
+        if func is None:
+            func = self.func = self.make_function(overrides)
+        return func
+
+    def validate_scope(self):
+        """ Discards the objects cached for the scope of the expression
+        if its scope has been invalidated since they were created, by
+        `invalidate_scopes` or by `invalidate_component_scopes` for the
+        component to which the expression is bound.
+
+        """
+        generation = getattr(self.obj, '_scope_generation', 0)
+        try:
+            if (self.generation == generation and 
+                self.global_generation == _scope_generation):
+                return
+        except AttributeError:
+            pass
+        self.generation = generation
+        self.global_generation = _scope_generation
+        self.clear_scope()
+
+    def clear_scope(self):
+        """ Discards the objects cached for the scope of the expression.
+
+        """
+        self.owners = {}
+        self.func = None
+        self.nested_globals = None
+
+    def make_function(self, overrides=()):
+        """ Creates a function which evaluates the expression with the
+        same name resolution as the namespaces returned by `get_globals`
+        and `get_locals`, or returns None if the expression contains 
+        nested scopes.
+
+        The names in `overrides` are the leading arguments of the 
+        function. The other free names of the expression are resolved
+        when the function is created: the values of the names found in
+        f_locals become the defaults of the function's arguments, the 
+        names found in the attribute space of the tree are read from a
+        weak reference to the owning object, and the remaining names 
+        are looked up in the module globals and the builtins. A name 
+        which is currently resolved in the toolkit is read through a
+        callable which checks the module globals first, so a module
+        global added later which shadows the toolkit name is seen, as 
+        it is by `eval`.
+
+        """
+        if self.has_nested_scopes():
+            return None
+        f_locals = self.f_locals
+        f_globals = self.f_globals
+        toolkit = self.toolkit
+        obj = self.obj
+        args = list(overrides)
+        defaults = []
+        attr_names = []
+        call_names = []
+        for name in code_names(self.code)[0]:
+            if name in overrides:
+                continue
+            if name in f_locals:
+                value = f_locals[name]
+            else:
+                owner = find_owner(obj, name)
+                if owner is not None:
+                    attr_names.append(name)
+                    value = weakref.ref(owner)
+                elif (name in f_globals or toolkit is None or 
+                      name not in toolkit):
+                    continue
+                else:
+                    call_names.append(name)
+                    value = partial(f_globals.get, name, toolkit[name])
+            args.append(name)
+            defaults.append(value)
+        code = function_code(self.code, tuple(args), frozenset(attr_names),
+                             frozenset(call_names))
+        # Like eval, make sure the globals provide the builtins.
+        if '__builtins__' not in f_globals:
+            f_globals['__builtins__'] = __builtin__
+        return FunctionType(code, f_globals, code.co_name, tuple(defaults))
+
+    def has_nested_scopes(self):
+        """ Returns whether the expression contains lambdas or generator
+        expressions, which are compiled to nested functions.
+
+        """
+        try:
+            return self.nested_scopes
+        except AttributeError:
+            consts = self.code.co_consts
+            nested_scopes = any(isinstance(c, CodeType) for c in consts)
+            self.nested_scopes = nested_scopes
+            return nested_scopes
 
     def get_globals(self):
-        """ Returns the global namespace dictionary which is the union
-        of f_globals and the toolkit, f_globals taking precedence.
+        """ Returns the global namespace dictionary for the expression.
+
+        This is the module globals dictionary itself; the names in the
+        toolkit are provided by the mapping returned by `get_locals`. 
+        If the expression contains nested scopes, the returned dict is
+        the union of f_globals and the toolkit, f_globals taking 
+        precedence, so that the toolkit names are visible in the 
+        nested scopes, which look up their names in the global 
+        namespace only. The union is built once and cached until the
+        scopes are invalidated, so a module global which is added 
+        later is not seen by the nested scopes until then.
 
         """
-        d = {}
-        d.update(self.toolkit)
-        d.update(self.f_globals)
-        return d
+        if self.has_nested_scopes():
+            self.validate_scope()
+            d = self.nested_globals
+            if d is None:
+                d = self.nested_globals = {}
+                d.update(self.toolkit)
+                d.update(self.f_globals)
+            return d
+        return self.f_globals
 
     def get_locals(self):
         """ Returns the local namespace mapping object. The mapping
         object first attempts to lookup the value in f_locals, then
         continues by walking up the tree checking the attributes of
-        all the parents.
+        all the parents, and finally checks the toolkit. The objects
+        in the tree which own the names are cached on the expression
+        until the scopes are invalidated.
 
         """
-        return ExpressionLocals(self.obj, self.f_locals)
+        self.validate_scope()
+        return ExpressionLocals(self.obj, self.f_locals, None,
+                                self.f_globals, self.toolkit, self.owners)
+
+    def eval_traced(self, tracer):
+        """ Evaluates the expression with every attribute access routed
+        through the `load_attr` method of the given tracer, and returns
+        the result. See enaml.parsing.code_tracing.
+
+        """
+        f_globals = self.get_globals()
+        f_locals = self.get_locals()
+        f_locals.overrides = {TRACER_NAME: tracer}
+        return eval(inject_tracing(self.code), f_globals, f_locals)
 
 
 class UpdatingExpression(SimpleExpression):
@@ -299,8 +665,14 @@ class UpdatingExpression(SimpleExpression):
     of those traits in the expression change, the expression is evaluated
     and the value of the component attribute is updated.
 
+    If the toolkit provides an `invoke_later` function and the component
+    has not opted out by setting its `defer_updates` attribute to False,
+    the evaluation is deferred to the next turn of the event loop so 
+    that changes to several of the traits are coalesced into a single
+    evaluation. See enaml.update_scheduler.
+
     """
-    __slots__ = ()
+    __slots__ = ('sources', 'dep_rank')
 
     def bind(self):
         """ Parse the expression for any trait attribute references. A
@@ -313,16 +685,13 @@ class UpdatingExpression(SimpleExpression):
         obj = self.obj
         global_ns = self.get_globals()
         local_ns = self.get_locals()
-        expr_ast = self.expr_ast
-
-        # The attribute visitor parses the expression looking for any
-        # `foo.bar` style attribute sub-expressions. The results value
-        # is a list of ('foo', 'bar') style tuples.
-        visitor = AttributeVisitor()
-        visitor.visit(expr_ast)
+        deps = self.deps
+        sources = []
 
+        # The compiler has computed the `foo.bar` style attribute 
+        # sub-expressions as a tuple of ('foo', 'bar') style tuples.
         update_method = self.update_object
-        for dep_name, attr in visitor.results():
+        for dep_name, attr in deps.attributes:
             try:
                 dep = local_ns[dep_name]
             except KeyError:
@@ -332,21 +701,222 @@ class UpdatingExpression(SimpleExpression):
                     raise NameError('name `%s` is not defined' % dep_name)
             if isinstance(dep, HasTraits):
                 dep.on_trait_change(update_method, attr)
+                sources.append((dep, attr))
 
         # This portion binds any trait attributes that are being
         # referenced via implicit attribute access.
-        for name, owner in parse_attr_names(expr_ast, obj, self.f_locals):
+        for name, owner in parse_attr_names(deps.names, obj, self.f_locals):
             owner.on_trait_change(update_method, name)
+            sources.append((owner, name))
+
+        self.sources = tuple(sources)
+
+    def unbind(self):
+        """ Removes the notifiers from the traits to which the 
+        expression is bound and discards a pending re-evaluation.
+
+        """
+        update_method = self.update_object
+        for obj, name in self.get_sources():
+            obj.on_trait_change(update_method, name, remove=True)
+        self.sources = ()
+        cancel_update(self)
 
+    @_profiled
     def update_object(self):
         """ The notification handler to update the component object.
 
-        When this method is called, the expression is re-evaluated, and
-        the results are assigned to the proper attribute on the component
-        object.
+        When this method is called, the expression is scheduled for 
+        re-evaluation, or re-evaluated immediately if updates are not 
+        deferred for the component.
+
+        """
+        invoke_later = self.toolkit.invoke_later
+        if invoke_later is None or not getattr(self.obj, 'defer_updates', 
+                                               False):
+            self.refresh()
+        else:
+            schedule_update(self, invoke_later)
+
+    @_profiled
+    def refresh(self):
+        """ Re-evaluates the expression and assigns the results to the
+        proper attribute on the component object.
 
         """
-        setattr(self.obj, self.attr, self.eval_expression())
+        obj = self.obj
+        if obj is not None:
+            setattr(obj, self.attr, self.eval_expression())
+
+    def rank(self):
+        """ Returns the position of the expression in the order of 
+        evaluation. 
+
+        The rank is zero for an expression which depends only on 
+        attributes which are not computed by updating expressions, and 
+        is otherwise one more than the highest rank of the updating 
+        expressions which compute the attributes it depends upon. The
+        value is computed once and cached.
+
+        """
+        try:
+            return self.dep_rank
+        except AttributeError:
+            pass
+        # Setting the rank before walking the sources terminates the
+        # recursion for expressions which depend upon each other.
+        rank = self.dep_rank = 0
+        for owner, name in self.get_sources():
+            for hook in getattr(owner, 'setup_hooks', ()):
+                if getattr(hook, 'name', None) == name:
+                    expr = getattr(hook, 'expression', None)
+                    if isinstance(expr, UpdatingExpression):
+                        rank = max(rank, expr.rank() + 1)
+        self.dep_rank = rank
+        return rank
+
+    def get_sources(self):
+        """ Returns the (obj, name) pairs of the traits to which the
+        expression is bound.
+
+        """
+        return getattr(self, 'sources', ())
+
+
+class AttributeTracer(object):
+    """ The tracer object used to evaluate the traced code of a 
+    TracingExpression. It records the trait attributes of the HasTraits
+    objects which are read during the evaluation.
+
+    """
+    __slots__ = ('items',)
+
+    #: The types of the container values which notify through the 
+    #: '<name>_items' trait when they are modified in-place.
+    container_types = (TraitListObject, TraitDictObject, TraitSetObject)
+
+    def __init__(self):
+        #: The set of (obj, name) pairs which were read.
+        self.items = set()
+
+    def load_attr(self, obj, name):
+        """ Returns the named attribute of the object, recording the
+        access if the attribute is a trait of a HasTraits object.
+
+        """
+        value = getattr(obj, name)
+        if isinstance(obj, HasTraits):
+            if (name in obj.__class_traits__ or 
+                name in obj._instance_traits()):
+                items = self.items
+                items.add((obj, name))
+                if isinstance(value, self.container_types):
+                    items.add((obj, name + '_items'))
+        return value
+
+
+class TracingExpression(UpdatingExpression):
+    """ A dynamically updating expression which subscribes to exactly 
+    the trait attributes which are read when it is evaluated.
+
+    Instead of relying on the dependencies found by the compiler, which 
+    only include the first level of `foo.bar` style attribute access, 
+    the expression is evaluated with a traced version of its code which
+    records every trait attribute read on a HasTraits object, at any 
+    depth of an attribute chain and including the objects returned by
+    subscripts and calls. The expression is traced again each time it
+    is evaluated and the notifiers are updated to match, so when an 
+    object in a chain is replaced the expression follows the new 
+    object. Attributes read inside a lambda or a generator expression
+    are not traced.
+
+    """
+    __slots__ = ('traced', 'subscribed')
+
+    def __init__(self, *args):
+        super(TracingExpression, self).__init__(*args)
+        #: The set of (obj, name) pairs read by the last evaluation.
+        self.traced = frozenset()
+        #: The set of (obj, name) pairs with notifiers attached, or 
+        #: None if the expression has not yet been bound.
+        self.subscribed = None
+
+    def bind(self):
+        """ Attaches a notifier to the traits which are referenced 
+        through the attribute space of the component and to the trait
+        attributes which were read by the evaluation of the expression.
+
+        """
+        SimpleExpression.bind(self)
+        update_method = self.update_object
+        names = self.deps.names
+        pairs = parse_attr_names(names, self.obj, self.f_locals)
+        for name, owner in pairs:
+            owner.on_trait_change(update_method, name)
+        self.sources = tuple((owner, name) for name, owner in pairs)
+        self.subscribed = frozenset()
+        self.update_subscriptions()
+
+    @_profiled
+    def eval_expression(self):
+        """ Evaluates the traced code of the expression and returns the
+        result. If the expression has been bound, the notifiers are 
+        updated to match the attributes which were read.
+
+        """
+        return self.eval_traced(AttributeTracer())
+
+    def eval_traced(self, tracer):
+        """ Overridden from the parent class to record the attributes
+        read through the tracer, which must be an AttributeTracer, and
+        to update the notifiers if the expression has been bound.
+
+        """
+        try:
+            val = SimpleExpression.eval_traced(self, tracer)
+        finally:
+            # The attributes read before an exception are kept so that
+            # a change to one of them triggers a new evaluation.
+            self.traced = frozenset(tracer.items)
+            if self.subscribed is not None:
+                self.update_subscriptions()
+        return val
+
+    def update_subscriptions(self):
+        """ Attaches and removes notifiers so that the subscribed 
+        attributes match the attributes read by the last evaluation.
+
+        """
+        traced = self.traced
+        subscribed = self.subscribed
+        if traced == subscribed:
+            return
+        update_method = self.update_object
+        for obj, name in subscribed - traced:
+            obj.on_trait_change(update_method, name, remove=True)
+        for obj, name in traced - subscribed:
+            obj.on_trait_change(update_method, name)
+        self.subscribed = traced
+        # The order of evaluation depends upon the traced attributes.
+        try:
+            del self.dep_rank
+        except AttributeError:
+            pass
+
+    def unbind(self):
+        """ Overridden from the parent class to stop tracing.
+
+        """
+        super(TracingExpression, self).unbind()
+        self.subscribed = None
+
+    def get_sources(self):
+        """ Returns the (obj, name) pairs of the traits to which the
+        expression is bound, including the traced attributes.
+
+        """
+        sources = super(TracingExpression, self).get_sources()
+        return sources + tuple(self.subscribed or ())
 
 
 class DelegatingExpression(SimpleExpression):
@@ -365,26 +935,24 @@ class DelegatingExpression(SimpleExpression):
         obj = self.obj
         global_ns = self.get_globals()
         local_ns = self.get_locals()
+        deps = self.deps
 
         # There are two options for a delegating expression, those
         # of the form 'foo.bar' and those of the form 'foo'.
-        if isinstance(self.expr_ast.body, ast.Name):
-            pairs = parse_attr_names(self.expr_ast, obj, self.f_locals)
+        if deps.is_name:
+            pairs = parse_attr_names(deps.names, obj, self.f_locals)
             if len(pairs) != 1:
                 msg = 'Delegation expression does not resolve - lineno (%s)'
-                raise TypeError(msg % self.expr_ast.lineno)
+                raise TypeError(msg % deps.lineno)
             dlgt_attr_name, dlgt = pairs.pop()
         else:
-            # The attribute visitor parses the expression looking for any
-            # `foo.bar` style attribute sub-expressions. The results value
-            # is a list of ('foo', 'bar') style tuples.
-            visitor = AttributeVisitor()
-            visitor.visit(self.expr_ast)
-            deps = visitor.results()
-            if len(deps) > 1:
+            # The compiler has computed the `foo.bar` style attribute 
+            # sub-expressions as a tuple of ('foo', 'bar') style tuples.
+            attributes = deps.attributes
+            if len(attributes) > 1:
                 msg = 'Invalid expression for delegation - lineno (%s)'
-                raise TypeError(msg % self.expr_ast.lineno)
-            dlgt_name, dlgt_attr_name = deps[0]
+                raise TypeError(msg % deps.lineno)
+            dlgt_name, dlgt_attr_name = attributes[0]
             try:
                 dlgt = local_ns[dlgt_name]
             except KeyError:
@@ -400,6 +968,22 @@ class DelegatingExpression(SimpleExpression):
 
         obj.on_trait_change(self.update_delegate, self.attr)
 
+    def unbind(self):
+        """ Removes the notifiers from the delegate and the component.
+
+        """
+        try:
+            dlgt, dlgt_attr_name = self.lookup_info
+        except AttributeError:
+            return
+        if isinstance(dlgt, HasTraits):
+            dlgt.on_trait_change(self.update_object, dlgt_attr_name,
+                                 remove=True)
+        obj = self.obj
+        if obj is not None:
+            obj.on_trait_change(self.update_delegate, self.attr, remove=True)
+
+    @_profiled
     def update_object(self, val):
         """ The notification handler to update the component object.
 
@@ -430,6 +1014,7 @@ class DelegatingExpression(SimpleExpression):
                     with guard(self, dlgt_obj, dlgt_attr_name):
                         setattr(dlgt_obj, dlgt_attr_name, new_val)
 
+    @_profiled
     def update_delegate(self, val):
         """ The notification handler to update the delegate object.
 
@@ -464,8 +1049,15 @@ class NotifyingExpression(SimpleExpression):
     """ A concrete expression object that will eval an expression when
     the attribute on the object changes.
 
+    The notification path is kept lean since the handlers are often 
+    bound to high frequency changes: in the steady state, the only 
+    object created per notification is the `args` object. For an 
+    expression with nested scopes, which must be evaluated with eval,
+    the namespaces are allocated once and reused until the scopes are
+    invalidated.
+
     """
-    __slots__ = ()
+    __slots__ = ('scope', 'scope_globals')
 
     arguments = namedtuple('arguments', 'obj name old new')
 
@@ -477,15 +1069,232 @@ class NotifyingExpression(SimpleExpression):
         super(NotifyingExpression, self).bind()
         self.obj.on_trait_change(self.eval_expression, self.attr)
 
+    def unbind(self):
+        """ Removes the notifier from the component attribute.
+
+        """
+        obj = self.obj
+        if obj is not None:
+            obj.on_trait_change(self.eval_expression, self.attr, remove=True)
+        self.scope = self.scope_globals = None
+
+    @_profiled
     def eval_expression(self, obj, name, old, new):
         """ Overridden from the parent class to add the arguments object
         to the expression locals.
 
         """
-        args = self.arguments(obj, name, old, new)
-        f_globals = self.get_globals()
-        f_locals = self.get_locals()
-        f_locals.overrides = {'args': args}
-        val = eval(self.code, f_globals, f_locals)
-        return val
+        args = _tuple_new(self.arguments, (obj, name, old, new))
+        # The notifier is attached to the component of the expression,
+        # so the component is passed as the `obj` argument. An object 
+        # which is not a component takes the slower path through
+        # `get_function`, which copes with a missing scope generation.
+        try:
+            func = self.func
+            if (self.generation != obj._scope_generation or
+                self.global_generation != _scope_generation):
+                func = None
+        except AttributeError:
+            func = None
+        if func is None:
+            func = self.get_function(('args',))
+        if func is not None:
+            return func(args)
+        f_globals, f_locals = self.get_scope()
+        f_locals.overrides['args'] = args
+        f_locals.temp_locals.clear()
+        return eval(self.code, f_globals, f_locals)
+
+    def get_scope(self):
+        """ Returns the (globals, locals) namespaces in which to eval
+        an expression with nested scopes. They are created once and 
+        reused until the scopes are invalidated.
+
+        """
+        self.validate_scope()
+        f_locals = self.scope
+        if f_locals is None:
+            self.scope_globals = self.get_globals()
+            f_locals = self.scope = self.get_locals()
+            f_locals.overrides = {'args': None}
+        return (self.scope_globals, f_locals)
+
+    def clear_scope(self):
+        """ Overridden from the parent class to discard the namespaces.
+
+        """
+        super(NotifyingExpression, self).clear_scope()
+        self.scope = self.scope_globals = None
+
+
+#------------------------------------------------------------------------------
+# Rate Limited Expression Classes
+#------------------------------------------------------------------------------
+def _make_limiter(expression, callback):
+    """ Creates the rate limiter of the given callback for a rate limited
+    expression. If the toolkit does not provide an `invoke_timer` 
+    function, the callback is returned unchanged. The limiter measures
+    time with the `clock` of the toolkit, if it provides one, so that
+    it agrees with the timers.
+
+    """
+    toolkit = expression.toolkit
+    invoke_timer = toolkit.invoke_timer
+    if invoke_timer is None:
+        return callback
+    return expression.limiter_class(expression.interval, invoke_timer, 
+                                    callback, toolkit.clock)
+
+
+def _cancel_limiter(limiter):
+    """ Cancels the pending delivery of a rate limiter created by 
+    _make_limiter, if any.
+
+    """
+    cancel = getattr(limiter, 'cancel', None)
+    if cancel is not None:
+        cancel()
+
+
+class RateLimitedUpdatingExpression(UpdatingExpression):
+    """ An updating expression which limits the rate at which the
+    component is updated. Intermediate updates are dropped, and the
+    latest value is always delivered.
+
+    Subclasses must provide the `limiter_class`. The interval can be
+    changed by subclassing, or with the keyword arguments of
+    enaml.operators.operator_factory.
+
+    """
+    __slots__ = ('limiter',)
+
+    #: The rate limiter class from enaml.rate_limiting.
+    limiter_class = None
+
+    #: The interval of the rate limiter in milliseconds.
+    interval = 50
+
+    @_profiled
+    def update_object(self):
+        """ Overridden from the parent class to pass the update through
+        the rate limiter.
+
+        """
+        try:
+            limiter = self.limiter
+        except AttributeError:
+            update = super(RateLimitedUpdatingExpression, self).update_object
+            limiter = self.limiter = _make_limiter(self, update)
+        limiter()
+
+    def unbind(self):
+        """ Overridden from the parent class to cancel a pending update.
+
+        """
+        super(RateLimitedUpdatingExpression, self).unbind()
+        _cancel_limiter(getattr(self, 'limiter', None))
+
+
+class ThrottledUpdatingExpression(RateLimitedUpdatingExpression):
+    """ An updating expression which updates the component at most once
+    per interval.
+
+    """
+    __slots__ = ()
+
+    limiter_class = Throttle
+
+
+class DebouncedUpdatingExpression(RateLimitedUpdatingExpression):
+    """ An updating expression which updates the component once its
+    dependencies have stopped changing for an interval.
+
+    """
+    __slots__ = ()
+
+    limiter_class = Debounce
+
+    interval = 100
+
+
+class RateLimitedDelegatingExpression(DelegatingExpression):
+    """ A delegating expression which limits the rate at which the
+    changes are pushed in either direction. Intermediate values are
+    dropped, and the latest value is always delivered.
+
+    The changes caused by delivering a value to one side are not sent
+    back through the rate limiter of the other side, so a stale value
+    can never be echoed back after a delay.
+
+    """
+    __slots__ = ('object_limiter', 'delegate_limiter')
+
+    #: The rate limiter class from enaml.rate_limiting.
+    limiter_class = None
+
+    #: The interval of the rate limiters in milliseconds.
+    interval = 50
+
+    @_profiled
+    def update_object(self, val):
+        """ Overridden from the parent class to pass the update through
+        the rate limiter.
+
+        """
+        dlgt_obj, dlgt_attr_name = self.lookup_info
+        if guard.guarded(self, dlgt_obj, dlgt_attr_name):
+            return
+        try:
+            limiter = self.object_limiter
+        except AttributeError:
+            cls = RateLimitedDelegatingExpression
+            update = super(cls, self).update_object
+            limiter = self.object_limiter = _make_limiter(self, update)
+        limiter(val)
+
+    @_profiled
+    def update_delegate(self, val):
+        """ Overridden from the parent class to pass the update through
+        the rate limiter.
+
+        """
+        if guard.guarded(self.obj, self.attr):
+            return
+        try:
+            limiter = self.delegate_limiter
+        except AttributeError:
+            cls = RateLimitedDelegatingExpression
+            update = super(cls, self).update_delegate
+            limiter = self.delegate_limiter = _make_limiter(self, update)
+        limiter(val)
+
+    def unbind(self):
+        """ Overridden from the parent class to cancel the pending 
+        updates.
+
+        """
+        super(RateLimitedDelegatingExpression, self).unbind()
+        _cancel_limiter(getattr(self, 'object_limiter', None))
+        _cancel_limiter(getattr(self, 'delegate_limiter', None))
+
+
+class ThrottledDelegatingExpression(RateLimitedDelegatingExpression):
+    """ A delegating expression which pushes the changes at most once
+    per interval in each direction.
+
+    """
+    __slots__ = ()
+
+    limiter_class = Throttle
+
+
+class DebouncedDelegatingExpression(RateLimitedDelegatingExpression):
+    """ A delegating expression which pushes the changes once they have
+    stopped for an interval.
+
+    """
+    __slots__ = ()
+
+    limiter_class = Debounce
 
+    interval = 100
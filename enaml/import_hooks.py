@@ -2,29 +2,205 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import imp
+import marshal
 import os
+import struct
 import sys
 import types
 
 
+#: The name of the directory in which compiled enaml modules are cached.
+#: It is created alongside the .enaml source files.
+CACHE_DIR = '__enamlcache__'
+
+
+#: The file extension of the cached compiled enaml modules.
+CACHE_EXT = 'enamlc'
+
+
+def _cache_tag():
+    """ Returns the tag which identifies the Python implementation and
+    the version of the Enaml compiler in the cache file names.
+
+    """
+    from .parsing.enaml_compiler import COMPILER_VERSION
+    return 'enaml-py%d%d-v%d' % (sys.version_info[:2] + (COMPILER_VERSION,))
+
+
+def _cache_magic():
+    """ Returns the magic bytes which are written to the head of every
+    cache file. The magic number changes with the Python bytecode format
+    and with the version of the Enaml compiler.
+
+    """
+    from .parsing.enaml_compiler import COMPILER_VERSION
+    return imp.get_magic() + struct.pack('<i', COMPILER_VERSION)
+
+
+def _cache_header(source_stat):
+    """ Returns the header for a cache file created from a source file
+    with the given os.stat() result.
+
+    """
+    mtime = int(source_stat.st_mtime) & 0xFFFFFFFF
+    size = source_stat.st_size & 0xFFFFFFFF
+    return _cache_magic() + struct.pack('<II', mtime, size)
+
+
+def make_cache_path(enaml_path):
+    """ Returns the path of the cache file for the given .enaml file.
+
+    Given '/path/to/foo.enaml', the cache path will be of the form
+    '/path/to/__enamlcache__/foo.<tag>.enamlc'.
+
+    """
+    head, tail = os.path.split(enaml_path)
+    stem = os.path.splitext(tail)[0]
+    name = os.path.extsep.join((stem, _cache_tag(), CACHE_EXT))
+    return os.path.join(head, CACHE_DIR, name)
+
+
+def read_cache(cache_path, source_stat):
+    """ Reads the compiled code object from an enaml cache file.
+
+    Parameters
+    ----------
+    cache_path : string
+        The path to the cache file.
+
+    source_stat : stat result
+        The os.stat() result for the .enaml source file. The cache is 
+        only valid if it was created for a source file with the same
+        modification time and size.
+
+    Returns
+    -------
+    result : types.CodeType or None
+        The cached code object, or None if the cache file does not
+        exist or is stale.
+
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+    except (IOError, OSError):
+        return None
+    header = _cache_header(source_stat)
+    if not data.startswith(header):
+        return None
+    try:
+        code = marshal.loads(data[len(header):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(code, types.CodeType):
+        return None
+    return code
+
+
+def write_cache(cache_path, code, source_stat):
+    """ Writes a compiled code object to an enaml cache file.
+
+    Errors which occur while writing the cache are ignored, so that
+    enaml modules can still be imported from read-only locations.
+
+    Parameters
+    ----------
+    cache_path : string
+        The path to the cache file.
+
+    code : types.CodeType
+        The code object generated by the compiler.
+
+    source_stat : stat result
+        The os.stat() result for the .enaml source file.
+
+    Returns
+    -------
+    result : bool
+        Whether or not the cache file was written.
+
+    """
+    data = _cache_header(source_stat) + marshal.dumps(code)
+    cache_dir = os.path.dirname(cache_path)
+    tmp_path = '%s.%s' % (cache_path, os.getpid())
+    try:
+        if not os.path.isdir(cache_dir):
+            os.mkdir(cache_dir)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        # Write then rename so that a concurrent reader never sees a 
+        # partially written file. On Windows, rename cannot replace
+        # an existing file, so that file is removed first.
+        if os.name == 'nt' and os.path.exists(cache_path):
+            os.remove(cache_path)
+        os.rename(tmp_path, cache_path)
+    except (IOError, OSError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def compile_enaml(enaml_path):
+    """ Parses and compiles a .enaml file into a module code object.
+
+    """
+    from .parsing import parser
+    from .parsing.enaml_compiler import EnamlCompiler
+    with open(enaml_path) as f:
+        enaml_source = f.read()
+    ast = parser.parse(enaml_source)
+    return EnamlCompiler.compile_code(ast, enaml_path)
+
+
 class EnamlImporter(object):
     """ A sys.meta_path finder object for enaml modules.
 
     An instance of this class can be added to sys.meta_path to enable
     the import of enaml files using the normal Python import machinery.
 
+    Rather than probing for a .enaml file in every path entry on every
+    import, the finder keeps a cache of the .enaml module names in each
+    directory it has searched. A cached listing is revalidated against
+    the mtime of its directory at most once per installation of the
+    importer, so within a `with enaml.imports():` block the set of
+    .enaml files is assumed to be stable. If .enaml files are created
+    while the importer is installed, `invalidate_caches()` should be
+    called before importing them.
+
     """
 
     # Count the number of times this importer has been installed. Only uninstall
     # it when this count hits 0 again. This permits nesting.
     install_count = 0
 
+    #: The number of filesystem probes (calls to stat and listdir) that
+    #: have been performed by the finder. This is useful when diagnosing
+    #: slow imports.
+    probe_count = 0
+
+    #: A dictionary mapping a directory to a tuple of (mtime, generation,
+    #: names) where names is the frozenset of .enaml module names in the
+    #: directory and generation is the cache generation in which the
+    #: entry was last validated.
+    _dir_cache = {}
+
+    #: The current cache generation. This is incremented on every outer
+    #: installation of the importer, which forces the cached directory
+    #: listings to be revalidated against the directory mtimes.
+    _cache_generation = 0
+
     @classmethod
     def install(cls):
         """ Appends this importer into sys.meta_path.
 
         """
         cls.install_count += 1
+        if cls.install_count == 1:
+            cls._cache_generation += 1
         if cls not in sys.meta_path:
             sys.meta_path.append(cls)
     
@@ -37,6 +213,50 @@ class EnamlImporter(object):
         if cls.install_count <= 0 and cls in sys.meta_path:
             sys.meta_path.remove(cls)
 
+    @classmethod
+    def invalidate_caches(cls):
+        """ Clears the cached directory listings used by the finder.
+
+        """
+        cls._dir_cache.clear()
+
+    @classmethod
+    def enaml_names(cls, directory):
+        """ Returns the frozenset of .enaml module names which exist in
+        the given directory, using the cached listing when it is valid.
+
+        """
+        cache = cls._dir_cache
+        generation = cls._cache_generation
+        entry = cache.get(directory)
+        if entry is not None and entry[1] == generation:
+            return entry[2]
+
+        # An empty path entry refers to the current working directory
+        real_dir = directory or os.curdir
+        cls.probe_count += 1
+        try:
+            mtime = os.stat(real_dir).st_mtime
+        except OSError:
+            mtime = None
+            names = frozenset()
+        else:
+            if entry is not None and entry[0] == mtime:
+                names = entry[2]
+            else:
+                cls.probe_count += 1
+                try:
+                    listing = os.listdir(real_dir)
+                except OSError:
+                    listing = []
+                suffix = os.path.extsep + 'enaml'
+                n = len(suffix)
+                names = frozenset(
+                    name[:-n] for name in listing if name.endswith(suffix)
+                )
+        cache[directory] = (mtime, generation, names)
+        return names
+
     @classmethod
     def parse_enaml(cls, enaml_path):
         """ Returns the ast generated by the enaml parser.
@@ -60,11 +280,8 @@ class EnamlImporter(object):
         """
         # We're looking inside a package and 'path' the package path
         if path is not None:
-            stem = fullname.rsplit('.', 1)[-1] + os.path.extsep + 'enaml'
-            for root in path:
-                enaml_path = os.path.join(root, stem)
-                if os.path.exists(enaml_path):
-                    return cls(enaml_path)
+            stem = fullname.rsplit('.', 1)[-1]
+            roots = path
         
         # We're trying a load a package
         elif '.' in fullname:
@@ -72,11 +289,15 @@ class EnamlImporter(object):
         
         # We're doing a direct import
         else:
-            stem = fullname + os.path.extsep + 'enaml'
-            for root in sys.path:
-                enaml_path = os.path.join(root, stem)
-                if os.path.exists(enaml_path):
-                    return cls(enaml_path)
+            stem = fullname
+            roots = sys.path
+
+        for root in roots:
+            if not isinstance(root, basestring):
+                continue
+            if stem in cls.enaml_names(root):
+                enaml_path = os.path.join(root, stem + os.path.extsep + 'enaml')
+                return cls(enaml_path)
 
     def __init__(self, enaml_module_path):
         """ Initialize an importer object.
@@ -89,6 +310,25 @@ class EnamlImporter(object):
         """
         self.enaml_module_path = enaml_module_path
 
+    def get_code(self):
+        """ Returns the compiled code object for the enaml module. 
+        
+        The code object is loaded from the cache if a valid cache file
+        exists. Otherwise, the module is parsed and compiled and the 
+        result written to the cache, unless sys.dont_write_bytecode 
+        is set.
+
+        """
+        path = self.enaml_module_path
+        source_stat = os.stat(path)
+        cache_path = make_cache_path(path)
+        code = read_cache(cache_path, source_stat)
+        if code is None:
+            code = compile_enaml(path)
+            if not sys.dont_write_bytecode:
+                write_cache(cache_path, code, source_stat)
+        return code
+
     def load_module(self, fullname):
         """ Loads and returns the Python module for the given enaml path.
         The created module is added to sys.modules.
@@ -97,10 +337,11 @@ class EnamlImporter(object):
         mod = sys.modules.setdefault(fullname, types.ModuleType(fullname))
         path = self.enaml_module_path
         mod.__path__ = path
+        mod.__file__ = path
         mod.__loader__ = self
         
-        from .parsing.enaml_compiler import EnamlCompiler
-        EnamlCompiler.compile(self.parse_enaml(path), mod.__dict__)
+        code = self.get_code()
+        exec code in mod.__dict__
         
         return mod
 
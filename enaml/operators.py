@@ -3,24 +3,41 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 from .expressions import (SimpleExpression, UpdatingExpression, 
-                          DelegatingExpression, NotifyingExpression)
+                          DelegatingExpression, NotifyingExpression,
+                          TracingExpression, ThrottledUpdatingExpression,
+                          DebouncedUpdatingExpression, 
+                          ThrottledDelegatingExpression, 
+                          DebouncedDelegatingExpression)
 from .widgets.setup_hooks import ExpressionSetupHook
 
 
-def operator_factory(expression_class, eval_default=True):
+def operator_factory(expression_class, eval_default=True, **attrs):
     """ A factory function which creates an Enaml operator function 
     for an implementor of enaml.expresssions.AbstractExpression. The
     created operator will setup an appropriate SetupHook for the 
     component so that the expression is properly bound at run time.
 
+    Any extra keyword arguments override the class attributes of the
+    expression class, such as the `interval` of the rate limited 
+    expressions. For example, a toolkit can throttle '<|' to 60Hz with:
+
+        toolkit['__operator_LessBar__'] = operator_factory(
+            ThrottledUpdatingExpression, interval=16,
+        )
+
     """
-    def operator(component, attr, ast, code, f_globals, toolkit, f_locals):
+    if attrs:
+        attrs['__slots__'] = ()
+        name = expression_class.__name__
+        expression_class = type(name, (expression_class,), attrs)
+
+    def operator(component, attr, deps, code, f_globals, toolkit, f_locals):
         """ The default Enaml expression operator. It uses an implementor
         of AbstractExpression to bind a python expression to a component
         at run time.
 
         """
-        expression = expression_class(component, attr, ast, code,
+        expression = expression_class(component, attr, deps, code,
                                       f_globals, toolkit, f_locals)
         hook = ExpressionSetupHook(attr, expression, eval_default)
         component.setup_hooks.append(hook)
@@ -33,11 +50,28 @@ def operator_factory(expression_class, eval_default=True):
 #:    '<<' : A dynamically updating expression
 #:    ':=' : A dynamically delegating expression
 #:    '>>' : A dynamically notifying expression
+#:    '<|' : A throttled updating expression
+#:    '<-' : A debounced updating expression
+#:    '|=' : A throttled delegating expression
+#:    '&=' : A debounced delegating expression
 #:
 OPERATORS = {
     '__operator_Equal__': operator_factory(SimpleExpression),
     '__operator_LessLess__': operator_factory(UpdatingExpression),
     '__operator_ColonEqual__': operator_factory(DelegatingExpression),
     '__operator_GreaterGreater__': operator_factory(NotifyingExpression, False),
+    '__operator_LessBar__': operator_factory(ThrottledUpdatingExpression),
+    '__operator_LessMinus__': operator_factory(DebouncedUpdatingExpression),
+    '__operator_BarEqual__': operator_factory(ThrottledDelegatingExpression),
+    '__operator_AmperEqual__': operator_factory(DebouncedDelegatingExpression),
 }
 
+
+#: The builtin Enaml expression operators with dependency tracing enabled
+#: for the '<<' operator. A toolkit opts in to tracing by updating itself
+#: with these operators:
+#:
+#:     toolkit.update(TRACING_OPERATORS)
+#:
+TRACING_OPERATORS = dict(OPERATORS)
+TRACING_OPERATORS['__operator_LessLess__'] = operator_factory(TracingExpression)
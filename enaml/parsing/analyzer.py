@@ -3,6 +3,7 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 import ast
+from collections import namedtuple
 
 
 class AttributeVisitor(ast.NodeVisitor):
@@ -27,3 +28,43 @@ class AttributeVisitor(ast.NodeVisitor):
         return list(self.deps)
 
 
+
+
+#: The static dependency description of a bound expression, computed
+#: once by the compiler. 'names' is the tuple of names referenced by 
+#: the expression, 'attributes' is the tuple of ('foo', 'bar') pairs 
+#: for the `foo.bar` style sub-expressions, 'is_name' indicates whether
+#: the expression is a single name, and 'lineno' is the line number of
+#: the expression.
+Dependencies = namedtuple('Dependencies', 'names attributes is_name lineno')
+
+
+def analyze_dependencies(py_ast):
+    """ Analyzes the ast of a bound expression and returns its static
+    dependency description.
+
+    Parameters
+    ----------
+    py_ast : ast.Expression
+        The ast of the bound expression.
+
+    Returns
+    -------
+    result : tuple
+        A plain tuple of the (names, attributes, is_name, lineno) fields
+        of a Dependencies object. A plain tuple is returned so that it 
+        may be stored as a constant in a marshallable code object.
+
+    """
+    names = []
+    seen = set()
+    for node in ast.walk(py_ast):
+        if isinstance(node, ast.Name) and node.id not in seen:
+            seen.add(node.id)
+            names.append(node.id)
+    visitor = AttributeVisitor()
+    visitor.visit(py_ast)
+    attributes = tuple(sorted(visitor.results()))
+    is_name = isinstance(py_ast.body, ast.Name)
+    lineno = getattr(py_ast, 'lineno', None)
+    return (tuple(names), attributes, is_name, lineno)
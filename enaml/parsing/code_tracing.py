@@ -0,0 +1,69 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Bytecode rewriting which allows the attribute accesses performed by
+an expression to be traced at run time.
+
+"""
+from . import byteplay
+
+
+#: The name under which the tracer object is looked up by traced code.
+#: It is not a valid Python identifier, so it cannot clash with a name
+#: used in the expression.
+TRACER_NAME = '_[tracer]'
+
+
+#: A cache of the traced versions of the code objects which have been
+#: passed to inject_tracing.
+_traced_code = {}
+
+
+def inject_tracing(code):
+    """ Returns a version of an expression code object in which every
+    attribute access is routed through the tracer object.
+
+    Each `LOAD_ATTR name` in the code is replaced by a call to the
+    `load_attr(obj, name)` method of the object found under TRACER_NAME
+    in the namespace of the expression. That method must return the
+    value of the attribute. The code must be evaluated with a locals
+    mapping which provides the tracer. The code objects of any nested
+    scopes in the expression (lambdas and generator expressions) are
+    not rewritten.
+
+    The rewritten code objects are cached, so calling this function
+    repeatedly with the same code object is cheap.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The code object for an expression compiled in 'eval' mode.
+
+    Returns
+    -------
+    result : types.CodeType
+        The traced version of the code object.
+
+    """
+    try:
+        return _traced_code[code]
+    except KeyError:
+        pass
+    bp = byteplay
+    bp_code = bp.Code.from_code(code)
+    new_ops = []
+    for op, arg in bp_code.code:
+        if op == bp.LOAD_ATTR:
+            new_ops.extend([
+                (bp.LOAD_NAME, TRACER_NAME),
+                (bp.LOAD_ATTR, 'load_attr'),
+                (bp.ROT_TWO, None),
+                (bp.LOAD_CONST, arg),
+                (bp.CALL_FUNCTION, 2),
+            ])
+        else:
+            new_ops.append((op, arg))
+    bp_code.code = new_ops
+    traced = _traced_code[code] = bp_code.to_code()
+    return traced
@@ -0,0 +1,151 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Runtime support for the code generated by the Enaml compiler.
+
+The code objects generated by the Enaml compiler must be serializable
+with the marshal module so that they can be cached on disk. This means
+they cannot hold references to arbitrary Python objects as constants.
+Instead, the generated code imports the COMPILER_HELPERS dictionary
+into the module namespace and looks up the runtime helpers from there.
+
+"""
+from functools import wraps
+
+from .. import imports
+from ..expressions import ExpressionLocals
+from ..toolkit import Toolkit
+from .analyzer import Dependencies
+
+
+#: The name under which the compiler helpers are stored in the global
+#: namespace of a compiled Enaml module.
+HELPERS_NAME = '__enaml_helpers__'
+
+
+#: The name under which the table of binding expression dependencies is
+#: stored in the global namespace of a compiled Enaml module.
+DEPS_NAME = '__enaml_deps__'
+
+
+#------------------------------------------------------------------------------
+# Runtime Helpers
+#------------------------------------------------------------------------------
+def _load_deps(table):
+    """ A compiler runtime function which converts the table of binding
+    expression dependencies into Dependencies objects when a compiled 
+    module is executed.
+
+    """
+    return tuple(Dependencies(*item) for item in table)
+
+
+def _add_children(obj, iterable):
+    """ A compiler runtime function which adds the return values of a
+    call in an enaml body as children of the given object.
+
+    """
+    add_child = obj.add_child
+    for item in iterable:
+        add_child(item)
+
+
+def _make_declaration(func):
+    """ Wraps a generated declaration function in a wrapper which creates
+    the identifier scope if necessary, and loads the active toolkit if
+    necessary.
+
+    """
+    @wraps(func)
+    def wrapper(identifiers=None, toolkit=None):
+        if identifiers is None:
+            identifiers = {}
+        if toolkit is None:
+            toolkit = Toolkit.active_toolkit()
+        return func(identifiers, toolkit)
+    return wrapper
+
+
+_missing = object()
+
+
+def _lookup_names(names, toolkit, f_globals, f_locals=None):
+    """ A compiler runtime function which resolves the names of the 
+    base types, child types, defns, and operators used by a declaration
+    or defn.
+
+    Each name is resolved as if it were evaluated with the toolkit as 
+    the globals and the module namespace (or the given locals, followed
+    by the module namespace) as the locals. The module and local 
+    namespaces are read directly, and the toolkit and builtin namespaces
+    are resolved through the cache maintained by the toolkit.
+
+    """
+    values = list(toolkit.lookup(names, _missing))
+    for index, name in enumerate(names):
+        if f_locals is not None and name in f_locals:
+            values[index] = f_locals[name]
+        elif name in f_globals:
+            values[index] = f_globals[name]
+        elif values[index] is _missing:
+            raise NameError('name %r is not defined' % name)
+    return values
+
+
+class _DefnCollector(object):
+    """ A simple object which collects the children created by a defn.
+
+    """
+    def __init__(self):
+        self.children = []
+
+    def add_child(self, child):
+        self.children.append(child)
+
+    def get_children(self):
+        return tuple(self.children)
+
+
+def _exec_python(code, f_globals, lineno):
+    """ A compiler runtime function which executes a chunk of raw
+    Python code in the namespace of the module.
+
+    """
+    try:
+        exec code in f_globals
+    except Exception as e:
+        msg = ('Unable to evaluate raw Python code on lineno %s. '
+               'Original exception was %s.')
+        exc_type = type(e)
+        raise exc_type(msg % (lineno, e))
+
+
+def _exec_import(code, f_globals, lineno):
+    """ A compiler runtime function which executes an import statement
+    with the enaml import hook in-place.
+
+    """
+    with imports():
+        try:
+            exec code in f_globals
+        except Exception as e:
+            msg = ('Unable to evaluate import on lineno %s. '
+                   'Original exception was %s.')
+            exc_type = type(e)
+            raise exc_type(msg % (lineno, e))
+
+
+#: The runtime helpers available to code generated by the compiler.
+COMPILER_HELPERS = {
+    'eval': eval,
+    'lookup_names': _lookup_names,
+    'add_children': _add_children,
+    'make_declaration': _make_declaration,
+    'defn_collector': _DefnCollector,
+    'expression_locals': ExpressionLocals,
+    'active_toolkit': Toolkit.active_toolkit,
+    'exec_python': _exec_python,
+    'exec_import': _exec_import,
+    'load_deps': _load_deps,
+}
@@ -2,15 +2,19 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import ast
 import itertools
-from functools import wraps
-import types
 
 from . import enaml_ast
 from . import byteplay
+from .analyzer import analyze_dependencies
+from .compiler_helpers import HELPERS_NAME, DEPS_NAME
 
-from .. import imports
-from ..toolkit import Toolkit
+
+#: The version of the code generated by the compiler. This must be
+#: incremented whenever the generated code changes in a way which is
+#: incompatible with code that was generated and cached previously.
+COMPILER_VERSION = 4
 
 
 #------------------------------------------------------------------------------
@@ -43,16 +47,6 @@ class _NodeVisitor(object):
 #------------------------------------------------------------------------------
 # Compiler Helpers
 #------------------------------------------------------------------------------
-def _compiler_add_children(obj, iterable):
-    """ A compiler runtime function which adds the return values of a
-    call in an enaml body as children of the given object.
-
-    """
-    add_child = obj.add_child
-    for item in iterable:
-        add_child(item)
-
-
 def _var_name_generator():
     """ Returns a generator that generates sequential variable names for
     use in a code block.
@@ -63,36 +57,141 @@ def _var_name_generator():
         yield '_var_' + str(count.next())
 
 
-def _decl_wrapper_gen(func):
-    """ Wraps a generated declaration function in a wrapper which creates
-    the identifier scope if necessary, and loads the active toolkit if
-    necessary.
+def _load_helper(name):
+    """ Returns the list of byteplay ops which load the compiler helper
+    of the given name onto the top of the stack. See the module
+    enaml.parsing.compiler_helpers for the available helpers.
+
+    """
+    bp = byteplay
+    return [
+        (bp.LOAD_GLOBAL, HELPERS_NAME),
+        (bp.LOAD_CONST, name),
+        (bp.BINARY_SUBSCR, None),
+    ]
+
+
+def _lookup_names(names, in_defn=False):
+    """ Returns the list of byteplay ops which resolve the given names
+    using the 'lookup_names' compiler helper and store the results in
+    the fast locals returned by _name_local. If `in_defn` is True, the
+    locals of the defn are searched before the module globals.
+
+    """
+    bp = byteplay
+    ops = _load_helper('lookup_names')
+    ops.extend([
+        (bp.LOAD_CONST, tuple(names)),
+        (bp.LOAD_FAST, 'toolkit'),
+        (bp.LOAD_FAST, 'f_globals'),
+    ])
+    if in_defn:
+        ops.extend([
+            (bp.LOAD_FAST, 'f_locals'),
+            (bp.CALL_FUNCTION, 0x0004),
+        ])
+    else:
+        ops.append((bp.CALL_FUNCTION, 0x0003))
+    ops.append((bp.UNPACK_SEQUENCE, len(names)))
+    for index in range(len(names)):
+        ops.append((bp.STORE_FAST, _name_local(index)))
+    return ops
+
+
+def _name_local(index):
+    """ Returns the name of the fast local which holds the value of the
+    resolved name at the given index.
 
     """
-    @wraps(func)
-    def wrapper(identifiers=None, toolkit=None):
-        if identifiers is None:
-            identifiers = {}
-        if toolkit is None:
-            toolkit = Toolkit.active_toolkit()
-        return func(identifiers, toolkit)
-    return wrapper
+    return '_name_' + str(index)
+
+
+def _load_deps(index):
+    """ Returns the list of byteplay ops which load the dependencies of
+    the binding at the given index in the module's dependency table onto
+    the top of the stack.
+
+    """
+    bp = byteplay
+    return [
+        (bp.LOAD_GLOBAL, DEPS_NAME),
+        (bp.LOAD_CONST, index),
+        (bp.BINARY_SUBSCR, None),
+    ]
 
 
 #------------------------------------------------------------------------------
-# Declaration Compiler
+# Base Compiler
 #------------------------------------------------------------------------------
-class DeclarationCompiler(_NodeVisitor):
-    """ A visitor which compiles a Declaration node into a code object.
+class _BaseCompiler(_NodeVisitor):
+    """ The base class of the Declaration and Defn compilers, which 
+    manages the dependency table of the module and the names which are
+    resolved by the generated code.
 
     """
-    def __init__(self):
+    def __init__(self, deps):
         self.ops = []
         self.name_gen = _var_name_generator()
         self.name_stack = []
+        self.deps = deps
+        self.names = {}
+        self.names_index = 0
+
+    def add_deps(self, expr_ast):
+        """ Analyzes the dependencies of a binding expression ast, adds
+        them to the module's dependency table, and returns their index 
+        in the table.
+
+        """
+        deps = self.deps
+        deps.append(analyze_dependencies(expr_ast))
+        return len(deps) - 1
+
+    def load_name(self, name):
+        """ Returns the byteplay op which loads the resolved value of the
+        given name. The distinct names used by the code are resolved 
+        once, at the point given by `names_index`, when the code is run.
+
+        """
+        names = self.names
+        if name not in names:
+            names[name] = len(names)
+        return (byteplay.LOAD_FAST, _name_local(names[name]))
+
+    def lookup_names_ops(self, in_defn=False):
+        """ Returns the list of byteplay ops which resolve the names 
+        loaded by the code.
+
+        """
+        names = self.names
+        if not names:
+            return []
+        ordered = sorted(names, key=names.get)
+        return _lookup_names(ordered, in_defn)
+
 
+#------------------------------------------------------------------------------
+# Declaration Compiler
+#------------------------------------------------------------------------------
+class DeclarationCompiler(_BaseCompiler):
+    """ A visitor which compiles a Declaration node into a code object.
+
+    """
     @classmethod
-    def compile(cls, node):
+    def compile(cls, node, deps):
+        """ Compiles the given Declaration node into a code object.
+
+        Parameters
+        ----------
+        node : Instance(enaml_ast.Declaration)
+            The declaration node to compile.
+
+        deps : list
+            The module's table of binding expression dependencies. The
+            dependencies of the bindings in the declaration are appended
+            to this list.
+
+        """
         #----------------------------------------------------------------------
         # Given this sample declaration:
         #   
@@ -102,28 +201,33 @@ class DeclarationCompiler(_NodeVisitor):
         #             text = 'clickme'
         #
         # We generate bytecode that would correspond to a function that 
-        # looks similar to this:
+        # looks similar to this, where lookup_names is the compiler helper
+        # which resolves names through the module and the toolkit:
         #
         #     def FooWindow(identifiers, toolkit):
         #         f_globals = globals()
-        #         foo = eval('Window', toolkit, f_globals)(identifiers, 
-        #                                                  toolkit)
+        #         _name_0, _name_1, _name_2 = lookup_names(
+        #             ('Window', '__operator_Equal__', 'PushButton'),
+        #             toolkit, f_globals,
+        #         )
+        #         foo = _name_0(identifiers, toolkit)
         #         identifiers['foo'] = foo
-        #         op = eval('__operator_Equal__', toolkit, f_globals)
-        #         op(foo, 'a', <ast for '12'>, <code for '12'>, 
+        #         op = _name_1
+        #         op(foo, 'a', <deps for '12'>, <code for '12'>, 
         #            f_globals, identifiers)
-        #         button = eval('PushButton', toolkit, f_globals)(identifiers, 
-        #                                                         toolkit)
+        #         button = _name_2(None, toolkit)
         #         identifiers['button'] = button
-        #         op = eval('__operator_Equal__', toolkit, f_globals)
-        #         op(item, 'text', <ast for 'clickme'>, <code for 'clickme'>, 
+        #         op = _name_1
+        #         op(item, 'text', <deps for 'clickme'>, <code for 'clickme'>, 
         #            f_globals, identifiers)
         #         foo.add_child(button)
         #         return foo
         #----------------------------------------------------------------------
-        compiler = cls()
+        compiler = cls(deps)
         compiler.visit(node)
         ops = compiler.ops
+        index = compiler.names_index
+        ops[index:index] = compiler.lookup_names_ops()
         code = byteplay.Code(ops, [], ['identifiers', 'toolkit'], False, False,
                              True, node.name, 'Enaml', node.lineno, node.doc)
         return code.to_code()
@@ -145,13 +249,26 @@ class DeclarationCompiler(_NodeVisitor):
             (bp.LOAD_GLOBAL, 'globals'),
             (bp.CALL_FUNCTION, 0x0000),
             (bp.STORE_FAST, 'f_globals'),
+        ])
 
-            # foo = eval('Window', toolkit, f_globals)(identifiers, toolkit)
-            (bp.LOAD_CONST, eval),
-            (bp.LOAD_CONST, node.base.code),
-            (bp.LOAD_FAST, 'toolkit'),
-            (bp.LOAD_FAST, 'f_globals'),
-            (bp.CALL_FUNCTION, 0x0003),
+        # The names used by the declaration are resolved at this point
+        self.names_index = len(ops)
+
+        # foo = <resolved 'Window'>(identifiers, toolkit)
+        #
+        # A base which is not a simple name is evaluated instead.
+        base_expr = node.base.py_ast.body
+        if isinstance(base_expr, ast.Name):
+            ops.append(self.load_name(base_expr.id))
+        else:
+            ops.extend(_load_helper('eval'))
+            ops.extend([
+                (bp.LOAD_CONST, node.base.code),
+                (bp.LOAD_FAST, 'toolkit'),
+                (bp.LOAD_FAST, 'f_globals'),
+                (bp.CALL_FUNCTION, 0x0003),
+            ])
+        ops.extend([
             (bp.LOAD_FAST, 'identifiers'),
             (bp.LOAD_FAST, 'toolkit'),
             (bp.CALL_FUNCTION, 0x0002),
@@ -188,26 +305,24 @@ class DeclarationCompiler(_NodeVisitor):
         ops = self.ops
         name_stack = self.name_stack
 
-        # Grab the ast and code object for the expression. These will
-        # be passed to the binding operator.
+        # Grab the ast and code object for the expression. The ast is
+        # analyzed for the dependencies of the expression, which are 
+        # passed to the binding operator along with the code.
         expr_ast = node.binding.expr.py_ast
         expr_code = node.binding.expr.code
-        op_code = compile(node.binding.op, 'Enaml', mode='eval')
 
         # A binding is accomplished by loading the appropriate binding
         # operator function and passing it the a number of arguments:
         #
-        # op = eval('__operator_Equal__', toolkit, f_globals)
-        # op(item, 'a', <ast>, <code>, f_globals, toolkit, identifiers)
+        # op = <resolved '__operator_Equal__'>
+        # op(item, 'a', <deps>, <code>, f_globals, toolkit, identifiers)
+        ops.append(self.load_name(node.binding.op))
         ops.extend([
-            (bp.LOAD_CONST, eval),
-            (bp.LOAD_CONST, op_code),
-            (bp.LOAD_FAST, 'toolkit'),
-            (bp.LOAD_FAST, 'f_globals'),
-            (bp.CALL_FUNCTION, 0x0003),
             (bp.LOAD_FAST, name_stack[-1]),
             (bp.LOAD_CONST, node.name),
-            (bp.LOAD_CONST, expr_ast),
+        ])
+        ops.extend(_load_deps(self.add_deps(expr_ast)))
+        ops.extend([
             (bp.LOAD_CONST, expr_code),
             (bp.LOAD_FAST, 'f_globals'),
             (bp.LOAD_FAST, 'toolkit'),
@@ -230,13 +345,8 @@ class DeclarationCompiler(_NodeVisitor):
         name = self.name_gen.next()
         name_stack.append(name)
 
-        op_code = compile(node.name, 'Enaml', mode='eval')
+        ops.append(self.load_name(node.name))
         ops.extend([
-            (bp.LOAD_CONST, eval),
-            (bp.LOAD_CONST, op_code),
-            (bp.LOAD_FAST, 'toolkit'),
-            (bp.LOAD_FAST, 'f_globals'),
-            (bp.CALL_FUNCTION, 0x0003),
             # When instantiating a Declaration, it is called without
             # identifiers, so that it creates it's own new identifier
             # scope. This means that derived declarations share ids,
@@ -287,14 +397,7 @@ class DeclarationCompiler(_NodeVisitor):
         # return values.
         #
         # SomeDefn(foo, bar, baz=12)
-        op_code = compile(node.name, 'Enaml', mode='eval')
-        ops.extend([
-            (bp.LOAD_CONST, eval),
-            (bp.LOAD_CONST, op_code),
-            (bp.LOAD_FAST, 'toolkit'),
-            (bp.LOAD_FAST, 'f_globals'),
-            (bp.CALL_FUNCTION, 0x0003),
-        ])
+        ops.append(self.load_name(node.name))
 
         n_args = 0
         n_kwargs = 0
@@ -306,8 +409,8 @@ class DeclarationCompiler(_NodeVisitor):
                 ops.append((bp.LOAD_CONST, arg.name))
                 n_kwargs += 1
                 arg_code = arg.argument.code
+            ops.extend(_load_helper('eval'))
             ops.extend([
-                (bp.LOAD_CONST, eval),
                 (bp.LOAD_CONST, arg_code),
                 (bp.LOAD_FAST, 'toolkit'),
                 (bp.LOAD_FAST, 'f_globals'),
@@ -320,7 +423,9 @@ class DeclarationCompiler(_NodeVisitor):
         # at the cost of a very small overhead.
         ops.extend([
             (bp.CALL_FUNCTION, (n_kwargs << 8) + n_args),
-            (bp.LOAD_CONST, _compiler_add_children),
+        ])
+        ops.extend(_load_helper('add_children'))
+        ops.extend([
             (bp.ROT_THREE, None),
             (bp.CALL_FUNCTION, 0x0002),
             (bp.POP_TOP, None),
@@ -330,30 +435,15 @@ class DeclarationCompiler(_NodeVisitor):
 #------------------------------------------------------------------------------
 # Defn Compiler
 #------------------------------------------------------------------------------
-class _DefnCollector(object):
-
-    def __init__(self):
-        self.children = []
-    
-    def add_child(self, child):
-        self.children.append(child)
-
-    def get_children(self):
-        return tuple(self.children)
-
-
-class DefnCompiler(_NodeVisitor):
-
-    def __init__(self):
-        self.ops = []
-        self.name_gen = _var_name_generator()
-        self.name_stack = []
+class DefnCompiler(_BaseCompiler):
 
     @classmethod
-    def compile(cls, node):
-        compiler = cls()
+    def compile(cls, node, deps):
+        compiler = cls(deps)
         compiler.visit(node)
         ops = compiler.ops
+        index = compiler.names_index
+        ops[index:index] = compiler.lookup_names_ops(in_defn=True)
         code = byteplay.Code(ops, [], node.parameters.names, False, False,
                              True, node.name, 'Enaml', node.lineno, node.doc)
         return code.to_code()
@@ -372,9 +462,8 @@ class DefnCompiler(_NodeVisitor):
         #     identifiers.update(f_locals)
         #     f_globals = globals()
         #     toolkit = Toolkit.active_toolkit()
-        #     merged_globals = {}
-        #     merged_globals.update(toolkit)
-        #     merged_globals.update(f_globals)
+        #     scope = ExpressionLocals(None, f_locals, None, f_globals, 
+        #                              toolkit)
         #     root = _DefnCollector()
         ops.extend([
             # f_locals = locals()
@@ -396,30 +485,36 @@ class DefnCompiler(_NodeVisitor):
             (bp.LOAD_GLOBAL, 'globals'),
             (bp.CALL_FUNCTION, 0x0000),
             (bp.STORE_FAST, 'f_globals'),
+        ])
 
-            # toolkit = Toolkit.active_toolkit()
-            (bp.LOAD_CONST, Toolkit),
-            (bp.LOAD_ATTR, 'active_toolkit'),
+        # toolkit = Toolkit.active_toolkit()
+        ops.extend(_load_helper('active_toolkit'))
+        ops.extend([
             (bp.CALL_FUNCTION, 0x0000),
             (bp.STORE_FAST, 'toolkit'),
+        ])
 
-            # eval_globals = {}
-            # eval_globals.update(toolkit)
-            # eval_globals.update(f_globals)
-            (bp.BUILD_MAP, 0),
-            (bp.DUP_TOP, None),
-            (bp.LOAD_ATTR, 'update'),
-            (bp.DUP_TOP, None),
-            (bp.LOAD_FAST, 'toolkit'),
-            (bp.CALL_FUNCTION, 0x0001),
-            (bp.POP_TOP, None),
+        # scope = ExpressionLocals(None, f_locals, None, f_globals, toolkit)
+        #
+        # The scope layers the defn locals and the toolkit over the module
+        # globals without copying any of the namespaces.
+        ops.extend(_load_helper('expression_locals'))
+        ops.extend([
+            (bp.LOAD_CONST, None),
+            (bp.LOAD_FAST, 'f_locals'),
+            (bp.LOAD_CONST, None),
             (bp.LOAD_FAST, 'f_globals'),
-            (bp.CALL_FUNCTION, 0x0001),
-            (bp.POP_TOP, None),
-            (bp.STORE_FAST, 'merged_globals'),
+            (bp.LOAD_FAST, 'toolkit'),
+            (bp.CALL_FUNCTION, 0x0005),
+            (bp.STORE_FAST, 'scope'),
+        ])
+
+        # The names used by the defn are resolved at this point
+        self.names_index = len(ops)
 
-            # root = _DefnCollector()
-            (bp.LOAD_CONST, _DefnCollector),
+        # root = _DefnCollector()
+        ops.extend(_load_helper('defn_collector'))
+        ops.extend([
             (bp.CALL_FUNCTION, 0x0000),
             (bp.STORE_FAST, name),
         ])
@@ -446,26 +541,24 @@ class DefnCompiler(_NodeVisitor):
         ops = self.ops
         name_stack = self.name_stack
 
-        # Grab the ast and code object for the expression. These will
-        # be passed to the binding operator.
+        # Grab the ast and code object for the expression. The ast is
+        # analyzed for the dependencies of the expression, which are 
+        # passed to the binding operator along with the code.
         expr_ast = node.binding.expr.py_ast
         expr_code = node.binding.expr.code
-        op_code = compile(node.binding.op, 'Enaml', mode='eval')
 
         # A binding is accomplished by loading the appropriate binding
         # operator function and passing it the a number of arguments:
         #
-        # op = eval('__operator_Equal__', merged_globals, f_locals)
-        # op(item, 'a', <ast>, <code>, f_globals, toolkit, identifiers)
+        # op = <resolved '__operator_Equal__'>
+        # op(item, 'a', <deps>, <code>, f_globals, toolkit, identifiers)
+        ops.append(self.load_name(node.binding.op))
         ops.extend([
-            (bp.LOAD_CONST, eval),
-            (bp.LOAD_CONST, op_code),
-            (bp.LOAD_FAST, 'merged_globals'),
-            (bp.LOAD_FAST, 'f_locals'),
-            (bp.CALL_FUNCTION, 0x0003),
             (bp.LOAD_FAST, name_stack[-1]),
             (bp.LOAD_CONST, node.name),
-            (bp.LOAD_CONST, expr_ast),
+        ])
+        ops.extend(_load_deps(self.add_deps(expr_ast)))
+        ops.extend([
             (bp.LOAD_CONST, expr_code),
             (bp.LOAD_FAST, 'f_globals'),
             (bp.LOAD_FAST, 'toolkit'),
@@ -488,14 +581,9 @@ class DefnCompiler(_NodeVisitor):
         name = self.name_gen.next()
         name_stack.append(name)
 
-        op_code = compile(node.name, 'Enaml', mode='eval')
+        # item = <resolved 'Foo'>(None, toolkit)
+        ops.append(self.load_name(node.name))
         ops.extend([
-            # item = eval('Foo', merged_globals, f_locals)(None, toolkit)
-            (bp.LOAD_CONST, eval),
-            (bp.LOAD_CONST, op_code),
-            (bp.LOAD_FAST, 'merged_globals'),
-            (bp.LOAD_FAST, 'f_locals'),
-            (bp.CALL_FUNCTION, 0x0003),
             (bp.LOAD_CONST, None),
             (bp.LOAD_FAST, 'toolkit'),
             (bp.CALL_FUNCTION, 0x0002),
@@ -542,14 +630,7 @@ class DefnCompiler(_NodeVisitor):
         # return values.
         #
         # SomeDefn(foo, bar, baz=12)
-        op_code = compile(node.name, 'Enaml', mode='eval')
-        ops.extend([
-            (bp.LOAD_CONST, eval),
-            (bp.LOAD_CONST, op_code),
-            (bp.LOAD_FAST, 'merged_globals'),
-            (bp.LOAD_FAST, 'f_locals'),
-            (bp.CALL_FUNCTION, 0x0003),
-        ])
+        ops.append(self.load_name(node.name))
 
         n_args = 0
         n_kwargs = 0
@@ -561,11 +642,11 @@ class DefnCompiler(_NodeVisitor):
                 ops.append((bp.LOAD_CONST, arg.name))
                 n_kwargs += 1
                 arg_code = arg.argument.code
+            ops.extend(_load_helper('eval'))
             ops.extend([
-                (bp.LOAD_CONST, eval),
                 (bp.LOAD_CONST, arg_code),
-                (bp.LOAD_FAST, 'merged_globals'),
-                (bp.LOAD_FAST, 'f_locals'),
+                (bp.LOAD_FAST, 'f_globals'),
+                (bp.LOAD_FAST, 'scope'),
                 (bp.CALL_FUNCTION, 0x0003),
             ])
         
@@ -575,7 +656,9 @@ class DefnCompiler(_NodeVisitor):
         # at the cost of a very small overhead.
         ops.extend([
             (bp.CALL_FUNCTION, (n_kwargs << 8) + n_args),
-            (bp.LOAD_CONST, _compiler_add_children),
+        ])
+        ops.extend(_load_helper('add_children'))
+        ops.extend([
             (bp.ROT_THREE, None),
             (bp.CALL_FUNCTION, 0x0002),
             (bp.POP_TOP, None),
@@ -590,7 +673,10 @@ class EnamlCompiler(_NodeVisitor):
     
     The entry point is the `compile` classmethod which will compile
     the ast into an appropriate python object and place the results 
-    in the provided module dictionary.
+    in the provided module dictionary. The `compile_code` classmethod
+    can be used to retrieve the code object for the module instead.
+    The generated code object holds only marshallable constants so 
+    that it may be cached on disk.
 
     """
     @classmethod
@@ -607,30 +693,91 @@ class EnamlCompiler(_NodeVisitor):
             compiling the enaml code.
         
         """
-        compiler = cls(module_dict)
-        compiler.visit(module_ast)
+        code = cls.compile_code(module_ast)
+        exec code in module_dict
 
-    def __init__(self, module_dict):
-        """ Initialize a compiler instance.
+    @classmethod
+    def compile_code(cls, module_ast, filename='Enaml'):
+        """ Compiles an enaml module ast node into a Python code object
+        which populates a module namespace when executed.
 
         Parameters
         ----------
-        module_dict : dict
-            The module dictionary into which the compiled objects are 
-            placed.
+        module_ast : Instance(enaml_ast.Module)
+            The enaml module ast node that should be compiled.
+
+        filename : str, optional
+            The filename to use for the generated module code object.
+
+        Returns
+        -------
+        result : types.CodeType
+            The code object for the module.
+
+        """
+        #----------------------------------------------------------------------
+        # The generated code for a module looks similar to this:
+        #
+        #     from enaml.parsing.compiler_helpers import \
+        #         COMPILER_HELPERS as __enaml_helpers__
+        #     __enaml_deps__ = __enaml_helpers__['load_deps'](<deps>)
+        #     __enaml_helpers__['exec_import'](<code>, globals(), lineno)
+        #     FooWindow = __enaml_helpers__['make_declaration'](
+        #         <function for FooWindow>
+        #     )
+        #     FooDefn = <function for FooDefn>
+        #----------------------------------------------------------------------
+        bp = byteplay
+        compiler = cls()
+        compiler.visit(module_ast)
+
+        ops = [
+            # from enaml.parsing.compiler_helpers import \
+            #     COMPILER_HELPERS as __enaml_helpers__
+            (bp.LOAD_CONST, 0),
+            (bp.LOAD_CONST, ('COMPILER_HELPERS',)),
+            (bp.IMPORT_NAME, 'enaml.parsing.compiler_helpers'),
+            (bp.IMPORT_FROM, 'COMPILER_HELPERS'),
+            (bp.STORE_NAME, HELPERS_NAME),
+            (bp.POP_TOP, None),
+        ]
         
+        if compiler.deps:
+            # __enaml_deps__ = __enaml_helpers__['load_deps'](<deps>)
+            ops.extend(_load_helper('load_deps'))
+            ops.extend([
+                (bp.LOAD_CONST, tuple(compiler.deps)),
+                (bp.CALL_FUNCTION, 0x0001),
+                (bp.STORE_NAME, DEPS_NAME),
+            ])
+
+        ops.extend(compiler.ops)
+        ops.extend([
+            (bp.LOAD_CONST, None),
+            (bp.RETURN_VALUE, None),
+        ])
+        code = byteplay.Code(ops, [], [], False, False, False, '<module>',
+                             filename, 1, None)
+        return code.to_code()
+
+    def __init__(self):
+        """ Initialize a compiler instance.
+
         """
-        # This ensures that the key '__builtins__' exists in the mod dict.
-        exec '' in module_dict
-        self.global_ns = module_dict
+        self.ops = []
+        self.deps = []
 
     def visit_Module(self, node):
         """ The module node visitory method. Used internally by the
         compiler.
 
         """
+        bp = byteplay
         if node.doc:
-            self.global_ns['__doc__'] = node.doc
+            self.ops.extend([
+                (bp.LOAD_CONST, node.doc),
+                (bp.STORE_NAME, '__doc__'),
+            ])
         for item in node.body:
             self.visit(item)
     
@@ -638,37 +785,47 @@ class EnamlCompiler(_NodeVisitor):
         """ A visitor which adds a chunk of raw Python into the module.
 
         """
-        try:
-            exec node.code in self.global_ns
-        except Exception as e:
-            msg = ('Unable to evaluate raw Python code on lineno %. '
-                   'Original exception was %s.')
-            exc_type = type(e)
-            raise exc_type(msg % (node.lineno, e))
+        bp = byteplay
+        self.ops.extend(_load_helper('exec_python'))
+        self.ops.extend([
+            (bp.LOAD_CONST, node.code),
+            (bp.LOAD_GLOBAL, 'globals'),
+            (bp.CALL_FUNCTION, 0x0000),
+            (bp.LOAD_CONST, node.lineno),
+            (bp.CALL_FUNCTION, 0x0003),
+            (bp.POP_TOP, None),
+        ])
         
     def visit_Import(self, node):
         """ The import statement visitor method. This ensures that imports
         are performed with the enaml import hook in-place.
 
         """
-        with imports():
-            try:
-                exec node.code in self.global_ns
-            except Exception as e:
-                msg = ('Unable to evaluate import on lineno %. '
-                       'Original exception was %s.')
-                exc_type = type(e)
-                raise exc_type(msg % (node.lineno, e))
+        bp = byteplay
+        self.ops.extend(_load_helper('exec_import'))
+        self.ops.extend([
+            (bp.LOAD_CONST, node.code),
+            (bp.LOAD_GLOBAL, 'globals'),
+            (bp.CALL_FUNCTION, 0x0000),
+            (bp.LOAD_CONST, node.lineno),
+            (bp.CALL_FUNCTION, 0x0003),
+            (bp.POP_TOP, None),
+        ])
 
     def visit_Declaration(self, node):
         """ The declaration node visitor. This will add an instance
         of EnamlDeclaration to the module.
 
         """
-        func_code = DeclarationCompiler.compile(node)
-        func = types.FunctionType(func_code, self.global_ns)
-        wrapper = _decl_wrapper_gen(func)
-        self.global_ns[node.name] = wrapper
+        bp = byteplay
+        func_code = DeclarationCompiler.compile(node, self.deps)
+        self.ops.extend(_load_helper('make_declaration'))
+        self.ops.extend([
+            (bp.LOAD_CONST, func_code),
+            (bp.MAKE_FUNCTION, 0),
+            (bp.CALL_FUNCTION, 0x0001),
+            (bp.STORE_NAME, node.name),
+        ])
     
     def visit_Defn(self, node):
         """ The defn node visitor. This will add an instance of EnamlDefn
@@ -676,7 +833,10 @@ class EnamlCompiler(_NodeVisitor):
 
         """
         # XXX Handle arg defaults
-        func_code = DefnCompiler.compile(node)
-        func = types.FunctionType(func_code, self.global_ns)
-        self.global_ns[node.name] = func
-
+        bp = byteplay
+        func_code = DefnCompiler.compile(node, self.deps)
+        self.ops.extend([
+            (bp.LOAD_CONST, func_code),
+            (bp.MAKE_FUNCTION, 0),
+            (bp.STORE_NAME, node.name),
+        ])
@@ -0,0 +1,353 @@
+
+# enaml_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'AMPER AMPEREQUAL AND AS ATEQUAL CIRCUMFLEX COLON COLONEQUAL COMMA DEDENT DEFN DOLLAREQUAL DOT DOUBLECOLON DOUBLESLASH DOUBLESTAR ELLIPSIS ELSE ENDMARKER EQEQUAL EQUAL FOR FROM GREATER GREATEREQUAL IF IMPORT IN INDENT IS LAMBDA LBRACE LEFTSHIFT LESS LESSEQUAL LESSMINUS LESSVBAR LPAR LSQB MINUS MINUSGREATER NAME NEWLINE NOT NOTEQUAL NUMBER OPERATOR OR PASS PERCENT PLUS PY_BLOCK PY_BLOCK_CONTINUE PY_BLOCK_END PY_BLOCK_START RBRACE RIGHTSHIFT RPAR RSQB SLASH STAR STRING STRING_CONTINUE STRING_END STRING_START_SINGLE STRING_START_TRIPLE TILDE VBAR VBAREQUAL VBARGREATER WS enaml : enaml_module ENDMARKER\n              | enaml_module NEWLINE ENDMARKER  enaml : NEWLINE ENDMARKER\n              | ENDMARKER  enaml : STRING NEWLINE ENDMARKER  enaml_module : enaml_module_body  enaml_module : STRING NEWLINE enaml_module_body  enaml_module_body : enaml_module_body enaml_module_item  enaml_module_body : enaml_module_item  enaml_module_item : enaml_import  enaml_module_item : defn  enaml_module_item : declaration  enaml_module_item : raw_python  raw_python : PY_BLOCK_START NEWLINE PY_BLOCK PY_BLOCK_END NEWLINE  enaml_import : import_stmt  declaration : NAME LPAR test RPAR COLON declaration_body  declaration_body : NEWLINE INDENT declaration_body_items DEDENT  declaration_body : NEWLINE INDENT identifier declaration_body_items DEDENT  declaration_body : NEWLINE INDENT STRING NEWLINE declaration_body_items DEDENT  declaration_body : NEWLINE INDENT STRING NEWLINE identifier declaration_body_items DEDENT  declaration_body_items : declaration_body_item  declaration_body_items : declaration_body_items declaration_body_item  declaration_body_item : attribute_binding  declaration_body_item : instantiation  declaration_body_item : enaml_call  declaration_body_item : PASS NEWLINE  identifier : NAME COLON NAME NEWLINE  instantiation : NAME COLON instantiation_body  instantiation_body : NEWLINE INDENT instantiation_body_items DEDENT  instantiation_body : NEWLINE INDENT identifier instantiation_body_items DEDENT  instantiation_body_items : instantiation_body_item  instantiation_body_items : instantiation_body_items instantiation_body_item  instantiation_body_item : instantiation  instantiation_body_item : enaml_call  instantiation_body_item : attribute_binding  instantiation_body_item : PASS NEWLINE  defn : DEFN NAME defn_parameters COLON defn_body  defn_parameters : LPAR RPAR  defn_parameters : LPAR defn_parameters_list RPAR  defn_parameters_list : defn_parameter  defn_parameters_list : defn_parameter COMMA  defn_parameters_list : defn_parameters_list_list defn_parameter  defn_parameters_list : defn_parameters_list_list defn_parameter COMMA  defn_parameters_list_list : defn_parameter COMMA  defn_parameters_list_list : defn_parameters_list_list defn_parameter COMMA  defn_parameter : defn_name_parameter  defn_parameter : defn_keyword_parameter  defn_name_parameter : NAME  defn_keyword_parameter : NAME EQUAL test  defn_body : NEWLINE INDENT defn_body_items DEDENT  defn_body : NEWLINE INDENT STRING NEWLINE defn_body_items DEDENT  defn_body_items : defn_body_item  defn_body_items : defn_body_items defn_body_item  defn_body_item : enaml_call  defn_body_item : instantiation  defn_body_item : PASS NEWLINE  enaml_call : NAME enaml_arguments NEWLINE  enaml_arguments : LPAR RPAR  enaml_arguments : LPAR enaml_arguments_list RPAR  enaml_arguments_list : enaml_argument  enaml_arguments_list : enaml_argument COMMA  enaml_arguments_list : enaml_arguments_list_list enaml_argument  enaml_arguments_list : enaml_arguments_list_list enaml_argument COMMA  enaml_arguments_list_list : enaml_argument COMMA  enaml_arguments_list_list : enaml_arguments_list_list enaml_argument COMMA  enaml_argument : test  enaml_argument : NAME EQUAL test  attribute_binding : NAME binding  binding : enaml_operator test NEWLINE  enaml_operator : EQUAL\n                       | COLONEQUAL\n                       | LEFTSHIFT\n                       | RIGHTSHIFT\n                       | ATEQUAL\n                       | AMPEREQUAL\n                       | DOLLAREQUAL\n                       | VBAREQUAL\n                       | LESSMINUS\n                       | MINUSGREATER\n                       | VBARGREATER\n                       | LESSVBAR  import_stmt : import_name NEWLINE  import_stmt : import_from NEWLINE  import_name : IMPORT dotted_as_names  import_from : FROM dotted_name IMPORT STAR  import_from : FROM dotted_name IMPORT import_as_names  import_from : FROM dotted_name IMPORT LPAR import_as_names RPAR  import_from : FROM import_from_dots dotted_name IMPORT STAR  import_from : FROM import_from_dots dotted_name IMPORT import_as_name  import_from : FROM import_from_dots dotted_name IMPORT LPAR import_as_names RPAR  import_from : FROM import_from_dots IMPORT STAR  import_from : FROM import_from_dots IMPORT import_as_names  import_from : FROM import_from_dots IMPORT LPAR import_as_names RPAR  import_from_dots : DOT  import_from_dots : import_from_dots DOT  import_as_name : NAME  import_as_name : NAME AS NAME  dotted_as_name : dotted_name  dotted_as_name : dotted_name AS NAME  import_as_names : import_as_name  import_as_names : import_as_name COMMA  import_as_names : import_as_name import_as_names_list  import_as_names : import_as_name import_as_names_list COMMA  import_as_names_list : COMMA import_as_name  import_as_names_list : import_as_names_list COMMA import_as_name  dotted_as_names : dotted_as_name  dotted_as_names : dotted_as_name dotted_as_names_list  dotted_as_names_list : COMMA dotted_as_name  dotted_as_names_list : dotted_as_names_list COMMA dotted_as_name  dotted_name : NAME  dotted_name : NAME dotted_name_list  dotted_name_list : DOT NAME  dotted_name_list : dotted_name_list DOT NAME  test : or_test  test : or_test IF or_test ELSE test  test : lambdef  or_test : and_test  or_test : and_test or_test_list  or_test_list : OR and_test  or_test_list : or_test_list OR and_test  and_test : not_test  and_test : not_test and_test_list  and_test_list : AND not_test  and_test_list : and_test_list AND not_test  not_test : comparison  not_test : NOT not_test  comparison : expr  comparison : expr comparison_list  comparison_list : comp_op expr  comparison_list : comparison_list comp_op expr  comp_op : LESS  comp_op : GREATER  comp_op : EQEQUAL  comp_op : GREATEREQUAL  comp_op : LESSEQUAL  comp_op : NOTEQUAL  comp_op : IN  comp_op : NOT IN  comp_op : IS  comp_op : IS NOT  expr : xor_expr  expr : xor_expr expr_list  expr_list : VBAR xor_expr  expr_list : expr_list VBAR xor_expr  xor_expr : and_expr  xor_expr : and_expr xor_expr_list  xor_expr_list : CIRCUMFLEX and_expr  xor_expr_list : xor_expr_list CIRCUMFLEX and_expr  and_expr : shift_expr  and_expr : shift_expr and_expr_list  and_expr_list : AMPER shift_expr  and_expr_list : and_expr_list AMPER shift_expr  shift_expr : arith_expr  shift_expr : arith_expr shift_list  shift_list : shift_op  shift_list : shift_list shift_op  shift_op : LEFTSHIFT arith_expr  shift_op : RIGHTSHIFT arith_expr  arith_expr : term  arith_expr : term arith_expr_list  arith_expr_list : arith_op  arith_expr_list : arith_expr_list arith_op  arith_op : PLUS term  arith_op : MINUS term  term : factor  term : factor term_list  term_list : term_op  term_list : term_list term_op  term_op : STAR factor  term_op : SLASH factor  term_op : PERCENT factor  term_op : DOUBLESLASH factor  factor : power  factor : PLUS factor  factor : MINUS factor  factor : TILDE factor  power : atom  power : atom DOUBLESTAR factor  power : atom power_list  power : atom power_list DOUBLESTAR factor  power_list : trailer  power_list : power_list trailer  atom : LPAR RPAR  atom : LPAR testlist_comp RPAR  atom : LSQB RSQB  atom : LSQB listmaker RSQB  atom : LBRACE RBRACE  atom : LBRACE dictorsetmaker RBRACE  atom : NAME  atom : NUMBER  atom : atom_string_list  atom_string_list : STRING  atom_string_list : atom_string_list STRING  listmaker : test list_for  listmaker : test  listmaker : test COMMA  listmaker : test listmaker_list  listmaker : test listmaker_list COMMA  listmaker_list : COMMA test  listmaker_list : listmaker_list COMMA test  testlist_comp : test comp_for  testlist_comp : test  testlist_comp : test COMMA  testlist_comp : test testlist_comp_list  testlist_comp : test testlist_comp_list COMMA  testlist_comp_list : COMMA test  testlist_comp_list : testlist_comp_list COMMA test  trailer : LPAR RPAR  trailer : LPAR arglist RPAR  trailer : LSQB subscriptlist RSQB  trailer : DOT NAME  subscriptlist : subscript  subscriptlist : subscript COMMA  subscriptlist : subscript subscriptlist_list  subscriptlist : subscript subscriptlist_list COMMA  subscriptlist_list : COMMA subscript  subscriptlist_list : subscriptlist_list COMMA subscript  subscript : ELLIPSIS  subscript : test  subscript : COLON  subscript : DOUBLECOLON  subscript : test COLON  subscript : test DOUBLECOLON  subscript : COLON test  subscript : COLON test COLON  subscript : DOUBLECOLON test  subscript : test COLON test  subscript : test COLON test COLON  subscript : COLON test COLON test  subscript : test COLON test COLON test  subscript : test DOUBLECOLON test  exprlist : expr  exprlist : expr COMMA  exprlist : expr exprlist_list  exprlist : expr exprlist_list COMMA  exprlist_list : COMMA expr  exprlist_list : exprlist_list COMMA expr  dictorsetmaker : test COLON test comp_for  dictorsetmaker : test COLON test  dictorsetmaker : test COLON test COMMA  dictorsetmaker : test COLON test dosm_colon_list  dictorsetmaker : test COLON test dosm_colon_list COMMA  dictorsetmaker : test comp_for  dictorsetmaker : test COMMA  dictorsetmaker : test dosm_comma_list  dictorsetmaker : test dosm_comma_list COMMA  dosm_colon_list : COMMA test COLON test  dosm_colon_list : dosm_colon_list COMMA test COLON test  dosm_comma_list : COMMA test  dosm_comma_list : dosm_comma_list COMMA test  arglist : argument  arglist : argument COMMA  arglist : STAR test  arglist : STAR test COMMA DOUBLESTAR test  arglist : DOUBLESTAR test  arglist : arglist_list argument  arglist : arglist_list argument COMMA  arglist : arglist_list STAR test  arglist : arglist_list STAR test COMMA DOUBLESTAR test  arglist : arglist_list DOUBLESTAR test  arglist_list : argument COMMA  arglist_list : arglist_list argument COMMA  argument : test  argument : test comp_for  argument : test EQUAL test  list_for : FOR exprlist IN testlist_safe  list_for : FOR exprlist IN testlist_safe list_iter  list_iter : list_for  list_iter : list_if  list_if : IF old_test  list_if : IF old_test list_iter  comp_for : FOR exprlist IN or_test  comp_for : FOR exprlist IN or_test comp_iter  comp_iter : comp_for  comp_iter : comp_if  comp_if : IF old_test  comp_if : IF old_test comp_iter  testlist_safe : old_test  testlist_safe : old_test testlist_safe_list  testlist_safe : old_test testlist_safe_list COMMA  testlist_safe_list : COMMA old_test  testlist_safe_list : testlist_safe_list COMMA old_test  old_test : or_test  old_test : old_lambdef  old_lambdef : LAMBDA COLON old_test  old_lambdef : LAMBDA varargslist COLON old_test  lambdef : LAMBDA COLON test  lambdef : LAMBDA varargslist COLON test  varargslist : fpdef COMMA STAR NAME  varargslist : fpdef COMMA STAR NAME COMMA DOUBLESTAR NAME  varargslist : fpdef COMMA DOUBLESTAR NAME  varargslist : fpdef  varargslist : fpdef COMMA  varargslist : fpdef varargslist_list COMMA STAR NAME  varargslist : fpdef varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME  varargslist : fpdef varargslist_list COMMA DOUBLESTAR NAME  varargslist : fpdef varargslist_list  varargslist : fpdef varargslist_list COMMA  varargslist : fpdef EQUAL test COMMA STAR NAME  varargslist : fpdef EQUAL test COMMA STAR NAME COMMA DOUBLESTAR NAME  varargslist : fpdef EQUAL test COMMA DOUBLESTAR NAME  varargslist : fpdef EQUAL test  varargslist : fpdef EQUAL test COMMA  varargslist : fpdef EQUAL test varargslist_list COMMA STAR NAME  varargslist : fpdef EQUAL test varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME  varargslist : fpdef EQUAL test varargslist_list COMMA DOUBLESTAR NAME  varargslist : fpdef EQUAL test varargslist_list  varargslist : fpdef EQUAL test varargslist_list COMMA  varargslist : STAR NAME  varargslist : STAR NAME COMMA DOUBLESTAR NAME  varargslist : DOUBLESTAR NAME  varargslist_list : COMMA fpdef  varargslist_list : COMMA fpdef EQUAL test  varargslist_list : varargslist_list COMMA fpdef  varargslist_list : varargslist_list COMMA fpdef EQUAL test  fpdef : NAME  fpdef : LPAR fplist RPAR  fplist : fpdef  fplist : fpdef COMMA  fplist : fpdef fplist_list  fplist : fpdef fplist_list COMMA  fplist_list : COMMA fpdef  fplist_list : fplist_list COMMA fpdef '
+    
+_lr_action_items = {'DEDENT':([308,310,311,313,349,351,358,360,361,362,363,389,396,398,407,408,409,411,452,472,473,475,476,477,482,484,492,494,495,496,500,],[-54,-52,-55,350,-56,-53,-24,-25,-21,-23,405,445,-57,-28,-22,-26,454,-68,481,-33,492,-34,-31,-35,497,-69,-29,-32,-36,500,-30,]),'LPAR':([17,33,35,45,47,52,53,54,56,60,61,64,66,68,69,73,74,78,89,102,105,107,110,111,112,113,115,119,123,125,126,128,129,130,132,135,138,139,142,143,145,147,148,149,150,151,153,155,156,157,158,159,165,177,183,184,186,188,190,199,200,202,203,204,206,209,210,211,213,214,219,220,222,224,229,230,232,238,239,240,246,247,248,262,272,273,275,276,278,282,283,285,286,289,292,295,296,300,314,315,316,322,325,328,330,334,338,344,346,352,357,366,367,370,376,377,382,384,393,394,402,406,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,474,493,],[35,49,52,87,90,52,-191,-190,52,52,-192,52,52,125,52,52,-189,159,174,-183,-193,52,52,52,52,52,52,52,52,52,125,52,52,-181,-185,52,52,52,-187,52,52,-136,52,-132,-131,-139,-134,-137,-135,-133,52,159,52,52,-184,52,52,52,52,52,52,52,-208,52,52,52,-182,-211,52,52,-186,52,52,52,-188,52,52,-140,52,-138,52,159,52,52,-209,52,52,52,-261,52,52,52,-210,52,52,52,159,159,352,52,52,-262,52,52,52,52,159,159,52,52,52,352,52,52,159,52,52,159,-189,52,52,352,-75,-70,-81,-79,-80,-73,52,-71,-74,-78,-77,-72,-76,52,52,52,52,52,-64,52,52,52,52,-65,352,352,]),'ENDMARKER':([0,4,5,6,7,9,11,12,14,19,20,21,28,29,36,44,180,182,267,350,405,445,454,481,497,],[1,-6,-9,22,-11,27,-13,-12,-15,-10,-83,-8,42,43,-82,-7,-37,-14,-16,-50,-17,-51,-18,-19,-20,]),'AMPER':([53,54,57,58,61,63,68,72,74,75,102,105,108,109,114,116,118,121,126,130,132,136,137,142,144,146,183,191,192,193,194,195,196,203,210,211,212,219,226,227,228,229,234,235,236,265,272,279,286,393,],[-191,-190,110,-165,-192,-173,-177,-159,-189,-153,-183,-193,-175,190,-167,-166,-174,-176,-179,-181,-185,-160,-161,-187,-155,-154,-184,-151,-169,-171,-172,-170,-168,-208,-182,-211,-178,-186,-162,-163,-164,-188,-157,-158,-156,-152,-209,-180,-210,-189,]),'LESS':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,265,268,272,279,286,290,294,393,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,150,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,150,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-152,-148,-209,-180,-210,-144,-130,-189,]),'IN':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,154,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,260,261,265,268,272,279,286,287,290,294,316,317,356,357,393,403,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,155,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,155,240,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,315,-232,-152,-148,-209,-180,-210,330,-144,-130,-233,-234,-236,-235,-189,-237,]),'NUMBER':([35,52,56,60,64,66,69,73,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,147,148,149,150,151,153,155,156,157,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,238,239,240,246,248,262,273,275,276,278,282,283,285,289,292,295,315,316,322,325,328,330,334,346,352,357,367,370,377,382,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-136,54,-132,-131,-139,-134,-137,-135,-133,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-140,54,-138,54,54,54,54,54,54,-261,54,54,54,54,54,54,54,54,-262,54,54,54,54,54,54,54,54,54,54,54,54,54,-75,-70,-81,-79,-80,-73,54,-71,-74,-78,-77,-72,-76,54,54,54,54,54,-64,54,54,54,54,-65,]),'LESSVBAR':([366,406,474,493,],[413,413,413,413,]),'RPAR':([49,52,53,54,55,57,58,59,61,62,63,65,67,68,70,71,72,74,75,76,77,84,86,94,95,97,98,99,102,103,104,105,106,108,109,114,116,118,120,121,122,124,125,126,130,132,134,136,137,142,144,146,152,161,168,169,171,175,176,179,183,185,186,187,189,191,192,193,194,195,196,198,201,203,205,207,208,210,211,212,219,225,226,227,228,229,234,235,236,237,242,243,250,251,252,253,255,257,258,262,263,264,265,268,269,270,271,272,274,277,278,279,286,290,294,296,297,298,305,306,318,321,322,323,324,336,337,338,352,355,374,375,379,391,392,393,395,399,400,401,425,446,448,451,457,462,470,471,480,487,],[96,102,-191,-190,-121,-149,-165,117,-192,-145,-173,-117,-116,-177,-141,-125,-159,-189,-153,-127,-114,-100,-96,-48,-46,178,-47,-40,-183,183,-202,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,203,-179,-181,-185,-142,-160,-161,-187,-155,-154,-128,-316,-101,-102,254,256,-42,-41,-184,-204,-203,-201,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,272,-263,-251,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-318,298,-287,-104,-103,-97,307,-43,-49,-205,-206,-124,-152,-148,-120,-253,-255,-209,-256,-264,-252,-180,-210,-144,-130,-319,-320,-317,-288,-105,-207,-258,-257,-260,-265,-115,-322,-321,390,-272,-284,-283,-323,-60,-66,-189,449,-275,-274,-273,-254,-61,-62,-276,-259,-285,-67,-63,-277,-286,]),'CIRCUMFLEX':([53,54,57,58,61,62,63,68,72,74,75,102,105,108,109,114,116,118,120,121,126,130,132,136,137,142,144,146,183,191,192,193,194,195,196,198,203,210,211,212,219,226,227,228,229,234,235,236,265,268,272,279,286,393,],[-191,-190,-149,-165,-192,119,-173,-177,-159,-189,-153,-183,-193,-175,-150,-167,-166,-174,199,-176,-179,-181,-185,-160,-161,-187,-155,-154,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-162,-163,-164,-188,-157,-158,-156,-152,-148,-209,-180,-210,-189,]),'LESSMINUS':([366,406,474,493,],[421,421,421,421,]),'COLON':([50,53,54,55,57,58,61,62,63,65,67,68,70,71,72,74,75,76,77,78,96,102,105,106,108,109,114,116,117,118,120,121,122,124,126,129,130,132,134,136,137,141,142,144,146,152,161,162,163,178,183,189,191,192,193,194,195,196,198,201,203,210,211,212,215,219,225,226,227,228,229,234,235,236,237,244,245,247,249,250,264,265,268,269,272,279,280,285,286,290,294,298,300,301,303,305,314,326,328,336,341,343,344,345,347,366,376,378,380,381,383,384,388,406,434,436,439,442,443,466,467,469,474,489,493,499,501,],[100,-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,-141,-125,-159,-189,-153,-127,-114,165,-38,-183,-193,-122,-175,-150,-167,-166,197,-174,-146,-176,-118,-126,-179,213,-181,-185,-142,-160,-161,232,-187,-155,-154,-128,-316,-292,248,-39,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-182,-211,-178,282,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-309,-297,-293,-311,-287,-124,-152,-148,-120,-209,-180,325,213,-210,-144,-130,-317,-298,-302,-312,-288,354,370,213,-115,-314,-307,-303,-289,-291,416,435,437,-310,-294,-296,-308,-313,354,461,463,-315,-299,-301,-304,-306,-290,416,-295,354,-300,-305,]),'NOTEQUAL':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,265,268,272,279,286,290,294,393,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,147,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,147,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-152,-148,-209,-180,-210,-144,-130,-189,]),'VBAR':([53,54,57,58,61,62,63,68,70,72,74,75,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,265,268,272,279,286,290,393,],[-191,-190,-149,-165,-192,-145,-173,-177,135,-159,-189,-153,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,224,-160,-161,-187,-155,-154,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-152,-148,-209,-180,-210,-144,-189,]),'DOUBLESTAR':([53,54,61,68,74,78,102,105,125,126,130,132,142,183,203,206,210,211,219,229,247,272,278,286,299,300,320,322,344,368,376,384,387,393,438,468,490,],[-191,-190,-192,128,-189,164,-183,-193,204,209,-181,-185,-187,-184,-208,275,-182,-211,-186,-188,304,-209,-261,-210,339,342,367,-262,386,426,164,441,444,-189,465,491,498,]),'STAR':([45,47,53,54,58,61,63,68,74,78,89,102,105,108,114,116,118,121,125,126,130,132,142,183,192,193,194,195,196,203,206,210,211,212,219,229,247,272,278,279,286,300,322,344,376,384,393,],[85,91,-191,-190,111,-192,-173,-177,-189,160,173,-183,-193,-175,-167,111,-174,-176,202,-179,-181,-185,-187,-184,-169,-171,-172,-170,-168,-208,273,-182,-211,-178,-186,-188,302,-209,-261,-180,-210,340,-262,385,160,440,-189,]),'PASS':([259,308,310,311,313,319,348,349,351,358,360,361,362,363,365,389,396,398,404,407,408,409,411,450,452,453,472,473,475,476,477,479,482,483,484,492,494,495,496,500,],[312,-54,-52,-55,312,364,312,-56,-53,-24,-25,-21,-23,364,364,312,-57,-28,364,-22,-26,364,-68,478,364,364,-33,478,-34,-31,-35,478,364,-27,-69,-29,-32,-36,478,-30,]),'MINUSGREATER':([366,406,474,493,],[414,414,414,414,]),'MINUS':([35,52,53,54,56,58,60,61,63,64,66,68,69,72,73,74,102,105,107,108,110,111,112,113,114,115,116,118,119,121,123,125,126,128,129,130,132,135,136,137,138,139,142,143,145,147,148,149,150,151,153,155,156,157,158,165,177,183,184,186,188,190,192,193,194,195,196,199,200,202,203,204,206,209,210,211,212,213,214,219,220,222,224,226,227,228,229,230,232,238,239,240,246,248,262,272,273,275,276,278,279,282,283,285,286,289,292,295,315,316,322,325,328,330,334,346,352,357,367,370,377,382,393,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[56,56,-191,-190,56,-165,56,-192,-173,56,56,-177,56,139,56,-189,-183,-193,56,-175,56,56,56,56,-167,56,-166,-174,56,-176,56,56,-179,56,56,-181,-185,56,139,-161,56,56,-187,56,56,-136,56,-132,-131,-139,-134,-137,-135,-133,56,56,56,-184,56,56,56,56,-169,-171,-172,-170,-168,56,56,56,-208,56,56,56,-182,-211,-178,56,56,-186,56,56,56,-162,-163,-164,-188,56,56,-140,56,-138,56,56,56,-209,56,56,56,-261,-180,56,56,56,-210,56,56,56,56,56,-262,56,56,56,56,56,56,56,56,56,56,56,-189,56,56,-75,-70,-81,-79,-80,-73,56,-71,-74,-78,-77,-72,-76,56,56,56,56,56,-64,56,56,56,56,-65,]),'DOT':([13,24,31,32,38,48,53,54,61,68,74,81,102,105,126,130,132,142,166,183,203,210,211,219,229,272,286,393,],[32,39,48,-94,80,-95,-191,-190,-192,127,-189,-112,-183,-193,127,-181,-185,-187,-113,-184,-208,-182,-211,-186,-188,-209,-210,-189,]),'RBRACE':([53,54,55,57,58,61,62,63,65,67,68,70,71,72,73,74,75,76,77,102,105,106,108,109,114,116,118,120,121,122,124,126,130,132,134,136,137,140,142,144,146,152,183,189,191,192,193,194,195,196,198,201,203,210,211,212,219,225,226,227,228,229,230,231,233,234,235,236,237,250,264,265,268,269,272,279,286,290,291,292,293,294,305,332,333,334,335,336,355,374,375,377,399,400,401,451,462,464,480,487,488,],[-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,-141,-125,-159,142,-189,-153,-127,-114,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,-185,-142,-160,-161,229,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-244,-245,-243,-157,-158,-156,-129,-287,-124,-152,-148,-120,-209,-180,-210,-144,-249,-246,-239,-130,-288,-250,-241,-240,-238,-115,-272,-284,-283,-242,-275,-274,-273,-276,-285,-247,-277,-286,-248,]),'GREATEREQUAL':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,265,268,272,279,286,290,294,393,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,153,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,153,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-152,-148,-209,-180,-210,-144,-130,-189,]),'GREATER':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,265,268,272,279,286,290,294,393,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,149,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,149,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-152,-148,-209,-180,-210,-144,-130,-189,]),'PY_BLOCK_END':([51,],[101,]),'VBARGREATER':([366,406,474,493,],[415,415,415,415,]),'NEWLINE':([0,3,4,5,7,9,10,11,12,14,16,18,19,20,21,23,24,25,26,36,38,41,44,53,54,55,57,58,61,62,63,65,67,68,70,71,72,74,75,76,77,79,81,82,84,85,86,88,91,92,100,101,102,105,106,108,109,114,116,118,120,121,122,124,126,130,132,134,136,137,142,144,146,152,166,167,168,169,172,173,180,182,183,189,191,192,193,194,195,196,197,198,201,203,210,211,212,219,225,226,227,228,229,234,235,236,237,250,251,252,253,254,256,264,265,267,268,269,272,279,286,290,294,305,306,307,309,312,336,350,353,354,359,364,390,405,416,445,449,454,455,456,478,481,497,],[6,20,-6,-9,-11,28,29,-13,-12,-15,34,36,-10,-83,-8,-98,-110,-84,-106,-82,-111,-107,-7,-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,-141,-125,-159,-189,-153,-127,-114,-99,-112,-108,-100,-85,-96,-86,-91,-92,181,182,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,-185,-142,-160,-161,-187,-155,-154,-128,-113,-109,-101,-102,-89,-88,-37,-14,-184,-123,-151,-169,-171,-172,-170,-168,266,-147,-119,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-287,-104,-103,-97,-87,-93,-124,-152,-16,-148,-120,-209,-180,-210,-144,-130,-288,-105,-90,348,349,-115,-50,396,397,404,408,-58,-17,397,-51,-59,-18,483,484,495,-19,-20,]),'PLUS':([35,52,53,54,56,58,60,61,63,64,66,68,69,72,73,74,102,105,107,108,110,111,112,113,114,115,116,118,119,121,123,125,126,128,129,130,132,135,136,137,138,139,142,143,145,147,148,149,150,151,153,155,156,157,158,165,177,183,184,186,188,190,192,193,194,195,196,199,200,202,203,204,206,209,210,211,212,213,214,219,220,222,224,226,227,228,229,230,232,238,239,240,246,248,262,272,273,275,276,278,279,282,283,285,286,289,292,295,315,316,322,325,328,330,334,346,352,357,367,370,377,382,393,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[60,60,-191,-190,60,-165,60,-192,-173,60,60,-177,60,138,60,-189,-183,-193,60,-175,60,60,60,60,-167,60,-166,-174,60,-176,60,60,-179,60,60,-181,-185,60,138,-161,60,60,-187,60,60,-136,60,-132,-131,-139,-134,-137,-135,-133,60,60,60,-184,60,60,60,60,-169,-171,-172,-170,-168,60,60,60,-208,60,60,60,-182,-211,-178,60,60,-186,60,60,60,-162,-163,-164,-188,60,60,-140,60,-138,60,60,60,-209,60,60,60,-261,-180,60,60,60,-210,60,60,60,60,60,-262,60,60,60,60,60,60,60,60,60,60,60,-189,60,60,-75,-70,-81,-79,-80,-73,60,-71,-74,-78,-77,-72,-76,60,60,60,60,60,-64,60,60,60,60,-65,]),'TILDE':([35,52,56,60,64,66,69,73,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,147,148,149,150,151,153,155,156,157,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,238,239,240,246,248,262,273,275,276,278,282,283,285,289,292,295,315,316,322,325,328,330,334,346,352,357,367,370,377,382,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-136,64,-132,-131,-139,-134,-137,-135,-133,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-140,64,-138,64,64,64,64,64,64,-261,64,64,64,64,64,64,64,64,-262,64,64,64,64,64,64,64,64,64,64,64,64,64,-75,-70,-81,-79,-80,-73,64,-71,-74,-78,-77,-72,-76,64,64,64,64,64,-64,64,64,64,64,-65,]),'COMMA':([23,24,26,38,41,53,54,55,57,58,61,62,63,65,67,68,70,71,72,74,75,76,77,79,81,82,84,86,94,95,98,99,102,104,105,106,108,109,114,116,118,120,121,122,124,126,130,132,133,134,136,137,141,142,144,146,152,161,162,166,167,169,176,183,185,189,191,192,193,194,195,196,198,201,203,207,208,210,211,212,213,214,215,216,218,219,223,225,226,227,228,229,231,234,235,236,237,242,244,245,250,251,253,258,261,263,264,265,268,269,270,272,274,277,279,280,281,282,283,284,286,288,290,291,293,294,297,298,301,303,305,306,317,318,321,324,325,326,327,329,331,332,333,336,337,341,343,345,355,356,369,370,371,373,374,375,379,381,388,391,392,393,399,400,401,403,427,433,439,442,448,451,459,462,464,466,470,480,486,487,488,],[-98,-110,40,-111,83,-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,-141,-125,-159,-189,-153,-127,-114,-99,-112,-108,168,-96,-48,-46,-47,179,-183,186,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,-185,222,-142,-160,-161,230,-187,-155,-154,-128,-316,247,-113,-109,252,257,-184,262,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-263,278,-182,-211,-178,-220,-221,-219,285,-218,-186,289,-143,-162,-163,-164,-188,292,-157,-158,-156,-129,296,299,300,-287,-104,-97,-49,316,-206,-124,-152,-148,-120,320,-209,322,-264,-180,-224,-226,-222,-223,328,-210,-199,-144,-249,334,-130,338,-317,344,-312,-288,-105,357,-207,368,-265,-225,-227,-231,-216,-200,-250,377,-115,-322,-314,384,387,-272,-236,-229,-228,-217,432,-284,-283,-323,438,-313,446,-66,-189,-275,-274,-273,-237,-230,460,-315,468,471,-276,-281,-285,-247,490,-67,-277,-282,-286,-248,]),'RSQB':([53,54,55,57,58,61,62,63,65,67,68,69,70,71,72,74,75,76,77,102,105,106,108,109,114,116,118,120,121,122,124,126,130,131,132,133,134,136,137,142,144,146,152,183,189,191,192,193,194,195,196,198,201,203,210,211,212,213,214,215,216,217,218,219,221,222,223,225,226,227,228,229,234,235,236,237,250,264,265,268,269,272,279,280,281,282,283,284,285,286,288,289,290,294,305,325,326,327,328,329,331,336,369,370,371,372,373,374,375,427,428,429,430,433,458,459,460,462,485,486,487,],[-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,132,-141,-125,-159,-189,-153,-127,-114,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,219,-185,-195,-142,-160,-161,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-182,-211,-178,-220,-221,-219,-212,286,-218,-186,-194,-196,-197,-143,-162,-163,-164,-188,-157,-158,-156,-129,-287,-124,-152,-148,-120,-209,-180,-224,-226,-222,-223,-214,-213,-210,-199,-198,-144,-130,-288,-225,-227,-231,-215,-216,-200,-115,-229,-228,-217,-266,-278,-284,-283,-230,-267,-269,-268,-279,-270,-281,-280,-285,-271,-282,-286,]),'EQEQUAL':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,265,268,272,279,286,290,294,393,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,157,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,157,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-152,-148,-209,-180,-210,-144,-130,-189,]),'$end':([1,2,22,27,42,43,],[-4,0,-3,-1,-2,-5,]),'AMPEREQUAL':([366,406,474,493,],[410,410,410,410,]),'RIGHTSHIFT':([53,54,58,61,63,68,72,74,75,102,105,108,114,116,118,121,126,130,132,136,137,142,144,146,183,192,193,194,195,196,203,210,211,212,219,226,227,228,229,234,235,236,272,279,286,366,393,406,474,493,],[-191,-190,-165,-192,-173,-177,-159,-189,145,-183,-193,-175,-167,-166,-174,-176,-179,-181,-185,-160,-161,-187,-155,145,-184,-169,-171,-172,-170,-168,-208,-182,-211,-178,-186,-162,-163,-164,-188,-157,-158,-156,-209,-180,-210,417,-189,417,417,417,]),'STRING':([0,35,52,53,56,60,61,64,66,69,73,105,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,147,148,149,150,151,153,155,156,157,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,238,239,240,246,248,259,262,273,275,276,278,282,283,285,289,292,295,315,316,319,322,325,328,330,334,346,352,357,367,370,377,382,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[10,61,61,105,61,61,-192,61,61,61,61,-193,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-136,61,-132,-131,-139,-134,-137,-135,-133,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-140,61,-138,61,61,309,61,61,61,61,-261,61,61,61,61,61,61,61,61,359,-262,61,61,61,61,61,61,61,61,61,61,61,61,61,-75,-70,-81,-79,-80,-73,61,-71,-74,-78,-77,-72,-76,61,61,61,61,61,-64,61,61,61,61,-65,]),'FOR':([53,54,55,57,58,61,62,63,65,67,68,70,71,72,74,75,76,77,102,104,105,106,108,109,114,116,118,120,121,122,124,126,130,132,133,134,136,137,141,142,144,146,152,183,189,191,192,193,194,195,196,198,201,203,207,210,211,212,219,225,226,227,228,229,234,235,236,237,250,264,265,268,269,272,279,286,290,293,294,305,336,355,372,373,374,375,433,451,458,459,460,462,486,487,],[-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,-141,-125,-159,-189,-153,-127,-114,-183,184,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,-185,220,-142,-160,-161,184,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,184,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-287,-124,-152,-148,-120,-209,-180,-210,-144,184,-130,-288,-115,184,220,-278,-284,-283,-279,184,220,-281,-280,-285,-282,-286,]),'COLONEQUAL':([366,406,474,493,],[419,419,419,419,]),'IS':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,265,268,272,279,286,290,294,393,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,151,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,151,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-152,-148,-209,-180,-210,-144,-130,-189,]),'DOUBLECOLON':([53,54,55,57,58,61,62,63,65,67,68,70,71,72,74,75,76,77,102,105,106,108,109,114,116,118,120,121,122,124,126,129,130,132,134,136,137,142,144,146,152,183,189,191,192,193,194,195,196,198,201,203,210,211,212,215,219,225,226,227,228,229,234,235,236,237,250,264,265,268,269,272,279,285,286,290,294,305,328,336,],[-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,-141,-125,-159,-189,-153,-127,-114,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,214,-181,-185,-142,-160,-161,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-182,-211,-178,283,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-287,-124,-152,-148,-120,-209,-180,214,-210,-144,-130,-288,214,-115,]),'PERCENT':([53,54,58,61,63,68,74,102,105,108,114,116,118,121,126,130,132,142,183,192,193,194,195,196,203,210,211,212,219,229,272,279,286,393,],[-191,-190,112,-192,-173,-177,-189,-183,-193,-175,-167,112,-174,-176,-179,-181,-185,-187,-184,-169,-171,-172,-170,-168,-208,-182,-211,-178,-186,-188,-209,-180,-210,-189,]),'DOUBLESLASH':([53,54,58,61,63,68,74,102,105,108,114,116,118,121,126,130,132,142,183,192,193,194,195,196,203,210,211,212,219,229,272,279,286,393,],[-191,-190,113,-192,-173,-177,-189,-183,-193,-175,-167,113,-174,-176,-179,-181,-185,-187,-184,-169,-171,-172,-170,-168,-208,-182,-211,-178,-186,-188,-209,-180,-210,-189,]),'ELLIPSIS':([129,285,328,],[218,218,218,]),'EQUAL':([53,54,55,57,58,61,62,63,65,67,68,70,71,72,74,75,76,77,94,102,105,106,108,109,114,116,118,120,121,122,124,126,130,132,134,136,137,142,144,146,152,161,162,183,189,191,192,193,194,195,196,198,201,203,207,210,211,212,219,225,226,227,228,229,234,235,236,237,250,264,265,268,269,272,279,286,290,294,298,303,305,336,341,366,393,406,474,493,],[-191,-190,-121,-149,-165,-192,-145,-173,-117,-116,-177,-141,-125,-159,-189,-153,-127,-114,177,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,-185,-142,-160,-161,-187,-155,-154,-128,-316,246,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,276,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-287,-124,-152,-148,-120,-209,-180,-210,-144,-130,-317,346,-288,-115,382,412,447,412,412,412,]),'AS':([23,24,38,81,86,166,],[37,-110,-111,-112,170,-113,]),'SLASH':([53,54,58,61,63,68,74,102,105,108,114,116,118,121,126,130,132,142,183,192,193,194,195,196,203,210,211,212,219,229,272,279,286,393,],[-191,-190,115,-192,-173,-177,-189,-183,-193,-175,-167,115,-174,-176,-179,-181,-185,-187,-184,-169,-171,-172,-170,-168,-208,-182,-211,-178,-186,-188,-209,-180,-210,-189,]),'IMPORT':([0,4,5,7,11,12,14,19,20,21,24,29,30,31,32,36,38,44,46,48,81,166,180,182,267,350,405,445,454,481,497,],[8,8,-9,-11,-13,-12,-15,-10,-83,-8,-110,8,45,47,-94,-82,-111,8,89,-95,-112,-113,-37,-14,-16,-50,-17,-51,-18,-19,-20,]),'LESSEQUAL':([53,54,57,58,61,62,63,68,70,72,74,75,76,102,105,108,109,114,116,118,120,121,126,130,132,134,136,137,142,144,146,152,183,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,265,268,272,279,286,290,294,393,],[-191,-190,-149,-165,-192,-145,-173,-177,-141,-159,-189,-153,156,-183,-193,-175,-150,-167,-166,-174,-146,-176,-179,-181,-185,-142,-160,-161,-187,-155,-154,156,-184,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-152,-148,-209,-180,-210,-144,-130,-189,]),'PY_BLOCK_START':([0,4,5,7,11,12,14,19,20,21,29,36,44,180,182,267,350,405,445,454,481,497,],[16,16,-9,-11,-13,-12,-15,-10,-83,-8,16,-82,16,-37,-14,-16,-50,-17,-51,-18,-19,-20,]),'LSQB':([35,52,53,54,56,60,61,64,66,68,69,73,74,102,105,107,110,111,112,113,115,119,123,125,126,128,129,130,132,135,138,139,142,143,145,147,148,149,150,151,153,155,156,157,158,165,177,183,184,186,188,190,199,200,202,203,204,206,209,210,211,213,214,219,220,222,224,229,230,232,238,239,240,246,248,262,272,273,275,276,278,282,283,285,286,289,292,295,315,316,322,325,328,330,334,346,352,357,367,370,377,382,393,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[69,69,-191,-190,69,69,-192,69,69,129,69,69,-189,-183,-193,69,69,69,69,69,69,69,69,69,129,69,69,-181,-185,69,69,69,-187,69,69,-136,69,-132,-131,-139,-134,-137,-135,-133,69,69,69,-184,69,69,69,69,69,69,69,-208,69,69,69,-182,-211,69,69,-186,69,69,69,-188,69,69,-140,69,-138,69,69,69,-209,69,69,69,-261,69,69,69,-210,69,69,69,69,69,-262,69,69,69,69,69,69,69,69,69,69,69,-189,69,69,-75,-70,-81,-79,-80,-73,69,-71,-74,-78,-77,-72,-76,69,69,69,69,69,-64,69,69,69,69,-65,]),'ELSE':([53,54,55,57,58,61,62,63,65,68,70,71,72,74,75,76,102,105,106,108,109,114,116,118,120,121,122,124,126,130,132,134,136,137,142,144,146,152,183,189,191,192,193,194,195,196,198,201,203,210,211,212,219,225,226,227,228,229,234,235,236,237,241,264,265,268,269,272,279,286,290,294,],[-191,-190,-121,-149,-165,-192,-145,-173,-117,-177,-141,-125,-159,-189,-153,-127,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,-185,-142,-160,-161,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,295,-124,-152,-148,-120,-209,-180,-210,-144,-130,]),'DEFN':([0,4,5,7,11,12,14,19,20,21,29,36,44,180,182,267,350,405,445,454,481,497,],[15,15,-9,-11,-13,-12,-15,-10,-83,-8,15,-82,15,-37,-14,-16,-50,-17,-51,-18,-19,-20,]),'IF':([53,54,55,57,58,61,62,63,65,68,70,71,72,74,75,76,77,102,105,106,108,109,114,116,118,120,121,122,124,126,130,132,134,136,137,142,144,146,152,183,189,191,192,193,194,195,196,198,201,203,210,211,212,219,225,226,227,228,229,234,235,236,237,264,265,268,269,272,279,286,290,294,355,372,373,374,375,393,433,451,458,459,460,462,486,487,],[-191,-190,-121,-149,-165,-192,-145,-173,-117,-177,-141,-125,-159,-189,-153,-127,158,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,-118,-126,-179,-181,-185,-142,-160,-161,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-124,-152,-148,-120,-209,-180,-210,-144,-130,402,431,-278,-284,-283,-189,-279,402,431,-281,-280,-285,-282,-286,]),'AND':([53,54,55,57,58,61,62,63,68,70,71,72,74,75,76,102,105,106,108,109,114,116,118,120,121,124,126,130,132,134,136,137,142,144,146,152,183,189,191,192,193,194,195,196,198,203,210,211,212,219,225,226,227,228,229,234,235,236,237,264,265,268,272,279,286,290,294,393,],[-191,-190,107,-149,-165,-192,-145,-173,-177,-141,-125,-159,-189,-153,-127,-183,-193,188,-175,-150,-167,-166,-174,-146,-176,-126,-179,-181,-185,-142,-160,-161,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-124,-152,-148,-209,-180,-210,-144,-130,-189,]),'LBRACE':([35,52,56,60,64,66,69,73,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,147,148,149,150,151,153,155,156,157,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,238,239,240,246,248,262,273,275,276,278,282,283,285,289,292,295,315,316,322,325,328,330,334,346,352,357,367,370,377,382,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-136,73,-132,-131,-139,-134,-137,-135,-133,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-140,73,-138,73,73,73,73,73,73,-261,73,73,73,73,73,73,73,73,-262,73,73,73,73,73,73,73,73,73,73,73,73,73,-75,-70,-81,-79,-80,-73,73,-71,-74,-78,-77,-72,-76,73,73,73,73,73,-64,73,73,73,73,-65,]),'FROM':([0,4,5,7,11,12,14,19,20,21,29,36,44,180,182,267,350,405,445,454,481,497,],[13,13,-9,-11,-13,-12,-15,-10,-83,-8,13,-82,13,-37,-14,-16,-50,-17,-51,-18,-19,-20,]),'NAME':([0,4,5,7,8,11,12,13,14,15,19,20,21,29,31,32,35,36,37,39,40,44,45,47,48,49,52,56,60,64,66,69,73,78,80,83,87,89,90,93,107,110,111,112,113,115,119,123,125,127,128,129,135,138,139,143,145,147,148,149,150,151,153,155,156,157,158,159,160,164,165,168,170,174,177,179,180,182,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,238,239,240,246,247,248,252,257,259,262,267,273,275,276,278,282,283,285,289,292,295,296,300,302,304,308,310,311,313,315,316,319,322,325,328,330,334,338,339,340,342,344,346,348,349,350,351,352,357,358,360,361,362,363,365,367,370,376,377,382,384,385,386,389,394,396,398,402,404,405,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,426,431,432,435,437,440,441,444,445,446,447,450,452,453,454,460,461,463,465,471,472,473,475,476,477,479,481,482,483,484,491,492,494,495,496,497,498,500,],[17,17,-9,-11,24,-13,-12,24,-15,33,-10,-83,-8,17,24,-94,74,-82,79,81,24,17,86,86,-95,94,74,74,74,74,74,74,74,161,166,24,86,86,86,94,74,74,74,74,74,74,74,74,74,211,74,74,74,74,74,74,74,-136,74,-132,-131,-139,-134,-137,-135,-133,74,161,244,249,74,86,253,86,74,-44,-37,-14,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-140,74,-138,74,161,74,86,-45,314,74,-16,74,74,74,-261,74,74,74,74,74,74,161,161,345,347,-54,-52,-55,314,74,74,366,-262,74,74,74,74,161,380,381,383,161,74,314,-56,-50,-53,393,74,-24,-25,-21,-23,406,406,74,74,161,74,74,161,442,443,314,393,-57,-28,74,366,-17,-22,-26,406,-75,-68,-70,-81,-79,-80,455,-73,74,-71,-74,-78,-77,-72,-76,74,74,74,74,74,466,467,469,-51,-64,74,474,406,406,-18,74,74,74,489,-65,-33,493,-34,-31,-35,493,-19,406,-27,-69,499,-29,-32,-36,493,-20,501,-30,]),'VBAREQUAL':([366,406,474,493,],[422,422,422,422,]),'ATEQUAL':([366,406,474,493,],[420,420,420,420,]),'DOLLAREQUAL':([366,406,474,493,],[424,424,424,424,]),'LEFTSHIFT':([53,54,58,61,63,68,72,74,75,102,105,108,114,116,118,121,126,130,132,136,137,142,144,146,183,192,193,194,195,196,203,210,211,212,219,226,227,228,229,234,235,236,272,279,286,366,393,406,474,493,],[-191,-190,-165,-192,-173,-177,-159,-189,143,-183,-193,-175,-167,-166,-174,-176,-179,-181,-185,-160,-161,-187,-155,143,-184,-169,-171,-172,-170,-168,-208,-182,-211,-178,-186,-162,-163,-164,-188,-157,-158,-156,-209,-180,-210,423,-189,423,423,423,]),'INDENT':([181,266,397,],[259,319,450,]),'NOT':([35,52,53,54,57,58,61,62,63,66,68,69,70,72,73,74,75,76,102,105,107,108,109,114,116,118,120,121,123,125,126,129,130,132,134,136,137,142,144,146,151,152,158,165,177,183,186,188,191,192,193,194,195,196,198,200,202,203,204,206,210,211,212,213,214,219,222,225,226,227,228,229,230,232,234,235,236,237,246,248,262,265,268,272,273,275,276,278,279,282,283,285,286,289,290,292,294,295,315,322,325,328,330,334,346,352,367,370,377,382,393,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[66,66,-191,-190,-149,-165,-192,-145,-173,66,-177,66,-141,-159,66,-189,-153,154,-183,-193,66,-175,-150,-167,-166,-174,-146,-176,66,66,-179,66,-181,-185,-142,-160,-161,-187,-155,-154,238,154,66,66,66,-184,66,66,-151,-169,-171,-172,-170,-168,-147,66,66,-208,66,66,-182,-211,-178,66,66,-186,66,-143,-162,-163,-164,-188,66,66,-157,-158,-156,-129,66,66,66,-152,-148,-209,66,66,66,-261,-180,66,66,66,-210,66,-144,66,-130,66,66,-262,66,66,66,66,66,66,66,66,66,66,-189,66,66,-75,-70,-81,-79,-80,-73,66,-71,-74,-78,-77,-72,-76,66,66,66,66,66,-64,66,66,66,66,-65,]),'PY_BLOCK':([34,],[51,]),'OR':([53,54,55,57,58,61,62,63,65,68,70,71,72,74,75,76,102,105,106,108,109,114,116,118,120,121,122,124,126,130,132,134,136,137,142,144,146,152,183,189,191,192,193,194,195,196,198,201,203,210,211,212,219,225,226,227,228,229,234,235,236,237,264,265,268,269,272,279,286,290,294,393,],[-191,-190,-121,-149,-165,-192,-145,-173,123,-177,-141,-125,-159,-189,-153,-127,-183,-193,-122,-175,-150,-167,-166,-174,-146,-176,200,-126,-179,-181,-185,-142,-160,-161,-187,-155,-154,-128,-184,-123,-151,-169,-171,-172,-170,-168,-147,-119,-208,-182,-211,-178,-186,-143,-162,-163,-164,-188,-157,-158,-156,-129,-124,-152,-148,-120,-209,-180,-210,-144,-130,-189,]),'LAMBDA':([35,52,69,73,125,129,165,177,186,202,204,206,213,214,222,230,232,246,248,262,273,275,276,278,282,283,285,289,292,295,322,325,328,330,334,346,352,367,370,377,382,394,402,410,412,413,414,415,417,418,419,420,421,422,423,424,426,431,432,435,437,446,447,460,461,463,471,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-261,78,78,78,78,78,78,-262,78,78,376,78,78,78,78,78,78,78,78,376,-75,-70,-81,-79,-80,-73,78,-71,-74,-78,-77,-72,-76,78,376,376,376,78,-64,78,376,376,78,-65,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'import_as_name':([45,47,87,89,90,168,174,252,],[84,84,84,172,84,251,84,306,]),'declaration':([0,4,29,44,],[12,12,12,12,]),'import_from':([0,4,29,44,],[3,3,3,3,]),'comp_op':([76,152,],[148,239,]),'enaml_argument':([352,394,],[391,448,]),'factor':([35,52,56,60,64,66,69,73,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,148,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[58,58,108,118,121,58,58,58,58,58,192,193,194,195,58,58,58,212,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,279,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'testlist_safe':([330,],[372,]),'defn_body_items':([259,348,],[313,389,]),'and_expr':([35,52,66,69,73,107,119,123,125,129,135,148,158,165,177,184,186,188,199,200,202,204,206,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[62,62,62,62,62,62,198,62,62,62,62,62,62,62,62,62,62,62,268,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'and_expr_list':([57,],[109,]),'or_test_list':([65,],[122,]),'enaml_operator':([366,406,474,493,],[418,418,418,418,]),'dotted_as_names_list':([26,],[41,]),'subscriptlist':([129,],[217,]),'raw_python':([0,4,29,44,],[11,11,11,11,]),'lambdef':([35,52,69,73,125,129,165,177,186,202,204,206,213,214,222,230,232,246,248,262,273,275,276,282,283,285,289,292,295,325,328,334,346,352,367,370,377,382,394,418,426,437,447,463,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'arith_op':([72,136,],[137,226,]),'term':([35,52,66,69,73,107,110,119,123,125,129,135,138,139,143,145,148,158,165,177,184,186,188,190,199,200,202,204,206,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[72,72,72,72,72,72,72,72,72,72,72,72,227,228,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'or_test':([35,52,69,73,125,129,158,165,177,186,202,204,206,213,214,222,230,232,246,248,262,273,275,276,282,283,285,289,292,295,315,325,328,330,334,346,352,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[77,77,77,77,77,77,241,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,355,77,77,375,77,77,77,77,77,77,77,77,375,77,77,375,375,375,77,77,375,375,77,]),'dosm_comma_list':([141,],[231,]),'and_test_list':([55,],[106,]),'defn_keyword_parameter':([49,93,],[98,98,]),'trailer':([68,126,],[130,210,]),'enaml_import':([0,4,29,44,],[19,19,19,19,]),'dotted_name':([8,13,31,40,83,],[23,30,46,23,23,]),'expr_list':([70,],[134,]),'varargslist_list':([162,301,],[245,343,]),'atom_string_list':([35,52,56,60,64,66,69,73,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,148,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'defn_name_parameter':([49,93,],[95,95,]),'xor_expr':([35,52,66,69,73,107,123,125,129,135,148,158,165,177,184,186,188,200,202,204,206,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[70,70,70,70,70,70,70,70,70,225,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,290,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'listmaker':([69,],[131,]),'arglist':([125,],[205,]),'comp_if':([355,451,],[399,399,]),'shift_expr':([35,52,66,69,73,107,110,119,123,125,129,135,148,158,165,177,184,186,188,190,199,200,202,204,206,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[57,57,57,57,57,57,191,57,57,57,57,57,57,57,57,57,57,57,57,265,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'import_from_dots':([13,],[31,]),'arglist_list':([125,],[206,]),'list_iter':([372,458,],[428,485,]),'dictorsetmaker':([73,],[140,]),'list_for':([133,372,458,],[221,430,430,]),'subscript':([129,285,328,],[216,329,371,]),'enaml_module':([0,],[9,]),'comp_for':([104,141,207,293,355,451,],[187,233,277,335,400,400,]),'defn_body':([100,],[180,]),'power':([35,52,56,60,64,66,69,73,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,148,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'xor_expr_list':([62,],[120,]),'fplist_list':([242,],[297,]),'enaml_module_item':([0,4,29,44,],[5,21,5,21,]),'term_list':([58,],[116,]),'comparison':([35,52,66,69,73,107,123,125,129,158,165,177,186,188,200,202,204,206,213,214,222,230,232,246,248,262,273,275,276,282,283,285,289,292,295,315,325,328,330,334,346,352,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'defn_parameters_list_list':([49,],[93,]),'arith_expr':([35,52,66,69,73,107,110,119,123,125,129,135,143,145,148,158,165,177,184,186,188,190,199,200,202,204,206,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[75,75,75,75,75,75,75,75,75,75,75,75,234,235,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'enaml_arguments_list_list':([352,],[394,]),'declaration_body_item':([319,363,365,404,409,452,453,482,],[361,407,361,361,407,407,361,407,]),'defn_parameters':([33,],[50,]),'comp_iter':([355,451,],[401,480,]),'dotted_as_names':([8,],[25,]),'shift_op':([75,146,],[144,236,]),'enaml_arguments':([314,366,406,474,493,],[353,353,353,353,353,]),'instantiation_body_items':([450,479,],[473,496,]),'testlist_comp':([52,],[103,]),'old_test':([330,402,431,432,435,460,461,],[373,451,458,459,462,486,487,]),'testlist_safe_list':([373,],[433,]),'instantiation':([259,313,319,348,363,365,389,404,409,450,452,453,473,479,482,496,],[311,311,358,311,358,358,311,358,358,472,358,358,472,472,358,472,]),'import_stmt':([0,4,29,44,],[14,14,14,14,]),'attribute_binding':([319,363,365,404,409,450,452,453,473,479,482,496,],[362,362,362,362,362,477,362,362,477,477,362,477,]),'dotted_as_name':([8,40,83,],[26,82,167,]),'identifier':([319,404,450,],[365,453,479,]),'binding':([366,406,474,493,],[411,411,411,411,]),'defn_body_item':([259,313,348,389,],[310,351,310,351,]),'term_op':([58,116,],[114,196,]),'atom':([35,52,56,60,64,66,69,73,107,110,111,112,113,115,119,123,125,128,129,135,138,139,143,145,148,158,165,177,184,186,188,190,199,200,202,204,206,209,213,214,220,222,224,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'import_as_names':([45,47,87,90,174,],[88,92,171,175,255,]),'old_lambdef':([330,402,431,432,435,460,461,],[374,374,374,374,374,374,374,]),'exprlist':([184,220,],[260,287,]),'expr':([35,52,66,69,73,107,123,125,129,148,158,165,177,184,186,188,200,202,204,206,213,214,220,222,230,232,239,246,248,262,273,275,276,282,283,285,289,292,295,315,316,325,328,330,334,346,352,357,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[76,76,76,76,76,76,76,76,76,237,76,76,76,261,76,76,76,76,76,76,76,76,261,76,76,76,294,76,76,76,76,76,76,76,76,76,76,76,76,76,356,76,76,76,76,76,76,403,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'declaration_body':([197,],[267,]),'instantiation_body':([354,416,],[398,398,]),'defn_parameter':([49,93,],[99,176,]),'arith_expr_list':([72,],[136,]),'shift_list':([75,],[146,]),'enaml':([0,],[2,]),'subscriptlist_list':([216,],[284,]),'argument':([125,206,],[208,274,]),'enaml_module_body':([0,29,],[4,44,]),'fplist':([159,],[243,]),'not_test':([35,52,66,69,73,107,123,125,129,158,165,177,186,188,200,202,204,206,213,214,222,230,232,246,248,262,273,275,276,282,283,285,289,292,295,315,325,328,330,334,346,352,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[55,55,124,55,55,189,55,55,55,55,55,55,55,264,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'instantiation_body_item':([450,473,479,496,],[476,494,476,494,]),'fpdef':([78,159,247,296,300,338,344,376,384,],[162,242,303,337,341,379,303,162,341,]),'testlist_comp_list':([104,],[185,]),'enaml_arguments_list':([352,],[395,]),'list_if':([372,458,],[429,429,]),'test':([35,52,69,73,125,129,165,177,186,202,204,206,213,214,222,230,232,246,248,262,273,275,276,282,283,285,289,292,295,325,328,334,346,352,367,370,377,382,394,418,426,437,447,463,],[59,104,133,141,207,215,250,258,263,270,271,207,280,281,288,291,293,301,305,318,321,323,324,326,327,215,331,332,336,369,215,378,388,392,425,427,436,439,392,456,457,464,470,488,]),'import_as_names_list':([84,],[169,]),'import_name':([0,4,29,44,],[18,18,18,18,]),'exprlist_list':([261,],[317,]),'comparison_list':([76,],[152,]),'and_test':([35,52,69,73,123,125,129,158,165,177,186,200,202,204,206,213,214,222,230,232,246,248,262,273,275,276,282,283,285,289,292,295,315,325,328,330,334,346,352,367,370,377,382,394,402,418,426,431,432,435,437,447,460,461,463,],[65,65,65,65,201,65,65,65,65,65,65,269,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'declaration_body_items':([319,365,404,453,],[363,409,452,482,]),'defn_parameters_list':([49,],[97,]),'defn':([0,4,29,44,],[7,7,7,7,]),'enaml_call':([259,313,319,348,363,365,389,404,409,450,452,453,473,479,482,496,],[308,308,360,308,360,360,308,360,360,475,360,360,475,475,360,475,]),'dosm_colon_list':([293,],[333,]),'power_list':([68,],[126,]),'varargslist':([78,376,],[163,434,]),'dotted_name_list':([24,],[38,]),'listmaker_list':([133,],[223,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> enaml","S'",1,None,None,None),
+  ('enaml -> enaml_module ENDMARKER','enaml',2,'p_enaml1','parser.py',74),
+  ('enaml -> enaml_module NEWLINE ENDMARKER','enaml',3,'p_enaml1','parser.py',75),
+  ('enaml -> NEWLINE ENDMARKER','enaml',2,'p_enaml2','parser.py',80),
+  ('enaml -> ENDMARKER','enaml',1,'p_enaml2','parser.py',81),
+  ('enaml -> STRING NEWLINE ENDMARKER','enaml',3,'p_enaml3','parser.py',86),
+  ('enaml_module -> enaml_module_body','enaml_module',1,'p_enaml_module1','parser.py',91),
+  ('enaml_module -> STRING NEWLINE enaml_module_body','enaml_module',3,'p_enaml_module2','parser.py',96),
+  ('enaml_module_body -> enaml_module_body enaml_module_item','enaml_module_body',2,'p_enaml_module_body1','parser.py',104),
+  ('enaml_module_body -> enaml_module_item','enaml_module_body',1,'p_enaml_module_body2','parser.py',109),
+  ('enaml_module_item -> enaml_import','enaml_module_item',1,'p_enaml_module_item1','parser.py',117),
+  ('enaml_module_item -> defn','enaml_module_item',1,'p_enaml_module_item2','parser.py',122),
+  ('enaml_module_item -> declaration','enaml_module_item',1,'p_enaml_module_item3','parser.py',127),
+  ('enaml_module_item -> raw_python','enaml_module_item',1,'p_enaml_module_item4','parser.py',132),
+  ('raw_python -> PY_BLOCK_START NEWLINE PY_BLOCK PY_BLOCK_END NEWLINE','raw_python',5,'p_enaml_raw_python','parser.py',140),
+  ('enaml_import -> import_stmt','enaml_import',1,'p_enaml_import','parser.py',152),
+  ('declaration -> NAME LPAR test RPAR COLON declaration_body','declaration',6,'p_declaration','parser.py',163),
+  ('declaration_body -> NEWLINE INDENT declaration_body_items DEDENT','declaration_body',4,'p_declaration_body1','parser.py',174),
+  ('declaration_body -> NEWLINE INDENT identifier declaration_body_items DEDENT','declaration_body',5,'p_declaration_body2','parser.py',181),
+  ('declaration_body -> NEWLINE INDENT STRING NEWLINE declaration_body_items DEDENT','declaration_body',6,'p_declaration_body3','parser.py',188),
+  ('declaration_body -> NEWLINE INDENT STRING NEWLINE identifier declaration_body_items DEDENT','declaration_body',7,'p_declaration_body4','parser.py',195),
+  ('declaration_body_items -> declaration_body_item','declaration_body_items',1,'p_declaration_body_items1','parser.py',202),
+  ('declaration_body_items -> declaration_body_items declaration_body_item','declaration_body_items',2,'p_declaration_body_items2','parser.py',207),
+  ('declaration_body_item -> attribute_binding','declaration_body_item',1,'p_declaration_body_item1','parser.py',212),
+  ('declaration_body_item -> instantiation','declaration_body_item',1,'p_declaration_body_item2','parser.py',217),
+  ('declaration_body_item -> enaml_call','declaration_body_item',1,'p_declaration_body_item3','parser.py',222),
+  ('declaration_body_item -> PASS NEWLINE','declaration_body_item',2,'p_declaration_body_item4','parser.py',227),
+  ('identifier -> NAME COLON NAME NEWLINE','identifier',4,'p_identifier','parser.py',235),
+  ('instantiation -> NAME COLON instantiation_body','instantiation',3,'p_instantiation','parser.py',247),
+  ('instantiation_body -> NEWLINE INDENT instantiation_body_items DEDENT','instantiation_body',4,'p_instantiation_body1','parser.py',253),
+  ('instantiation_body -> NEWLINE INDENT identifier instantiation_body_items DEDENT','instantiation_body',5,'p_instantiation_body2','parser.py',260),
+  ('instantiation_body_items -> instantiation_body_item','instantiation_body_items',1,'p_instantiation_body_items1','parser.py',267),
+  ('instantiation_body_items -> instantiation_body_items instantiation_body_item','instantiation_body_items',2,'p_instantiation_body_items2','parser.py',272),
+  ('instantiation_body_item -> instantiation','instantiation_body_item',1,'p_instantiation_body_item1','parser.py',277),
+  ('instantiation_body_item -> enaml_call','instantiation_body_item',1,'p_instantiation_body_item2','parser.py',282),
+  ('instantiation_body_item -> attribute_binding','instantiation_body_item',1,'p_instantiation_body_item3','parser.py',287),
+  ('instantiation_body_item -> PASS NEWLINE','instantiation_body_item',2,'p_instantiation_body_item4','parser.py',292),
+  ('defn -> DEFN NAME defn_parameters COLON defn_body','defn',5,'p_defn','parser.py',300),
+  ('defn_parameters -> LPAR RPAR','defn_parameters',2,'p_defn_parameters1','parser.py',309),
+  ('defn_parameters -> LPAR defn_parameters_list RPAR','defn_parameters',3,'p_defn_parameters2','parser.py',314),
+  ('defn_parameters_list -> defn_parameter','defn_parameters_list',1,'p_defn_parameters_list1','parser.py',333),
+  ('defn_parameters_list -> defn_parameter COMMA','defn_parameters_list',2,'p_defn_parameters_list2','parser.py',338),
+  ('defn_parameters_list -> defn_parameters_list_list defn_parameter','defn_parameters_list',2,'p_defn_parameters_list3','parser.py',343),
+  ('defn_parameters_list -> defn_parameters_list_list defn_parameter COMMA','defn_parameters_list',3,'p_defn_parameters_list4','parser.py',348),
+  ('defn_parameters_list_list -> defn_parameter COMMA','defn_parameters_list_list',2,'p_defn_parameters_list_list1','parser.py',353),
+  ('defn_parameters_list_list -> defn_parameters_list_list defn_parameter COMMA','defn_parameters_list_list',3,'p_defn_parameters_list_list2','parser.py',358),
+  ('defn_parameter -> defn_name_parameter','defn_parameter',1,'p_defn_parameter1','parser.py',363),
+  ('defn_parameter -> defn_keyword_parameter','defn_parameter',1,'p_defn_parameter2','parser.py',368),
+  ('defn_name_parameter -> NAME','defn_name_parameter',1,'p_defn_name_parameter','parser.py',373),
+  ('defn_keyword_parameter -> NAME EQUAL test','defn_keyword_parameter',3,'p_defn_keyword_parameter','parser.py',378),
+  ('defn_body -> NEWLINE INDENT defn_body_items DEDENT','defn_body',4,'p_defn_body1','parser.py',391),
+  ('defn_body -> NEWLINE INDENT STRING NEWLINE defn_body_items DEDENT','defn_body',6,'p_defn_body2','parser.py',398),
+  ('defn_body_items -> defn_body_item','defn_body_items',1,'p_defn_body_items1','parser.py',405),
+  ('defn_body_items -> defn_body_items defn_body_item','defn_body_items',2,'p_defn_body_items2','parser.py',410),
+  ('defn_body_item -> enaml_call','defn_body_item',1,'p_defn_body_item1','parser.py',415),
+  ('defn_body_item -> instantiation','defn_body_item',1,'p_defn_body_item2','parser.py',420),
+  ('defn_body_item -> PASS NEWLINE','defn_body_item',2,'p_defn_body_item3','parser.py',425),
+  ('enaml_call -> NAME enaml_arguments NEWLINE','enaml_call',3,'p_enaml_call','parser.py',433),
+  ('enaml_arguments -> LPAR RPAR','enaml_arguments',2,'p_enaml_arguments1','parser.py',439),
+  ('enaml_arguments -> LPAR enaml_arguments_list RPAR','enaml_arguments',3,'p_enaml_arguments2','parser.py',444),
+  ('enaml_arguments_list -> enaml_argument','enaml_arguments_list',1,'p_enaml_arguments_list1','parser.py',472),
+  ('enaml_arguments_list -> enaml_argument COMMA','enaml_arguments_list',2,'p_enaml_arguments_list2','parser.py',477),
+  ('enaml_arguments_list -> enaml_arguments_list_list enaml_argument','enaml_arguments_list',2,'p_enaml_arguments_list3','parser.py',482),
+  ('enaml_arguments_list -> enaml_arguments_list_list enaml_argument COMMA','enaml_arguments_list',3,'p_enaml_arguments_list4','parser.py',487),
+  ('enaml_arguments_list_list -> enaml_argument COMMA','enaml_arguments_list_list',2,'p_enaml_arguments_list_list1','parser.py',492),
+  ('enaml_arguments_list_list -> enaml_arguments_list_list enaml_argument COMMA','enaml_arguments_list_list',3,'p_enaml_arguments_list_list2','parser.py',497),
+  ('enaml_argument -> test','enaml_argument',1,'p_enaml_argument1','parser.py',502),
+  ('enaml_argument -> NAME EQUAL test','enaml_argument',3,'p_enaml_argument2','parser.py',510),
+  ('attribute_binding -> NAME binding','attribute_binding',2,'p_attribute_binding','parser.py',523),
+  ('binding -> enaml_operator test NEWLINE','binding',3,'p_binding','parser.py',528),
+  ('enaml_operator -> EQUAL','enaml_operator',1,'p_enaml_operator','parser.py',540),
+  ('enaml_operator -> COLONEQUAL','enaml_operator',1,'p_enaml_operator','parser.py',541),
+  ('enaml_operator -> LEFTSHIFT','enaml_operator',1,'p_enaml_operator','parser.py',542),
+  ('enaml_operator -> RIGHTSHIFT','enaml_operator',1,'p_enaml_operator','parser.py',543),
+  ('enaml_operator -> ATEQUAL','enaml_operator',1,'p_enaml_operator','parser.py',544),
+  ('enaml_operator -> AMPEREQUAL','enaml_operator',1,'p_enaml_operator','parser.py',545),
+  ('enaml_operator -> DOLLAREQUAL','enaml_operator',1,'p_enaml_operator','parser.py',546),
+  ('enaml_operator -> VBAREQUAL','enaml_operator',1,'p_enaml_operator','parser.py',547),
+  ('enaml_operator -> LESSMINUS','enaml_operator',1,'p_enaml_operator','parser.py',548),
+  ('enaml_operator -> MINUSGREATER','enaml_operator',1,'p_enaml_operator','parser.py',549),
+  ('enaml_operator -> VBARGREATER','enaml_operator',1,'p_enaml_operator','parser.py',550),
+  ('enaml_operator -> LESSVBAR','enaml_operator',1,'p_enaml_operator','parser.py',551),
+  ('import_stmt -> import_name NEWLINE','import_stmt',2,'p_import_stmt1','parser.py',589),
+  ('import_stmt -> import_from NEWLINE','import_stmt',2,'p_import_stmt2','parser.py',597),
+  ('import_name -> IMPORT dotted_as_names','import_name',2,'p_import_name','parser.py',605),
+  ('import_from -> FROM dotted_name IMPORT STAR','import_from',4,'p_import_from1','parser.py',612),
+  ('import_from -> FROM dotted_name IMPORT import_as_names','import_from',4,'p_import_from2','parser.py',620),
+  ('import_from -> FROM dotted_name IMPORT LPAR import_as_names RPAR','import_from',6,'p_import_from3','parser.py',627),
+  ('import_from -> FROM import_from_dots dotted_name IMPORT STAR','import_from',5,'p_import_from4','parser.py',634),
+  ('import_from -> FROM import_from_dots dotted_name IMPORT import_as_name','import_from',5,'p_import_from5','parser.py',642),
+  ('import_from -> FROM import_from_dots dotted_name IMPORT LPAR import_as_names RPAR','import_from',7,'p_import_from6','parser.py',649),
+  ('import_from -> FROM import_from_dots IMPORT STAR','import_from',4,'p_import_from7','parser.py',656),
+  ('import_from -> FROM import_from_dots IMPORT import_as_names','import_from',4,'p_import_from8','parser.py',664),
+  ('import_from -> FROM import_from_dots IMPORT LPAR import_as_names RPAR','import_from',6,'p_import_from9','parser.py',671),
+  ('import_from_dots -> DOT','import_from_dots',1,'p_import_from_dots1','parser.py',678),
+  ('import_from_dots -> import_from_dots DOT','import_from_dots',2,'p_import_from_dots2','parser.py',683),
+  ('import_as_name -> NAME','import_as_name',1,'p_import_as_name1','parser.py',688),
+  ('import_as_name -> NAME AS NAME','import_as_name',3,'p_import_as_name2','parser.py',693),
+  ('dotted_as_name -> dotted_name','dotted_as_name',1,'p_dotted_as_name1','parser.py',698),
+  ('dotted_as_name -> dotted_name AS NAME','dotted_as_name',3,'p_dotted_as_name2','parser.py',704),
+  ('import_as_names -> import_as_name','import_as_names',1,'p_import_as_names1','parser.py',710),
+  ('import_as_names -> import_as_name COMMA','import_as_names',2,'p_import_as_names2','parser.py',715),
+  ('import_as_names -> import_as_name import_as_names_list','import_as_names',2,'p_import_as_names3','parser.py',720),
+  ('import_as_names -> import_as_name import_as_names_list COMMA','import_as_names',3,'p_import_as_names4','parser.py',725),
+  ('import_as_names_list -> COMMA import_as_name','import_as_names_list',2,'p_import_as_names_list1','parser.py',730),
+  ('import_as_names_list -> import_as_names_list COMMA import_as_name','import_as_names_list',3,'p_import_as_names_list2','parser.py',735),
+  ('dotted_as_names -> dotted_as_name','dotted_as_names',1,'p_dotted_as_names1','parser.py',740),
+  ('dotted_as_names -> dotted_as_name dotted_as_names_list','dotted_as_names',2,'p_dotted_as_names2','parser.py',745),
+  ('dotted_as_names_list -> COMMA dotted_as_name','dotted_as_names_list',2,'p_dotted_as_names_list1','parser.py',750),
+  ('dotted_as_names_list -> dotted_as_names_list COMMA dotted_as_name','dotted_as_names_list',3,'p_dotted_as_names_star_list2','parser.py',755),
+  ('dotted_name -> NAME','dotted_name',1,'p_dotted_name1','parser.py',760),
+  ('dotted_name -> NAME dotted_name_list','dotted_name',2,'p_dotted_name2','parser.py',765),
+  ('dotted_name_list -> DOT NAME','dotted_name_list',2,'p_dotted_name_list1','parser.py',770),
+  ('dotted_name_list -> dotted_name_list DOT NAME','dotted_name_list',3,'p_dotted_name_list2','parser.py',775),
+  ('test -> or_test','test',1,'p_test1','parser.py',783),
+  ('test -> or_test IF or_test ELSE test','test',5,'p_test2','parser.py',788),
+  ('test -> lambdef','test',1,'p_test3','parser.py',794),
+  ('or_test -> and_test','or_test',1,'p_or_test1','parser.py',799),
+  ('or_test -> and_test or_test_list','or_test',2,'p_or_test2','parser.py',804),
+  ('or_test_list -> OR and_test','or_test_list',2,'p_or_test_list1','parser.py',811),
+  ('or_test_list -> or_test_list OR and_test','or_test_list',3,'p_or_test_list2','parser.py',816),
+  ('and_test -> not_test','and_test',1,'p_and_test1','parser.py',821),
+  ('and_test -> not_test and_test_list','and_test',2,'p_and_test2','parser.py',826),
+  ('and_test_list -> AND not_test','and_test_list',2,'p_and_test_list1','parser.py',833),
+  ('and_test_list -> and_test_list AND not_test','and_test_list',3,'p_and_test_list2','parser.py',838),
+  ('not_test -> comparison','not_test',1,'p_not_test','parser.py',843),
+  ('not_test -> NOT not_test','not_test',2,'p_not_test2','parser.py',848),
+  ('comparison -> expr','comparison',1,'p_comparison1','parser.py',854),
+  ('comparison -> expr comparison_list','comparison',2,'p_comparison2','parser.py',859),
+  ('comparison_list -> comp_op expr','comparison_list',2,'p_comparison_list1','parser.py',867),
+  ('comparison_list -> comparison_list comp_op expr','comparison_list',3,'p_comparison_list2','parser.py',872),
+  ('comp_op -> LESS','comp_op',1,'p_comp_op1','parser.py',877),
+  ('comp_op -> GREATER','comp_op',1,'p_comp_op2','parser.py',882),
+  ('comp_op -> EQEQUAL','comp_op',1,'p_comp_op3','parser.py',887),
+  ('comp_op -> GREATEREQUAL','comp_op',1,'p_comp_op4','parser.py',892),
+  ('comp_op -> LESSEQUAL','comp_op',1,'p_comp_op5','parser.py',897),
+  ('comp_op -> NOTEQUAL','comp_op',1,'p_comp_op6','parser.py',902),
+  ('comp_op -> IN','comp_op',1,'p_comp_op7','parser.py',907),
+  ('comp_op -> NOT IN','comp_op',2,'p_comp_op8','parser.py',912),
+  ('comp_op -> IS','comp_op',1,'p_comp_op9','parser.py',917),
+  ('comp_op -> IS NOT','comp_op',2,'p_comp_op10','parser.py',922),
+  ('expr -> xor_expr','expr',1,'p_expr1','parser.py',927),
+  ('expr -> xor_expr expr_list','expr',2,'p_expr2','parser.py',932),
+  ('expr_list -> VBAR xor_expr','expr_list',2,'p_expr_list1','parser.py',940),
+  ('expr_list -> expr_list VBAR xor_expr','expr_list',3,'p_expr_list2','parser.py',945),
+  ('xor_expr -> and_expr','xor_expr',1,'p_xor_expr1','parser.py',950),
+  ('xor_expr -> and_expr xor_expr_list','xor_expr',2,'p_xor_expr2','parser.py',955),
+  ('xor_expr_list -> CIRCUMFLEX and_expr','xor_expr_list',2,'p_xor_expr_list1','parser.py',963),
+  ('xor_expr_list -> xor_expr_list CIRCUMFLEX and_expr','xor_expr_list',3,'p_xor_expr_list2','parser.py',968),
+  ('and_expr -> shift_expr','and_expr',1,'p_and_expr1','parser.py',973),
+  ('and_expr -> shift_expr and_expr_list','and_expr',2,'p_and_expr2','parser.py',978),
+  ('and_expr_list -> AMPER shift_expr','and_expr_list',2,'p_and_expr_list1','parser.py',986),
+  ('and_expr_list -> and_expr_list AMPER shift_expr','and_expr_list',3,'p_and_expr_list2','parser.py',991),
+  ('shift_expr -> arith_expr','shift_expr',1,'p_shift_expr1','parser.py',996),
+  ('shift_expr -> arith_expr shift_list','shift_expr',2,'p_shift_expr2','parser.py',1001),
+  ('shift_list -> shift_op','shift_list',1,'p_shift_list1','parser.py',1009),
+  ('shift_list -> shift_list shift_op','shift_list',2,'p_shift_list2','parser.py',1014),
+  ('shift_op -> LEFTSHIFT arith_expr','shift_op',2,'p_shift_op1','parser.py',1019),
+  ('shift_op -> RIGHTSHIFT arith_expr','shift_op',2,'p_shift_op2','parser.py',1024),
+  ('arith_expr -> term','arith_expr',1,'p_arith_expr1','parser.py',1029),
+  ('arith_expr -> term arith_expr_list','arith_expr',2,'p_arith_expr2','parser.py',1034),
+  ('arith_expr_list -> arith_op','arith_expr_list',1,'p_arith_expr_list1','parser.py',1042),
+  ('arith_expr_list -> arith_expr_list arith_op','arith_expr_list',2,'p_arith_expr_list2','parser.py',1047),
+  ('arith_op -> PLUS term','arith_op',2,'p_arith_op1','parser.py',1052),
+  ('arith_op -> MINUS term','arith_op',2,'p_arith_op2','parser.py',1058),
+  ('term -> factor','term',1,'p_term1','parser.py',1063),
+  ('term -> factor term_list','term',2,'p_term2','parser.py',1068),
+  ('term_list -> term_op','term_list',1,'p_term_list1','parser.py',1076),
+  ('term_list -> term_list term_op','term_list',2,'p_term_list2','parser.py',1081),
+  ('term_op -> STAR factor','term_op',2,'p_term_op1','parser.py',1086),
+  ('term_op -> SLASH factor','term_op',2,'p_term_op2','parser.py',1091),
+  ('term_op -> PERCENT factor','term_op',2,'p_term_op3','parser.py',1096),
+  ('term_op -> DOUBLESLASH factor','term_op',2,'p_term_op4','parser.py',1101),
+  ('factor -> power','factor',1,'p_factor1','parser.py',1106),
+  ('factor -> PLUS factor','factor',2,'p_factor2','parser.py',1111),
+  ('factor -> MINUS factor','factor',2,'p_factor3','parser.py',1119),
+  ('factor -> TILDE factor','factor',2,'p_factor4','parser.py',1127),
+  ('power -> atom','power',1,'p_power1','parser.py',1135),
+  ('power -> atom DOUBLESTAR factor','power',3,'p_power2','parser.py',1140),
+  ('power -> atom power_list','power',2,'p_power3','parser.py',1146),
+  ('power -> atom power_list DOUBLESTAR factor','power',4,'p_power4','parser.py',1162),
+  ('power_list -> trailer','power_list',1,'p_power_list1','parser.py',1179),
+  ('power_list -> power_list trailer','power_list',2,'p_power_list2','parser.py',1184),
+  ('atom -> LPAR RPAR','atom',2,'p_atom1','parser.py',1189),
+  ('atom -> LPAR testlist_comp RPAR','atom',3,'p_atom2','parser.py',1194),
+  ('atom -> LSQB RSQB','atom',2,'p_atom3','parser.py',1208),
+  ('atom -> LSQB listmaker RSQB','atom',3,'p_atom4','parser.py',1213),
+  ('atom -> LBRACE RBRACE','atom',2,'p_atom5','parser.py',1225),
+  ('atom -> LBRACE dictorsetmaker RBRACE','atom',3,'p_atom6','parser.py',1230),
+  ('atom -> NAME','atom',1,'p_atom7','parser.py',1251),
+  ('atom -> NUMBER','atom',1,'p_atom8','parser.py',1256),
+  ('atom -> atom_string_list','atom',1,'p_atom9','parser.py',1262),
+  ('atom_string_list -> STRING','atom_string_list',1,'p_atom_string_list1','parser.py',1268),
+  ('atom_string_list -> atom_string_list STRING','atom_string_list',2,'p_atom_string_list2','parser.py',1273),
+  ('listmaker -> test list_for','listmaker',2,'p_listmaker1','parser.py',1283),
+  ('listmaker -> test','listmaker',1,'p_listmaker2','parser.py',1288),
+  ('listmaker -> test COMMA','listmaker',2,'p_listmaker3','parser.py',1293),
+  ('listmaker -> test listmaker_list','listmaker',2,'p_listmaker4','parser.py',1298),
+  ('listmaker -> test listmaker_list COMMA','listmaker',3,'p_listmaker5','parser.py',1304),
+  ('listmaker_list -> COMMA test','listmaker_list',2,'p_listmaker_list1','parser.py',1310),
+  ('listmaker_list -> listmaker_list COMMA test','listmaker_list',3,'p_listmaker_list2','parser.py',1315),
+  ('testlist_comp -> test comp_for','testlist_comp',2,'p_testlist_comp1','parser.py',1320),
+  ('testlist_comp -> test','testlist_comp',1,'p_testlist_comp2','parser.py',1325),
+  ('testlist_comp -> test COMMA','testlist_comp',2,'p_testlist_comp3','parser.py',1330),
+  ('testlist_comp -> test testlist_comp_list','testlist_comp',2,'p_testlist_comp4','parser.py',1335),
+  ('testlist_comp -> test testlist_comp_list COMMA','testlist_comp',3,'p_testlist_comp5','parser.py',1341),
+  ('testlist_comp_list -> COMMA test','testlist_comp_list',2,'p_testlist_comp_list1','parser.py',1347),
+  ('testlist_comp_list -> testlist_comp_list COMMA test','testlist_comp_list',3,'p_testlist_comp_list2','parser.py',1352),
+  ('trailer -> LPAR RPAR','trailer',2,'p_trailer1','parser.py',1357),
+  ('trailer -> LPAR arglist RPAR','trailer',3,'p_trailer2','parser.py',1362),
+  ('trailer -> LSQB subscriptlist RSQB','trailer',3,'p_trailer3','parser.py',1369),
+  ('trailer -> DOT NAME','trailer',2,'p_trailer4','parser.py',1374),
+  ('subscriptlist -> subscript','subscriptlist',1,'p_subscriptlist1','parser.py',1379),
+  ('subscriptlist -> subscript COMMA','subscriptlist',2,'p_subscriptlist2','parser.py',1384),
+  ('subscriptlist -> subscript subscriptlist_list','subscriptlist',2,'p_subscriptlist3','parser.py',1390),
+  ('subscriptlist -> subscript subscriptlist_list COMMA','subscriptlist',3,'p_subscriptlist4','parser.py',1396),
+  ('subscriptlist_list -> COMMA subscript','subscriptlist_list',2,'p_subscriptlist_list1','parser.py',1402),
+  ('subscriptlist_list -> subscriptlist_list COMMA subscript','subscriptlist_list',3,'p_subscript_list2','parser.py',1407),
+  ('subscript -> ELLIPSIS','subscript',1,'p_subscript1','parser.py',1412),
+  ('subscript -> test','subscript',1,'p_subcript2','parser.py',1417),
+  ('subscript -> COLON','subscript',1,'p_subscript3','parser.py',1422),
+  ('subscript -> DOUBLECOLON','subscript',1,'p_subscript4','parser.py',1427),
+  ('subscript -> test COLON','subscript',2,'p_subscript5','parser.py',1433),
+  ('subscript -> test DOUBLECOLON','subscript',2,'p_subscrip6','parser.py',1438),
+  ('subscript -> COLON test','subscript',2,'p_subscript7','parser.py',1444),
+  ('subscript -> COLON test COLON','subscript',3,'p_subscript8','parser.py',1449),
+  ('subscript -> DOUBLECOLON test','subscript',2,'p_subscript9','parser.py',1455),
+  ('subscript -> test COLON test','subscript',3,'p_subscript10','parser.py',1460),
+  ('subscript -> test COLON test COLON','subscript',4,'p_subscript11','parser.py',1465),
+  ('subscript -> COLON test COLON test','subscript',4,'p_subscript12','parser.py',1471),
+  ('subscript -> test COLON test COLON test','subscript',5,'p_subscript13','parser.py',1476),
+  ('subscript -> test DOUBLECOLON test','subscript',3,'p_subscript14','parser.py',1481),
+  ('exprlist -> expr','exprlist',1,'p_exprlist1','parser.py',1492),
+  ('exprlist -> expr COMMA','exprlist',2,'p_exprlist2','parser.py',1500),
+  ('exprlist -> expr exprlist_list','exprlist',2,'p_exprlist3','parser.py',1509),
+  ('exprlist -> expr exprlist_list COMMA','exprlist',3,'p_exprlist4','parser.py',1518),
+  ('exprlist_list -> COMMA expr','exprlist_list',2,'p_exprlist_list1','parser.py',1527),
+  ('exprlist_list -> exprlist_list COMMA expr','exprlist_list',3,'p_exprlist_list2','parser.py',1532),
+  ('dictorsetmaker -> test COLON test comp_for','dictorsetmaker',4,'p_dictorsetmaker1','parser.py',1537),
+  ('dictorsetmaker -> test COLON test','dictorsetmaker',3,'p_dictorsetmaker2','parser.py',1542),
+  ('dictorsetmaker -> test COLON test COMMA','dictorsetmaker',4,'p_dictorsetmaker3','parser.py',1548),
+  ('dictorsetmaker -> test COLON test dosm_colon_list','dictorsetmaker',4,'p_dictorsetmaker4','parser.py',1554),
+  ('dictorsetmaker -> test COLON test dosm_colon_list COMMA','dictorsetmaker',5,'p_dictorsetmaker5','parser.py',1560),
+  ('dictorsetmaker -> test comp_for','dictorsetmaker',2,'p_dictorsetmaker6','parser.py',1566),
+  ('dictorsetmaker -> test COMMA','dictorsetmaker',2,'p_dictorsetmaker7','parser.py',1571),
+  ('dictorsetmaker -> test dosm_comma_list','dictorsetmaker',2,'p_dictorsetmaker8','parser.py',1577),
+  ('dictorsetmaker -> test dosm_comma_list COMMA','dictorsetmaker',3,'p_dictorsetmaker9','parser.py',1583),
+  ('dosm_colon_list -> COMMA test COLON test','dosm_colon_list',4,'p_dosm_colon_list1','parser.py',1589),
+  ('dosm_colon_list -> dosm_colon_list COMMA test COLON test','dosm_colon_list',5,'p_dosm_colon_list2','parser.py',1594),
+  ('dosm_comma_list -> COMMA test','dosm_comma_list',2,'p_dosm_comma_list1','parser.py',1599),
+  ('dosm_comma_list -> dosm_comma_list COMMA test','dosm_comma_list',3,'p_dosm_comma_list2','parser.py',1604),
+  ('arglist -> argument','arglist',1,'p_arglist1','parser.py',1609),
+  ('arglist -> argument COMMA','arglist',2,'p_arglist2','parser.py',1617),
+  ('arglist -> STAR test','arglist',2,'p_arglist3','parser.py',1625),
+  ('arglist -> STAR test COMMA DOUBLESTAR test','arglist',5,'p_arglist4','parser.py',1630),
+  ('arglist -> DOUBLESTAR test','arglist',2,'p_arglist5','parser.py',1635),
+  ('arglist -> arglist_list argument','arglist',2,'p_arglist6','parser.py',1640),
+  ('arglist -> arglist_list argument COMMA','arglist',3,'p_arglist7','parser.py',1652),
+  ('arglist -> arglist_list STAR test','arglist',3,'p_arglist8','parser.py',1664),
+  ('arglist -> arglist_list STAR test COMMA DOUBLESTAR test','arglist',6,'p_arglist9','parser.py',1676),
+  ('arglist -> arglist_list DOUBLESTAR test','arglist',3,'p_arglist10','parser.py',1688),
+  ('arglist_list -> argument COMMA','arglist_list',2,'p_arglist_list1','parser.py',1700),
+  ('arglist_list -> arglist_list argument COMMA','arglist_list',3,'p_arglist_list2','parser.py',1705),
+  ('argument -> test','argument',1,'p_argument1','parser.py',1710),
+  ('argument -> test comp_for','argument',2,'p_argument2','parser.py',1715),
+  ('argument -> test EQUAL test','argument',3,'p_argument3','parser.py',1722),
+  ('list_for -> FOR exprlist IN testlist_safe','list_for',4,'p_list_for1','parser.py',1730),
+  ('list_for -> FOR exprlist IN testlist_safe list_iter','list_for',5,'p_list_for2','parser.py',1735),
+  ('list_iter -> list_for','list_iter',1,'p_list_iter1','parser.py',1747),
+  ('list_iter -> list_if','list_iter',1,'p_list_iter2','parser.py',1752),
+  ('list_if -> IF old_test','list_if',2,'p_list_if1','parser.py',1757),
+  ('list_if -> IF old_test list_iter','list_if',3,'p_list_if2','parser.py',1762),
+  ('comp_for -> FOR exprlist IN or_test','comp_for',4,'p_comp_for1','parser.py',1767),
+  ('comp_for -> FOR exprlist IN or_test comp_iter','comp_for',5,'p_comp_for2','parser.py',1772),
+  ('comp_iter -> comp_for','comp_iter',1,'p_comp_iter1','parser.py',1784),
+  ('comp_iter -> comp_if','comp_iter',1,'p_comp_iter2','parser.py',1789),
+  ('comp_if -> IF old_test','comp_if',2,'p_comp_if1','parser.py',1794),
+  ('comp_if -> IF old_test comp_iter','comp_if',3,'p_comp_if2','parser.py',1799),
+  ('testlist_safe -> old_test','testlist_safe',1,'p_testlist_safe1','parser.py',1804),
+  ('testlist_safe -> old_test testlist_safe_list','testlist_safe',2,'p_testlist_safe2','parser.py',1809),
+  ('testlist_safe -> old_test testlist_safe_list COMMA','testlist_safe',3,'p_testlist_safe3','parser.py',1815),
+  ('testlist_safe_list -> COMMA old_test','testlist_safe_list',2,'p_testlist_safe_list1','parser.py',1821),
+  ('testlist_safe_list -> testlist_safe_list COMMA old_test','testlist_safe_list',3,'p_testlist_safe_list2','parser.py',1826),
+  ('old_test -> or_test','old_test',1,'p_old_test1','parser.py',1831),
+  ('old_test -> old_lambdef','old_test',1,'p_old_test2','parser.py',1836),
+  ('old_lambdef -> LAMBDA COLON old_test','old_lambdef',3,'p_old_lambdef1','parser.py',1841),
+  ('old_lambdef -> LAMBDA varargslist COLON old_test','old_lambdef',4,'p_old_lambdef2','parser.py',1848),
+  ('lambdef -> LAMBDA COLON test','lambdef',3,'p_lambdef1','parser.py',1855),
+  ('lambdef -> LAMBDA varargslist COLON test','lambdef',4,'p_lambdef2','parser.py',1862),
+  ('varargslist -> fpdef COMMA STAR NAME','varargslist',4,'p_varargslist1','parser.py',1869),
+  ('varargslist -> fpdef COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',7,'p_varargslist2','parser.py',1876),
+  ('varargslist -> fpdef COMMA DOUBLESTAR NAME','varargslist',4,'p_varargslist3','parser.py',1883),
+  ('varargslist -> fpdef','varargslist',1,'p_varargslist4','parser.py',1890),
+  ('varargslist -> fpdef COMMA','varargslist',2,'p_varargslist5','parser.py',1897),
+  ('varargslist -> fpdef varargslist_list COMMA STAR NAME','varargslist',5,'p_varargslist6','parser.py',1904),
+  ('varargslist -> fpdef varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',8,'p_varargslist7','parser.py',1913),
+  ('varargslist -> fpdef varargslist_list COMMA DOUBLESTAR NAME','varargslist',5,'p_varargslist8','parser.py',1922),
+  ('varargslist -> fpdef varargslist_list','varargslist',2,'p_varargslist9','parser.py',1931),
+  ('varargslist -> fpdef varargslist_list COMMA','varargslist',3,'p_varargslist10','parser.py',1940),
+  ('varargslist -> fpdef EQUAL test COMMA STAR NAME','varargslist',6,'p_varargslist11','parser.py',1949),
+  ('varargslist -> fpdef EQUAL test COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',9,'p_varargslist12','parser.py',1956),
+  ('varargslist -> fpdef EQUAL test COMMA DOUBLESTAR NAME','varargslist',6,'p_varargslist13','parser.py',1963),
+  ('varargslist -> fpdef EQUAL test','varargslist',3,'p_varargslist14','parser.py',1970),
+  ('varargslist -> fpdef EQUAL test COMMA','varargslist',4,'p_varargslist15','parser.py',1977),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA STAR NAME','varargslist',7,'p_varargslist16','parser.py',1984),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA STAR NAME COMMA DOUBLESTAR NAME','varargslist',10,'p_varargslist17','parser.py',1993),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA DOUBLESTAR NAME','varargslist',7,'p_varargslist18','parser.py',2002),
+  ('varargslist -> fpdef EQUAL test varargslist_list','varargslist',4,'p_varargslist19','parser.py',2011),
+  ('varargslist -> fpdef EQUAL test varargslist_list COMMA','varargslist',5,'p_varargslist20','parser.py',2020),
+  ('varargslist -> STAR NAME','varargslist',2,'p_varargslist21','parser.py',2029),
+  ('varargslist -> STAR NAME COMMA DOUBLESTAR NAME','varargslist',5,'p_varargslist22','parser.py',2035),
+  ('varargslist -> DOUBLESTAR NAME','varargslist',2,'p_varargslist23','parser.py',2041),
+  ('varargslist_list -> COMMA fpdef','varargslist_list',2,'p_varargslist_list1','parser.py',2048),
+  ('varargslist_list -> COMMA fpdef EQUAL test','varargslist_list',4,'p_varargslist_list2','parser.py',2053),
+  ('varargslist_list -> varargslist_list COMMA fpdef','varargslist_list',3,'p_varargslist_list3','parser.py',2058),
+  ('varargslist_list -> varargslist_list COMMA fpdef EQUAL test','varargslist_list',5,'p_varargslist_list4','parser.py',2067),
+  ('fpdef -> NAME','fpdef',1,'p_fpdef1','parser.py',2075),
+  ('fpdef -> LPAR fplist RPAR','fpdef',3,'p_fpdef2','parser.py',2080),
+  ('fplist -> fpdef','fplist',1,'p_fplist1','parser.py',2087),
+  ('fplist -> fpdef COMMA','fplist',2,'p_fplist2','parser.py',2092),
+  ('fplist -> fpdef fplist_list','fplist',2,'p_fplist3','parser.py',2097),
+  ('fplist -> fpdef fplist_list COMMA','fplist',3,'p_fplist4','parser.py',2103),
+  ('fplist_list -> COMMA fpdef','fplist_list',2,'p_fplist_list1','parser.py',2109),
+  ('fplist_list -> fplist_list COMMA fpdef','fplist_list',3,'p_fplist_list2','parser.py',2114),
+]
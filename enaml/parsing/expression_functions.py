@@ -0,0 +1,138 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Bytecode rewriting which turns the code of a binding expression into
+the code of a function.
+
+The code objects of the binding expressions are compiled in 'eval' mode,
+so every free name in the expression is loaded with LOAD_NAME from the
+locals mapping of the evaluation. Once the scope which resolves each
+name is known, the loads can instead be made from the fast locals and
+the globals of a function, which avoids the Python level lookups of the
+mapping on every evaluation.
+
+"""
+from . import byteplay
+
+
+#: A cache of the (load_names, store_names) of the code objects passed
+#: to code_names.
+_code_names = {}
+
+
+#: A cache of the function code objects created by function_code.
+_function_codes = {}
+
+
+def code_names(code):
+    """ Returns the names loaded and stored by an expression code object.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The code object for an expression compiled in 'eval' mode.
+
+    Returns
+    -------
+    result : tuple
+        A tuple of (load_names, store_names) where load_names is a tuple
+        of the names loaded with LOAD_NAME, in order of first use, which
+        are never stored by the expression, and store_names is the set
+        of names which are stored (by a list comprehension).
+
+    """
+    try:
+        return _code_names[code]
+    except KeyError:
+        pass
+    bp = byteplay
+    loads = []
+    stores = set()
+    for op, arg in bp.Code.from_code(code).code:
+        if op == bp.LOAD_NAME:
+            if arg not in loads:
+                loads.append(arg)
+        elif op == bp.STORE_NAME or op == bp.DELETE_NAME:
+            stores.add(arg)
+    load_names = tuple(name for name in loads if name not in stores)
+    res = _code_names[code] = (load_names, frozenset(stores))
+    return res
+
+
+def function_code(code, args, attr_names, call_names=frozenset()):
+    """ Returns a version of an expression code object which is the code
+    of a function.
+
+    The names in `args` are the arguments of the function. Loads of
+    these names, and of the names stored by the expression, become
+    LOAD_FAST. The arguments named in `attr_names` hold a callable
+    (normally a weak reference) which returns the object owning the
+    attribute of that name, and a load of the name becomes a load of
+    the attribute of that object. The arguments named in `call_names`
+    hold a callable which returns the value of the name, and a load of
+    the name becomes a call of the callable. All other names are loaded
+    with LOAD_GLOBAL. The code objects of nested scopes are not 
+    rewritten, so this should only be used for code without nested 
+    scopes.
+
+    The rewritten code objects are cached.
+
+    Parameters
+    ----------
+    code : types.CodeType
+        The code object for an expression compiled in 'eval' mode.
+
+    args : tuple of strings
+        The argument names of the function.
+
+    attr_names : frozenset of strings
+        The subset of `args` which are loaded as attributes.
+
+    call_names : frozenset of strings, optional
+        The subset of `args` which are loaded by calling them.
+
+    Returns
+    -------
+    result : types.CodeType
+        The code object for the function.
+
+    """
+    key = (code, args, attr_names, call_names)
+    try:
+        return _function_codes[key]
+    except KeyError:
+        pass
+    bp = byteplay
+    bp_code = bp.Code.from_code(code)
+    load_names, store_names = code_names(code)
+    new_ops = []
+    for op, arg in bp_code.code:
+        if op == bp.LOAD_NAME:
+            if arg in attr_names and arg not in store_names:
+                new_ops.extend([
+                    (bp.LOAD_FAST, arg),
+                    (bp.CALL_FUNCTION, 0),
+                    (bp.LOAD_ATTR, arg),
+                ])
+            elif arg in call_names and arg not in store_names:
+                new_ops.extend([
+                    (bp.LOAD_FAST, arg),
+                    (bp.CALL_FUNCTION, 0),
+                ])
+            elif arg in args or arg in store_names:
+                new_ops.append((bp.LOAD_FAST, arg))
+            else:
+                new_ops.append((bp.LOAD_GLOBAL, arg))
+        elif op == bp.STORE_NAME:
+            new_ops.append((bp.STORE_FAST, arg))
+        elif op == bp.DELETE_NAME:
+            new_ops.append((bp.DELETE_FAST, arg))
+        else:
+            new_ops.append((op, arg))
+    func_code = bp.Code(
+        new_ops, [], list(args), False, False, True, bp_code.name,
+        bp_code.filename, bp_code.firstlineno, None,
+    )
+    res = _function_codes[key] = func_code.to_code()
+    return res
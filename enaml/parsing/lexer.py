@@ -412,9 +412,10 @@ class EnamlLexer(object):
     #--------------------------------------------------------------------------
     # Normal Class Items
     #--------------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, fused=True):
         self.lexer = lex.lex(module=self)
         self.token_stream = None
+        self.fused = fused
         
     def input(self, txt):
         self.lexer.input(txt)
@@ -462,6 +463,8 @@ class EnamlLexer(object):
         return tok
 
     def make_token_stream(self):
+        if self.fused:
+            return self.fused_token_stream()
         token_stream = iter(self.lexer.token, None)
         token_stream = self.create_py_blocks(token_stream)
         token_stream = self.create_strings(token_stream)
@@ -470,139 +473,251 @@ class EnamlLexer(object):
         token_stream = self.add_endmarker(token_stream)
         return token_stream
 
+    def fused_token_stream(self):
+        # This performs the same processing as the chain of filters
+        # created by make_token_stream when `fused` is False, but does
+        # it in a single generator so that a token does not need to 
+        # pass through five generator frames on its way to the parser.
+        # The filters are documented individually below; any change
+        # to them must be mirrored here. The two must produce the
+        # identical token stream, which is verified by the test suite.
+        NO_INDENT = 0
+        MAY_INDENT = 1
+        MUST_INDENT = 2
+
+        token_stream = iter(self.lexer.token, None)
+
+        # annotate_indentation_state
+        self.at_line_start = at_line_start = True
+        indent = NO_INDENT
+
+        # synthesize_indentation_tokens
+        levels = [0]
+        depth = 0
+        prev_was_ws = False
+        token = None
+
+        for tok in token_stream:
+            tok_type = tok.type
+            if tok_type == 'PY_BLOCK_START':
+                toks = self.py_block_tokens(tok, token_stream)
+            elif tok_type.startswith('STRING_START_'):
+                toks = (self.join_string(tok, token_stream),)
+            else:
+                toks = (tok,)
+
+            for token in toks:
+                tok_type = token.type
+                token.at_line_start = at_line_start
+
+                # annotate_indentation_state
+                if tok_type == 'COLON':
+                    at_line_start = False
+                    indent = MAY_INDENT
+                    token.must_indent = False
+                elif tok_type == 'NEWLINE':
+                    at_line_start = True
+                    if indent == MAY_INDENT:
+                        indent = MUST_INDENT
+                    token.must_indent = False
+                elif tok_type == 'WS':
+                    assert token.at_line_start == True
+                    at_line_start = True
+                    token.must_indent = False
+                else:
+                    token.must_indent = indent == MUST_INDENT
+                    at_line_start = False
+                    indent = NO_INDENT
+
+                # synthesize_indentation_tokens
+                if tok_type == 'WS':
+                    assert depth == 0
+                    depth = len(token.value)
+                    prev_was_ws = True
+                elif tok_type == 'NEWLINE':
+                    depth = 0
+                    if not (prev_was_ws or token.at_line_start):
+                        yield token
+                else:
+                    prev_was_ws = False
+                    if token.must_indent:
+                        if not (depth > levels[-1]):
+                            msg = 'Expected an indented block.'
+                            raise_indentation_error(msg, token)
+                        levels.append(depth)
+                        yield self.indent(token.lineno)
+                    elif token.at_line_start and depth != levels[-1]:
+                        if depth > levels[-1]:
+                            msg = 'Unexpected indent.'
+                            raise_indentation_error(msg, token)
+                        try:
+                            i = levels.index(depth)
+                        except ValueError:
+                            msg = ('Unindent does not match any outer level '
+                                   'of indentation.')
+                            raise_indentation_error(msg, token)
+                        for _ in range(i + 1, len(levels)):
+                            yield self.dedent(token.lineno)
+                            levels.pop()
+                    yield token
+
+                self.at_line_start = at_line_start
+
+        if token is None:
+            yield self.newline(-1)
+        elif token.type != 'NEWLINE':
+            if token.type != 'WS' or token.lineno == 1:
+                yield self.newline(-1)
+
+        if len(levels) > 1:
+            assert token is not None
+            for _ in range(1, len(levels)):
+                yield self.dedent(token.lineno)
+
+        # add_endmarker
+        end_marker = lex.LexToken()
+        end_marker.type = 'ENDMARKER'
+        end_marker.value = None
+        end_marker.lineno = -1
+        end_marker.lexpos = -1
+        yield end_marker
+
     def create_py_blocks(self, token_stream):
         for tok in token_stream:
             if not tok.type == 'PY_BLOCK_START':
                 yield tok
                 continue
-            
-            # yield the start token since it's needed by the parser
-            start_tok = tok
-            yield start_tok
-
-            # The next token must be a newline or its a syntax error
-            try:
-                nl_tok = token_stream.next()
-            except StopIteration:
-                nl_tok = None
-
-            if nl_tok is None or nl_tok.type != 'NEWLINE':
-                if nl_tok is None:
-                    # create a fake token with a line number
-                    # for the error handler.
-                    nl_tok = lex.LexToken()
-                    nl_tok.lineno = start_tok.lineno
-                msg = 'Newline required after a ":: python ::" tag'
-                raise_syntax_error(msg, nl_tok)
-
-            # yield the newline token since it's needed by the parser
-            yield nl_tok
-
-            # Collect the Python code from the block
-            py_toks = []
-            end_tok = None
-            for tok in token_stream:
-                if tok.type == 'PY_BLOCK_END':
-                    end_tok = tok
-                    break
-                elif tok.type == 'NEWLINE':
-                    py_toks.append(tok)
-                else:
-                    assert tok.type == 'PY_BLOCK_CONTINUE', tok.type
-                    py_toks.append(tok)
-            
-            if end_tok is None:
-                # Reach end of input without an :: end :: delimiter
-                msg = 'EOF while scanning raw python block'
-                raise_syntax_error(msg, start_tok)
-              
-            # Create the python text to add to the py block token
-            # creating blank lines as necessary so that syntax errors
-            # get reported with correct line numbers. The captured
-            # text gets handed directly to Python's compile function.
-            leader = '\n' * start_tok.lineno
-            py_txt = leader + ''.join(tok.value for tok in py_toks)
-                   
-            # create a python token
-            py_block = lex.LexToken()
-            py_block.lineno = start_tok.lineno + 1
-            py_block.lexpos = -1
-            py_block.value = py_txt
-            py_block.type = 'PY_BLOCK'
-
-            # Yield the py block to the parser
-            yield py_block
-
-            # Yield the end block to the parser
-            yield end_tok
-
-            # An end token must be followed by a newline
-            try:
-                nl_tok = token_stream.next()
-            except StopIteration:
-                nl_tok = None
-            
-            if nl_tok is None or nl_tok.type != 'NEWLINE':
-                if nl_tok is None:
-                    # create a fake token with a line number
-                    # for the error handler.
-                    nl_tok = lex.LexToken()
-                    nl_tok.lineno = end_tok.lineno
-                msg = 'Newline required after a ":: end ::" tag'
-                raise_syntax_error(msg, nl_tok)
-            
-            # The parser requires the newline token
-            yield nl_tok
+            for py_tok in self.py_block_tokens(tok, token_stream):
+                yield py_tok
+
+    def py_block_tokens(self, start_tok, token_stream):
+        # yield the start token since it's needed by the parser
+        yield start_tok
+
+        # The next token must be a newline or its a syntax error
+        try:
+            nl_tok = token_stream.next()
+        except StopIteration:
+            nl_tok = None
+
+        if nl_tok is None or nl_tok.type != 'NEWLINE':
+            if nl_tok is None:
+                # create a fake token with a line number
+                # for the error handler.
+                nl_tok = lex.LexToken()
+                nl_tok.lineno = start_tok.lineno
+            msg = 'Newline required after a ":: python ::" tag'
+            raise_syntax_error(msg, nl_tok)
+
+        # yield the newline token since it's needed by the parser
+        yield nl_tok
+
+        # Collect the Python code from the block
+        py_toks = []
+        end_tok = None
+        for tok in token_stream:
+            if tok.type == 'PY_BLOCK_END':
+                end_tok = tok
+                break
+            elif tok.type == 'NEWLINE':
+                py_toks.append(tok)
+            else:
+                assert tok.type == 'PY_BLOCK_CONTINUE', tok.type
+                py_toks.append(tok)
+        
+        if end_tok is None:
+            # Reach end of input without an :: end :: delimiter
+            msg = 'EOF while scanning raw python block'
+            raise_syntax_error(msg, start_tok)
+          
+        # Create the python text to add to the py block token
+        # creating blank lines as necessary so that syntax errors
+        # get reported with correct line numbers. The captured
+        # text gets handed directly to Python's compile function.
+        leader = '\n' * start_tok.lineno
+        py_txt = leader + ''.join(tok.value for tok in py_toks)
+               
+        # create a python token
+        py_block = lex.LexToken()
+        py_block.lineno = start_tok.lineno + 1
+        py_block.lexpos = -1
+        py_block.value = py_txt
+        py_block.type = 'PY_BLOCK'
+
+        # Yield the py block to the parser
+        yield py_block
+
+        # Yield the end block to the parser
+        yield end_tok
+
+        # An end token must be followed by a newline
+        try:
+            nl_tok = token_stream.next()
+        except StopIteration:
+            nl_tok = None
+        
+        if nl_tok is None or nl_tok.type != 'NEWLINE':
+            if nl_tok is None:
+                # create a fake token with a line number
+                # for the error handler.
+                nl_tok = lex.LexToken()
+                nl_tok.lineno = end_tok.lineno
+            msg = 'Newline required after a ":: end ::" tag'
+            raise_syntax_error(msg, nl_tok)
+        
+        # The parser requires the newline token
+        yield nl_tok
 
     def create_strings(self, token_stream):
         for tok in token_stream:
             if not tok.type.startswith("STRING_START_"):
                 yield tok
                 continue
+            yield self.join_string(tok, token_stream)
 
-            # This is a string start; process until string end
-            start_tok = tok
-            string_toks = []
-            for tok in token_stream:
-                if tok.type == "STRING_END":
-                    break
-                else:
-                    assert tok.type == "STRING_CONTINUE", tok.type
-                    string_toks.append(tok)
+    def join_string(self, start_tok, token_stream):
+        # This is a string start; process until string end
+        string_toks = []
+        for tok in token_stream:
+            if tok.type == "STRING_END":
+                break
             else:
-                # Reached end of input without string termination
-                msg = 'EOF while scanning %s-quoted string.'
-                if start_tok.type == 'STRING_START_TRIPLE':
-                    msg = msg % 'triple'
-                else:
-                    msg = msg % 'single'
-                raise_syntax_error(msg, start_tok)
-
-            # Parse the quoted string.
-            #
-            # The four combinations are:
-            #  "ur"  - raw_unicode_escape
-            #  "u"   - unicode_escape
-            #  "r"   - no need to do anything
-            #  ""    - string_escape
-            s = "".join(tok.value for tok in string_toks)
-            quote_type = start_tok.value.lower()
-            if quote_type == "":
-                s = s.decode("string_escape")
-            elif quote_type == "u":
-                s = s.decode("unicode_escape")
-            elif quote_type == "ur":
-                s = s.decode("raw_unicode_escape")
-            elif quote_type == "r":
-                s = s
+                assert tok.type == "STRING_CONTINUE", tok.type
+                string_toks.append(tok)
+        else:
+            # Reached end of input without string termination
+            msg = 'EOF while scanning %s-quoted string.'
+            if start_tok.type == 'STRING_START_TRIPLE':
+                msg = msg % 'triple'
             else:
-                msg = 'Unknown string quote type: %r' % quote_type
-                raise AssertionError(msg)
+                msg = msg % 'single'
+            raise_syntax_error(msg, start_tok)
 
-            start_tok.type = "STRING"
-            start_tok.value = s
-
-            yield start_tok
+        # Parse the quoted string.
+        #
+        # The four combinations are:
+        #  "ur"  - raw_unicode_escape
+        #  "u"   - unicode_escape
+        #  "r"   - no need to do anything
+        #  ""    - string_escape
+        s = "".join(tok.value for tok in string_toks)
+        quote_type = start_tok.value.lower()
+        if quote_type == "":
+            s = s.decode("string_escape")
+        elif quote_type == "u":
+            s = s.decode("unicode_escape")
+        elif quote_type == "ur":
+            s = s.decode("raw_unicode_escape")
+        elif quote_type == "r":
+            s = s
+        else:
+            msg = 'Unknown string quote type: %r' % quote_type
+            raise AssertionError(msg)
+
+        start_tok.type = "STRING"
+        start_tok.value = s
+
+        return start_tok
 
     # Keep track of indentation state
     #
@@ -3,7 +3,9 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 import ast
+import imp
 import os
+import sys
 
 import ply.yacc as yacc
 
@@ -12,15 +14,6 @@ from .lexer import raise_syntax_error, EnamlLexer
 
 from ..exceptions import EnamlSyntaxError
 
-# Get a save directory for the lex and parse tables
-_enaml_dir = os.path.join(os.path.expanduser('~'), '.enaml')
-try:
-    if not os.path.exists(_enaml_dir):
-        os.mkdir(_enaml_dir)
-except OSError:
-    _enaml_dir = os.getcwd()
-
-
 # Need to expose the lexer tokens.
 tokens = EnamlLexer.tokens
 
@@ -2126,12 +2119,117 @@ def p_error(t):
     raise_syntax_error('invalid syntax.', t)
 
 
-_parser = yacc.yacc(debug=False, tabmodule='enaml_parsetab', 
-                    outputdir=_enaml_dir, errorlog=yacc.NullLogger())
+#------------------------------------------------------------------------------
+# Parser Construction
+#------------------------------------------------------------------------------
+# The parser is constructed lazily on the first call to parse(), so that
+# importing this module does not pay for the grammar analysis. A set of 
+# pre-generated tables is shipped in this package. If those tables are 
+# stale (e.g. they were generated for a different version of ply), new 
+# tables are generated and written to the package directory if it is
+# writable, or to a per-user directory otherwise.
+
+#: The name of the module which holds the generated parse tables.
+_tabmodule = 'enaml_parsetab'
+
+
+#: The directory of this package, which holds the shipped parse tables.
+_package_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+#: The per-user directory for the parse tables. This is used when the
+#: package directory is not writable.
+_user_dir = os.path.join(os.path.expanduser('~'), '.enaml')
+
+
+#: The parser instance, created on demand by _get_parser().
+_parser = None
+
+
+def _grammar_signature():
+    """ Returns the signature of the grammar defined in this module. 
+    This is the same signature ply writes into the generated tables.
+
+    """
+    pinfo = yacc.ParserReflect(globals())
+    pinfo.get_all()
+    return pinfo.signature()
+
+
+def _load_tables(directory, signature):
+    """ Loads the parse table module from the given directory.
+
+    Returns the module if it exists, was generated by the installed
+    version of ply, and matches the given grammar signature. Returns
+    None otherwise.
+
+    """
+    path = os.path.join(directory, _tabmodule + '.py')
+    if not os.path.isfile(path):
+        return None
+    name = '_enaml_parsetab'
+    try:
+        tables = imp.load_source(name, path)
+    except Exception:
+        return None
+    finally:
+        sys.modules.pop(name, None)
+    if getattr(tables, '_tabversion', None) != yacc.__tabversion__:
+        return None
+    if getattr(tables, '_lr_signature', None) != signature:
+        return None
+    return tables
+
+
+def _writable_dir():
+    """ Returns the directory into which newly generated parse tables
+    should be written, or None if there is no writable directory.
+
+    """
+    if os.access(_package_dir, os.W_OK):
+        return _package_dir
+    try:
+        if not os.path.isdir(_user_dir):
+            os.mkdir(_user_dir)
+    except OSError:
+        return None
+    if os.access(_user_dir, os.W_OK):
+        return _user_dir
+    return None
+
+
+def _get_parser():
+    """ Returns the ply parser for the Enaml grammar, creating it if
+    necessary.
+
+    """
+    global _parser
+    if _parser is not None:
+        return _parser
+
+    errorlog = yacc.NullLogger()
+    signature = _grammar_signature()
+    for directory in (_package_dir, _user_dir):
+        tables = _load_tables(directory, signature)
+        if tables is not None:
+            _parser = yacc.yacc(debug=False, tabmodule=tables,
+                                write_tables=False, errorlog=errorlog)
+            return _parser
+
+    # There are no valid tables, so they must be generated. The table
+    # module name is qualified with a package which does not exist so
+    # that ply does not bother importing the stale tables. Ply writes
+    # the new tables to <outputdir>/enaml_parsetab.py.
+    outputdir = _writable_dir()
+    tabmodule = '_enaml_tables.' + _tabmodule
+    _parser = yacc.yacc(debug=False, tabmodule=tabmodule, 
+                        outputdir=outputdir or _package_dir,
+                        write_tables=outputdir is not None,
+                        errorlog=errorlog)
+    return _parser
 
 
 def parse(tml):
     # Need to create a new lexer each time, or line numbers get screwy.
     _lexer = EnamlLexer()
-    return _parser.parse(tml, lexer=_lexer)
-
+    return _get_parser().parse(tml, lexer=_lexer)
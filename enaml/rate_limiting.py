@@ -0,0 +1,143 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Objects which limit the rate at which a callback is invoked.
+
+The limiters are called in place of the callback. They drop the
+intermediate calls and always deliver the arguments of the latest call,
+using the `invoke_timer` function of the toolkit to schedule the
+deferred deliveries.
+
+"""
+import time
+
+
+#: The function which returns the current time in seconds, used by the
+#: limiters which are not given the clock of their toolkit. Tests may
+#: replace it with a fake clock.
+clock = time.time
+
+
+class Throttle(object):
+    """ A rate limiter which invokes the callback at most once per
+    interval.
+
+    The first call is delivered immediately. The calls made during the
+    following interval are dropped except for the latest, which is
+    delivered when the interval expires.
+
+    """
+    def __init__(self, interval, invoke_timer, callback, clock=None):
+        """ Initialize a rate limiter.
+
+        Parameters
+        ----------
+        interval : int
+            The interval in milliseconds.
+
+        invoke_timer : callable
+            The toolkit function which invokes a callable some number
+            of milliseconds from now.
+
+        callback : callable
+            The callable to invoke with the arguments of the latest
+            call.
+
+        clock : callable, optional
+            The toolkit function which returns the current time in 
+            seconds of the clock against which the timers run. The
+            module level clock is used if this is not given.
+
+        """
+        self.interval = interval
+        self.invoke_timer = invoke_timer
+        self.callback = callback
+        self.clock = clock
+        self.args = None
+        self.pending = False
+        self.dirty = False
+
+    def __call__(self, *args):
+        self.args = args
+        if self.pending:
+            self.dirty = True
+        else:
+            self.deliver()
+
+    def now(self):
+        """ Returns the current time in seconds of the clock of the
+        limiter.
+
+        """
+        timer_clock = self.clock
+        if timer_clock is None:
+            timer_clock = clock
+        return timer_clock()
+
+    def cancel(self):
+        """ Drops the pending call, if any. A running timer expires
+        without invoking the callback.
+
+        """
+        self.args = None
+        self.dirty = False
+
+    def deliver(self):
+        """ Invokes the callback and starts a new interval.
+
+        """
+        args = self.args
+        self.args = None
+        self.pending = True
+        self.invoke_timer(self.interval, self.on_timer)
+        self.callback(*args)
+
+    def on_timer(self):
+        """ The timer handler which ends the current interval.
+
+        """
+        self.pending = False
+        if self.dirty:
+            self.dirty = False
+            self.deliver()
+
+
+class Debounce(Throttle):
+    """ A rate limiter which invokes the callback once the calls have
+    stopped for an interval.
+
+    Only a single timer is outstanding at any time. When it expires
+    before the calls have been quiet for the full interval, it is
+    restarted for the remaining time.
+
+    """
+    def __init__(self, interval, invoke_timer, callback, clock=None):
+        super(Debounce, self).__init__(interval, invoke_timer, callback,
+                                       clock)
+        self.last_call = 0.0
+
+    def __call__(self, *args):
+        self.args = args
+        self.last_call = self.now()
+        if not self.pending:
+            self.pending = True
+            self.invoke_timer(self.interval, self.on_timer)
+
+    def on_timer(self):
+        """ The timer handler which delivers the latest call if the
+        calls have been quiet for the interval.
+
+        """
+        if self.args is None:
+            self.pending = False
+            return
+        elapsed = (self.now() - self.last_call) * 1000.0
+        remaining = int(round(self.interval - elapsed))
+        if remaining > 0:
+            self.invoke_timer(remaining, self.on_timer)
+            return
+        self.pending = False
+        args = self.args
+        self.args = None
+        self.callback(*args)
@@ -2,6 +2,7 @@
 # -*- coding: UTF-8 -*-
 """ Command-line tool to run .enaml files.
 """
+import sys
 
 import enaml
 from enaml.parsing.parser import parse
@@ -24,6 +25,13 @@ def main():
     parser.add_argument('-t', '--toolkit', default='default',
         choices=['default', 'wx', 'qt', 'muntjac'],
         help='The toolkit backend to use')
+    parser.add_argument('--profile-expressions', action='store_true',
+        help='Print the time spent evaluating each binding on exit.')
+    parser.add_argument('--profile-sort', default='total',
+        choices=['total', 'max', 'calls'],
+        help='The column by which the expression profile is sorted.')
+    parser.add_argument('--profile-json', metavar='FILE',
+        help='Also write the expression profile to FILE as JSON.')
     parser.add_argument('enaml_file', help='The .enaml file to show.')
 
     args = parser.parse_args()
@@ -31,18 +39,32 @@ def main():
     with open(args.enaml_file) as f:
         enaml_code = f.read()
     ast = parse(enaml_code)
-    ns = {}
-
-    with enaml.imports():
-        EnamlCompiler.compile(ast, ns)
-
-    with toolkits[args.toolkit]():
-        if 'main' in ns:
-            ns['main']()
-        else:
-            component = ns[args.component]
-            window = component()
-            window.show()
+    ns = {'__file__': args.enaml_file}
+
+    profiler = None
+    if args.profile_expressions or args.profile_json:
+        from enaml.expression_profiler import ExpressionProfiler
+        profiler = ExpressionProfiler()
+        profiler.enable()
+
+    try:
+        with enaml.imports():
+            EnamlCompiler.compile(ast, ns)
+
+        with toolkits[args.toolkit]():
+            if 'main' in ns:
+                ns['main']()
+            else:
+                component = ns[args.component]
+                window = component()
+                window.show()
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.report(sys.stdout, args.profile_sort)
+            if args.profile_json:
+                with open(args.profile_json, 'w') as f:
+                    profiler.dump_json(f, args.profile_sort)
 
 if __name__ == '__main__':
     main()
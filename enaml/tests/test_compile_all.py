@@ -0,0 +1,112 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from multiprocessing.pool import Pool
+import os
+import shutil
+from StringIO import StringIO
+import tempfile
+import unittest
+
+from enaml import compile_all as compile_all_module
+from enaml.compile_all import compile_all
+from enaml.import_hooks import make_cache_path, read_cache
+
+
+class RecordingPool(Pool):
+    """ A process pool which records how it was shut down.
+
+    """
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        super(RecordingPool, self).__init__(*args, **kwargs)
+        self.closed = False
+        self.terminated = False
+        self.instances.append(self)
+
+    def close(self):
+        self.closed = True
+        super(RecordingPool, self).close()
+
+    def terminate(self):
+        self.terminated = True
+        super(RecordingPool, self).terminate()
+
+
+class TestCompileAll(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        self.old_pool = compile_all_module.Pool
+        compile_all_module.Pool = RecordingPool
+        del RecordingPool.instances[:]
+
+    def tearDown(self):
+        compile_all_module.Pool = self.old_pool
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, source):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w') as f:
+            f.write(source)
+        return path
+
+    def test_compile(self):
+        """ Test that the cache files are written for a directory tree,
+        and are read back by the import hook.
+
+        """
+        path = self.write('good.enaml', 'import os\n')
+        stream = StringIO()
+        self.assertTrue(compile_all([self.tmp_dir], jobs=1, stream=stream))
+        code = read_cache(make_cache_path(path), os.stat(path))
+        self.assertEqual(code.co_filename, path)
+        self.assertIn('good.enaml: ', stream.getvalue())
+
+    def test_syntax_error(self):
+        """ Test that a syntax error is reported with its line number.
+
+        """
+        self.write('bad.enaml', 'import os\ndefn Foo(:\n')
+        stream = StringIO()
+        self.assertFalse(compile_all([self.tmp_dir], jobs=1, stream=stream))
+        output = stream.getvalue()
+        self.assertIn('bad.enaml', output)
+        self.assertIn('lineno', output)
+
+
+    def test_pool(self):
+        """ Test that the files are compiled by a process pool which is
+        closed once they all succeed.
+
+        """
+        paths = [self.write('good%d.enaml' % i, 'import os\n')
+                 for i in range(4)]
+        stream = StringIO()
+        self.assertTrue(compile_all([self.tmp_dir], jobs=2, stream=stream))
+        for path in paths:
+            self.assertTrue(os.path.exists(make_cache_path(path)))
+        pool, = RecordingPool.instances
+        self.assertTrue(pool.closed)
+        self.assertFalse(pool.terminated)
+
+    def test_pool_syntax_error(self):
+        """ Test that the first error of a process pool is reported and
+        the pool is terminated without waiting for the other files.
+
+        """
+        for i in range(4):
+            self.write('good%d.enaml' % i, 'import os\n')
+        for i in range(2):
+            self.write('bad%d.enaml' % i, 'import os\ndefn Foo(:\n')
+        stream = StringIO()
+        self.assertFalse(compile_all([self.tmp_dir], jobs=2, stream=stream))
+        output = stream.getvalue()
+        self.assertEqual(output.count('Error compiling'), 1)
+        self.assertIn('lineno', output)
+        pool, = RecordingPool.instances
+        self.assertTrue(pool.terminated)
+        self.assertFalse(pool.closed)
@@ -0,0 +1,358 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import gc
+import unittest
+import weakref
+
+from ..toolkit import Toolkit
+from ..widgets.container import AbstractTkContainer, Container
+from ..widgets.control import AbstractTkControl, Control
+from ..widgets.form import Form
+from ..widgets.layout.constraints_layout import constraint_key
+from ..widgets.layout.layout_helpers import vbox
+
+
+class GeometryTkComponent(AbstractTkContainer, AbstractTkControl):
+    """ An abstract object which stores its geometry instead of a
+    toolkit widget.
+
+    """
+    def __init__(self, size_hint=(-1, -1)):
+        self._size_hint = size_hint
+        self._geometry = (0, 0, 0, 0)
+        self._min_size = (0, 0)
+
+    shell_obj = None
+
+    toolkit_widget = None
+
+    def create(self, parent):
+        pass
+
+    def initialize(self):
+        pass
+
+    def bind(self):
+        pass
+
+    def destroy(self):
+        pass
+
+    def size(self):
+        return self._geometry[2:]
+
+    def size_hint(self):
+        return self._size_hint
+
+    def resize(self, width, height):
+        self._geometry = self._geometry[:2] + (width, height)
+
+    def min_size(self):
+        return self._min_size
+
+    def set_min_size(self, min_width, min_height):
+        self._min_size = (min_width, min_height)
+
+    def pos(self):
+        return self._geometry[:2]
+
+    def move(self, x, y):
+        self._geometry = (x, y) + self._geometry[2:]
+
+    def frame_geometry(self):
+        return self._geometry
+
+    def geometry(self):
+        return self._geometry
+
+    def set_geometry(self, x, y, width, height):
+        self._geometry = (x, y, width, height)
+
+    def shell_enabled_changed(self, enabled):
+        pass
+
+    def shell_visible_changed(self, visible):
+        pass
+
+    def shell_bg_color_changed(self, color):
+        pass
+
+    def shell_fg_color_changed(self, color):
+        pass
+
+    def shell_font_changed(self, font):
+        pass
+
+
+class UncachedContainer(Container):
+    """ A container which computes new default constraints on every 
+    call, so that none of them match those in the solver.
+
+    """
+    def default_user_constraints(self):
+        return [vbox(*self.children)]
+
+
+def make_container(count, invoke_later=None, container_class=Container):
+    """ Creates a container with the given number of controls, laid out
+    with the default vertical box. The calls which the container defers
+    are passed to the invoke_later function, or dropped if it is None.
+
+    """
+    toolkit = Toolkit()
+    toolkit.invoke_later = invoke_later or (lambda func, *args: None)
+    container = container_class(abstract_obj=GeometryTkComponent(),
+                                toolkit=toolkit)
+    for i in xrange(count):
+        control = Control(abstract_obj=GeometryTkComponent((50, 20)),
+                          toolkit=toolkit)
+        container.children.append(control)
+    container.set_parent_refs()
+    container.set_shell_refs()
+    return container
+
+
+def solver_cns(layout):
+    """ Returns the set of the ids of the constraints which have been
+    added to the solver of a layout manager.
+
+    """
+    res = set(id(cn) for cn in layout.component_cns)
+    for cns_dict in (layout.user_cns, layout.child_cns,
+                     layout.child_size_cns):
+        for cns in cns_dict.itervalues():
+            res.update(id(cn) for cn in cns)
+    return res
+
+
+class TestConstraintsLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.container = make_container(5)
+        self.layout = self.container.layout
+        self.layout.initialize()
+
+    def min_size(self):
+        return self.container.abstract_obj.min_size()
+
+    def test_constraint_key(self):
+        """ Test that recomputed constraints have equal keys.
+
+        """
+        a, b = self.container.children[:2]
+        cn = (a.bottom + 10 == b.top) | 'strong'
+        self.assertEqual(constraint_key(cn),
+                         constraint_key((a.bottom + 10 == b.top) | 'strong'))
+        self.assertNotEqual(constraint_key(cn),
+                            constraint_key((a.bottom + 10 == b.top) | 'weak'))
+        self.assertNotEqual(constraint_key(cn),
+                            constraint_key((a.bottom + 12 == b.top) | 'strong'))
+        self.assertNotEqual(constraint_key(cn),
+                            constraint_key((b.bottom + 10 == a.top) | 'strong'))
+
+    def test_unchanged(self):
+        """ Test that updating unchanged constraints leaves the solver
+        untouched.
+
+        """
+        layout = self.layout
+        solver = layout.solver
+        before = solver_cns(layout)
+        layout.update_constraints()
+        self.assertIs(layout.solver, solver)
+        self.assertEqual(solver_cns(layout), before)
+
+    def test_visible_changed(self):
+        """ Test that hiding and showing a child only changes the
+        constraints which depend upon it.
+
+        """
+        layout = self.layout
+        children = self.container.children
+        first = children[0]
+        min_size = self.min_size()
+        before = solver_cns(layout)
+        first_cns = set(id(cn) for cn in layout.child_cns[first])
+
+        children[2].visible = False
+        layout.update_constraints()
+        self.assertNotIn(children[2], layout.child_cns)
+        self.assertEqual(first_cns,
+                         set(id(cn) for cn in layout.child_cns[first]))
+        hidden = solver_cns(layout)
+        self.assertLess(len(hidden - before), len(hidden) / 2)
+
+        # The minimum size matches that of a fresh solver.
+        fresh = make_container(4)
+        fresh.layout.initialize()
+        self.assertEqual(self.min_size(), fresh.abstract_obj.min_size())
+
+        children[2].visible = True
+        layout.update_constraints()
+        self.assertEqual(self.min_size(), min_size)
+        self.assertEqual(len(solver_cns(layout)), len(before))
+
+    def test_constraints_changed(self):
+        """ Test that changing the user constraints replaces them in the
+        solver.
+
+        """
+        container = self.container
+        default_cns = set(id(cn) for cn in self.layout.user_cns[container])
+        container.constraints = [container.width >= 200]
+        self.layout.update_constraints()
+        user_cns = self.layout.user_cns[container]
+        self.assertEqual(len(user_cns), 1)
+        self.assertFalse(default_cns & solver_cns(self.layout))
+        self.assertEqual(self.min_size()[0], 200)
+
+    def test_form_diff(self):
+        """ Test that toggling a child of a form only changes a few of
+        the constraints in the solver, rather than rebuilding it.
+
+        """
+        form = make_container(8, container_class=Form)
+        layout = form.layout
+        layout.initialize()
+        min_size = form.abstract_obj.min_size()
+        before = solver_cns(layout)
+        form.children[3].visible = False
+        layout.update_constraints()
+        form.children[3].visible = True
+        layout.update_constraints()
+        after = solver_cns(layout)
+        self.assertEqual(layout.rebuilds, 0)
+        self.assertLess(len(after - before), len(after) / 4)
+        self.assertEqual(form.abstract_obj.min_size(), min_size)
+
+    def test_rebuild(self):
+        """ Test that the solver is rebuilt, rather than diffed, when
+        most of its constraints have changed.
+
+        """
+        container = make_container(5, container_class=UncachedContainer)
+        layout = container.layout
+        layout.initialize()
+        solver = layout.solver
+        container.children[2].visible = False
+        layout.update_constraints()
+        self.assertEqual(layout.rebuilds, 1)
+        self.assertIsNot(layout.solver, solver)
+        self.assertEqual(len(solver_cns(layout)), layout.constraint_count())
+        fresh = make_container(4)
+        fresh.layout.initialize()
+        self.assertEqual(container.abstract_obj.min_size(),
+                         fresh.abstract_obj.min_size())
+
+    def test_release_children(self):
+        """ Test that the cached constraints do not keep the removed 
+        children or the children of a destroyed container alive.
+
+        """
+        for container_class in (Container, Form):
+            container = make_container(4, container_class=container_class)
+            layout = container.layout
+            layout.initialize()
+            ref = weakref.ref(container.children[-1])
+            container.children.pop()
+            self.assertEqual(container._default_user_cns, ())
+            self.assertEqual(getattr(container, '_form_cns', ()), ())
+            layout.update_constraints()
+            gc.collect()
+            self.assertIsNone(ref())
+
+            self.assertTrue(container._default_user_cns or
+                            getattr(container, '_form_cns', None))
+            container.destroy()
+            self.assertEqual(container._default_user_cns, ())
+            self.assertEqual(getattr(container, '_form_cns', ()), ())
+
+    def test_guard_reset_on_error(self):
+        """ Test that an exception raised while updating the constraints
+        or laying out does not leave the layout manager locked.
+
+        """
+        layout = self.layout
+        container = self.container
+
+        def fail(*args):
+            raise ValueError
+
+        for name, method in (('compute_user_cns', layout.update_constraints),
+                             ('apply_geometry', layout.layout)):
+            setattr(layout, name, fail)
+            self.assertRaises(ValueError, method)
+            self.assertFalse(layout._recursion_guard)
+            delattr(layout, name)
+
+        # The layout manager still responds to changes.
+        container.constraints = [container.width >= 200]
+        layout.update_constraints()
+        self.assertEqual(self.min_size()[0], 200)
+
+        fresh = make_container(2).layout
+        fresh.compute_component_cns = fail
+        self.assertRaises(ValueError, fresh.initialize)
+        self.assertFalse(fresh._recursion_guard)
+        self.assertFalse(fresh._initialized)
+
+
+class TestApplyGeometry(unittest.TestCase):
+
+    def setUp(self):
+        self.container = make_container(4)
+        inner = make_container(3)
+        self.container.children.append(inner)
+        self.container.set_parent_refs()
+        self.container.set_shell_refs()
+        self.inner = inner
+        self.layout = self.container.layout
+        self.layout.initialize()
+        self.container.resize(200, 400)
+
+    def test_offsets(self):
+        """ Test that the offsets computed top down match those computed
+        from the geometry of the ancestors.
+
+        """
+        self.container.do_layout()
+        geometry = self.inner.children[-1].geometry()
+        self.assertGreater(geometry[1], 0)
+        self.assertLess(geometry[1], self.inner.geometry()[3])
+        descendants = list(self.layout.traverse_descendants(self.container))
+        expected = [child.geometry() for child in descendants]
+        for child in descendants:
+            child.abstract_obj.set_geometry(0, 0, 0, 0)
+        for child in descendants:
+            child.set_solved_geometry(self.container)
+        self.assertEqual([child.geometry() for child in descendants],
+                         expected)
+
+    def test_skip_unchanged(self):
+        """ Test that only the geometry which has changed is pushed to
+        the toolkit.
+
+        """
+        layout = self.layout
+        self.container.do_layout()
+        self.assertEqual(layout.geometry_updates, 8)
+        self.assertEqual(layout.geometry_skips, 0)
+        self.container.do_layout()
+        self.assertEqual(layout.geometry_updates, 8)
+        self.assertEqual(layout.geometry_skips, 8)
+
+        # Growing the first child moves the children which follow it,
+        # but the children of the inner container are unchanged relative
+        # to it.
+        first = self.container.children[0]
+        first.abstract_obj._size_hint = (50, 40)
+        layout.update_size_cns(first)
+        self.container.do_layout()
+        self.assertEqual(first.geometry()[3], 40)
+        self.assertEqual(layout.geometry_updates, 13)
+        self.assertEqual(layout.geometry_skips, 11)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import gc
+import unittest
+import weakref
+
+from traits.api import HasTraits, List, Str
+
+from ..operators import OPERATORS
+from ..parsing.enaml_compiler import EnamlCompiler
+from ..parsing.parser import parse
+from ..toolkit import Constructor, Toolkit
+from .test_setup_engine import Node, RecordingTkComponent
+
+
+ENAML_SOURCE = """
+defn MainWindow(model):
+    Panel:
+        id: root
+        title << model.name
+        Panel:
+            id: field
+            text := model.name
+            count << len(root.title)
+        Panel:
+            clicked >> model.events.append(args.new)
+"""
+
+
+class Model(HasTraits):
+
+    name = Str('model')
+
+    events = List
+
+
+def name_notifiers(model):
+    """ Returns the number of notifiers of the 'name' trait of a model.
+
+    """
+    return len(model._trait('name', 2)._notifiers(1))
+
+
+class TestDestroy(unittest.TestCase):
+
+    def setUp(self):
+        self.ns = {}
+        EnamlCompiler.compile(parse(ENAML_SOURCE), self.ns)
+        self.log = log = []
+        abstract_loader = lambda: (lambda: RecordingTkComponent(log))
+        self.toolkit = Toolkit(OPERATORS)
+        self.toolkit['Panel'] = Constructor(lambda: Node, abstract_loader)
+        self.model = Model()
+
+    def create_window(self):
+        with self.toolkit:
+            window, = self.ns['MainWindow'](self.model)
+        window.defer_updates = False
+        window.setup()
+        return window
+
+    def test_destroy(self):
+        """ Test that destroying a window unbinds its expressions and
+        tears down the tree.
+
+        """
+        model = self.model
+        baseline = name_notifiers(model)
+        window = self.create_window()
+        field = window.children[0]
+        self.assertGreater(name_notifiers(model), baseline)
+        model.name = 'changed'
+        self.assertEqual(window.title, 'changed')
+        self.assertEqual(field.text, 'changed')
+
+        window.destroy()
+        self.assertEqual(name_notifiers(model), baseline)
+        model.name = 'after'
+        self.assertEqual(window.title, 'changed')
+        self.assertEqual(field.text, 'changed')
+        field.text = 'ignored'
+        self.assertEqual(model.name, 'after')
+        self.assertEqual(window.children, [])
+        self.assertIsNone(field.parent)
+        self.assertEqual(field.setup_hooks, [])
+        destroyed = [item[1] for item in self.log if item[0] == 'destroy']
+        self.assertEqual(len(destroyed), 3)
+
+    def test_remove_from_parent(self):
+        """ Test that destroying a child removes it from its parent.
+
+        """
+        window = self.create_window()
+        field = window.children[0]
+        field.destroy()
+        self.assertNotIn(field, window.children)
+        self.assertIsNone(field.parent)
+        self.model.name = 'changed'
+        self.assertEqual(window.title, 'changed')
+
+    def test_no_leaks(self):
+        """ Test that creating and destroying a window many times leaves
+        no objects or notifiers behind.
+
+        """
+        model = self.model
+        baseline = name_notifiers(model)
+
+        def cycle():
+            window = self.create_window()
+            model.name = 'changed'
+            window.children[-1].clicked = True
+            window.destroy()
+            del self.log[:]
+            del model.events[:]
+            return weakref.ref(window)
+
+        for i in range(10):
+            cycle()
+        gc.collect()
+        start = len(gc.get_objects())
+        for i in range(1000):
+            ref = cycle()
+        # The tree holds no reference cycles once destroyed, so it is
+        # freed without the help of the garbage collector.
+        self.assertIsNone(ref())
+        gc.collect()
+        self.assertLess(len(gc.get_objects()) - start, 100)
+        self.assertEqual(name_notifiers(model), baseline)
+
+
+if __name__ == '__main__':
+    unittest.main()
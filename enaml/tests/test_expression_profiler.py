@@ -0,0 +1,184 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import ast
+import json
+from StringIO import StringIO
+import unittest
+
+from traits.api import Any
+
+from ..expression_profiler import ExpressionProfiler
+from ..expressions import (DelegatingExpression, NotifyingExpression,
+                           SimpleExpression, UpdatingExpression)
+from ..parsing.analyzer import Dependencies, analyze_dependencies
+from ..toolkit import Toolkit
+from ..widgets.base_component import BaseComponent
+
+
+class Node(object):
+
+    parent = None
+
+
+def make_expression(source, lineno, obj=None, attr='value', 
+                    expr_cls=SimpleExpression, f_locals=None):
+    expr_ast = ast.parse(source, mode='eval')
+    expr_ast.lineno = lineno
+    code = compile(expr_ast, 'Enaml', mode='eval')
+    deps = Dependencies(*analyze_dependencies(expr_ast))
+    f_globals = {'__file__': 'view.enaml'}
+    if obj is None:
+        obj = Node()
+    return expr_cls(obj, attr, deps, code, f_globals, Toolkit(), 
+                    f_locals or {})
+
+
+class TestExpressionProfiler(unittest.TestCase):
+
+    def test_record(self):
+        """ Test that the evaluations are recorded per binding, that
+        the methods are restored, and that nothing is recorded once the
+        profiler is disabled.
+
+        """
+        original = SimpleExpression.__dict__['eval_expression']
+        first = make_expression('sum(range(1000))', 3)
+        second = make_expression('1 + 2', 4)
+        with ExpressionProfiler() as profiler:
+            self.assertIsNot(SimpleExpression.__dict__['eval_expression'],
+                             original)
+            for _ in range(3):
+                first.eval_expression()
+            self.assertEqual(second.eval_expression(), 3)
+        self.assertIs(SimpleExpression.__dict__['eval_expression'], original)
+        second.eval_expression()
+
+        items = profiler.sorted_stats('calls')
+        self.assertEqual(len(items), 2)
+        item = items[0]
+        self.assertEqual((item.filename, item.lineno, item.attr, item.calls),
+                         ('view.enaml', 3, 'value', 3))
+        self.assertEqual(item.method, 'SimpleExpression.eval_expression')
+        self.assertTrue(0.0 < item.max <= item.total)
+        self.assertEqual(items[1].calls, 1)
+
+        stream = StringIO()
+        profiler.report(stream, 'calls')
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn('view.enaml:3 value', lines[1])
+
+        stream = StringIO()
+        profiler.dump_json(stream, 'calls')
+        data = json.loads(stream.getvalue())
+        self.assertEqual([item['lineno'] for item in data], [3, 4])
+
+    def test_single_profiler(self):
+        """ Test that only one profiler can be enabled at a time.
+
+        """
+        with ExpressionProfiler():
+            self.assertRaises(RuntimeError, ExpressionProfiler().enable)
+
+
+class Model(BaseComponent):
+
+    value = Any(0)
+
+    result = Any
+
+
+class TestProfiledNotifications(unittest.TestCase):
+    """ Fires the expressions through real trait changes, since the
+    notifiers pass arguments according to the signature of the bound
+    expression methods.
+
+    """
+    def setUp(self):
+        self.model = Model()
+        self.view = Model(defer_updates=False)
+        self.sink = []
+        self.profiler = ExpressionProfiler()
+
+    def tearDown(self):
+        self.profiler.disable()
+
+    def bind_all(self):
+        model = self.model
+        view = self.view
+        f_locals = {'model': model, 'sink': self.sink}
+        exprs = [
+            make_expression('model.value * 2', 10, view, 'result',
+                            UpdatingExpression, f_locals),
+            make_expression('model.value', 11, view, 'value', 
+                            DelegatingExpression, f_locals),
+            make_expression('sink.append(args.new)', 12, view, 'value',
+                            NotifyingExpression, f_locals),
+        ]
+        for expr in exprs:
+            expr.bind()
+        return exprs
+
+    def check_updates(self, first):
+        model = self.model
+        view = self.view
+        model.value = first
+        self.assertEqual(view.value, first)
+        self.assertEqual(view.result, first * 2)
+        view.value = first + 1
+        self.assertEqual(model.value, first + 1)
+        self.assertEqual(view.result, (first + 1) * 2)
+        self.assertEqual(self.sink[-2:], [first, first + 1])
+
+    def methods(self):
+        return set(item.method for item in self.profiler.stats.itervalues())
+
+    def test_bound_while_profiling(self):
+        """ Test that expressions bound while profiling is on are fired
+        with their arguments, and are unbound after it is disabled.
+
+        """
+        self.profiler.enable()
+        exprs = self.bind_all()
+        self.check_updates(1)
+        self.assertEqual(self.methods(), set([
+            'UpdatingExpression.update_object', 'UpdatingExpression.refresh',
+            'SimpleExpression.eval_expression', 
+            'DelegatingExpression.update_object',
+            'DelegatingExpression.update_delegate',
+            'NotifyingExpression.eval_expression',
+        ]))
+        self.profiler.disable()
+        stats = dict((key, item.calls) 
+                     for key, item in self.profiler.stats.iteritems())
+        self.check_updates(5)
+        self.assertEqual(dict((key, item.calls) for key, item in 
+                              self.profiler.stats.iteritems()), stats)
+
+        for expr in exprs:
+            expr.unbind()
+        del self.sink[:]
+        self.model.value = 10
+        self.view.value = 20
+        self.assertEqual(self.view.result, 12)
+        self.assertEqual(self.model.value, 10)
+        self.assertEqual(self.sink, [])
+
+    def test_bound_before_profiling(self):
+        """ Test that expressions bound before profiling is on are
+        timed, and are unbound while it is on.
+
+        """
+        exprs = self.bind_all()
+        self.check_updates(1)
+        self.profiler.enable()
+        self.check_updates(3)
+        self.assertIn('NotifyingExpression.eval_expression', self.methods())
+        for expr in exprs:
+            expr.unbind()
+        del self.sink[:]
+        self.view.value = 20
+        self.assertEqual(self.model.value, 4)
+        self.assertEqual(self.sink, [])
@@ -0,0 +1,395 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import ast
+import sys
+import unittest
+
+from traits.api import Any, HasTraits, Instance, Int, List
+
+from ..expressions import (ExpressionLocals, NotifyingExpression, 
+                           SimpleExpression, TracingExpression, 
+                           UpdatingExpression, invalidate_scopes)
+from ..operators import OPERATORS
+from ..parsing.analyzer import Dependencies, analyze_dependencies
+from ..toolkit import Toolkit
+from ..widgets.base_component import BaseComponent
+from ..widgets.setup_hooks import evaluate_defaults
+
+
+class Node(object):
+    """ A minimal stand-in for a component in the tree.
+
+    """
+    def __init__(self, parent=None, **attrs):
+        self.parent = parent
+        self.__dict__.update(attrs)
+
+
+def make_expression(source, obj, f_globals, toolkit, f_locals=None, 
+                    expr_cls=SimpleExpression):
+    expr_ast = ast.parse(source, mode='eval')
+    code = compile(expr_ast, 'Enaml', mode='eval')
+    deps = Dependencies(*analyze_dependencies(expr_ast))
+    if f_locals is None:
+        f_locals = {}
+    return expr_cls(obj, 'value', deps, code, f_globals, toolkit, f_locals)
+
+
+class TestExpressionScopes(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = Toolkit(a='tk_a', b='tk_b', c='tk_c', d='tk_d')
+        self.f_globals = {'b': 'mod_b', 'c': 'mod_c', 'd': 'mod_d'}
+        self.obj = Node(Node(c='attr_c', d='attr_d'))
+        self.f_locals = {'d': 'local_d'}
+
+    def test_locals_precedence(self):
+        """ Test the lookup order of the expression locals mapping.
+
+        """
+        scope = ExpressionLocals(self.obj, self.f_locals, None,
+                                 self.f_globals, self.toolkit)
+        self.assertEqual(scope['a'], 'tk_a')
+        self.assertEqual(scope['c'], 'attr_c')
+        self.assertEqual(scope['d'], 'local_d')
+        # Module names are left to the global namespace of the eval
+        self.assertRaises(KeyError, scope.__getitem__, 'b')
+        self.assertRaises(KeyError, scope.__getitem__, 'e')
+
+    def test_eval_without_copy(self):
+        """ Test that an expression is evaluated in the module globals
+        with the same name resolution as the merged namespace.
+
+        """
+        expr = make_expression('(a, b, c, d, len)', self.obj, self.f_globals,
+                               self.toolkit, self.f_locals)
+        self.assertTrue(expr.get_globals() is self.f_globals)
+        self.assertEqual(expr.eval_expression(),
+                         ('tk_a', 'mod_b', 'attr_c', 'local_d', len))
+        self.f_globals['a'] = 'mod_a'
+        self.assertEqual(expr.eval_expression()[0], 'mod_a')
+        self.f_globals['b'] = 'new_b'
+        self.assertEqual(expr.eval_expression()[1], 'new_b')
+        self.toolkit['a'] = 'new_tk_a'
+        del self.f_globals['a']
+        self.assertEqual(expr.eval_expression()[0], 'new_tk_a')
+
+    def test_function(self):
+        """ Test that an expression without nested scopes is evaluated
+        with a function, including the names stored by a list 
+        comprehension.
+
+        """
+        expr = make_expression('[x + c for x in (d, a)]', self.obj,
+                               self.f_globals, self.toolkit, self.f_locals)
+        self.assertTrue(expr.get_function() is not None)
+        self.assertEqual(expr.eval_expression(), 
+                         ['local_dattr_c', 'tk_aattr_c'])
+        self.obj.parent.c = 'new_c'
+        self.assertEqual(expr.eval_expression(), 
+                         ['local_dnew_c', 'tk_anew_c'])
+
+    def test_nested_scopes(self):
+        """ Test that toolkit names are visible in nested scopes.
+
+        """
+        expr = make_expression('list(x + a for x in b)', self.obj, 
+                               self.f_globals, self.toolkit)
+        self.assertEqual(expr.eval_expression(),
+                         ['mtk_a', 'otk_a', 'dtk_a', '_tk_a', 'btk_a'])
+
+    def test_nested_scopes_globals(self):
+        """ Test that the merged globals of an expression with nested 
+        scopes are built once and rebuilt when the scopes are
+        invalidated.
+
+        """
+        expr = make_expression('list(x + a for x in b)', self.obj, 
+                               self.f_globals, self.toolkit)
+        f_globals = expr.get_globals()
+        self.assertIsNot(f_globals, self.f_globals)
+        expr.eval_expression()
+        self.assertIs(expr.get_globals(), f_globals)
+        self.toolkit['a'] = 'new_a'
+        self.assertIsNot(expr.get_globals(), f_globals)
+        self.assertEqual(expr.eval_expression()[0], 'mnew_a')
+
+
+
+class TestOwnerCache(unittest.TestCase):
+
+    def test_cached_owner(self):
+        """ Test that the owner of a name is remembered until the scopes
+        are invalidated.
+
+        """
+        root = Node(value=42)
+        leaf = parent = Node(root)
+        for _ in range(10):
+            leaf = Node(leaf)
+        expr = make_expression('value', leaf, {}, Toolkit())
+        self.assertEqual(expr.eval_expression(), 42)
+
+        # A plain object does not invalidate the scopes on re-parenting,
+        # so the cached owner is still used.
+        parent.parent = None
+        self.assertEqual(expr.eval_expression(), 42)
+
+        invalidate_scopes()
+        self.assertRaises(NameError, expr.eval_expression)
+
+    def test_reparenting(self):
+        """ Test that re-parenting a component invalidates the cached 
+        owners.
+
+        """
+        first = BaseComponent()
+        first.add_trait('value', Any('first'))
+        second = BaseComponent()
+        second.add_trait('value', Any('second'))
+        child = BaseComponent(parent=first)
+        expr = make_expression('value', child, {}, Toolkit())
+        self.assertEqual(expr.eval_expression(), 'first')
+        child.parent = second
+        self.assertEqual(expr.eval_expression(), 'second')
+        child.add_trait('value', Any('child'))
+        self.assertEqual(expr.eval_expression(), 'child')
+
+    def test_other_tree(self):
+        """ Test that setting up the bindings of another tree leaves the
+        cached scopes of the expressions of a tree intact.
+
+        """
+        toolkit = Toolkit()
+        root = BaseComponent()
+        root.add_trait('value', Any(42))
+        middle = BaseComponent()
+        leaf = BaseComponent()
+        root.children.append(middle)
+        middle.children.append(leaf)
+        root.set_parent_refs()
+        expr = make_expression('value + 1', leaf, {}, toolkit)
+        self.assertEqual(expr.eval_expression(), 43)
+        self.assertEqual(expr.get_locals()['value'], 42)
+        func = expr.func
+        owners = expr.owners
+        self.assertIn('value', owners)
+
+        # Build a second tree whose bindings add traits lazily.
+        operator = OPERATORS['__operator_Equal__']
+        other = BaseComponent()
+        for i in range(10):
+            child = BaseComponent()
+            for attr, source in (('x', 'base + 1'), ('y', 'x * 2')):
+                expr_ast = ast.parse(source, mode='eval')
+                code = compile(expr_ast, 'Enaml', mode='eval')
+                deps = Dependencies(*analyze_dependencies(expr_ast))
+                operator(child, attr, deps, code, {}, toolkit, {})
+            other.children.append(child)
+        other.add_trait('base', Any(1))
+        other.set_parent_refs()
+        evaluate_defaults(other)
+        self.assertEqual(other.children[-1].y, 4)
+
+        self.assertEqual(expr.eval_expression(), 43)
+        self.assertIs(expr.func, func)
+        self.assertIs(expr.owners, owners)
+        self.assertIn('value', owners)
+
+        # Changing the tree itself still invalidates its expressions.
+        middle.add_trait('value', Any(0))
+        self.assertEqual(expr.eval_expression(), 1)
+        self.assertIsNot(expr.func, func)
+
+
+
+class TestDependencies(unittest.TestCase):
+
+    def test_analyze(self):
+        """ Test the dependencies computed for an expression.
+
+        """
+        expr_ast = ast.parse('model.selected + foo.bar.baz + x + x', 
+                             mode='eval')
+        deps = Dependencies(*analyze_dependencies(expr_ast))
+        self.assertEqual(sorted(deps.names), ['foo', 'model', 'x'])
+        self.assertEqual(deps.attributes, 
+                         (('foo', 'bar'), ('model', 'selected')))
+        self.assertFalse(deps.is_name)
+        self.assertEqual(deps.lineno, None)
+        name_ast = ast.parse('model', mode='eval')
+        self.assertTrue(analyze_dependencies(name_ast)[2])
+
+    def test_updating_bind(self):
+        """ Test that an updating expression subscribes to the attributes
+        named by its precomputed dependencies.
+
+        """
+        parent = BaseComponent()
+        parent.add_trait('offset', Any(1))
+        child = BaseComponent(parent=parent)
+        child.add_trait('value', Any())
+        model = BaseComponent()
+        model.add_trait('count', Any(10))
+        expr = make_expression('model.count + offset', child, 
+                               {'model': model}, Toolkit(), 
+                               expr_cls=UpdatingExpression)
+        expr.bind()
+        self.assertEqual(child.value, None)
+        model.count = 20
+        self.assertEqual(child.value, 21)
+        parent.offset = 2
+        self.assertEqual(child.value, 22)
+
+
+class Item(HasTraits):
+
+    price = Int
+
+    other = Int
+
+
+class Model(HasTraits):
+
+    selected = Instance(Item)
+
+    items = List(Instance(Item))
+
+    use_first = Int(1)
+
+
+class TestTracing(unittest.TestCase):
+
+    def setUp(self):
+        self.component = BaseComponent()
+        self.component.add_trait('value', Any())
+        self.model = Model(selected=Item(price=1))
+
+    def bind(self, source, f_globals=None):
+        if f_globals is None:
+            f_globals = {}
+        f_globals['model'] = self.model
+        expr = make_expression(source, self.component, f_globals, 
+                               Toolkit(), expr_cls=TracingExpression)
+        self.component.value = expr.eval_expression()
+        expr.bind()
+        # The notifiers hold weak references to the expression.
+        self.expr = expr
+
+    def test_attribute_chain(self):
+        """ Test that a change at any depth of an attribute chain 
+        updates the component, and that replacing an object in the 
+        chain moves the notifiers to the new object.
+
+        """
+        self.bind('model.selected.price * 2')
+        component = self.component
+        model = self.model
+        self.assertEqual(component.value, 2)
+        old = model.selected
+        old.price = 3
+        self.assertEqual(component.value, 6)
+        model.selected = Item(price=5)
+        self.assertEqual(component.value, 10)
+        old.price = 100
+        self.assertEqual(component.value, 10)
+        model.selected.price = 7
+        self.assertEqual(component.value, 14)
+
+    def test_subscripts_and_branches(self):
+        """ Test that attributes read through subscripts and in the 
+        branch taken by a conditional are traced.
+
+        """
+        model = self.model
+        model.items = [Item(price=1), Item(price=2)]
+        self.bind('model.items[0].price if model.use_first '
+                  'else model.items[-1].price')
+        component = self.component
+        self.assertEqual(component.value, 1)
+        model.items[0].price = 10
+        self.assertEqual(component.value, 10)
+        model.use_first = 0
+        self.assertEqual(component.value, 2)
+        model.items[-1].price = 20
+        self.assertEqual(component.value, 20)
+        model.items.append(Item(price=30))
+        self.assertEqual(component.value, 30)
+
+    def test_no_spurious_updates(self):
+        """ Test that changes to attributes which were not read do not
+        re-evaluate the expression.
+
+        """
+        evals = []
+        def count(value):
+            evals.append(value)
+            return value
+        self.bind('count(model.selected.price)', {'count': count})
+        self.model.selected.other = 1
+        self.assertEqual(evals, [1])
+        self.model.selected.price = 2
+        self.assertEqual(evals, [1, 2])
+
+
+class TestNotifyingExpression(unittest.TestCase):
+
+    def setUp(self):
+        self.component = BaseComponent()
+        self.component.add_trait('value', Any(0))
+        self.sink = []
+        # The notifiers hold weak references to the expressions.
+        self.exprs = []
+
+    def bind(self, source):
+        expr = make_expression(source, self.component, {'sink': self.sink},
+                               Toolkit(), expr_cls=NotifyingExpression)
+        expr.bind()
+        self.exprs.append(expr)
+        return expr
+
+    def test_notify(self):
+        """ Test that the handler receives the arguments object, with 
+        and without nested scopes.
+
+        """
+        self.bind('sink.append(args)')
+        self.bind('sink.append(list(x for x in args[2:]))')
+        self.component.value = 1
+        self.component.value = 2
+        args = NotifyingExpression.arguments
+        self.assertEqual(self.sink, [
+            args(self.component, 'value', 0, 1), [0, 1],
+            args(self.component, 'value', 1, 2), [1, 2],
+        ])
+        self.assertEqual(self.sink[0].new, 1)
+
+    def test_steady_state_calls(self):
+        """ Test that a steady state notification creates only the 
+        arguments object. Every object is created by a call, so the 
+        calls made by the notification are recorded with a profile
+        function: only the tuple constructor for the arguments, the 
+        expression function and the handler's own call are expected.
+
+        """
+        expr = self.bind('sink.append(args)')
+        component = self.component
+        expr.eval_expression(component, 'value', 0, 1)
+        calls = set()
+        def profile(frame, event, arg):
+            if event == 'call':
+                calls.add(frame.f_code.co_name)
+            elif event == 'c_call':
+                calls.add(arg.__name__)
+        sys.setprofile(profile)
+        try:
+            expr.eval_expression(component, 'value', 1, 2)
+        finally:
+            sys.setprofile(None)
+        calls.discard('setprofile')
+        self.assertEqual(calls, set(['eval_expression', '__new__', 
+                                     '<module>', 'append']))
+        self.assertEqual(len(self.sink), 2)
+
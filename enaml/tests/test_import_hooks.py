@@ -2,7 +2,11 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import os
+import shutil
 import sys
+import tempfile
+import types
 import unittest
 
 from .. import import_hooks
@@ -45,3 +49,145 @@ class TestImportHooks(unittest.TestCase):
         self.assertEquals(import_hooks.EnamlImporter.install_count, 0)
         self.assertEquals(len(import_hooks.sys.meta_path), 0)
 
+
+class TestEnamlCache(unittest.TestCase):
+
+    source = (
+        ":: python ::\n"
+        "value = 42\n"
+        ":: end ::\n"
+        "defn Foo(a):\n"
+        "    Label:\n"
+        "        text = a\n"
+    )
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.enaml_path = os.path.join(self.tmp_dir, 'cached_view.enaml')
+        with open(self.enaml_path, 'w') as f:
+            f.write(self.source)
+        self.dont_write_bytecode = sys.dont_write_bytecode
+        sys.dont_write_bytecode = False
+
+    def tearDown(self):
+        sys.dont_write_bytecode = self.dont_write_bytecode
+        shutil.rmtree(self.tmp_dir)
+
+    def load(self):
+        importer = import_hooks.EnamlImporter(self.enaml_path)
+        code = importer.get_code()
+        ns = {}
+        exec code in ns
+        return ns
+
+    def test_cache_path(self):
+        """ Test that the cache file is placed in the cache directory.
+
+        """
+        path = import_hooks.make_cache_path(self.enaml_path)
+        head, tail = os.path.split(path)
+        self.assertEqual(head, os.path.join(self.tmp_dir, '__enamlcache__'))
+        self.assertTrue(tail.startswith('cached_view.enaml-'))
+        self.assertTrue(tail.endswith('.enamlc'))
+
+    def test_cache_written_and_read(self):
+        """ Test that a compiled module is written to the cache and that
+        the cached code is used on subsequent loads.
+
+        """
+        ns = self.load()
+        self.assertEqual(ns['value'], 42)
+        self.assertTrue(callable(ns['Foo']))
+
+        cache_path = import_hooks.make_cache_path(self.enaml_path)
+        self.assertTrue(os.path.isfile(cache_path))
+        source_stat = os.stat(self.enaml_path)
+        code = import_hooks.read_cache(cache_path, source_stat)
+        self.assertTrue(isinstance(code, types.CodeType))
+
+        # Loading again must not require the parser.
+        old_compile = import_hooks.compile_enaml
+        def fail(path):
+            self.fail('The cached code was not used.')
+        import_hooks.compile_enaml = fail
+        try:
+            ns = self.load()
+        finally:
+            import_hooks.compile_enaml = old_compile
+        self.assertEqual(ns['value'], 42)
+
+    def test_stale_cache(self):
+        """ Test that a cache file is ignored when the source changes.
+
+        """
+        self.load()
+        cache_path = import_hooks.make_cache_path(self.enaml_path)
+        with open(self.enaml_path, 'a') as f:
+            f.write('\n')
+        source_stat = os.stat(self.enaml_path)
+        self.assertEqual(import_hooks.read_cache(cache_path, source_stat), None)
+
+    def test_corrupt_cache(self):
+        """ Test that a corrupt cache file is ignored.
+
+        """
+        cache_path = import_hooks.make_cache_path(self.enaml_path)
+        os.mkdir(os.path.dirname(cache_path))
+        with open(cache_path, 'wb') as f:
+            f.write('garbage')
+        ns = self.load()
+        self.assertEqual(ns['value'], 42)
+
+
+class TestEnamlFinder(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        import_hooks.EnamlImporter.invalidate_caches()
+
+    def tearDown(self):
+        import_hooks.EnamlImporter.invalidate_caches()
+        shutil.rmtree(self.tmp_dir)
+
+    def touch(self, name):
+        with open(os.path.join(self.tmp_dir, name), 'w') as f:
+            f.write('')
+
+    def test_find_module(self):
+        """ Test that enaml modules are found in the package path.
+
+        """
+        self.touch('view.enaml')
+        self.touch('helper.py')
+        Importer = import_hooks.EnamlImporter
+        loader = Importer.find_module('pkg.view', [self.tmp_dir])
+        self.assertEqual(loader.enaml_module_path,
+                         os.path.join(self.tmp_dir, 'view.enaml'))
+        self.assertEqual(Importer.find_module('pkg.helper', [self.tmp_dir]),
+                         None)
+
+    def test_probe_count(self):
+        """ Test that repeated lookups in a directory are answered from
+        the cache without touching the filesystem.
+
+        """
+        self.touch('view.enaml')
+        Importer = import_hooks.EnamlImporter
+        count = Importer.probe_count
+        for name in ('pkg.view', 'pkg.os', 'pkg.sys', 'pkg.view'):
+            Importer.find_module(name, [self.tmp_dir])
+        # One stat and one listdir of the directory
+        self.assertEqual(Importer.probe_count - count, 2)
+
+    def test_invalidate_caches(self):
+        """ Test that new files are found after invalidating the caches.
+
+        """
+        Importer = import_hooks.EnamlImporter
+        self.assertEqual(Importer.find_module('pkg.late', [self.tmp_dir]),
+                         None)
+        self.touch('late.enaml')
+        Importer.invalidate_caches()
+        loader = Importer.find_module('pkg.late', [self.tmp_dir])
+        self.assertNotEqual(loader, None)
+
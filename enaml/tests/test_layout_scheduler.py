@@ -0,0 +1,188 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from traits.api import Any
+
+from ..widgets.container import Container
+from ..widgets.layout.constraints_layout import ConstraintsLayout
+from .test_constraints_layout import GeometryTkComponent, make_container
+
+
+class InnerLayout(ConstraintsLayout):
+    """ A layout manager which is not merged into the layout of the
+    ancestor containers.
+
+    """
+    pass
+
+
+class RecordingContainer(Container):
+    """ A container which records its layouts in a log.
+
+    """
+    log = Any
+
+    def do_layout(self):
+        self.log.append(self)
+        super(RecordingContainer, self).do_layout()
+
+
+class InnerContainer(RecordingContainer):
+    """ A container which manages its own layout.
+
+    """
+    def _layout_default(self):
+        return InnerLayout(self)
+
+
+class TestLayoutScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.posted = []
+        self.container = make_container(5, self.posted.append)
+        self.container.initialize_layout()
+        self.container.abstract_obj.resize(200, 300)
+        self.scheduler = self.container.layout_scheduler
+
+    def run_posted(self):
+        posted = self.posted[:]
+        del self.posted[:]
+        for func in posted:
+            func()
+
+    def test_coalesce(self):
+        """ Test that the requests made during one turn of the event loop
+        are run as one constraints update and one layout.
+
+        """
+        container = self.container
+        children = container.children
+        children[1].visible = False
+        children[3].visible = False
+        container.constraints = [container.width >= 200]
+        children[0].hug_width = 'weak'
+        self.assertEqual(len(self.posted), 1)
+        self.run_posted()
+        counters = self.scheduler.counters()
+        self.assertEqual(counters['flushes'], 1)
+        self.assertEqual(counters['constraint_updates'], 1)
+        self.assertEqual(counters['layouts'], 1)
+        self.assertEqual(counters['requests'], 9)
+        self.assertEqual(counters['coalesced'], 7)
+        self.assertFalse(container._needs_update_constraints)
+        self.assertFalse(container._needs_layout)
+        self.assertEqual(self.posted, [])
+
+        # The hidden children are not laid out.
+        self.assertEqual(children[1].geometry(), (0, 0, 0, 0))
+        self.assertNotEqual(children[2].geometry(), (0, 0, 0, 0))
+
+    def test_size_hints(self):
+        """ Test that the size hint changes of several children are
+        applied by the constraints pass with a single solve for the
+        minimum size.
+
+        """
+        container = self.container
+        layout = container.layout
+        children = container.children
+        solves = layout.min_size_solves
+        min_size = container.abstract_obj.min_size()
+        for child in children:
+            child.abstract_obj._size_hint = (60, 30)
+            child.size_hint_updated = True
+        self.assertEqual(layout.min_size_solves, solves)
+        self.assertEqual(container.abstract_obj.min_size(), min_size)
+        self.assertEqual(len(self.posted), 1)
+
+        self.run_posted()
+        self.assertEqual(layout.min_size_solves, solves + 1)
+        self.assertNotEqual(container.abstract_obj.min_size(), min_size)
+        self.assertEqual(children[0].geometry()[3], 30)
+        counters = self.scheduler.counters()
+        self.assertEqual(counters['constraint_updates'], 1)
+        self.assertEqual(counters['layouts'], 1)
+
+        # Together with a change of visibility, the minimum size is still
+        # solved once.
+        for child in children:
+            child.abstract_obj._size_hint = (50, 20)
+            child.size_hint_updated = True
+        children[1].visible = False
+        self.run_posted()
+        self.assertEqual(layout.min_size_solves, solves + 2)
+        self.assertFalse(container._size_hint_dirty)
+
+    def test_nested(self):
+        """ Test that nested containers share the scheduler of the top
+        container and are laid out from the top down.
+
+        """
+        log = []
+        toolkit = self.container.toolkit
+        outer = RecordingContainer(log=log, toolkit=toolkit,
+                                   abstract_obj=GeometryTkComponent())
+        inner = InnerContainer(log=log, toolkit=toolkit,
+                               abstract_obj=GeometryTkComponent())
+        children = self.container.children[:]
+        self.container.children = []
+        inner.children = children
+        outer.children = [inner]
+        outer.set_parent_refs()
+        outer.set_shell_refs()
+        outer.initialize_layout()
+        self.assertIs(inner.layout_scheduler, outer.layout_scheduler)
+
+        inner.children[0].visible = False
+        outer.constraints = [outer.width >= 200]
+        inner.set_needs_layout()
+        outer.set_needs_layout()
+        self.run_posted()
+        self.assertEqual(log, [outer, inner])
+        counters = outer.layout_scheduler.counters()
+        self.assertEqual(counters['constraint_updates'], 2)
+        self.assertEqual(counters['flushes'], 1)
+
+    def test_destroy(self):
+        """ Test that destroying a container while its layout is pending
+        removes it from the scheduler of the window.
+
+        """
+        log = []
+        toolkit = self.container.toolkit
+        outer = RecordingContainer(log=log, toolkit=toolkit,
+                                   abstract_obj=GeometryTkComponent())
+        inner = InnerContainer(log=log, toolkit=toolkit,
+                               abstract_obj=GeometryTkComponent())
+        children = self.container.children[:]
+        self.container.children = []
+        inner.children = children
+        outer.children = [inner]
+        outer.set_parent_refs()
+        outer.set_shell_refs()
+        outer.initialize_layout()
+        scheduler = outer.layout_scheduler
+
+        inner.children[0].visible = False
+        inner.set_needs_layout()
+        self.assertIn(inner, scheduler.constraints_dirty)
+        self.assertIn(inner, scheduler.layout_dirty)
+        inner.destroy()
+        self.assertNotIn(inner, scheduler.constraints_dirty)
+        self.assertNotIn(inner, scheduler.layout_dirty)
+        self.assertEqual(outer.children, [])
+
+        # The pending flush only lays out the remaining container.
+        outer.set_needs_layout()
+        self.run_posted()
+        self.assertEqual(log, [outer])
+        counters = scheduler.counters()
+        self.assertEqual(counters['constraint_updates'], 0)
+        self.assertEqual(counters['layouts'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import unittest
+
+from ..parsing.lexer import EnamlLexer
+
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, 'examples'
+)
+
+
+SOURCES = [
+    '',
+    'from foo import bar',
+    'Main(Window):\n    a = u"x\\ty" + r\'\\n\'\n\n    b << """\nc\n"""\n',
+    'Main(Window):\n    Panel:\n        foo = (1,\n            2)\n  \n',
+    ':: python ::\ndef f():\n    return 1\n:: end ::\nMain(Window):\n\tpass',
+    'Main(Window):\n    a = 1\n  b = 2\n',
+    'Main(Window):\n    a = "unterminated\n',
+]
+
+
+def lex_tokens(source, fused):
+    """ Returns the token stream for the source as a list of tuples, or
+    the exception which was raised while lexing.
+
+    """
+    lexer = EnamlLexer(fused=fused)
+    lexer.input(source)
+    try:
+        return [
+            (tok.type, tok.value, tok.lineno, tok.lexpos) for tok in lexer
+        ]
+    except Exception as e:
+        return (type(e), str(e))
+
+
+class TestFusedLexer(unittest.TestCase):
+
+    def assertParity(self, source):
+        self.assertEqual(lex_tokens(source, True), lex_tokens(source, False))
+
+    def test_sources(self):
+        """ Test that the fused and filtered token streams are identical
+        for a set of hand written sources.
+
+        """
+        for source in SOURCES:
+            self.assertParity(source)
+
+    def test_examples(self):
+        """ Test that the fused and filtered token streams are identical
+        for all the example .enaml files.
+
+        """
+        count = 0
+        for dirpath, dirnames, filenames in os.walk(EXAMPLES_DIR):
+            for name in filenames:
+                if name.endswith('.enaml'):
+                    with open(os.path.join(dirpath, name)) as f:
+                        self.assertParity(f.read())
+                    count += 1
+        if count == 0:
+            self.skipTest('examples directory not found')
+
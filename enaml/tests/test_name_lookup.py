@@ -0,0 +1,61 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from ..parsing.compiler_helpers import COMPILER_HELPERS
+from ..toolkit import Toolkit
+
+
+lookup_names = COMPILER_HELPERS['lookup_names']
+
+
+class TestNameLookup(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = Toolkit(Window='tk_window', Field='tk_field')
+
+    def test_scopes(self):
+        """ Test that names resolve through the locals, the module, the 
+        toolkit and the builtins in that order.
+
+        """
+        f_globals = {'Field': 'mod_field', 'Label': 'mod_label'}
+        f_locals = {'Label': 'local_label'}
+        names = ('Window', 'Field', 'Label', 'len')
+        self.assertEqual(
+            lookup_names(names, self.toolkit, f_globals),
+            ['tk_window', 'mod_field', 'mod_label', len],
+        )
+        self.assertEqual(
+            lookup_names(names, self.toolkit, f_globals, f_locals),
+            ['tk_window', 'mod_field', 'local_label', len],
+        )
+
+    def test_undefined(self):
+        """ Test that an undefined name raises a NameError.
+
+        """
+        with self.assertRaises(NameError):
+            lookup_names(('Window', 'Missing'), self.toolkit, {})
+
+    def test_invalidation(self):
+        """ Test that changes to the toolkit and the module are seen by
+        subsequent lookups.
+
+        """
+        toolkit = self.toolkit
+        f_globals = {}
+        names = ('Window', 'Field')
+        self.assertEqual(lookup_names(names, toolkit, f_globals),
+                         ['tk_window', 'tk_field'])
+        toolkit['Window'] = 'new_window'
+        del toolkit['Field']
+        f_globals['Field'] = 'mod_field'
+        self.assertEqual(lookup_names(names, toolkit, f_globals),
+                         ['new_window', 'mod_field'])
+        toolkit.update(Window='newer_window')
+        self.assertEqual(lookup_names(names, toolkit, f_globals),
+                         ['newer_window', 'mod_field'])
+
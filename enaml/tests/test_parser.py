@@ -0,0 +1,50 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+from ..parsing import parser
+
+
+class TestParserTables(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.old_state = (parser._parser, parser._package_dir,
+                          parser._user_dir)
+        parser._parser = None
+
+    def tearDown(self):
+        (parser._parser, parser._package_dir,
+         parser._user_dir) = self.old_state
+        shutil.rmtree(self.tmp_dir)
+
+    def test_lazy_construction(self):
+        """ Test that the parser is only built on the first parse.
+
+        """
+        self.assertEqual(parser._parser, None)
+        parser.parse('Foo(Bar):\n    a = 1\n')
+        self.assertNotEqual(parser._parser, None)
+
+    def test_user_dir_fallback(self):
+        """ Test that the tables are written to the user directory when
+        the package directory is not writable, and that those tables 
+        are reused afterwards.
+
+        """
+        parser._package_dir = os.path.join(self.tmp_dir, 'missing')
+        parser._user_dir = os.path.join(self.tmp_dir, 'user')
+        parser.parse('Foo(Bar):\n    a = 1\n')
+
+        tab_path = os.path.join(parser._user_dir, 'enaml_parsetab.py')
+        self.assertTrue(os.path.isfile(tab_path))
+        signature = parser._grammar_signature()
+        tables = parser._load_tables(parser._user_dir, signature)
+        self.assertNotEqual(tables, None)
+        self.assertEqual(parser._load_tables(parser._user_dir, 'stale'), None)
+
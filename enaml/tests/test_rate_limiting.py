@@ -0,0 +1,238 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import ast
+from heapq import heappush, heappop
+from itertools import count
+import unittest
+
+from traits.api import Any, HasTraits, Int
+
+from .. import rate_limiting
+from ..expressions import (ThrottledUpdatingExpression,
+                           DebouncedUpdatingExpression,
+                           ThrottledDelegatingExpression)
+from ..operators import OPERATORS, operator_factory
+from ..parsing.analyzer import Dependencies, analyze_dependencies
+from ..parsing.parser import parse
+from ..rate_limiting import Throttle, Debounce
+from ..toolkit import Toolkit, null_toolkit
+from ..widgets.base_component import BaseComponent
+from ..widgets.null.utils import get_app_null
+
+
+class FakeClock(object):
+    """ A clock and timer queue which only advance when told to.
+
+    """
+    def __init__(self):
+        #: The current time in milliseconds.
+        self.now = 0
+        self.timers = []
+        self.counter = count()
+
+    def __call__(self):
+        return self.now / 1000.0
+
+    def invoke_timer(self, ms, callback):
+        item = (self.now + ms, self.counter.next(), callback)
+        heappush(self.timers, item)
+
+    def advance(self, ms):
+        end = self.now + ms
+        timers = self.timers
+        while timers and timers[0][0] <= end:
+            due, _, callback = heappop(timers)
+            self.now = due
+            callback()
+        self.now = end
+
+
+class Model(HasTraits):
+
+    price = Int
+
+
+class RateLimitingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.old_clock = rate_limiting.clock
+        rate_limiting.clock = self.clock
+        self.calls = []
+
+    def tearDown(self):
+        rate_limiting.clock = self.old_clock
+
+
+class TestLimiters(RateLimitingTestCase):
+
+    def test_throttle(self):
+        """ Test that a throttle delivers the first call immediately and
+        the latest call at the end of each interval.
+
+        """
+        clock = self.clock
+        throttle = Throttle(50, clock.invoke_timer, self.calls.append)
+        throttle(1)
+        self.assertEqual(self.calls, [1])
+        for value in range(2, 10):
+            clock.advance(1)
+            throttle(value)
+        self.assertEqual(self.calls, [1])
+        clock.advance(50)
+        self.assertEqual(self.calls, [1, 9])
+        clock.advance(100)
+        self.assertEqual(self.calls, [1, 9])
+        self.assertEqual(clock.timers, [])
+        throttle(10)
+        self.assertEqual(self.calls, [1, 9, 10])
+
+    def test_debounce(self):
+        """ Test that a debounce delivers the latest call once the calls
+        have been quiet for an interval.
+
+        """
+        clock = self.clock
+        debounce = Debounce(50, clock.invoke_timer, self.calls.append)
+        for value in range(10):
+            debounce(value)
+            clock.advance(10)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(clock.timers), 1)
+        clock.advance(39)
+        self.assertEqual(self.calls, [])
+        clock.advance(1)
+        self.assertEqual(self.calls, [9])
+        clock.advance(100)
+        self.assertEqual(self.calls, [9])
+
+    def test_cancel(self):
+        """ Test that cancelling a limiter drops the pending call.
+
+        """
+        clock = self.clock
+        for cls in (Throttle, Debounce):
+            limiter = cls(50, clock.invoke_timer, self.calls.append)
+            limiter(1)
+            limiter(2)
+            limiter.cancel()
+            clock.advance(200)
+        self.assertEqual(self.calls, [1])
+
+
+class TestRateLimitedExpressions(RateLimitingTestCase):
+
+    def setUp(self):
+        super(TestRateLimitedExpressions, self).setUp()
+        self.toolkit = Toolkit()
+        self.toolkit.invoke_timer = self.clock.invoke_timer
+        self.model = Model()
+        self.component = BaseComponent()
+        self.component.add_trait('value', Any(0))
+
+    def bind(self, expression_class, source):
+        expr_ast = ast.parse(source, mode='eval')
+        code = compile(expr_ast, 'Enaml', mode='eval')
+        deps = Dependencies(*analyze_dependencies(expr_ast))
+        f_globals = {'model': self.model}
+        expr = expression_class(self.component, 'value', deps, code,
+                                f_globals, self.toolkit, {})
+        expr.bind()
+        # The notifiers hold weak references to the expression.
+        self.expr = expr
+
+    def test_throttled_update(self):
+        """ Test that a throttled updating expression drops the
+        intermediate values and delivers the latest.
+
+        """
+        self.bind(ThrottledUpdatingExpression, 'model.price')
+        model = self.model
+        component = self.component
+        model.price = 1
+        self.assertEqual(component.value, 1)
+        for price in range(2, 100):
+            model.price = price
+        self.assertEqual(component.value, 1)
+        self.clock.advance(50)
+        self.assertEqual(component.value, 99)
+
+    def test_debounced_update(self):
+        """ Test that a debounced updating expression updates once the
+        changes stop.
+
+        """
+        self.bind(DebouncedUpdatingExpression, 'model.price')
+        model = self.model
+        for price in range(1, 100):
+            model.price = price
+            self.clock.advance(1)
+        self.assertEqual(self.component.value, 0)
+        self.clock.advance(100)
+        self.assertEqual(self.component.value, 99)
+
+    def test_throttled_delegate(self):
+        """ Test that a throttled delegating expression delivers the
+        latest value in each direction without echoing stale values.
+
+        """
+        self.bind(ThrottledDelegatingExpression, 'model.price')
+        model = self.model
+        component = self.component
+        for value in range(1, 10):
+            component.value = value
+        self.assertEqual(model.price, 1)
+        self.clock.advance(50)
+        self.assertEqual(model.price, 9)
+        self.assertEqual(component.value, 9)
+        model.price = 20
+        self.assertEqual(component.value, 20)
+        self.clock.advance(100)
+        self.assertEqual(model.price, 20)
+        self.assertEqual(component.value, 20)
+
+    def test_null_toolkit_clock(self):
+        """ Test that a debounced expression of the null toolkit measures
+        time with the virtual clock of its timers.
+
+        """
+        app = get_app_null()
+        app.run()
+        self.toolkit = null_toolkit()
+        self.bind(DebouncedUpdatingExpression, 'model.price')
+        model = self.model
+        for price in range(1, 100):
+            model.price = price
+            app.advance(1)
+        app.advance(98)
+        self.assertEqual(self.component.value, 0)
+        app.advance(1)
+        self.assertEqual(self.component.value, 99)
+        self.assertEqual(self.clock.timers, [])
+
+    def test_interval(self):
+        """ Test the interval can be set through the operator factory.
+
+        """
+        operator = operator_factory(ThrottledUpdatingExpression, interval=5)
+        operator(self.component, 'value', None, None, {}, self.toolkit, {})
+        expr = self.component.setup_hooks[-1].expression
+        self.assertIsInstance(expr, ThrottledUpdatingExpression)
+        self.assertEqual(expr.interval, 5)
+
+    def test_operators(self):
+        """ Test that the rate limited operators are parsed and provided
+        by the operator table.
+
+        """
+        source = ('defn Main():\n'
+                  '    Window:\n'
+                  '        a <| model.x\n'
+                  '        b <- model.x\n'
+                  '        c |= model.x\n'
+                  '        d &= model.x\n')
+        body = parse(source).body[0].body[0].body
+        for item in body:
+            self.assertIn(item.binding.op, OPERATORS)
@@ -0,0 +1,320 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import sys
+import unittest
+import weakref
+
+from traits.api import Property
+
+from .. import expressions
+from ..widgets import base_component, setup_engine
+from ..widgets.base_component import (AbstractTkBaseComponent, BaseComponent,
+                                      shell_listener_map)
+from ..widgets.setup_hooks import NullSetupHook
+
+
+class RecordingTkComponent(AbstractTkBaseComponent):
+    """ An abstract object which records the setup calls in a log.
+
+    """
+    def __init__(self, log):
+        self.log = log
+        self.widget = None
+        self._shell_obj = lambda: None
+
+    def _get_shell_obj(self):
+        return self._shell_obj()
+
+    def _set_shell_obj(self, obj):
+        self._shell_obj = weakref.ref(obj)
+
+    shell_obj = property(_get_shell_obj, _set_shell_obj)
+
+    def create(self, parent):
+        name = self.shell_obj.name
+        self.widget = 'widget_' + name
+        self.log.append(('create', name, parent))
+
+    def initialize(self):
+        self.log.append(('initialize', self.shell_obj.name))
+
+    def bind(self):
+        self.log.append(('bind', self.shell_obj.name))
+
+    def destroy(self):
+        self.log.append(('destroy', self.shell_obj.name))
+        self.widget = None
+
+    def shell_enabled_changed(self, enabled):
+        pass
+
+    def shell_visible_changed(self, visible):
+        pass
+
+    def shell_bg_color_changed(self, color):
+        pass
+
+    def shell_fg_color_changed(self, color):
+        pass
+
+    def shell_font_changed(self, font):
+        pass
+
+
+class RecordingHook(NullSetupHook):
+    """ A setup hook which records its steps in a log.
+
+    """
+    def __init__(self, log):
+        self.log = log
+
+    def create(self, component):
+        self.log.append(('pre-create', component.name))
+        yield
+        self.log.append(('post-create', component.name))
+
+
+class ListeningTkComponent(RecordingTkComponent):
+    """ An abstract object with change handlers for the shell traits.
+
+    """
+    def shell_enabled_changed(self, enabled):
+        self.log.append(('enabled', enabled))
+
+    def shell_anytrait_changed(self, name, new):
+        self.log.append(('anytrait', name))
+
+    def shell_missing_changed(self, value):
+        pass
+
+
+class FiringTkComponent(ListeningTkComponent):
+    """ An abstract object which also uses '_fired' handlers.
+
+    """
+    def shell_visible_fired(self, visible):
+        self.log.append(('visible', visible))
+
+    def shell_anytrait_fired(self, name, new):
+        self.log.append(('anytrait fired', name))
+
+    def shell_missing_fired(self, value):
+        pass
+
+
+class Node(BaseComponent):
+
+    toolkit_widget = Property
+
+    def _get_toolkit_widget(self):
+        return self.abstract_obj.widget
+
+
+def registered_listeners(node):
+    """ Returns the set of (trait_name, method_name) pairs of the 
+    method notifiers registered on a node.
+
+    """
+    res = set()
+    for name in [None] + node.trait_names():
+        if name is None:
+            notifiers = node._notifiers(0)
+        else:
+            trait = node._trait(name, 0)
+            notifiers = trait._notifiers(0) if trait is not None else None
+        for notifier in notifiers or ():
+            method_name = getattr(notifier, 'name', None)
+            if method_name is not None:
+                res.add((name, method_name))
+    return res
+
+
+def make_node(name, log):
+    return Node(name=name, abstract_obj=RecordingTkComponent(log))
+
+
+class TestSetupEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.log = log = []
+        self.root = make_node('root', log)
+        self.a = make_node('a', log)
+        self.b = make_node('b', log)
+        self.c = make_node('c', log)
+        self.root.children = [self.a, self.c]
+        self.a.children = [self.b]
+        self.a.setup_hooks.append(RecordingHook(log))
+
+    def test_order(self):
+        """ Test that the passes run top down in order and the hooks run
+        around their pass.
+
+        """
+        self.root.setup('parent_widget')
+        self.assertEqual(self.log, [
+            ('pre-create', 'a'),
+            ('create', 'root', 'parent_widget'),
+            ('create', 'a', 'widget_root'),
+            ('create', 'b', 'widget_a'),
+            ('create', 'c', 'widget_root'),
+            ('post-create', 'a'),
+            ('initialize', 'root'),
+            ('initialize', 'a'),
+            ('initialize', 'b'),
+            ('initialize', 'c'),
+            ('bind', 'root'),
+            ('bind', 'a'),
+            ('bind', 'b'),
+            ('bind', 'c'),
+        ])
+        self.assertIs(self.b.parent, self.a)
+        self.assertIs(self.c.parent, self.root)
+        self.assertIs(self.b.abstract_obj.shell_obj, self.b)
+        self.assertTrue(self.root.initialized)
+
+    def test_timings(self):
+        """ Test that the time spent in each pass is recorded.
+
+        """
+        self.root.setup()
+        phases = [phase for phase, seconds in self.root.setup_timings]
+        self.assertEqual(phases, ['set_parent_refs', 'set_shell_refs',
+                                  'create', 'initialize', 'bind',
+                                  'set_listeners'])
+        self.root.ordered_defaults = True
+        self.root.setup()
+        phases = [phase for phase, seconds in self.root.setup_timings]
+        self.assertIn('evaluate_defaults', phases)
+
+    def test_deep_tree(self):
+        """ Test that a tree deeper than the recursion limit can be
+        setup.
+
+        """
+        log = []
+        root = node = make_node('0', log)
+        for i in xrange(sys.getrecursionlimit() + 100):
+            child = make_node(str(i + 1), log)
+            node.children.append(child)
+            node = child
+        root.setup()
+        self.assertEqual(node.abstract_obj.widget, 'widget_%s' % node.name)
+        self.assertEqual(log[-1], ('bind', node.name))
+
+    def test_deep_tree_invalidation(self):
+        """ Test that the scopes of a deep tree are invalidated in time
+        linear in its size, rather than once per subtree.
+
+        """
+        log = []
+        root = node = make_node('0', log)
+        size = 1000
+        for i in xrange(size):
+            child = make_node(str(i + 1), log)
+            node.children.append(child)
+            node = child
+
+        # The number of components passed to each invalidation, both
+        # by the setup engine and by the change handlers of the tree.
+        visited = []
+        invalidate = expressions.invalidate_component_scopes
+        def counting_invalidate(components):
+            components = list(components)
+            visited.append(len(components))
+            invalidate(components)
+        modules = (setup_engine, base_component)
+        for module in modules:
+            module.invalidate_component_scopes = counting_invalidate
+        try:
+            root.setup()
+        finally:
+            for module in modules:
+                module.invalidate_component_scopes = invalidate
+        self.assertEqual(visited, [size + 1])
+        self.assertIs(node.parent.children[0], node)
+        self.assertEqual(node._scope_generation, root._scope_generation)
+
+
+class TestShellListeners(unittest.TestCase):
+
+    def test_listener_map(self):
+        """ Test the listener map follows the naming contract and is
+        computed once per pair of classes.
+
+        """
+        res = shell_listener_map(Node, ListeningTkComponent)
+        self.assertIn(('enabled', 'shell_enabled_changed'), res)
+        self.assertIn(('visible', 'shell_visible_changed'), res)
+        self.assertIn((None, 'shell_anytrait_changed'), res)
+        names = [name for name, method_name in res]
+        self.assertNotIn('missing', names)
+        self.assertIs(shell_listener_map(Node, ListeningTkComponent), res)
+
+    def test_notifiers(self):
+        """ Test that the handlers are notified of changes until they
+        are removed.
+
+        """
+        log = []
+        node = Node(abstract_obj=ListeningTkComponent(log))
+        node.add_shell_listeners()
+        node.add_shell_listeners()
+        node.enabled = False
+        self.assertEqual(sorted(log), [('anytrait', 'enabled'),
+                                       ('enabled', False)])
+        del log[:]
+        node.remove_shell_listeners()
+        node.enabled = True
+        self.assertEqual(log, [])
+
+    def test_same_as_trait_listener(self):
+        """ Test that the registered notifiers are those registered by
+        .add_trait_listener, for handlers using both the '_changed' and
+        the '_fired' suffixes.
+
+        """
+        log = []
+        abstract_obj = FiringTkComponent(log)
+        node = Node(abstract_obj=abstract_obj)
+        node.add_shell_listeners()
+        baseline = Node(abstract_obj=abstract_obj)
+        baseline.add_trait_listener(abstract_obj, 'shell')
+        res = registered_listeners(node)
+        self.assertIn(('enabled', 'shell_enabled_changed'), res)
+        self.assertEqual(res, registered_listeners(baseline))
+        node.remove_shell_listeners()
+        self.assertEqual(registered_listeners(node), set())
+
+    def test_fallback_scan(self):
+        """ Test that the map recorded from the prefix matching of traits
+        is that of the fallback scan, and that the fallback is used when
+        the matching of traits is not available.
+
+        """
+        for abstract_cls in (ListeningTkComponent, FiringTkComponent):
+            res = shell_listener_map(Node, abstract_cls)
+            scanned = base_component._scan_shell_listeners(Node, abstract_cls)
+            self.assertEqual(res, tuple(sorted(scanned)))
+
+        trait_listener = base_component._trait_listener
+        maps = base_component._shell_listener_maps
+        base_component._trait_listener = None
+        base_component._shell_listener_maps = {}
+        try:
+            res = shell_listener_map(Node, FiringTkComponent)
+            log = []
+            node = Node(abstract_obj=ListeningTkComponent(log))
+            node.add_shell_listeners()
+            node.enabled = False
+        finally:
+            base_component._trait_listener = trait_listener
+            base_component._shell_listener_maps = maps
+        self.assertEqual(res, shell_listener_map(Node, FiringTkComponent))
+        self.assertEqual(sorted(log), [('anytrait', 'enabled'),
+                                       ('enabled', False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import ast
+import unittest
+
+from ..exceptions import EnamlRuntimeError
+from ..operators import OPERATORS
+from ..parsing.analyzer import Dependencies, analyze_dependencies
+from ..toolkit import Toolkit
+from ..widgets.base_component import BaseComponent, SetupContext
+from ..widgets.setup_hooks import evaluate_defaults
+
+
+class TestDefaultStrategies(unittest.TestCase):
+
+    def setUp(self):
+        self.toolkit = Toolkit()
+        self.toolkit.update(OPERATORS)
+        self.root = BaseComponent()
+        self.child = BaseComponent()
+        self.root.add_child(self.child)
+        self.f_locals = {'root': self.root, 'child': self.child}
+
+    def bind(self, component, attr, source, op='__operator_Equal__'):
+        expr_ast = ast.parse(source, mode='eval')
+        code = compile(expr_ast, 'Enaml', mode='eval')
+        deps = Dependencies(*analyze_dependencies(expr_ast))
+        self.toolkit[op](component, attr, deps, code, {}, self.toolkit,
+                         self.f_locals)
+
+    def bind_tree(self):
+        # The bindings are made out of dependency order.
+        root = self.root
+        child = self.child
+        self.bind(child, 'enabled', 'a > 1')
+        self.bind(child, 'c', 'a * 2')
+        self.bind(child, 'd', 'root.a + c', '__operator_LessLess__')
+        self.bind(root, 'a', 'b + 1')
+        self.bind(root, 'b', '1')
+
+    def create(self, ordered):
+        self.root.set_parent_refs()
+        if ordered:
+            evaluate_defaults(self.root)
+        with SetupContext('create')(self.root):
+            pass
+
+    def check_tree(self):
+        root = self.root
+        child = self.child
+        self.assertEqual(root.a, 2)
+        self.assertEqual(root.b, 1)
+        self.assertEqual(child.c, 4)
+        self.assertEqual(child.d, 6)
+        self.assertTrue(child.enabled)
+
+    def test_lazy_defaults(self):
+        """ Test the default values computed through the temporary
+        instance traits.
+
+        """
+        self.bind_tree()
+        self.create(False)
+        self.check_tree()
+
+    def test_ordered_defaults(self):
+        """ Test the default values computed in dependency order, and
+        that no instance traits are added for the class traits.
+
+        """
+        self.bind_tree()
+        self.create(True)
+        self.check_tree()
+        self.assertNotIn('enabled', self.child._instance_traits())
+        for hook in self.child.setup_hooks:
+            self.assertTrue(hook.default_ready)
+
+    def test_ordered_notifiers(self):
+        """ Test that the ordered defaults are assigned quietly and the
+        expressions are bound by the bind pass as usual.
+
+        """
+        changes = []
+        self.child.on_trait_change(lambda: changes.append(1), 'enabled')
+        self.bind_tree()
+        self.create(True)
+        self.child.defer_updates = False
+        self.assertEqual(changes, [])
+        with SetupContext('bind')(self.root):
+            pass
+        self.root.a = 10
+        self.assertEqual(self.child.d, 14)
+
+    def test_override(self):
+        """ Test that a later binding of an attribute overrides an
+        earlier one.
+
+        """
+        self.bind(self.root, 'a', '1')
+        self.bind(self.root, 'a', '2')
+        self.create(True)
+        self.assertEqual(self.root.a, 2)
+
+    def test_cycle(self):
+        """ Test that a cycle in the dependencies is reported with the
+        attributes involved.
+
+        """
+        self.bind(self.root, 'a', 'b + 1')
+        self.bind(self.root, 'b', 'child.c + 1')
+        self.bind(self.child, 'c', 'a')
+        with self.assertRaises(EnamlRuntimeError) as cm:
+            self.create(True)
+        self.assertIn('BaseComponent.a -> BaseComponent.b -> '
+                      'BaseComponent.c -> BaseComponent.a', str(cm.exception))
+
+    def test_hidden_dependency(self):
+        """ Test that an attribute read through an object which is itself
+        computed is computed on demand before it is read.
+
+        """
+        self.bind(self.root, 'm', 'child')
+        self.bind(self.root, 'x', 'm.c + 1')
+        self.bind(self.child, 'c', '5')
+        self.create(True)
+        self.assertEqual(self.root.x, 6)
+
+    def test_hidden_cycle(self):
+        """ Test that a cycle through a dependency which is found while
+        evaluating is reported with the attributes involved.
+
+        """
+        self.bind(self.root, 'm', 'child')
+        self.bind(self.root, 'x', 'm.c')
+        self.bind(self.child, 'c', 'root.x')
+        with self.assertRaises(EnamlRuntimeError) as cm:
+            self.create(True)
+        self.assertIn('BaseComponent.x -> BaseComponent.c -> '
+                      'BaseComponent.x', str(cm.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
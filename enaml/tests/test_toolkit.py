@@ -0,0 +1,94 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from ..toolkit import Constructor, Toolkit
+
+
+class Shell(object):
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class Abstract(object):
+    pass
+
+
+class CountingLoader(object):
+    """ A loader which counts the number of times it is called.
+
+    """
+    def __init__(self, cls):
+        self.cls = cls
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.cls
+
+
+def failing_loader():
+    raise ImportError('No module named missing')
+
+
+class TestConstructor(unittest.TestCase):
+
+    def setUp(self):
+        self.shell_loader = CountingLoader(Shell)
+        self.abstract_loader = CountingLoader(Abstract)
+        self.toolkit = Toolkit(
+            Shell=Constructor(self.shell_loader, self.abstract_loader),
+            Missing=Constructor(failing_loader, failing_loader),
+        )
+
+    def test_memoized(self):
+        """ Test that the loaders are called once for all of the
+        components created by a constructor.
+
+        """
+        ctor = self.toolkit['Shell']
+        for i in range(3):
+            component = ctor()
+            self.assertIsInstance(component, Shell)
+            self.assertIsInstance(component.kwargs['abstract_obj'], Abstract)
+            self.assertEqual(component.kwargs['style_type'], 'Shell')
+        self.assertEqual(self.shell_loader.calls, 1)
+        self.assertEqual(self.abstract_loader.calls, 1)
+
+    def test_loader_changed(self):
+        """ Test that changing a loader discards its resolved class.
+
+        """
+        ctor = self.toolkit['Shell']
+        ctor()
+        ctor.abstract_loader = CountingLoader(Shell)
+        self.assertIsInstance(ctor().kwargs['abstract_obj'], Shell)
+        clone = ctor.clone(shell_loader=CountingLoader(Abstract))
+        self.assertEqual(clone.resolve(), (Abstract, Shell))
+        self.assertEqual(self.shell_loader.calls, 1)
+
+    def test_preload(self):
+        """ Test that preloading resolves the classes and skips the
+        constructors which fail to import.
+
+        """
+        self.toolkit.preload()
+        self.assertEqual(self.shell_loader.calls, 1)
+        self.toolkit['Shell']()
+        self.assertEqual(self.shell_loader.calls, 1)
+        self.assertRaises(ImportError, self.toolkit['Missing'])
+
+    def test_preload_background(self):
+        """ Test preloading in a background thread.
+
+        """
+        thread = self.toolkit.preload(background=True)
+        thread.join()
+        self.assertEqual(self.abstract_loader.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
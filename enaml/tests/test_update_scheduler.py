@@ -0,0 +1,172 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import ast
+import gc
+import unittest
+
+from traits.api import Any, HasTraits, Int
+
+from ..expressions import UpdatingExpression
+from ..parsing.analyzer import Dependencies, analyze_dependencies
+from ..toolkit import Toolkit
+from ..update_scheduler import _scheduler, flush_updates
+from ..widgets.base_component import BaseComponent
+from ..widgets.setup_hooks import ExpressionSetupHook
+
+
+class Model(HasTraits):
+
+    x = Int(1)
+
+    y = Int(1)
+
+
+class TestUpdateScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.posted = []
+        self.toolkit = Toolkit()
+        self.toolkit.invoke_later = self.posted.append
+        self.model = Model()
+        self.evals = []
+
+    def tearDown(self):
+        flush_updates()
+
+    def bind(self, component, source):
+        """ Binds an updating expression to the 'value' attribute of
+        the component. The evaluations of the expression are recorded
+        in self.evals as (component, value) pairs.
+
+        """
+        def record(value):
+            self.evals.append((component, value))
+            return value
+        expr_ast = ast.parse(source, mode='eval')
+        code = compile(expr_ast, 'Enaml', mode='eval')
+        deps = Dependencies(*analyze_dependencies(expr_ast))
+        f_globals = {'model': self.model, 'record': record}
+        expr = UpdatingExpression(component, 'value', deps, code,
+                                  f_globals, self.toolkit, {})
+        component.setup_hooks.append(ExpressionSetupHook('value', expr))
+        component.value = expr.eval_expression()
+        expr.bind()
+        del self.evals[:]
+
+    def make_component(self, parent=None):
+        component = BaseComponent()
+        if parent is not None:
+            component.parent = parent
+        component.add_trait('value', Any(0))
+        return component
+
+    def test_coalesce(self):
+        """ Test that changes to several dependencies are coalesced into
+        a single evaluation per turn of the event loop.
+
+        """
+        component = self.make_component()
+        self.bind(component, 'record(model.x + model.y)')
+        self.model.x = 2
+        self.model.y = 3
+        self.assertEqual(component.value, 2)
+        self.assertEqual(self.evals, [])
+        self.assertEqual(len(self.posted), 1)
+        self.posted.pop()()
+        self.assertEqual(component.value, 5)
+        self.assertEqual(self.evals, [(component, 5)])
+        self.model.x = 3
+        self.assertEqual(len(self.posted), 1)
+
+    def test_dependency_order(self):
+        """ Test that an expression depending on the results of other
+        expressions is evaluated once, after them.
+
+        """
+        parent = self.make_component()
+        first = self.make_component(parent)
+        second = self.make_component(parent)
+        # The diamond is notified first, before the expressions it
+        # depends upon are made dirty.
+        parent.add_trait('first', Any(first))
+        parent.add_trait('second', Any(second))
+        self.bind(parent, 'record(model.x + first.value + second.value)')
+        self.bind(first, 'record(model.x * 10)')
+        self.bind(second, 'record(model.x * 100)')
+        self.model.x = 2
+        flush_updates()
+        self.assertEqual(self.evals, [
+            (first, 20), (second, 200), (parent, 222),
+        ])
+        self.assertEqual(parent.value, 222)
+
+    def test_opt_out(self):
+        """ Test that a component which does not defer updates is
+        updated synchronously.
+
+        """
+        component = self.make_component()
+        component.defer_updates = False
+        self.bind(component, 'record(model.x + model.y)')
+        self.model.x = 2
+        self.model.y = 3
+        self.assertEqual(self.evals, [(component, 3), (component, 5)])
+        self.assertEqual(self.posted, [])
+
+    def test_unbind(self):
+        """ Test that unbinding an expression discards its pending
+        evaluation.
+
+        """
+        component = self.make_component()
+        self.bind(component, 'record(model.x + model.y)')
+        self.model.x = 2
+        component.setup_hooks[0].expression.unbind()
+        flush_updates()
+        self.model.y = 3
+        flush_updates()
+        self.assertEqual(self.evals, [])
+        self.assertEqual(component.value, 2)
+
+    def test_destroy(self):
+        """ Test that destroying a component discards the pending
+        evaluations of the expressions bound to it.
+
+        """
+        parent = self.make_component()
+        child = self.make_component(parent)
+        parent.children.append(child)
+        self.bind(parent, 'record(model.x + 1)')
+        self.bind(child, 'record(model.x + 2)')
+        self.model.x = 2
+        self.assertEqual(len(_scheduler.pending), 2)
+        child.destroy()
+        self.assertEqual(len(_scheduler.pending), 1)
+        flush_updates()
+        self.assertEqual(self.evals, [(parent, 3)])
+        self.assertEqual(child.value, 3)
+
+    def test_collected(self):
+        """ Test that the pending evaluation of an expression whose 
+        component has been garbage collected is skipped.
+
+        """
+        # The expression is bound without the recording function of
+        # self.bind, which would keep the component alive.
+        component = self.make_component()
+        expr_ast = ast.parse('model.x + model.y', mode='eval')
+        code = compile(expr_ast, 'Enaml', mode='eval')
+        deps = Dependencies(*analyze_dependencies(expr_ast))
+        expr = UpdatingExpression(component, 'value', deps, code,
+                                  {'model': self.model}, self.toolkit, {})
+        component.setup_hooks.append(ExpressionSetupHook('value', expr))
+        expr.bind()
+        self.model.x = 2
+        self.assertEqual(len(_scheduler.pending), 1)
+        del component
+        gc.collect()
+        self.assertIsNone(expr.obj)
+        flush_updates()
+        self.assertEqual(_scheduler.pending, [])
@@ -7,7 +7,8 @@ import inspect
 
 from enaml.parsing.parser import parse
 from enaml.parsing.enaml_compiler import EnamlCompiler
-from enaml.toolkit import default_toolkit
+from enaml.toolkit import Toolkit
+from enaml.update_scheduler import flush_updates
 
 
 def required_method(function_object):
@@ -32,8 +33,10 @@ class EnamlTestCase(unittest.TestCase):
     the testing of enaml components
 
     """
-    #: default toolkit to use for the enaml source parsing
-    toolkit = default_toolkit()
+    #: toolkit to use for the enaml source parsing. The default toolkit
+    #: is used if None, and is only created when a test needs it, so
+    #: that the toolkit test cases do not depend on its gui library.
+    toolkit = None
 
     def component_by_name(self, component, name):
         """ Find an item in the view with a given name. The component
@@ -72,6 +75,8 @@ class EnamlTestCase(unittest.TestCase):
         EnamlCompiler.compile(enaml_ast, enaml_module)
 
         toolkit = self.toolkit
+        if toolkit is None:
+            toolkit = Toolkit.default_toolkit()
 
         with toolkit:
             defn = enaml_module['MainView']
@@ -111,6 +116,9 @@ class EnamlTestCase(unittest.TestCase):
             possible to retrieve a sensible value for the attribute.
 
         """
+        # Bring the deferred expression updates up-to-date before
+        # comparing the values.
+        flush_updates()
         widget = component.toolkit_widget
         enaml_value = getattr(component, attribute_name)
         widget_method = getattr(self, 'get_' + attribute_name)
@@ -0,0 +1,18 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from enaml.toolkit import null_toolkit
+
+class NullTestAssistant(object):
+    """ Assistant class for testing null based components.
+
+    This class is to be used as a mixing with the base enaml test case
+    class for the components tests of the null backend. It sets the
+    correct toolkit attribute. The null toolkit needs no display, so
+    these tests run everywhere.
+
+    """
+
+    toolkit = null_toolkit()
+
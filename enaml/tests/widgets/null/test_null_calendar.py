@@ -0,0 +1,43 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import calendar
+
+
+class TestNullCalendar(NullTestAssistant, calendar.TestCalendar):
+    """ NullCalendar tests. 
+
+    """
+    def get_date(self, widget):
+        """  Get the toolkits widget's active date.
+
+        """
+        return widget.date
+
+    def get_min_date(self, widget):
+        """  Get the toolkits widget's maximum date attribute.
+
+        """
+        return widget.min_date
+
+    def get_max_date(self, widget):
+        """ Get the toolkits widget's minimum date attribute.
+
+        """
+        return widget.max_date
+
+    def activate_date(self, widget, date):
+        """ Fire an event to indicate that a date was activated.
+
+        """
+        widget.emit('activated', date)
+
+    def select_date(self, widget, date):
+        """ Fire an event to indicate that a date was selected.
+
+        """
+        widget.date = date
+        widget.emit('selection_changed')
+
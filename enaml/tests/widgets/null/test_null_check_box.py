@@ -0,0 +1,41 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import check_box
+
+class TestNullCheckBox(NullTestAssistant, check_box.TestCheckBox):
+    """ NullCheckBox tests. """
+
+    def get_text(self, widget):
+        """ Returns the text from the tookit widget.
+
+        """
+        return widget.text
+
+    def get_checked(self, widget):
+        """ Returns the checked status from the tookit widget.
+
+        """
+        return widget.checked
+
+    def checkbox_pressed(self, widget):
+        """ Press the checkbox programmatically.
+
+        """
+        widget.emit('pressed')
+
+    def checkbox_released(self, widget):
+        """ Release the button programmatically.
+
+        """
+        widget.emit('released')
+
+    def checkbox_toggle(self, widget):
+        """ Toggle the button programmatically.
+
+        """
+        widget.checked = True
+        widget.emit('toggled')
+
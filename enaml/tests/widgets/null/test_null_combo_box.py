@@ -0,0 +1,32 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import combo_box
+
+
+class TestNullComboBox(NullTestAssistant, combo_box.TestComboBox):
+    """ NullComboBox tests. """
+
+    def get_selected_text(self, widget):
+        """ Get the current selected text of a combo box.
+
+        """
+        if widget.index == -1:
+            return ''
+        return widget.items[widget.index]
+
+    def get_item_text(self, widget, index):
+        """ Get the text of a combo box item at a particular index.
+
+        """
+        return widget.items[index]
+
+    def select_item(self, widget, index):
+        """ Fire an event to simulate the selection of an item.
+
+        """
+        widget.index = index
+        widget.emit('index_changed')
+
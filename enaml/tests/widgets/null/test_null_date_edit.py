@@ -0,0 +1,42 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import date_edit
+
+
+class TestNullDateEdit(NullTestAssistant, date_edit.TestDateEdit):
+    """ NullDateEdit tests. """
+
+    def get_date(self, widget):
+        """  Get the toolkits widget's active date.
+
+        """
+        return widget.date
+
+    def get_min_date(self, widget):
+        """  Get the toolkits widget's maximum date attribute.
+
+        """
+        return widget.min_date
+
+    def get_max_date(self, widget):
+        """ Get the toolkits widget's minimum date attribute.
+
+        """
+        return widget.max_date
+
+    def change_date(self, widget, date):
+        """ Simulate a change date action at the toolkit widget.
+
+        """
+        widget.date = date
+        widget.emit('date_changed')
+
+    def get_date_as_string(self, widget):
+        """  Get the toolkits widget's active date as a string.
+
+        """
+        return widget.text
+
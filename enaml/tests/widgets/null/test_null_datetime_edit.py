@@ -0,0 +1,42 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import datetime_edit
+
+
+class TestNullDatetimeEdit(NullTestAssistant, datetime_edit.TestDatetimeEdit):
+    """ NullDatetimeEdit tests. """
+
+    def get_datetime(self, widget):
+        """  Get the toolkits widget's active datetime.
+
+        """
+        return widget.datetime
+
+    def get_min_datetime(self, widget):
+        """  Get the toolkits widget's maximum datetime attribute.
+
+        """
+        return widget.min_datetime
+
+    def get_max_datetime(self, widget):
+        """ Get the toolkits widget's minimum datetime attribute.
+
+        """
+        return widget.max_datetime
+
+    def change_datetime(self, widget, datetime):
+        """ Simulate a change datetime action at the toolkit widget.
+
+        """
+        widget.datetime = datetime
+        widget.emit('datetime_changed')
+
+    def get_datetime_as_string(self, widget):
+        """  Get the toolkits widget's active datetime as a string.
+
+        """
+        return widget.text
+
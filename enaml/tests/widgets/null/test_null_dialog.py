@@ -0,0 +1,17 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from . import test_null_window
+from .. import dialog
+
+class TestNullDialog(test_null_window.TestNullWindow, dialog.TestDialog):
+    """ NullDialog tests. """
+
+    def disable_showing(self, widget):
+        """ Disable the actual display of the dialog window.
+
+        """
+        # A null dialog is never displayed.
+        pass
+
@@ -0,0 +1,86 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+
+from .. import field
+
+
+class TestNullField(NullTestAssistant, field.TestField):
+    """ NullField tests. 
+
+    """
+    def get_value(self, widget):
+        """ Get the visible text of a field.
+
+        """
+        return widget.text
+
+    def edit_text(self, widget, text):
+        """ Simulate typing in a field.
+
+        """
+        widget.insert(text)
+
+    def change_text(self, widget, text):
+        """ Change text programmatically, rather than "edit" it.
+
+        """
+        widget.set_text(text)
+
+    def set_cursor_position(self, widget, index):
+        """ Set the cursor at a specific position.
+
+        """
+        widget.set_cursor_position(index)
+
+    def get_cursor_position(self, widget):
+        """ Get the cursor position.
+
+        """
+        return widget.cursor
+
+    def set_selected_text(self, widget, start, stop):
+        """ Select text in a field.
+
+        """
+        widget.set_selection(start, stop - start)
+
+    def get_selected_text(self, widget):
+        """ Get the currently-selected text from a field.
+
+        """
+        return widget.selected_text()
+
+    def get_password_mode(self, widget):
+        """ Get the password mode status of the widget
+
+        """
+        return widget.password_mode
+
+    def press_return(self, widget):
+        """ Simulate a press of the 'Return' key.
+
+        """
+        widget.emit('return_pressed')
+
+    def gain_focus_if_needed(self, widget):
+        """ Have the widget gain focus if required for the tests.
+
+        """
+        # A null widget has no focus.
+        pass
+
+    def test_widget_read_only(self):
+        """ Check that the toolkit widget enforces its read-only flag.
+
+        The edits of the null field are simulated by its insert method,
+        which honors the flag, so this is not an expected failure.
+
+        """
+        initial = 'abc'
+        self.component.read_only = True
+        self.edit_text(self.widget, 'foo')
+        self.assertEqual(self.get_value(self.widget), initial)
+
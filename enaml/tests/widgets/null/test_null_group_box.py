@@ -0,0 +1,28 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import group_box
+
+
+class TestNullGroupBox(NullTestAssistant, group_box.TestGroupBox):
+
+    def get_title(self, component, widget):
+        """ Returns the title text from the tookit widget
+
+        """
+        return widget.title
+
+    def get_flat(self, component, widget):
+        """ Returns the flat style status from the tookit widget
+
+        """
+        return widget.flat
+
+    def get_title_align(self, component, widget):
+        """ Returns the title aligment in the tookit widget
+
+        """
+        return widget.title_align
+
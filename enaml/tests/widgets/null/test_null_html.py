@@ -0,0 +1,18 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import re
+
+from .null_test_assistant import NullTestAssistant
+from .. import html
+
+class TestNullHtml(NullTestAssistant, html.TestHtml):
+    """ NullHtml tests. """
+
+    def get_source(self, widget):
+        """ Get the plain text of the source of an Html widget.
+
+        """
+        return re.sub('<[^>]*>', '', widget.source)
+
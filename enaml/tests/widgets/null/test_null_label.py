@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import label
+
+class TestNullLabel(NullTestAssistant, label.TestLabel):
+    """ NullLabel tests. """
+
+    def get_text(self, widget):
+        """ Get a label's text.
+
+        """
+        return widget.text
+
@@ -0,0 +1,23 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import operators
+
+class TestNullLessLess(NullTestAssistant, operators.TestLessLess):
+    """ TestSuite for the LessLess operator in the null toolkit.
+
+    """
+    def get_text(self, widget):
+        """ Returns the label text from the tookit widget of Label.
+
+        """
+        return widget.text
+
+    def get_checked(self, widget):
+        """ Returns the label text from the tookit widget of CheckBox.
+
+        """
+        return widget.checked
+
@@ -0,0 +1,29 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import push_button
+
+
+class TestNullPushButton(NullTestAssistant, push_button.TestPushButton):
+    """ NullPushButton tests. """
+
+    def button_pressed(self):
+        """ Press the button programmatically.
+
+        """
+        self.widget.emit('pressed')
+
+    def button_released(self):
+        """ Release the button programmatically.
+
+        """
+        self.widget.emit('released')
+
+    def button_clicked(self):
+        """ Click the button programmatically.
+
+        """
+        self.widget.emit('clicked')
+
@@ -0,0 +1,23 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import radio_button
+
+
+class TestNullRadioButton(NullTestAssistant, radio_button.TestRadioButton):
+    """ NullRadioButton tests. """
+
+    def get_value(self, button):
+        """ Get the checked state of a radio button.
+
+        """
+        return button.checked
+
+    def get_text(self, button):
+        """ Get the label of a button.
+
+        """
+        return button.text
+
@@ -0,0 +1,96 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import slider
+
+
+# Map test event actions to the null slider signals
+EVENT_MAP = {slider.TestEvents.PRESSED: 'pressed',
+             slider.TestEvents.RELEASED: 'released'}
+
+# Map test event actions to the null slider actions
+ACTION_MAP ={slider.TestEvents.HOME: 'to_minimum',
+             slider.TestEvents.END: 'to_maximum',
+             slider.TestEvents.STEP_UP: 'single_step_add',
+             slider.TestEvents.STEP_DOWN: 'single_step_sub',
+             slider.TestEvents.PAGE_UP: 'page_step_add',
+             slider.TestEvents.PAGE_DOWN: 'page_step_sub'}
+
+class TestNullSlider(NullTestAssistant, slider.TestSlider):
+    """ NullSlider tests. """
+
+    def get_value(self, widget):
+        """ Get a slider's position.
+
+        """
+        return widget.value
+
+    def get_minimum(self, widget):
+        """ Get the Slider's minimum value.
+
+        """
+        return widget.minimum
+
+    def get_maximum(self, widget):
+        """ Get the Slider's maximum value.
+
+        """
+        return widget.maximum
+
+    def get_tick_interval(self, widget):
+        """ Get the Slider's tick_interval value.
+
+        """
+        return widget.tick_interval
+
+    def get_tick_position(self, widget):
+        """ Get the Slider's tick position style.
+
+        """
+        return widget.tick_position
+
+    def get_orientation(self, widget):
+        """ Get the Slider's orientation.
+
+        """
+        return widget.orientation
+
+    def get_single_step(self, widget):
+        """ Get the Slider's single step value.
+
+        """
+        return widget.single_step
+
+    def get_page_step(self, widget):
+        """ Get the Slider's page step value.
+
+        """
+        return widget.page_step
+
+    def get_tracking(self, widget):
+        """ Get the Slider's tracking status.
+
+        """
+        return widget.tracking
+
+    def send_event(self, widget, event):
+        """ Send an event to the Slider programmatically.
+
+        Arguments
+        ---------
+        widget :
+            The widget to send the event to.
+
+        event :
+            The desired event to be proccessed.
+
+        """
+        if event in ACTION_MAP:
+            widget.trigger_action(ACTION_MAP[event])
+        elif event in EVENT_MAP:
+            widget.emit(EVENT_MAP[event])
+        else:
+            raise NotImplementedError('Test event is not Implemented')
+
@@ -0,0 +1,59 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import spin_box
+
+
+class TestNullSpinBox(NullTestAssistant, spin_box.TestSpinBox):
+    """ NullSpinBox tests. """
+
+    def get_value(self, widget):
+        """ Get a spin box's value.
+
+        """
+        return widget.value
+
+    def get_low(self, widget):
+        """ Get a spin box's minimum value.
+
+        """
+        return widget.low
+
+    def get_high(self, widget):
+        """ Get a spin box's maximum value.
+
+        """
+        return widget.high
+
+    def get_step(self, widget):
+        """ Get a spin box's step size.
+
+        """
+        return widget.step
+
+    def get_wrap(self, widget):
+        """ Check if a spin box wraps around at the edge values.
+
+        """
+        return widget.wrap
+
+    def get_text(self, widget):
+        """ Get the text displayed in a spin box.
+
+        """
+        return widget.text()
+
+    def spin_up_event(self, widget):
+        """ Simulate a click on the 'up' spin button.
+
+        """
+        widget.step_up()
+
+    def spin_down_event(self, widget):
+        """ Simulate a click on the 'down' spin button.
+
+        """
+        widget.step_down()
+
@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_test_assistant import NullTestAssistant
+from .. import window
+
+class TestNullWindow(NullTestAssistant, window.TestWindow):
+    """ NullWindow tests. """
+
+    def get_title(self, widget):
+        """ Get a window's title.
+
+        """
+        return widget.title
+
@@ -2,9 +2,13 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+import __builtin__
 import os
+import threading
 
-from traits.api import HasStrictTraits, Callable, Str, WeakRef
+from traits.api import HasStrictTraits, Any, Callable, Str, WeakRef
+
+from .expressions import invalidate_scopes
 
 
 #------------------------------------------------------------------------------
@@ -32,6 +36,12 @@ class Constructor(HasStrictTraits):
     #: attribute on the components as they are created.
     toolkit = WeakRef('Toolkit')
 
+    #: The shell class returned by the shell loader, once resolved.
+    _shell_cls = Any
+
+    #: The abstract class returned by the abstract loader, once resolved.
+    _abstract_cls = Any
+
     def __init__(self, shell_loader, abstract_loader):
         """ Initialize a constructor instance.
 
@@ -51,29 +61,62 @@ class Constructor(HasStrictTraits):
         self.abstract_loader = abstract_loader
 
     def __call__(self, *args, **kwargs):
-        """ Calls the loaders and assembles the component.
+        """ Assembles the component from the resolved classes.
 
         Subclasses should override this method to implement custom
         construction behavior if the default is not sufficient.
 
         """
-        shell_cls = self.shell_loader()
-        abstract_cls = self.abstract_loader()
+        shell_cls, abstract_cls = self.resolve()
         component = shell_cls(style_type=self.style_type,
                               toolkit=self.toolkit,
                               abstract_obj=abstract_cls())
         return component
 
+    def resolve(self):
+        """ Returns the (shell_cls, abstract_cls) classes of the widget.
+        The loaders are called the first time the classes are needed,
+        and the classes they return are reused until a loader is 
+        changed.
+
+        """
+        shell_cls = self._shell_cls
+        if shell_cls is None:
+            shell_cls = self._shell_cls = self.shell_loader()
+        abstract_cls = self._abstract_cls
+        if abstract_cls is None:
+            abstract_cls = self._abstract_cls = self.abstract_loader()
+        return shell_cls, abstract_cls
+
     def clone(self, shell_loader=None, abstract_loader=None):
         """ Creates a clone of this constructor, optionally changing
-        out one or both of the loaders.
+        out one or both of the loaders. The classes resolved by the 
+        loaders which are kept are shared with the clone.
 
         """
+        shell_cls = abstract_cls = None
         if shell_loader is None:
             shell_loader = self.shell_loader
+            shell_cls = self._shell_cls
         if abstract_loader is None:
             abstract_loader = self.abstract_loader
-        return Constructor(shell_loader, abstract_loader)
+            abstract_cls = self._abstract_cls
+        res = Constructor(shell_loader, abstract_loader)
+        res._shell_cls = shell_cls
+        res._abstract_cls = abstract_cls
+        return res
+
+    def _shell_loader_changed(self):
+        """ Discards the shell class resolved by the old loader.
+
+        """
+        self._shell_cls = None
+
+    def _abstract_loader_changed(self):
+        """ Discards the abstract class resolved by the old loader.
+
+        """
+        self._abstract_cls = None
 
 
 #------------------------------------------------------------------------------
@@ -122,10 +165,19 @@ class Toolkit(dict):
         the style types are properly assigned to the constructors.
 
         """
+        self._lookup_cache = {}
         super(Toolkit, self).__init__(*args, **kwargs)
         for key, value in self.iteritems():
             self[key] = value
 
+    def _invalidate(self):
+        """ Clears the lookup cache and invalidates the scopes of the
+        expressions, which may have resolved names in the toolkit.
+
+        """
+        self._lookup_cache.clear()
+        invalidate_scopes()
+
     def __setitem__(self, key, value):
         """ Overridden dict.__setitem__ to apply style types to the
         constructors.
@@ -138,8 +190,37 @@ class Toolkit(dict):
             value = value.clone()
             value.style_type = key
             value.toolkit = self
+        self._invalidate()
         super(Toolkit, self).__setitem__(key, value)
 
+    def __delitem__(self, key):
+        """ Overridden dict.__delitem__ to invalidate the lookup caches.
+
+        """
+        self._invalidate()
+        super(Toolkit, self).__delitem__(key)
+
+    def pop(self, *args):
+        """ Overridden dict.pop to invalidate the lookup caches.
+
+        """
+        self._invalidate()
+        return super(Toolkit, self).pop(*args)
+
+    def popitem(self):
+        """ Overridden dict.popitem to invalidate the lookup caches.
+
+        """
+        self._invalidate()
+        return super(Toolkit, self).popitem()
+
+    def clear(self):
+        """ Overridden dict.clear to invalidate the lookup caches.
+
+        """
+        self._invalidate()
+        super(Toolkit, self).clear()
+
     def update(self, other=None, **kwargs):
         """ Overridden from dict.update to apply style types to the
         constructors.
@@ -170,6 +251,77 @@ class Toolkit(dict):
             self[key] = default
         return default
 
+    def lookup(self, names, default=None):
+        """ Looks up a sequence of names in the toolkit and then in the
+        builtins.
+
+        This performs the same resolution as evaluating each name with
+        the toolkit as the global namespace. The results are cached 
+        until the toolkit is modified.
+
+        Parameters
+        ----------
+        names : tuple of strings
+            The names to lookup.
+
+        default : object, optional
+            The value to use for a name which does not exist in the 
+            toolkit or the builtins.
+
+        Returns
+        -------
+        result : tuple
+            The objects for the given names.
+
+        """
+        key = (names, default)
+        cache = self._lookup_cache
+        if key in cache:
+            return cache[key]
+        values = []
+        for name in names:
+            if name in self:
+                values.append(self[name])
+            else:
+                values.append(getattr(__builtin__, name, default))
+        values = cache[key] = tuple(values)
+        return values
+
+    def preload(self, background=False):
+        """ Resolves the classes of all of the constructors in the 
+        toolkit ahead of time, so that the widget modules are not 
+        imported while the first window is being built.
+
+        A constructor whose modules cannot be imported (for example, 
+        because an optional dependency is missing) is skipped, and the 
+        error is raised as usual if the widget is ever used.
+
+        Parameters
+        ----------
+        background : bool, optional
+            If True, the classes are resolved in a daemon thread, for 
+            example while a splash screen is shown. The widget modules
+            must only be imported there and no widgets created. The 
+            default is False.
+
+        Returns
+        -------
+        result : threading.Thread or None
+            The started thread if `background` is True, which may be
+            joined to wait for the preloading to finish.
+
+        """
+        ctors = [value for value in self.itervalues() 
+                 if isinstance(value, Constructor)]
+        if not background:
+            _preload(ctors)
+            return None
+        thread = threading.Thread(target=_preload, args=(ctors,), 
+                                  name='enaml-preload')
+        thread.daemon = True
+        thread.start()
+        return thread
+
     def __enter__(self):
         """ A context manager method that pushes this toolkit onto
         the active toolkit stack.
@@ -264,6 +416,19 @@ class Toolkit(dict):
 
     invoke_timer = property(_get_invoke_timer, _set_invoke_timer)
 
+    def _get_clock(self):
+        """ Returns the function which returns the current time in 
+        seconds of the clock against which the timers run, or None if
+        they run against the wall clock.
+
+        """
+        return self.get('__clock__')
+
+    def _set_clock(self, val):
+        self['__clock__'] = val
+
+    clock = property(_get_clock, _set_clock)
+
     def _get_control_exception_handler(self):
         """ Returns the function for handling exceptions on a control object
         that would otherwise be swallowed.
@@ -277,6 +442,19 @@ class Toolkit(dict):
     control_exception_handler = property(_get_control_exception_handler,
                                          _set_control_exception_handler)
 
+
+def _preload(ctors):
+    """ Resolves the classes of the given constructors, skipping those
+    whose modules cannot be imported.
+
+    """
+    for ctor in ctors:
+        try:
+            ctor.resolve()
+        except ImportError:
+            pass
+
+
 #------------------------------------------------------------------------------
 # Toolkit Factory Functions
 #------------------------------------------------------------------------------
@@ -293,6 +471,9 @@ def default_toolkit():
     if toolkit == 'wx':
         return wx_toolkit()
 
+    if toolkit == 'null':
+        return null_toolkit()
+
     raise ValueError('Invalid Toolkit: %s' % toolkit)
 
 
@@ -352,6 +533,38 @@ def wx_toolkit():
     return toolkit
 
 
+def null_toolkit():
+    """ Creates and return a toolkit object for the headless null 
+    backend. The widgets keep their state in memory and the event loop
+    is driven by hand, which makes this toolkit suitable for tests and 
+    benchmarks.
+
+    """
+    from .operators import OPERATORS
+    from .widgets.null.constructors import NULL_CONSTRUCTORS
+    from .widgets.null.styling import NULL_STYLE_SHEET
+    from .widgets.null.utils import (get_app_null, start_event_loop_null,
+                                     invoke_later, invoke_timer, clock)
+    from .widgets.layout.layout_helpers import LAYOUT_HELPERS
+
+    utils = {}
+
+    toolkit = Toolkit(NULL_CONSTRUCTORS)
+
+    toolkit.create_app = get_app_null
+    toolkit.start_app = start_event_loop_null
+    toolkit.style_sheet = NULL_STYLE_SHEET
+    toolkit.invoke_later = invoke_later
+    toolkit.invoke_timer = invoke_timer
+    toolkit.clock = clock
+    toolkit.control_exception_handler = None
+    toolkit.update(utils)
+    toolkit.update(OPERATORS)
+    toolkit.update(LAYOUT_HELPERS)
+
+    return toolkit
+
+
 def muntjac_toolkit():
     """ Creates and return a toolkit object for the Muntjac backend.
 
@@ -0,0 +1,167 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A scheduler which coalesces the re-evaluation of updating expressions.
+
+When several of the attributes an updating expression depends upon
+change together, the expression is only marked as dirty. The dirty
+expressions are evaluated once, in dependency order, on the next turn
+of the event loop.
+
+"""
+from heapq import heapify, heappush, heappop
+from itertools import count
+
+
+class UpdateScheduler(object):
+    """ An object which collects dirty expressions and evaluates them
+    in a single batch.
+
+    Expressions are evaluated in order of their `rank`, so an expression
+    is evaluated after the expressions which compute the attributes it
+    depends upon. Expressions which are made dirty while the batch is
+    being flushed are evaluated as part of the same batch.
+
+    """
+    def __init__(self):
+        #: A heap of (rank, counter, expression) tuples to evaluate.
+        self.pending = []
+
+        #: The set of expressions in the pending heap.
+        self.queued = set()
+
+        #: A counter which keeps the heap stable for equal ranks.
+        self.counter = count()
+
+        #: Whether a call to flush has been posted to the event loop.
+        self.posted = False
+
+        #: Whether a flush is in progress.
+        self.flushing = False
+
+        #: The function last used to post a flush to the event loop.
+        self.invoke_later = None
+
+    def schedule(self, expression, invoke_later):
+        """ Marks an expression as dirty.
+
+        Parameters
+        ----------
+        expression : UpdatingExpression
+            The expression to re-evaluate. Its `rank` method gives the
+            order of evaluation and its `refresh` method evaluates the
+            expression and assigns the result. Its `obj` attribute is
+            the component to which it is bound, or None once the 
+            component has been garbage collected.
+
+        invoke_later : callable
+            The toolkit function used to post the flush to the event
+            loop if one is not already pending.
+
+        """
+        if expression in self.queued:
+            return
+        self.queued.add(expression)
+        item = (expression.rank(), self.counter.next(), expression)
+        heappush(self.pending, item)
+        self.invoke_later = invoke_later
+        if not (self.posted or self.flushing):
+            self.posted = True
+            invoke_later(self.flush)
+
+    def cancel(self, expression):
+        """ Discards the pending re-evaluation of an expression, if 
+        any. The entry is left in the heap and skipped by the flush.
+
+        """
+        self.queued.discard(expression)
+
+    def discard(self, components):
+        """ Drops the pending re-evaluations of the expressions bound to
+        the given components, along with those of the expressions whose
+        component has been garbage collected. This is called for the 
+        components of a tree which is being destroyed, so that the heap
+        does not keep their expressions alive.
+
+        """
+        components = set(components)
+        pending = self.pending
+        queued = self.queued
+        keep = []
+        for item in pending:
+            expression = item[2]
+            obj = expression.obj
+            if obj is None or obj in components:
+                queued.discard(expression)
+            elif expression in queued:
+                keep.append(item)
+        # The heap is updated in place, since a flush may be running.
+        pending[:] = keep
+        heapify(pending)
+
+    def flush(self):
+        """ Evaluates all of the dirty expressions synchronously.
+
+        This is called from the event loop, and may be called directly
+        to bring the ui up-to-date without running the event loop,
+        which is mostly useful for testing.
+
+        """
+        self.posted = False
+        if self.flushing:
+            return
+        pending = self.pending
+        queued = self.queued
+        self.flushing = True
+        try:
+            while pending:
+                expression = heappop(pending)[2]
+                if expression in queued:
+                    queued.discard(expression)
+                    # The component may have been collected since the
+                    # expression was scheduled.
+                    if expression.obj is not None:
+                        expression.refresh()
+        finally:
+            self.flushing = False
+            # If an expression raised an exception, the remaining
+            # expressions are left for the next flush.
+            if pending:
+                self.posted = True
+                self.invoke_later(self.flush)
+
+
+#: The scheduler shared by the updating expressions.
+_scheduler = UpdateScheduler()
+
+
+def schedule_update(expression, invoke_later):
+    """ Marks an updating expression as dirty so that it is evaluated
+    on the next turn of the event loop. See UpdateScheduler.schedule.
+
+    """
+    _scheduler.schedule(expression, invoke_later)
+
+
+def flush_updates():
+    """ Synchronously evaluates the dirty updating expressions.
+
+    """
+    _scheduler.flush()
+
+
+def discard_updates(components):
+    """ Drops the pending re-evaluations of the expressions bound to the
+    given components. See UpdateScheduler.discard.
+
+    """
+    _scheduler.discard(components)
+
+
+def cancel_update(expression):
+    """ Discards the pending re-evaluation of an updating expression.
+    See UpdateScheduler.cancel.
+
+    """
+    _scheduler.cancel(expression)
@@ -5,12 +5,17 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
 from collections import deque
 from functools import wraps
+from types import FunctionType
 
 from traits.api import (
-    Any, Bool, HasStrictTraits, Instance, List, Property, Str, Tuple, WeakRef,
+    Any, Bool, HasStrictTraits, HasTraits, Instance, Int, List, Property,
+    Str, Tuple, WeakRef,
 )
 
+from .setup_engine import SetupEngine
 from .setup_hooks import AbstractSetupHook
+from ..expressions import invalidate_component_scopes
+from ..update_scheduler import discard_updates
 
 from ..styling.color import ColorTrait
 from ..styling.font import FontTrait
@@ -82,6 +87,17 @@ class AbstractTkBaseComponent(object):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def destroy(self):
+        """ Destroy the implementation object.
+
+        This method is called when the shell object is destroyed, after
+        the implementations of its children have been destroyed. The
+        toolkit object should be released so that it can be freed.
+
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def shell_enabled_changed(self, enabled):
         """ The change handler for the 'enabled' attribute on the shell
@@ -126,6 +142,119 @@ class AbstractTkBaseComponent(object):
         raise NotImplementedError
 
 
+#: The function of the prefix matching of HasTraits.add_trait_listener,
+#: or None if the installed version of traits does not provide it.
+_trait_listener = getattr(getattr(HasTraits, '_trait_listener', None), 
+                          'im_func', None)
+
+
+def _class_method_names(cls):
+    """ Yields the names of the functions defined by a class and its
+    bases, the most derived definition of each name first.
+
+    """
+    seen = set()
+    for klass in cls.__mro__:
+        for name, method in klass.__dict__.iteritems():
+            if type(method) is FunctionType and name not in seen:
+                seen.add(name)
+                yield name
+
+
+class _ListenerRecorder(object):
+    """ A stand-in for a shell object which runs the prefix matching of
+    HasTraits._trait_listener against an abstract class, and records 
+    the notifiers it would register rather than registering them.
+
+    """
+    def __init__(self, shell_cls):
+        self.__base_traits__ = shell_cls.__base_traits__
+        self.pairs = []
+
+    def _each_trait_method(self, cls):
+        # The class is matched in place of an instance of it, so walk 
+        # its own mro rather than that of its class.
+        return _class_method_names(cls)
+
+    def _on_trait_change(self, handler, name=None, remove=False):
+        self.pairs.append((name, handler.__name__))
+
+
+def _scan_shell_listeners(shell_cls, abstract_cls):
+    """ Returns the list of the (trait_name, method_name) pairs of the
+    'shell_<name>_changed' and 'shell_anytrait_changed' methods of the 
+    abstract class. This is the fallback of shell_listener_map for the
+    versions of traits whose prefix matching cannot be recorded.
+
+    """
+    traits = shell_cls.__base_traits__
+    res = []
+    for name in _class_method_names(abstract_cls):
+        if name.startswith('shell_') and name.endswith('_changed'):
+            short_name = name[6:-8]
+            if short_name in traits:
+                res.append((short_name, name))
+            elif short_name == 'anytrait':
+                res.append((None, name))
+    return res
+
+
+#: The cache of the listener maps computed by shell_listener_map.
+_shell_listener_maps = {}
+
+
+def shell_listener_map(shell_cls, abstract_cls):
+    """ Returns the listener map of an abstract class for the traits of
+    a shell class.
+
+    The map is the set of notifiers which .add_trait_listener would 
+    register for an instance of the abstract class with the prefix 
+    'shell', e.g. a method named 'shell_<name>_changed' handles the 
+    changes to the trait <name> of the shell object and a method named
+    'shell_anytrait_changed' handles the changes to any trait. The 
+    prefix matching is that of traits itself, including its handling 
+    of '_fired' methods, but it is run once per pair of classes rather
+    than for every instance. If the private api of traits on which the
+    matching relies is not available, the 'shell_<name>_changed' and 
+    'shell_anytrait_changed' methods are scanned for instead.
+
+    Parameters
+    ----------
+    shell_cls : type
+        A subclass of BaseComponent.
+
+    abstract_cls : type
+        The class of the abstract objects of the shell class.
+
+    Returns
+    -------
+    result : tuple
+        A tuple of (trait_name, method_name) pairs, where the trait name 
+        is None for a handler of any trait.
+
+    """
+    key = (shell_cls, abstract_cls)
+    try:
+        return _shell_listener_maps[key]
+    except KeyError:
+        pass
+    pairs = None
+    if _trait_listener is not None:
+        recorder = _ListenerRecorder(shell_cls)
+        try:
+            _trait_listener(recorder, abstract_cls, 'shell', False)
+        except (AttributeError, TypeError):
+            # The private api of this version of traits is not the one
+            # which the recorder stands in for.
+            pass
+        else:
+            pairs = recorder.pairs
+    if pairs is None:
+        pairs = _scan_shell_listeners(shell_cls, abstract_cls)
+    res = _shell_listener_maps[key] = tuple(sorted(set(pairs)))
+    return res
+
+
 class NullContext(object):
     """ A do-nothing context object that is created by the __call__
     method of SetupContext when that context is being used by a 
@@ -256,7 +385,7 @@ class BaseComponent(HasStrictTraits):
     #: The parent component of this component. It is stored as a weakref
     #: to mitigate issues with reference cycles. A top-level component's
     #: parent is None.
-    parent = WeakRef('BaseComponent')
+    parent = WeakRef('BaseComponent', allow_none=True)
 
     #: The list of children components for this component. Subclasses
     #: should redefine this trait to restrict which types of children
@@ -294,6 +423,22 @@ class BaseComponent(HasStrictTraits):
     #: that need to be called after the component has been set up.
     initialized = Bool(False)
 
+    #: Whether the '<<' expressions bound to the attributes of this
+    #: component are re-evaluated once per turn of the event loop, 
+    #: rather than on every change of the traits they depend upon.
+    #: Set this to False to have the expressions updated synchronously.
+    defer_updates = Bool(True)
+
+    #: Whether the default values of the expressions bound to the tree
+    #: are computed by a single pass in dependency order when the tree
+    #: is setup from this component, rather than lazily through 
+    #: temporary instance traits. See setup_hooks.evaluate_defaults.
+    ordered_defaults = Bool(False)
+
+    #: The (phase, seconds) pairs of the wall time spent in each pass 
+    #: of the last call to setup() on this component, for diagnostics.
+    setup_timings = List(Tuple(Str, Any))
+
     #: The background color of the widget
     bg_color = Property(ColorTrait, depends_on=['_user_bg_color', '_style_bg_color'])
     
@@ -337,7 +482,49 @@ class BaseComponent(HasStrictTraits):
     #: An optional name to give to this component to assist in finding
     #: it in the tree.
     name = Str
+
+    #: The generation of the scope in which the names of the expressions
+    #: bound to this component are resolved. It is changed when one of
+    #: the names may be resolved by a different ancestor, so that the
+    #: expressions discard the owners they have cached. See 
+    #: enaml.expressions.invalidate_component_scopes.
+    _scope_generation = Int
     
+    def add_trait(self, name, *trait):
+        """ Overridden from the parent class to invalidate the cached 
+        scopes of the expressions, since the new trait may shadow an 
+        attribute of an ancestor.
+
+        """
+        super(BaseComponent, self).add_trait(name, *trait)
+        self.invalidate_scopes()
+
+    def remove_trait(self, name):
+        """ Overridden from the parent class to invalidate the cached 
+        scopes of the expressions.
+
+        """
+        res = super(BaseComponent, self).remove_trait(name)
+        self.invalidate_scopes()
+        return res
+
+    def _parent_changed(self):
+        """ The change handler for the 'parent' attribute. Invalidates
+        the cached scopes of the expressions, since names may now be
+        resolved by different ancestors.
+
+        """
+        self.invalidate_scopes()
+
+    def invalidate_scopes(self):
+        """ Invalidates the cached scopes of the expressions bound to 
+        this component and its descendants, which are the expressions
+        which may resolve a name on this component. The expressions of
+        the rest of the tree keep their caches.
+
+        """
+        invalidate_component_scopes(self.traverse())
+
     def add_child(self, child):
         """ Add the child to this component.
 
@@ -462,7 +649,14 @@ class BaseComponent(HasStrictTraits):
         6) The abstract object is added as a listener to the shell object
 
         Each of these methods are performed top down. Setup hooks are 
-        called for items 3, 4, and 5.
+        called for items 3, 4, and 5. If `ordered_defaults` is True, the
+        default values of the bound expressions are computed between 
+        items 2 and 3.
+
+        The passes are run by a SetupEngine, which collects the tree 
+        once and runs each pass as a loop over its components rather 
+        than as a recursive walk. The time spent in each pass is stored
+        in `setup_timings`.
 
         After step 6, the `initialized` trait is set to True.
 
@@ -473,12 +667,9 @@ class BaseComponent(HasStrictTraits):
             to pass the appropriate toolkit widget that should be the parent.
 
         """
-        self.set_parent_refs()
-        self.set_shell_refs()
-        self.create(parent)
-        self.initialize()
-        self.bind()
-        self.set_listeners()
+        engine = SetupEngine(self)
+        engine.run(parent, self.ordered_defaults)
+        self.setup_timings = engine.timings
 
         self.initialized = True
 
@@ -488,9 +679,7 @@ class BaseComponent(HasStrictTraits):
         by user code.
 
         """
-        for child in self.children:
-            child.parent = self
-            child.set_parent_refs()
+        SetupEngine(self).set_parent_refs()
 
     def set_shell_refs(self):
         """ Assigns a reference to self to the abstract obj and 
@@ -544,10 +733,74 @@ class BaseComponent(HasStrictTraits):
         component with a prefix of 'shell'.
 
         """
-        self.add_trait_listener(self.abstract_obj, 'shell')
+        self.add_shell_listeners()
         for child in self.children:
             child.set_listeners()
 
+    def add_shell_listeners(self):
+        """ Adds the 'shell_*' handlers of the abstract object as 
+        notifiers of the traits of this component. This is equivalent
+        to .add_trait_listener(self.abstract_obj, 'shell') but uses the 
+        cached listener map of the classes.
+
+        """
+        abstract_obj = self.abstract_obj
+        listener_map = shell_listener_map(type(self), type(abstract_obj))
+        for name, method_name in listener_map:
+            handler = getattr(abstract_obj, method_name)
+            self._on_trait_change(handler, name)
+
+    def remove_shell_listeners(self):
+        """ Removes the notifiers added by add_shell_listeners.
+
+        """
+        abstract_obj = self.abstract_obj
+        listener_map = shell_listener_map(type(self), type(abstract_obj))
+        for name, method_name in listener_map:
+            handler = getattr(abstract_obj, method_name)
+            self._on_trait_change(handler, name, remove=True)
+
+    def destroy(self):
+        """ Destroys the tree of components rooted at this component.
+
+        The tree is torn down bottom up, so that the children of each
+        component are destroyed before it. For each component, the 
+        expressions bound to it are unbound, the abstract object is 
+        removed as a listener and told to destroy its toolkit object, 
+        and the references to its children and setup hooks are cleared.
+        The pending updates of the tree are discarded. Finally, this 
+        component is removed from its parent. A destroyed
+        component must not be used again.
+
+        """
+        # Collect the tree in preorder and tear it down in reverse, 
+        # which visits the children of each component before it.
+        components = []
+        stack = [self]
+        while stack:
+            cmpnt = stack.pop()
+            components.append(cmpnt)
+            stack.extend(cmpnt.children)
+        for cmpnt in reversed(components):
+            for hook in cmpnt.setup_hooks:
+                hook.destroy(cmpnt)
+            if cmpnt.abstract_obj is not None:
+                cmpnt.remove_shell_listeners()
+                cmpnt.abstract_obj.destroy()
+            # The setup hooks hold the expressions, whose locals refer 
+            # to the other components of the tree, so they are cleared 
+            # along with the children to break the reference cycles.
+            cmpnt.trait_setq(setup_hooks=[], children=[], initialized=False)
+            if cmpnt is not self:
+                cmpnt.parent = None
+        discard_updates(components)
+
+        parent = self.parent
+        if parent is not None:
+            if self in parent.children:
+                parent.remove_child(self)
+            self.parent = None
+
     def _set_bg_color(self, new):
         """ Property setter for the 'bg_color' background color property.
         Set values are pushed to the '_user_bg_color' trait.
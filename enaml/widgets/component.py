@@ -119,7 +119,7 @@ class AbstractTkComponent(AbstractTkBaseComponent):
         """
         raise NotImplementedError
 
-    def set_solved_geometry(self, root):
+    def set_solved_geometry(self, root, offset=None):
         """ Makes the component take the solved geometry and other constrained
         variables and set its internal values.
 
@@ -134,6 +134,11 @@ class AbstractTkComponent(AbstractTkBaseComponent):
             the global solved (x,y) values to local values relative to their
             immediate parent.
 
+        offset : (dx, dy), optional
+            The position of the immediate parent relative to the root, as
+            computed by the layout pass. If not given, it is computed from
+            the geometry of the ancestors.
+
         Returns
         -------
         dx, dy : int
@@ -148,15 +153,18 @@ class AbstractTkComponent(AbstractTkBaseComponent):
         width = shell.width.value
         height = shell.height.value
         x, y, width, height = (int(round(z)) for z in (x, y, width, height))
-        # This is offset against the root Container. Each Component's geometry
-        # actually needs to be offset against its parent. Walk up the tree and
-        # subtract out the parent's offset.
-        dx = 0
-        dy = 0
-        for ancestor in shell.walk_up_containers(root):
-            adx, ady, _, _ = ancestor.geometry()
-            dx += adx
-            dy += ady
+        if offset is None:
+            # This is offset against the root Container. Each Component's
+            # geometry actually needs to be offset against its parent. Walk
+            # up the tree and subtract out the parent's offset.
+            dx = 0
+            dy = 0
+            for ancestor in shell.walk_up_containers(root):
+                adx, ady, _, _ = ancestor.geometry()
+                dx += adx
+                dy += ady
+        else:
+            dx, dy = offset
         self.set_geometry(x-dx, y-dy, width, height)
         return (dx, dy)
 
@@ -384,15 +392,15 @@ class Component(BaseComponent):
         """
         self.abstract_obj.set_geometry(x, y, width, height)
 
-    def set_solved_geometry(self, root):
+    def set_solved_geometry(self, root, offset=None):
         """ Makes the component take the solved geometry and other constrained
         variables and set its internal values.
 
         This method can assume that all of its parents have had their geometry
-        set correctly.
+        set correctly. See AbstractTkComponent.set_solved_geometry.
 
         """
-        return self.abstract_obj.set_solved_geometry(root)
+        return self.abstract_obj.set_solved_geometry(root, offset)
 
     def walk_up_containers(self, root):
         """ Walk up the component hierarchy from this component and yield the
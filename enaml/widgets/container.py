@@ -2,12 +2,14 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import List, Instance, Either, Bool, on_trait_change
+from traits.api import (List, Instance, Either, Bool, Tuple, Property,
+                        on_trait_change)
 
 from .component import Component, AbstractTkComponent
 from .control import Control
 from .layout.constraints_layout import ConstraintsLayout
 from .layout.layout_manager import AbstractLayoutManager
+from .layout.layout_scheduler import LayoutScheduler
 
 
 _SIZE_HINT_DEPS = ('children:size_hint_updated, children:hug_width, '
@@ -56,6 +58,37 @@ class Container(Component):
     #: its children
     _needs_layout = Bool(True)
 
+    #: A private tuple of the children and the default user constraints
+    #: computed for them. The constraints are reused while the children
+    #: are unchanged, so that the variables of the layout helpers are
+    #: the same and the layout manager may diff the constraints.
+    _default_user_cns = Tuple
+
+    #: A private set of the children whose size hints have changed
+    #: since the constraints were last updated.
+    _size_hint_dirty = Instance(set, ())
+
+    #: A private scheduler for the layout requests of the containers
+    #: of the tree rooted at this container. Only the scheduler of the
+    #: top-most container of a window is used.
+    _layout_scheduler = Instance(LayoutScheduler, ())
+
+    #: A read-only property which returns the layout scheduler of the
+    #: window which contains this container.
+    layout_scheduler = Property
+
+    def _get_layout_scheduler(self):
+        """ Property getter for the 'layout_scheduler' property.
+
+        """
+        root = self
+        parent = self.parent
+        while parent is not None:
+            if isinstance(parent, Container):
+                root = parent
+            parent = parent.parent
+        return root._layout_scheduler
+
     def _layout_default(self):
         """ Default value for the layout manager.
 
@@ -72,6 +105,24 @@ class Container(Component):
         super(Container, self).setup(parent=parent)
         self.initialize_layout()
 
+    def destroy(self):
+        """ Destroys the tree of components rooted at this container. 
+        This is overridden from the parent class to remove the containers
+        of the tree from the layout scheduler before they are torn down,
+        so that a pending flush does not lay them out.
+
+        """
+        scheduler = self.layout_scheduler
+        containers = [cmpnt for cmpnt in self.traverse()
+                      if isinstance(cmpnt, Container)]
+        scheduler.discard(containers)
+        for container in containers:
+            container.trait_setq(_needs_update_constraints=False,
+                                 _needs_layout=False,
+                                 _size_hint_dirty=set())
+            container.clear_cached_constraints()
+        super(Container, self).destroy()
+
     def initialize_layout(self):
         """ Initialize the layout for the first time.
 
@@ -88,7 +139,34 @@ class Container(Component):
 
         """
         from .layout.layout_helpers import vbox
-        return [vbox(*self.children)]
+        children = tuple(self.children)
+        if self._default_user_cns:
+            cached_children, cns = self._default_user_cns
+            if cached_children == children:
+                return list(cns)
+        cns = [vbox(*children)]
+        self._default_user_cns = (children, cns)
+        return list(cns)
+
+    def clear_cached_constraints(self):
+        """ Releases the constraints cached for the current children, 
+        which hold references to them. Subclasses which cache their 
+        container constraints should extend this method.
+
+        """
+        self._default_user_cns = ()
+
+    def _children_changed(self):
+        """ The change handler for the 'children' attribute. 
+
+        """
+        self.clear_cached_constraints()
+
+    def _children_items_changed(self):
+        """ The change handler for the items of the 'children' list.
+
+        """
+        self.clear_cached_constraints()
 
     def container_constraints(self):
         """ A set of constraints that should always be applied to this
@@ -104,7 +182,8 @@ class Container(Component):
 
         """
         if self._needs_update_constraints:
-            self.toolkit.invoke_later(self.update_constraints)
+            self.layout_scheduler.schedule_constraints(
+                self, self.toolkit.invoke_later)
 
     def set_needs_update_constraints(self, needs=True):
         """ Indicate that the constraints for this component should be
@@ -118,14 +197,22 @@ class Container(Component):
         else:
             self._needs_update_constraints = needs
             if needs:
-                self.toolkit.invoke_later(self.update_constraints)
+                self.layout_scheduler.schedule_constraints(
+                    self, self.toolkit.invoke_later)
 
     def update_constraints(self):
-        """ Update the constraints for this component.
+        """ Update the constraints for this component, along with the
+        size constraints of the children whose size hints changed.
 
         """
-        if self.layout is not None:
-            self.layout.update_constraints()
+        layout = self.layout
+        if layout is not None:
+            children = self._size_hint_dirty
+            self._size_hint_dirty = set()
+            if self._needs_update_constraints:
+                layout.update_constraints(children)
+            elif children:
+                layout.update_size_cns(*children)
             self.set_needs_layout(True)
         self._needs_update_constraints = False
 
@@ -136,7 +223,8 @@ class Container(Component):
 
         """
         if self._needs_layout:
-            self.toolkit.invoke_later(self.do_layout)
+            self.layout_scheduler.schedule_layout(
+                self, self.toolkit.invoke_later)
 
     def set_needs_layout(self, needs=True):
         """ Indicate that the layout should be refreshed some time later.
@@ -146,14 +234,14 @@ class Container(Component):
             # Our layout is being managed by an ancestor.
             self.parent.set_needs_layout(needs)
         else:
-            old = self._needs_layout
             self._needs_layout = needs
-            if not old and needs:
-                # Only invoke the do_layout() once, when _needs_layout 
-                # changes from False to True, but not when it was already 
-                # True. This makes sure that we only update the layout once 
-                # even if we set multiple traits that request a new layout.
-                self.toolkit.invoke_later(self.do_layout)
+            if needs:
+                # The scheduler makes sure that we only update the layout
+                # once even if we set multiple traits that request a new
+                # layout, and that the containers of the window are laid
+                # out from the top down.
+                self.layout_scheduler.schedule_layout(
+                    self, self.toolkit.invoke_later)
 
     def do_layout(self):
         """ Updates the layout of this component.
@@ -174,14 +262,13 @@ class Container(Component):
             # the notification.
             self.parent.handle_size_hint_changed(child, name, old, new)
         else:
-            # Update the constraints in the solver immediately since
-            # there may be more than one widget during a pass that
-            # will the size hint updated, and multiple calls to 
-            # set_needs_layout get collapsed to a single call. If we
-            # were to update the size hint cns via invoke_later, some
-            # of the updates may occur after the layout pass has already
-            # taken place.
-            self.layout.update_size_cns(child)
+            # The size hint cns are updated by the constraints pass of
+            # the scheduler, which runs before its layout pass, so that
+            # the changes made to several children during one turn of
+            # the event loop cost a single solve for the minimum size.
+            self._size_hint_dirty.add(child)
+            self.layout_scheduler.schedule_constraints(
+                self, self.toolkit.invoke_later)
             self.set_needs_layout()
 
     @on_trait_change(_CONSTRAINT_DEPS)
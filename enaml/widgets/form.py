@@ -2,7 +2,7 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Instance, Str
+from traits.api import Instance, Str, Tuple
 
 from casuarius import ConstraintVariable
 
@@ -38,6 +38,12 @@ class Form(Container):
     # FIXME: Use an Enum.
     layout_strength = Str('strong')
 
+    #: A private tuple of the children and the layout strength, and the
+    #: form constraints computed for them. The constraints are reused 
+    #: while those are unchanged, so that the variables of the layout 
+    #: helpers are the same and the layout manager may diff them.
+    _form_cns = Tuple
+
     def default_user_constraints(self):
         """ Overridden parent class method which returns an empty list.
         All constraints are supplied by 'container_constraints()'.
@@ -45,6 +51,14 @@ class Form(Container):
         """
         return []
 
+    def clear_cached_constraints(self):
+        """ Overridden parent class method which also releases the 
+        cached form constraints.
+
+        """
+        super(Form, self).clear_cached_constraints()
+        self._form_cns = ()
+
     def container_constraints(self):
         """ Computes the current form constraints for the current
         children.
@@ -52,6 +66,12 @@ class Form(Container):
         """
         # FIXME: do something sensible when children are not visible.
         children = self.children
+        layout_strength = self.layout_strength
+        key = (tuple(children), layout_strength)
+        if self._form_cns:
+            cached_key, cns = self._form_cns
+            if cached_key == key:
+                return list(cns)
         labels = children[::2]
         widgets = children[1::2]
 
@@ -66,7 +86,6 @@ class Form(Container):
         else:
             odd_child = None
 
-        layout_strength = self.layout_strength
         constraints = []
 
         # Align the left side of each widget with the midline constraint
@@ -87,5 +106,6 @@ class Form(Container):
             # FIXME: baselines would be much better.
             constraints.append(align_v_center(label, widget) | layout_strength)
 
-        return constraints
+        self._form_cns = (key, constraints)
+        return list(constraints)
 
@@ -11,6 +11,57 @@ from .layout_helpers import DeferredConstraints
 import casuarius
 
 
+def _expression_key(expr):
+    """ Computes a hashable key for a linear expression from the
+    identities of its variables, their coefficients and its constant.
+
+    """
+    terms = sorted((id(term.var), term.coeff) for term in expr.terms)
+    return (tuple(terms), expr.constant)
+
+
+def constraint_key(cn):
+    """ Computes a hashable key for a linear constraint. Two constraints
+    with equal keys have the same effect on a solver, even when they are
+    distinct objects, so a constraint which is recomputed may be diffed
+    against the one already added to a solver.
+
+    """
+    strength = cn.strength
+    return (cn.op, _expression_key(cn.lhs), _expression_key(cn.rhs),
+            strength.is_required, strength.symbolic_weight.weights,
+            cn.weight)
+
+
+def diff_constraints(old_cns, new_cns):
+    """ Diffs a list of constraints which have been added to a solver
+    against a list of recomputed constraints.
+
+    Returns
+    -------
+    result : (kept, removed, added)
+        The constraints which should be in the solver, in which the old
+        constraints are reused for those which are unchanged, along with
+        the old constraints to remove from the solver and the new ones
+        to add to it.
+
+    """
+    unmatched = defaultdict(list)
+    for cn in old_cns:
+        unmatched[constraint_key(cn)].append(cn)
+    kept = []
+    added = []
+    for cn in new_cns:
+        olds = unmatched.get(constraint_key(cn))
+        if olds:
+            kept.append(olds.pop())
+        else:
+            kept.append(cn)
+            added.append(cn)
+    removed = [cn for olds in unmatched.itervalues() for cn in olds]
+    return kept, removed, added
+
+
 class ConstraintsLayout(AbstractLayoutManager):
 
     def __init__(self, component):
@@ -22,7 +73,8 @@ class ConstraintsLayout(AbstractLayoutManager):
         # The constraints for the component which should never need to change
         self.component_cns = None
 
-        # The user constraints which may change
+        # The user constraints which may change, for the component and
+        # each of its descendants
         self.user_cns = None
 
         # The hard constraints for the children which should never change
@@ -32,6 +84,23 @@ class ConstraintsLayout(AbstractLayoutManager):
         # a childs size_hint is updated
         self.child_size_cns = None
 
+        # The geometry last applied to each descendant by a layout pass,
+        # relative to its parent.
+        self.geometries = {}
+
+        # The number of geometries applied to the descendants by the
+        # layout passes, and the number which were skipped since they
+        # were unchanged.
+        self.geometry_updates = 0
+        self.geometry_skips = 0
+
+        # The number of solves for the minimum size of the component.
+        self.min_size_solves = 0
+
+        # The number of constraint updates which rebuilt the solver, 
+        # since most of its constraints had changed.
+        self.rebuilds = 0
+
         # A flag to prevent recursion into various method. 
         # XXX this may no longer be needed
         self._recursion_guard = False
@@ -51,27 +120,73 @@ class ConstraintsLayout(AbstractLayoutManager):
         if self._recursion_guard or self._initialized:
             return
         self._recursion_guard = True
+        try:
+            # Rather than do intialization in the __init__ method, which
+            # in Python has the context of only happening once, we use
+            # this method since the manager will be re-initialized whenever
+            # any of the constraints of the components children change.
+            self.solver = casuarius.Solver(autosolve=False)
+            self.component_cns = []
+            self.user_cns = defaultdict(list)
+            self.child_cns = defaultdict(list)
+            self.child_size_cns = defaultdict(list)
+            self.geometries = {}
+
+            component = self.component()
+            if component is None:
+                msg = 'Component weakly referenced by %r disappeared' % self
+                raise RuntimeError(msg)
+
+            solver = self.solver
+
+            # The list of all descendants participating in constraints-based
+            # layout.
+            descendants = list(self.traverse_descendants(component))
+            self.prepare_descendants(descendants)
+
+            # Component default constraints
+            cns = self.compute_component_cns(component)
+            self.component_cns = cns
+            self.add_constraints(cns)
 
-        # Rather than do intialization in the __init__ method, which
-        # in Python has the context of only happening once, we use
-        # this method since the manager will be re-initialized whenever
-        # any of the constraints of the components children change.
-        self.solver = casuarius.Solver(autosolve=False)
-        self.component_cns = []
-        self.user_cns = []
-        self.child_cns = defaultdict(list)
-        self.child_size_cns = defaultdict(list)
-
-        component = self.component()
-        if component is None:
-            msg = 'Component weakly referenced by %r disappeared' % self
-            raise RuntimeError(msg)
-
-        solver = self.solver
-
-        # The list of all descendants participating in constraints-based layout.
-        descendants = list(self.traverse_descendants(component))
+            # User constraints
+            cns_dict = self.user_cns
+            for cmpnt in [component] + descendants:
+                cns = self.compute_user_cns(cmpnt)
+                if cns:
+                    cns_dict[cmpnt].extend(cns)
+                    self.add_constraints(cns)
+
+            # Child default constraints
+            cns_dict = self.child_cns
+            for child in descendants:
+                cns = self.compute_child_cns(child)
+                cns_dict[child].extend(cns)
+                self.add_constraints(cns)
+
+            # Child size constraints
+            cns_dict = self.child_size_cns
+            for child in descendants:
+                cns = self.compute_child_size_cns(child)
+                cns_dict[child].extend(cns)
+                self.add_constraints(cns)
+
+            solver.autosolve = True
+
+            # Set the minimum size of the component based on the current
+            # set of constraints
+            min_size = self.calc_min_size()
+            component.set_min_size(*min_size)
+
+            self._initialized = True
+        finally:
+            self._recursion_guard = False
+
+    def prepare_descendants(self, descendants):
+        """ Prepares the layout of the descendants participating in the
+        layout of this manager.
 
+        """
         # Disable the layout engines on all Containers descending from this one.
         # FIXME: This destructively sets the .layout attribute to None. It
         # works, but we might be able to do it more cleanly.
@@ -83,42 +198,6 @@ class ConstraintsLayout(AbstractLayoutManager):
                     # Initialize their layout.
                     desc.initialize_layout()
 
-        # Component default constraints
-        cns = self.compute_component_cns(component)
-        self.component_cns = cns
-        self.add_constraints(cns)
-
-        # User constraints
-        cns = self.compute_user_cns(component)
-        for child in descendants:
-            cns.extend(self.compute_user_cns(child))
-        self.user_cns = cns
-        self.add_constraints(cns)
-
-        # Child default constraints
-        cns_dict = self.child_cns
-        for child in descendants:
-            cns = self.compute_child_cns(child)
-            cns_dict[child].extend(cns)
-            self.add_constraints(cns)
-        
-        # Child size constraints
-        cns_dict = self.child_size_cns
-        for child in descendants:
-            cns = self.compute_child_size_cns(child)
-            cns_dict[child].extend(cns)
-            self.add_constraints(cns)
-
-        solver.autosolve = True
-
-        # Set the minimum size of the component based on the current
-        # set of constraints
-        min_size = self.calc_min_size()
-        component.set_min_size(*min_size)
-
-        self._recursion_guard = False
-        self._initialized = True
-
     def add_constraints(self, constraints):
         """ Add an iterable of constraints to the solver.
 
@@ -127,6 +206,14 @@ class ConstraintsLayout(AbstractLayoutManager):
         for cn in constraints:
             solver.add_constraint(cn)
 
+    def remove_constraints(self, constraints):
+        """ Remove an iterable of constraints from the solver.
+
+        """
+        solver = self.solver
+        for cn in constraints:
+            solver.remove_constraint(cn)
+
     #--------------------------------------------------------------------------
     # Solver Iteration
     #--------------------------------------------------------------------------
@@ -139,26 +226,59 @@ class ConstraintsLayout(AbstractLayoutManager):
         if self._recursion_guard or not self._initialized:
             return
         self._recursion_guard = True
+        try:
+            component = self.component()
+            if component is None:
+                msg = 'Component weakly referenced by %r disappeared' % self
+                raise RuntimeError(msg)
+
+            solver = self.solver
+
+            # Grab the info required for the suggestions to the solver
+            width, height = component.size()
+            width_var = component.width
+            height_var = component.height
+
+            suggestions = [(width_var, width), (height_var, height)]
+            with solver.suggest_values(suggestions, casuarius.medium):
+                # Update the geometry of the children with their new
+                # solved values.
+                self.apply_geometry(component)
+        finally:
+            self._recursion_guard = False
+
+    def apply_geometry(self, component):
+        """ Applies the solved geometry to the descendants of the
+        component in a single top down pass.
+
+        The position of each descendant relative to the component is
+        recorded as it is visited, so the offset of a descendant is the
+        position of its parent and the ancestors need not be queried.
+        The geometry is only pushed to the toolkit for the descendants
+        whose integer geometry has changed since the last pass.
 
-        component = self.component()
-        if component is None:
-            msg = 'Component weakly referenced by %r disappeared' % self
-            raise RuntimeError(msg)
-
-        solver = self.solver
-
-        # Grab the info required for the suggestions to the solver
-        width, height = component.size()
-        width_var = component.width
-        height_var = component.height
-
-        with solver.suggest_values([(width_var, width), (height_var, height)], casuarius.medium):
-            # Update the geometry of the children with their new
-            # solved values.
-            for child in self.traverse_descendants(component):
-                child.set_solved_geometry(component)
-
-        self._recursion_guard = False
+        """
+        old_geometries = self.geometries
+        geometries = {}
+        positions = {component: (0, 0)}
+        updates = skips = 0
+        for child in self.traverse_descendants(component):
+            x, y, width, height = (
+                int(round(var.value)) for var in
+                (child.left, child.top, child.width, child.height)
+            )
+            positions[child] = (x, y)
+            dx, dy = positions[child.parent]
+            geometry = (x - dx, y - dy, width, height)
+            geometries[child] = geometry
+            if old_geometries.get(child) == geometry:
+                skips += 1
+            else:
+                child.set_solved_geometry(component, (dx, dy))
+                updates += 1
+        self.geometries = geometries
+        self.geometry_updates += updates
+        self.geometry_skips += skips
 
     def calc_min_size(self):
         """ Run an iteration of the solver with the suggested size of the
@@ -167,6 +287,7 @@ class ConstraintsLayout(AbstractLayoutManager):
         system. The return value is (min_width, min_height).
 
         """
+        self.min_size_solves += 1
         component = self.component()
         if component is None:
             msg = 'Component weakly referenced by %r disappeared' % self
@@ -277,24 +398,146 @@ class ConstraintsLayout(AbstractLayoutManager):
     #--------------------------------------------------------------------------
     # Constraint Update 
     #--------------------------------------------------------------------------
-    def update_constraints(self):
-        """ Re-run the initialization routine to build a new solver with
-        updated constraints. This should typically only be called when 
-        the user constraints are updated.
+    def update_constraints(self, size_hint_children=()):
+        """ Update the solver with the constraints of the current set of
+        visible descendants and their current user constraints. This 
+        should typically only be called when the user constraints are 
+        updated, or when the visibility of a descendant changes.
+
+        Rather than building a new solver, the recomputed constraints 
+        are diffed per component against those which are already in 
+        the solver, and only the constraints which have changed are 
+        removed from and added to the solver.
+
+        Parameters
+        ----------
+        size_hint_children : iterable, optional
+            The children whose size hints have changed since the last
+            update. Their size constraints are diffed along with the
+            other changes, so that the minimum size is solved once.
 
         """
-        # FIXME: we can probably do better by storing the old constraints,
-        # getting the new constraints, finding the differences, and telling the
-        # solver to remove/add constraints.
-        # Or maybe not. Timings will tell.
-        self._initialized = False
-        self.initialize()
+        if not self._initialized:
+            self.initialize()
+            return
+        if self._recursion_guard:
+            return
+        self._recursion_guard = True
+        rebuild = False
+        try:
+            component = self.component()
+            if component is None:
+                msg = 'Component weakly referenced by %r disappeared' % self
+                raise RuntimeError(msg)
+
+            descendants = list(self.traverse_descendants(component))
+            self.prepare_descendants(descendants)
+            count = self.constraint_count()
+
+            removed = []
+            added = []
+
+            # The user constraints are recomputed for every component, since
+            # any of them may have changed.
+            old_dict = self.user_cns
+            new_dict = defaultdict(list)
+            for cmpnt in [component] + descendants:
+                old_cns = old_dict.pop(cmpnt, [])
+                new_cns = self.compute_user_cns(cmpnt)
+                kept, rem, add = diff_constraints(old_cns, new_cns)
+                if kept:
+                    new_dict[cmpnt].extend(kept)
+                removed.extend(rem)
+                added.extend(add)
+            for old_cns in old_dict.itervalues():
+                removed.extend(old_cns)
+            self.user_cns = new_dict
+
+            # The child constraints only depend upon the child, so they are
+            # only computed for the children which have become visible, and
+            # removed for those which have become hidden.
+            visible = set(descendants)
+            for cns_dict, compute in ((self.child_cns, self.compute_child_cns),
+                (self.child_size_cns, self.compute_child_size_cns)):
+                for child in cns_dict.keys():
+                    if child not in visible:
+                        removed.extend(cns_dict.pop(child))
+                for child in descendants:
+                    if child not in cns_dict:
+                        cns = compute(child)
+                        cns_dict[child].extend(cns)
+                        added.extend(cns)
+            self.diff_size_cns(size_hint_children, removed, added)
+
+            # Removing constraints one at a time costs more than adding
+            # them to a new solver, so when most of them have changed, 
+            # such as for layout helpers which are recomputed on every
+            # call, the solver is rebuilt instead.
+            if 2 * len(removed) > count:
+                rebuild = True
+            else:
+                self.replace_constraints(component, removed, added)
+        finally:
+            self._recursion_guard = False
+        if rebuild:
+            self.rebuilds += 1
+            self._initialized = False
+            self.initialize()
+
+    def constraint_count(self):
+        """ Returns the number of constraints in the solver.
+
+        """
+        count = len(self.component_cns)
+        for cns_dict in (self.user_cns, self.child_cns,
+                         self.child_size_cns):
+            count += sum(len(cns) for cns in cns_dict.itervalues())
+        return count
+
+    def diff_size_cns(self, children, removed, added):
+        """ Recomputes the size constraints of the given children and
+        diffs them against those in the solver. The stale and the new
+        constraints are appended to the removed and added lists. The
+        children which are not part of the layout are skipped, since
+        their constraints are computed when they become visible.
 
-    def update_size_cns(self, child):
-        """ Update the constraints for the size hint of the given child.
-        This will be more efficient that calling update_constraints
-        and should be used when size_hint of child changes, or the
-        it 'hug' or 'resist_clip' attributes change.
+        """
+        cns_dict = self.child_size_cns
+        for child in children:
+            old_cns = cns_dict.get(child)
+            if old_cns is None:
+                continue
+            new_cns = self.compute_child_size_cns(child)
+            kept, rem, add = diff_constraints(old_cns, new_cns)
+            cns_dict[child] = kept
+            removed.extend(rem)
+            added.extend(add)
+
+    def replace_constraints(self, component, removed, added):
+        """ Removes and adds constraints in one batch, then recomputes
+        the minimum size of the component if the solver changed.
+
+        """
+        if removed or added:
+            # Remove the stale constraints first, since they may conflict
+            # with those which replace them.
+            solver = self.solver
+            solver.autosolve = False
+            self.remove_constraints(removed)
+            self.add_constraints(added)
+            solver.autosolve = True
+
+            # Recompute the minimum size since the constraint changes
+            # may have an effect on it.
+            min_size = self.calc_min_size()
+            component.set_min_size(*min_size)
+
+    def update_size_cns(self, *children):
+        """ Update the constraints for the size hints of the given 
+        children. This will be more efficient that calling 
+        update_constraints and should be used when the size_hint of a
+        child changes, or its 'hug' or 'resist_clip' attributes change.
+        The minimum size is solved once for all of the children.
 
         """
         if not self._initialized:
@@ -304,22 +547,8 @@ class ConstraintsLayout(AbstractLayoutManager):
             msg = 'Component weakly referenced by %r disappeared' % self
             raise RuntimeError(msg)
 
-        solver = self.solver
-        
-        # Remove the existing constraints for the child's size hint.
-        old_cns = self.child_size_cns[child]
-        for old_cn in old_cns:
-            solver.remove_constraint(old_cn)
-        del self.child_size_cns[child]
-
-        # Add the new constraints for the child's size hint
-        new_cns = self.compute_child_size_cns(child)
-        self.child_size_cns[child].extend(new_cns)
-        for new_cn in new_cns:
-            solver.add_constraint(new_cn)
-
-        # Recompute the minimum size since the constraint changes
-        # may have an effect on it.
-        min_size = self.calc_min_size()
-        component.set_min_size(*min_size)
+        removed = []
+        added = []
+        self.diff_size_cns(children, removed, added)
+        self.replace_constraints(component, removed, added)
 
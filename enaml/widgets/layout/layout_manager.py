@@ -14,7 +14,7 @@ class AbstractLayoutManager(object):
         raise NotImplementedError
 
     @abstractmethod
-    def update_constraints(self):
+    def update_constraints(self, size_hint_children=()):
         raise NotImplementedError
     
     @abstractmethod
@@ -30,7 +30,7 @@ class NullLayoutManager(AbstractLayoutManager):
     def initialize(self):
         pass
 
-    def update_constraints(self):
+    def update_constraints(self, size_hint_children=()):
         pass
 
     def layout(self):
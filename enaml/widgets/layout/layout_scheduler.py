@@ -0,0 +1,177 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A scheduler which coalesces the relayout requests of the containers
+of a window.
+
+Changes to the constraints, the visibility or the size hints of the
+children of a container request an update of the constraints and a
+relayout of the container. The size hint changes are only recorded by
+the container, and applied by the constraints pass. Rather than 
+posting a callback for each request, the requests are collected by the
+scheduler of the window and run on the next turn of the event loop as
+a single pass which updates the constraints of the dirty containers,
+followed by a single top down pass which lays them out.
+
+"""
+
+
+def _depth(container):
+    """ Returns the number of ancestors of a container.
+
+    """
+    depth = 0
+    parent = container.parent
+    while parent is not None:
+        depth += 1
+        parent = parent.parent
+    return depth
+
+
+class LayoutScheduler(object):
+    """ An object which collects the containers which need to update
+    their constraints or their layout, and updates them in a batch.
+
+    """
+    def __init__(self):
+        #: The set of containers which need to update their constraints.
+        self.constraints_dirty = set()
+
+        #: The set of containers which need to be laid out.
+        self.layout_dirty = set()
+
+        #: Whether a call to flush has been posted to the event loop.
+        self.posted = False
+
+        #: Whether a flush is in progress.
+        self.flushing = False
+
+        #: The function last used to post a flush to the event loop.
+        self.invoke_later = None
+
+        #: The number of requests made of the scheduler.
+        self.requests = 0
+
+        #: The number of requests which were merged with a pending one
+        #: for the same container.
+        self.coalesced = 0
+
+        #: The number of flushes which have been run.
+        self.flushes = 0
+
+        #: The number of constraint updates run by the flushes.
+        self.constraint_updates = 0
+
+        #: The number of layouts run by the flushes.
+        self.layouts = 0
+
+    def schedule_constraints(self, container, invoke_later):
+        """ Marks a container as needing to update its constraints. Its
+        layout is updated as part of the same flush.
+
+        Parameters
+        ----------
+        container : Container
+            The container which manages the layout of the changed
+            components.
+
+        invoke_later : callable
+            The toolkit function used to post the flush to the event
+            loop if one is not already pending.
+
+        """
+        self._schedule(self.constraints_dirty, container, invoke_later)
+
+    def schedule_layout(self, container, invoke_later):
+        """ Marks a container as needing to be laid out. See the
+        schedule_constraints method for the parameters.
+
+        """
+        self._schedule(self.layout_dirty, container, invoke_later)
+
+    def _schedule(self, dirty, container, invoke_later):
+        """ Adds a container to a dirty set and posts a flush to the
+        event loop if needed.
+
+        """
+        self.requests += 1
+        if container in dirty:
+            self.coalesced += 1
+            return
+        dirty.add(container)
+        self.invoke_later = invoke_later
+        if not (self.posted or self.flushing):
+            self.posted = True
+            invoke_later(self.flush)
+
+    def discard(self, containers):
+        """ Removes containers from the dirty sets, so that a pending
+        flush does not update them. This is called for the containers
+        of a tree which is being destroyed.
+
+        Parameters
+        ----------
+        containers : iterable
+            The containers to remove.
+
+        """
+        for container in containers:
+            self.constraints_dirty.discard(container)
+            self.layout_dirty.discard(container)
+
+    def counters(self):
+        """ Returns a dictionary of the counters of the scheduler.
+
+        """
+        return dict(
+            requests=self.requests,
+            coalesced=self.coalesced,
+            flushes=self.flushes,
+            constraint_updates=self.constraint_updates,
+            layouts=self.layouts,
+        )
+
+    def flush(self):
+        """ Updates the constraints of the dirty containers, from the
+        top of the window down, then lays out the dirty containers in
+        the same order.
+
+        This is called from the event loop, and may be called directly
+        to bring the layout up-to-date without running the event loop,
+        which is mostly useful for testing.
+
+        """
+        self.posted = False
+        if self.flushing:
+            return
+        self.flushing = True
+        self.flushes += 1
+        try:
+            # Updating the constraints of a container requests its
+            # layout, and may request the update of an ancestor.
+            constraints_dirty = self.constraints_dirty
+            while constraints_dirty:
+                containers = sorted(constraints_dirty, key=_depth)
+                constraints_dirty.clear()
+                for container in containers:
+                    if (container._needs_update_constraints or
+                        container._size_hint_dirty):
+                        self.constraint_updates += 1
+                        container.update_constraints()
+
+            # A container may already have been laid out by the layout
+            # of an ancestor which resized it.
+            containers = sorted(self.layout_dirty, key=_depth)
+            self.layout_dirty.clear()
+            for container in containers:
+                if container._needs_layout:
+                    self.layouts += 1
+                    container.do_layout()
+        finally:
+            self.flushing = False
+            # Requests made during the layout pass, or left over by an
+            # exception, are handled on the next turn of the event loop.
+            if self.constraints_dirty or self.layout_dirty:
+                self.posted = True
+                self.invoke_later(self.flush)
@@ -79,6 +79,16 @@ class MuntjacBaseComponent(AbstractTkBaseComponent):
         """
         pass
 
+    def destroy(self):
+        """ Destroy the toolkit object.
+
+        This method is called when the shell object is destroyed, after
+        the implementations of its children have been destroyed. 
+        Subclasses which create a toolkit object should release it.
+
+        """
+        pass
+
     def shell_enabled_changed(self, enabled):
         """ The change handler for the 'enabled' attribute on the shell
         object. Should be implemented by subclasses where appropriate.
@@ -55,6 +55,18 @@ class MuntjacComponent(MuntjacBaseComponent, AbstractTkComponent):
         self.set_enabled(shell.enabled)
         self.set_visible(shell.visible)
 
+    def destroy(self):
+        """ Removes the Muntjac widget from its parent.
+
+        """
+        super(MuntjacComponent, self).destroy()
+        widget = self.widget
+        if widget is not None:
+            parent = widget.getParent()
+            if parent is not None:
+                parent.removeComponent(widget)
+            self.widget = None
+
     #--------------------------------------------------------------------------
     # Abstract Implementation
     #--------------------------------------------------------------------------
@@ -0,0 +1,65 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..abstract_item_view import AbstractTkItemView
+
+
+class NullAbstractItemView(NullControl, AbstractTkItemView):
+    """ An abstract base class for implementing null item views.
+
+    The models are kept on the widget, and nothing is drawn from them.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initialize the widget with the attributes of this instance.
+
+        """
+        super(NullAbstractItemView, self).initialize()
+        shell = self.shell_obj
+        self.set_item_model(shell.item_model)
+        self.set_selection_model(shell.selection_model)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the fixed size hint of a scrolled item view.
+
+        """
+        return (256, 192)
+
+    def shell_item_model_changed(self, item_model):
+        """ The change handler for the 'item_model' attribute on the 
+        shell object.
+
+        """
+        self.set_item_model(item_model)
+    
+    def shell_selection_model_changed(self, selection_model):
+        """ The change handler for the 'selection_model' attribute on
+        the shell object.
+
+        """
+        self.set_selection_model(selection_model)
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_item_model(self, item_model):
+        """ Sets the model to use for the view.
+
+        """
+        self.widget.item_model = item_model
+    
+    def set_selection_model(self, selection_model):
+        """ Sets the selection model to use for the view.
+
+        """
+        self.widget.selection_model = selection_model
+
@@ -0,0 +1,70 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..bounded_date import AbstractTkBoundedDate
+
+
+class NullBoundedDate(NullControl, AbstractTkBoundedDate):
+    """ A base class for use with widgets implementing behavior
+    for subclasses of BoundedDate.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes of the control.
+
+        """
+        super(NullBoundedDate, self).initialize()
+        shell = self.shell_obj
+        self.set_min_date(shell.min_date)
+        self.set_max_date(shell.max_date)
+        self.set_date(shell.date)
+
+    #--------------------------------------------------------------------------
+    # Abstract implementation methods
+    #--------------------------------------------------------------------------
+    def shell_date_changed(self, date):
+        """ The change handler for the 'date' attribute.
+
+        """
+        self.set_date(date)
+
+    def shell_min_date_changed(self, min_date):
+        """ The change handler for the 'min_date' attribute.
+
+        """
+        self.set_min_date(min_date)
+
+    def shell_max_date_changed(self, max_date):
+        """ The change handler for the 'max_date' attribute.
+
+        """
+        self.set_max_date(max_date)
+
+    #--------------------------------------------------------------------------
+    # Widget modification methods
+    #--------------------------------------------------------------------------
+    def set_date(self, date):
+        """ Sets the date on the widget. The shell object has already
+        clipped it to the bounds.
+
+        """
+        self.widget.date = date
+
+    def set_min_date(self, min_date):
+        """ Sets the minimum date on the widget.
+
+        """
+        self.widget.min_date = min_date
+
+    def set_max_date(self, max_date):
+        """ Sets the maximum date on the widget.
+
+        """
+        self.widget.max_date = max_date
+
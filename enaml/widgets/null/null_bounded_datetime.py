@@ -0,0 +1,70 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..bounded_datetime import AbstractTkBoundedDatetime
+
+
+class NullBoundedDatetime(NullControl, AbstractTkBoundedDatetime):
+    """ A base class for use with widgets implementing behavior
+    for subclasses of BoundedDatetime.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes of the control.
+
+        """
+        super(NullBoundedDatetime, self).initialize()
+        shell = self.shell_obj
+        self.set_min_datetime(shell.min_datetime)
+        self.set_max_datetime(shell.max_datetime)
+        self.set_datetime(shell.datetime)
+
+    #--------------------------------------------------------------------------
+    # Abstract implementation methods
+    #--------------------------------------------------------------------------
+    def shell_datetime_changed(self, datetime):
+        """ The change handler for the 'datetime' attribute.
+
+        """
+        self.set_datetime(datetime)
+
+    def shell_min_datetime_changed(self, min_datetime):
+        """ The change handler for the 'min_datetime' attribute.
+
+        """
+        self.set_min_datetime(min_datetime)
+
+    def shell_max_datetime_changed(self, max_datetime):
+        """ The change handler for the 'max_datetime' attribute.
+
+        """
+        self.set_max_datetime(max_datetime)
+
+    #--------------------------------------------------------------------------
+    # Widget modification methods
+    #--------------------------------------------------------------------------
+    def set_datetime(self, datetime):
+        """ Sets the datetime on the widget. The shell object has already
+        clipped it to the bounds.
+
+        """
+        self.widget.datetime = datetime
+
+    def set_min_datetime(self, min_datetime):
+        """ Sets the minimum datetime on the widget.
+
+        """
+        self.widget.min_datetime = min_datetime
+
+    def set_max_datetime(self, max_datetime):
+        """ Sets the maximum datetime on the widget.
+
+        """
+        self.widget.max_datetime = max_datetime
+
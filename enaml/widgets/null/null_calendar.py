@@ -0,0 +1,52 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_bounded_date import NullBoundedDate
+
+from ..calendar import AbstractTkCalendar
+
+
+class NullCalendar(NullBoundedDate, AbstractTkCalendar):
+    """ A null implementation of Calendar.
+
+    A click by the user is simulated by setting the 'date' attribute
+    of the widget and emitting its 'selection_changed' signal, and a
+    double click by emitting 'activated' with the date.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def bind(self):
+        """ Binds the event handlers for the calendar widget.
+
+        """
+        super(NullCalendar, self).bind()
+        widget = self.widget
+        widget.connect('activated', self.on_date_activated)
+        widget.connect('selection_changed', self.on_date_selected)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the fixed size hint of a month view.
+
+        """
+        return (280, 180)
+
+    def on_date_activated(self, date):
+        """ The event handler for the calendar's activation event.
+
+        """
+        shell = self.shell_obj
+        shell.date = date
+        shell.activated = date
+
+    def on_date_selected(self):
+        """ The event handler for the calendar's selection event.
+
+        """
+        self.shell_obj.selected = self.widget.date
+
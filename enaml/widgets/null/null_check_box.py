@@ -0,0 +1,15 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_toggle_control import NullToggleControl
+
+from ..check_box import AbstractTkCheckBox
+
+
+class NullCheckBox(NullToggleControl, AbstractTkCheckBox):
+    """ A null implementation of CheckBox.
+
+    """
+    pass
+
@@ -0,0 +1,91 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+from .null_widget import LINE_HEIGHT, text_size
+
+from ..combo_box import AbstractTkComboBox
+
+
+#: The width in pixels of the drop down arrow of a combo box.
+ARROW_WIDTH = 24
+
+
+class NullComboBox(NullControl, AbstractTkComboBox):
+    """ A null implementation of ComboBox.
+
+    A selection is simulated by setting the 'index' attribute of the
+    widget and emitting its 'index_changed' signal.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Intializes the widget with the attributes of this instance.
+
+        """
+        super(NullComboBox, self).initialize()
+        shell = self.shell_obj
+        self.set_items(shell.labels)
+        self.set_selection(shell.index)
+
+    def bind(self):
+        """ Connects the event handlers for the combo box.
+
+        """
+        super(NullComboBox, self).bind()
+        self.widget.connect('index_changed', self.on_selected)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size of the longest label plus the arrow.
+
+        """
+        width = max([text_size(item)[0] for item in self.widget.items] or [0])
+        return (width + ARROW_WIDTH, LINE_HEIGHT + 6)
+
+    def shell_index_changed(self, index):
+        """ The change handler for the 'index' attribute on the shell
+        object.
+
+        """
+        self.set_selection(index)
+
+    def shell_labels_changed(self, labels):
+        """ The change handler for the 'labels' attribute on the shell
+        object.
+
+        """
+        self.set_items(labels)
+
+    def on_selected(self):
+        """ The event handler for a combo box selection event.
+
+        """
+        shell = self.shell_obj
+        curr_index = self.widget.index
+        shell.index = curr_index
+
+        # Only fire the selected event if we have a valid selection
+        if curr_index != -1:
+            shell.selected = shell.value
+
+    def set_items(self, str_items):
+        """ Sets the items in the combo box. The shell object has
+        already computed the index for the new items.
+
+        """
+        widget = self.widget
+        widget.items = list(str_items)
+        widget.index = self.shell_obj.index
+
+    def set_selection(self, index):
+        """ Sets the selected index of the combo box.
+
+        """
+        self.widget.index = index
+
@@ -0,0 +1,220 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_base_component import NullBaseComponent
+from .null_widget import NullWidget
+
+from ..component import AbstractTkComponent
+
+
+class NullComponent(NullBaseComponent, AbstractTkComponent):
+    """ A null implementation of Component.
+
+    A NullComponent is not meant to be used directly. It provides some
+    common functionality that is useful to all widgets and should
+    serve as the base class for all other classes.
+
+    .. note:: This is not a HasTraits class.
+
+    """
+    #: The NullWidget created by the component
+    widget = None
+
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def create(self, parent):
+        """ Creates the underlying NullWidget.
+
+        """
+        self.widget = NullWidget(parent)
+
+    def initialize(self):
+        """ Initializes the attributes of the NullWidget.
+
+        """
+        super(NullComponent, self).initialize()
+        shell = self.shell_obj
+        self.set_bg_color(shell.bg_color)
+        self.set_fg_color(shell.fg_color)
+        self.set_font(shell.font)
+        self.set_enabled(shell.enabled)
+        if not shell.visible:
+            self.set_visible(shell.visible)
+
+    def destroy(self):
+        """ Detaches the NullWidget from its parent.
+
+        """
+        super(NullComponent, self).destroy()
+        widget = self.widget
+        if widget is not None:
+            widget.destroy()
+            self.widget = None
+
+    #--------------------------------------------------------------------------
+    # Abstract Implementation
+    #--------------------------------------------------------------------------
+    @property
+    def toolkit_widget(self):
+        """ A property that returns the toolkit specific widget for this
+        component.
+
+        """
+        return self.widget
+
+    def size(self):
+        """ Returns the size of the widget as a (width, height) tuple of
+        integers.
+
+        """
+        return self.widget.size()
+
+    def size_hint(self):
+        """ Returns a (width, height) tuple of integers which represent
+        the suggested size of the widget for its current state. A plain
+        component has no content, so it has no size hint.
+
+        """
+        return (-1, -1)
+
+    def resize(self, width, height):
+        """ Resizes the widget according the given width and height
+        integers.
+
+        """
+        self.widget.resize(width, height)
+
+    def min_size(self):
+        """ Returns the hard minimum (width, height) of the widget.
+
+        """
+        return self.widget.min_size
+
+    def set_min_size(self, min_width, min_height):
+        """ Set the hard minimum width and height of the widget.
+
+        """
+        self.widget.set_min_size(min_width, min_height)
+
+    def pos(self):
+        """ Returns the position of the widget as an (x, y) tuple of
+        integers relative to the origin of the widget's parent.
+
+        """
+        return self.widget.geometry[:2]
+
+    def move(self, x, y):
+        """ Moves the widget according to the given x and y integers
+        which are relative to the origin of the widget's parent.
+
+        """
+        self.widget.move(x, y)
+
+    def frame_geometry(self):
+        """ Returns an (x, y, width, height) tuple of geometry info for
+        the widget. The null toolkit draws no window decorations, so
+        this is the same as the geometry.
+
+        """
+        return self.widget.geometry
+
+    def geometry(self):
+        """ Returns an (x, y, width, height) tuple of geometry info for
+        the widget.
+
+        """
+        return self.widget.geometry
+
+    def set_geometry(self, x, y, width, height):
+        """ Sets the geometry of the widget to the given x, y, width,
+        and height values.
+
+        """
+        self.widget.set_geometry(x, y, width, height)
+
+    #--------------------------------------------------------------------------
+    # Shell Object Change Handlers
+    #--------------------------------------------------------------------------
+    def shell_enabled_changed(self, enabled):
+        """ The change handler for the 'enabled' attribute on the shell
+        object.
+
+        """
+        self.set_enabled(enabled)
+
+    def shell_visible_changed(self, visible):
+        """ The change handler for the 'visible' attribute on the shell
+        object.
+
+        """
+        self.set_visible(visible)
+
+    def shell_bg_color_changed(self, color):
+        """ The change handler for the 'bg_color' attribute on the shell
+        object.
+
+        """
+        self.set_bg_color(color)
+
+    def shell_fg_color_changed(self, color):
+        """ The change handler for the 'fg_color' attribute on the shell
+        object.
+
+        """
+        self.set_fg_color(color)
+
+    def shell_font_changed(self, font):
+        """ The change handler for the 'font' attribute on the shell
+        object.
+
+        """
+        self.set_font(font)
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_enabled(self, enabled):
+        """ Enable or disable the widget.
+
+        """
+        self.widget.enabled = enabled
+
+    def set_visible(self, visible):
+        """ Show or hide the widget.
+
+        """
+        parent = self.shell_obj.parent
+        if parent is not None:
+            parent.set_needs_update_constraints()
+        self.widget.visible = visible
+
+    def set_bg_color(self, color):
+        """ Set the background color of the widget.
+
+        """
+        self.widget.bg_color = color
+
+    def set_fg_color(self, color):
+        """ Set the foreground color of the widget.
+
+        """
+        self.widget.fg_color = color
+
+    def set_font(self, font):
+        """ Set the font of the widget.
+
+        """
+        self.widget.font = font
+
+    #--------------------------------------------------------------------------
+    # Convenienence methods
+    #--------------------------------------------------------------------------
+    def child_widgets(self):
+        """ Iterates over the shell widget's children and yields the
+        toolkit widgets for those children.
+
+        """
+        for child in self.shell_obj.children:
+            yield child.toolkit_widget
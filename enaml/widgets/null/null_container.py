@@ -0,0 +1,33 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_component import NullComponent
+
+from ..container import AbstractTkContainer
+
+
+class NullContainer(NullComponent, AbstractTkContainer):
+    """ A null implementation of Container.
+
+    NullContainer is usually to be used as a base class for other
+    container widgets. However, it may also be used directly as an
+    undecorated container for widgets for layout purposes.
+
+    """
+    def bind(self):
+        """ Binds the signal handlers for the widget.
+
+        """
+        super(NullContainer, self).bind()
+        self.widget.connect('resized', self.on_resize)
+
+    def on_resize(self):
+        """ Triggers a relayout of the shell object since the widget
+        has been resized.
+
+        """
+        # As with the other toolkits, the layout happens immediately
+        # since the widget has already changed size.
+        self.shell_obj.do_layout()
+
@@ -0,0 +1,12 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_component import NullComponent
+
+from ..control import AbstractTkControl
+
+
+class NullControl(NullComponent, AbstractTkControl):
+    pass
+
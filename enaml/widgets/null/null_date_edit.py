@@ -0,0 +1,88 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_bounded_date import NullBoundedDate
+from .null_widget import LINE_HEIGHT, format_datetime, text_size
+
+from ..date_edit import AbstractTkDateEdit
+
+
+#: The width in pixels of the arrows of the edit.
+ARROW_WIDTH = 16
+
+
+class NullDateEdit(NullBoundedDate, AbstractTkDateEdit):
+    """ A null implementation of DateEdit.
+
+    A change by the user is simulated by setting the 'date' attribute
+    of the widget and emitting its 'date_changed' signal. The 'text'
+    attribute of the widget is the displayed date.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes of the control.
+
+        """
+        super(NullDateEdit, self).initialize()
+        self.set_format(self.shell_obj.date_format)
+
+    def bind(self):
+        """ Connects the signal handlers for the edit widget.
+
+        """
+        super(NullDateEdit, self).bind()
+        self.widget.connect('date_changed', self.on_date_changed)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size of the displayed text plus the arrows.
+
+        """
+        width = text_size(self.widget.text)[0]
+        return (width + ARROW_WIDTH, LINE_HEIGHT + 6)
+
+    def shell_date_format_changed(self, date_format):
+        """ The change handler for the 'date_format' attribute.
+
+        """
+        self.set_format(date_format)
+        self.shell_obj.size_hint_updated = True
+
+    def on_date_changed(self):
+        """ The signal handler for the control's changed event.
+
+        """
+        shell = self.shell_obj
+        new_date = self.widget.date
+        shell.date = new_date
+        shell.date_changed = new_date
+
+    def set_date(self, date):
+        """ Sets the date on the widget and updates the displayed text.
+
+        """
+        super(NullDateEdit, self).set_date(date)
+        self.update_text()
+
+    def set_format(self, date_format):
+        """ Sets the display format on the widget with the provided value.
+
+        """
+        self.widget.format = date_format
+        self.update_text()
+
+    def update_text(self):
+        """ Renders the date of the widget with its display format. The
+        format is not known until the widget is initialized.
+
+        """
+        widget = self.widget
+        display_format = getattr(widget, 'format', '')
+        widget.text = format_datetime(widget.date, display_format)
+
@@ -0,0 +1,88 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_bounded_datetime import NullBoundedDatetime
+from .null_widget import LINE_HEIGHT, format_datetime, text_size
+
+from ..datetime_edit import AbstractTkDatetimeEdit
+
+
+#: The width in pixels of the arrows of the edit.
+ARROW_WIDTH = 16
+
+
+class NullDatetimeEdit(NullBoundedDatetime, AbstractTkDatetimeEdit):
+    """ A null implementation of DatetimeEdit.
+
+    A change by the user is simulated by setting the 'datetime' attribute
+    of the widget and emitting its 'datetime_changed' signal. The 'text'
+    attribute of the widget is the displayed datetime.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes of the control.
+
+        """
+        super(NullDatetimeEdit, self).initialize()
+        self.set_format(self.shell_obj.datetime_format)
+
+    def bind(self):
+        """ Connects the signal handlers for the edit widget.
+
+        """
+        super(NullDatetimeEdit, self).bind()
+        self.widget.connect('datetime_changed', self.on_datetime_changed)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size of the displayed text plus the arrows.
+
+        """
+        width = text_size(self.widget.text)[0]
+        return (width + ARROW_WIDTH, LINE_HEIGHT + 6)
+
+    def shell_datetime_format_changed(self, datetime_format):
+        """ The change handler for the 'datetime_format' attribute.
+
+        """
+        self.set_format(datetime_format)
+        self.shell_obj.size_hint_updated = True
+
+    def on_datetime_changed(self):
+        """ The signal handler for the control's changed event.
+
+        """
+        shell = self.shell_obj
+        new_datetime = self.widget.datetime
+        shell.datetime = new_datetime
+        shell.datetime_changed = new_datetime
+
+    def set_datetime(self, datetime):
+        """ Sets the datetime on the widget and updates the displayed text.
+
+        """
+        super(NullDatetimeEdit, self).set_datetime(datetime)
+        self.update_text()
+
+    def set_format(self, datetime_format):
+        """ Sets the display format on the widget with the provided value.
+
+        """
+        self.widget.format = datetime_format
+        self.update_text()
+
+    def update_text(self):
+        """ Renders the datetime of the widget with its display format. The
+        format is not known until the widget is initialized.
+
+        """
+        widget = self.widget
+        display_format = getattr(widget, 'format', '')
+        widget.text = format_datetime(widget.datetime, display_format)
+
@@ -0,0 +1,54 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_window import NullWindow
+
+from ..dialog import AbstractTkDialog
+
+
+class NullDialog(NullWindow, AbstractTkDialog):
+    """ A null implementation of a Dialog.
+
+    Showing the dialog does not block, since there is no user to close
+    it. It stays active until accept() or reject() is called.
+
+    """
+    #---------------------------------------------------------------------------
+    # Implementation
+    #---------------------------------------------------------------------------
+    def accept(self):
+        """ Accept and close the dialog.
+
+        """
+        self._close('accepted')
+
+    def reject(self):
+        """ Reject and close the dialog.
+
+        """
+        self._close('rejected')
+
+    def _close(self, result):
+        """ Hides the dialog and updates the result on the shell object.
+
+        """
+        self.widget.visible = False
+        self.shell_obj.trait_set(_result=result, _active=False, closed=result)
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_visible(self, visible):
+        """ Overridden from the parent class to properly launch and close 
+        the dialog.
+
+        """
+        if not self._initializing:
+            shell = self.shell_obj
+            if visible:
+                self.widget.visible = True
+                shell.trait_set(_active=True, opened=True)
+            elif shell.active:
+                self.reject()
+
@@ -0,0 +1,36 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..enable_canvas import AbstractTkEnableCanvas
+
+
+class NullEnableCanvas(NullControl, AbstractTkEnableCanvas):
+    """ A null implementation of EnableCanvas.
+
+    There is no enable backend for the null toolkit, so the component
+    is kept on the widget but never drawn.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes of the control.
+
+        """
+        super(NullEnableCanvas, self).initialize()
+        self.widget.component = self.shell_obj.component
+
+    def shell_component_changed(self, component):
+        """ The change handler for the 'component' attribute on the 
+        shell object.
+
+        """
+        raise NotImplementedError('changing components not yet supported')
+
+    def size_hint(self):
+        return self.shell_obj.component.get_preferred_size()
+
@@ -0,0 +1,543 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+from .null_widget import NullWidget, CHAR_WIDTH, LINE_HEIGHT
+from .utils import get_app_null
+
+from ..field import AbstractTkField
+
+from ...guard import guard
+
+
+#: The maximum length of the text of a line edit.
+MAX_LENGTH = 32767
+
+
+class NullLineEdit(NullWidget):
+    """ An in-memory single line text editor.
+
+    The selection runs from the anchor to the cursor. The edits made
+    through the editing methods emit the 'text_edited' signal as well
+    as the 'text_changed' signal, as if they were made by the user,
+    while set_text only emits 'text_changed'.
+
+    """
+    def __init__(self, parent=None):
+        super(NullLineEdit, self).__init__(parent)
+        self.text = u''
+        self.cursor = 0
+        self.anchor = 0
+        self.max_length = MAX_LENGTH
+        self.read_only = False
+        self.placeholder_text = u''
+        self.password_mode = 'normal'
+        self.undo_stack = []
+        self.redo_stack = []
+
+    def selection(self):
+        """ Returns the (start, end) of the selection.
+
+        """
+        return tuple(sorted((self.anchor, self.cursor)))
+
+    def selected_text(self):
+        """ Returns the selected text.
+
+        """
+        start, end = self.selection()
+        return self.text[start:end]
+
+    def _update(self, text, cursor, anchor=None, edited=False):
+        """ Updates the state of the editor and emits the signals for
+        the changes.
+
+        """
+        if anchor is None:
+            anchor = cursor
+        old_text = self.text
+        old_cursor = self.cursor
+        old_selection = self.selected_text()
+        self.text = text
+        self.cursor = cursor
+        self.anchor = anchor
+        if text != old_text:
+            if edited:
+                self.emit('text_edited')
+            self.emit('text_changed')
+        if cursor != old_cursor:
+            self.emit('cursor_position_changed')
+        if self.selected_text() != old_selection:
+            self.emit('selection_changed')
+
+    def _edit(self, text, cursor):
+        """ Makes an undoable edit of the text.
+
+        """
+        if self.read_only or text == self.text:
+            return
+        text = text[:self.max_length]
+        cursor = min(cursor, len(text))
+        self.undo_stack.append((self.text, self.cursor))
+        del self.redo_stack[:]
+        self._update(text, cursor, edited=True)
+
+    def set_text(self, text):
+        """ Replaces the text, moving the cursor to its end. This clears
+        the undo history.
+
+        """
+        text = text[:self.max_length]
+        del self.undo_stack[:]
+        del self.redo_stack[:]
+        self._update(text, len(text))
+
+    def set_max_length(self, max_length):
+        """ Sets the maximum length, truncating the text if needed.
+
+        """
+        self.max_length = max_length
+        if len(self.text) > max_length:
+            self.set_text(self.text)
+
+    def set_cursor_position(self, position):
+        """ Moves the cursor, clearing the selection.
+
+        """
+        position = max(0, min(position, len(self.text)))
+        self._update(self.text, position)
+
+    def set_selection(self, start, length):
+        """ Selects the given number of characters from start. The
+        cursor is left at the end of the selection.
+
+        """
+        size = len(self.text)
+        start = max(0, min(start, size))
+        end = max(0, min(start + length, size))
+        self._update(self.text, end, start)
+
+    def select_all(self):
+        """ Selects all of the text.
+
+        """
+        self._update(self.text, len(self.text), 0)
+
+    def deselect(self):
+        """ Clears the selection, leaving the cursor in place.
+
+        """
+        self._update(self.text, self.cursor)
+
+    def home(self, mark=False):
+        """ Moves the cursor to the start of the text, extending the
+        selection if mark is True.
+
+        """
+        self._update(self.text, 0, self.anchor if mark else None)
+
+    def end(self, mark=False):
+        """ Moves the cursor to the end of the text, extending the
+        selection if mark is True.
+
+        """
+        self._update(self.text, len(self.text), self.anchor if mark else None)
+
+    def insert(self, text):
+        """ Inserts text at the cursor, replacing the selection.
+
+        """
+        start, end = self.selection()
+        room = self.max_length - (len(self.text) - (end - start))
+        text = text[:max(room, 0)]
+        new_text = self.text[:start] + text + self.text[end:]
+        self._edit(new_text, start + len(text))
+
+    def backspace(self):
+        """ Deletes the selection, or the character before the cursor.
+
+        """
+        start, end = self.selection()
+        if start == end:
+            start = max(start - 1, 0)
+        self._edit(self.text[:start] + self.text[end:], start)
+
+    def delete(self):
+        """ Deletes the selection, or the character after the cursor.
+
+        """
+        start, end = self.selection()
+        if start == end:
+            end += 1
+        self._edit(self.text[:start] + self.text[end:], start)
+
+    def clear(self):
+        """ Deletes all of the text.
+
+        """
+        self._edit(u'', 0)
+
+    def copy(self):
+        """ Copies the selected text to the clipboard of the null
+        application. Nothing is copied in password mode.
+
+        """
+        text = self.selected_text()
+        if text and self.password_mode == 'normal':
+            get_app_null().clipboard = text
+
+    def cut(self):
+        """ Copies the selected text to the clipboard and deletes it.
+
+        """
+        if self.selected_text() and self.password_mode == 'normal':
+            self.copy()
+            self.backspace()
+
+    def paste(self):
+        """ Inserts the text of the clipboard at the cursor.
+
+        """
+        self.insert(get_app_null().clipboard)
+
+    def undo(self):
+        """ Undoes the last edit.
+
+        """
+        if self.undo_stack and not self.read_only:
+            self.redo_stack.append((self.text, self.cursor))
+            text, cursor = self.undo_stack.pop()
+            self._update(text, cursor, edited=True)
+
+    def redo(self):
+        """ Redoes the last undone edit.
+
+        """
+        if self.redo_stack and not self.read_only:
+            self.undo_stack.append((self.text, self.cursor))
+            text, cursor = self.redo_stack.pop()
+            self._update(text, cursor, edited=True)
+
+
+class NullField(NullControl, AbstractTkField):
+    """ A null implementation of a Field which uses a NullLineEdit to
+    provide a single line of editable text.
+
+    The typing of a user is simulated by calling the editing methods
+    of the widget, and the return key by emitting 'return_pressed'.
+
+    """
+    #--------------------------------------------------------------------------
+    # SetupMethods
+    #--------------------------------------------------------------------------
+    def create(self, parent):
+        """ Creates the underlying NullLineEdit.
+
+        """
+        self.widget = NullLineEdit(parent)
+
+    def initialize(self):
+        """ Initializes the attributes of the widget.
+
+        """
+        super(NullField, self).initialize()
+        shell = self.shell_obj
+        self.set_read_only(shell.read_only)
+        self.set_placeholder_text(shell.placeholder_text)
+
+        text = shell.field_text
+        if text is not None:
+            self.set_text(text)
+        
+        shell._modified = False
+
+        self.set_cursor_position(shell.cursor_position)
+        self.set_password_mode(shell.password_mode)
+        self.set_max_length(shell.max_length)
+
+    def bind(self):
+        """ Binds the event handlers for the NullLineEdit.
+
+        """
+        super(NullField, self).bind()
+        widget = self.widget
+        widget.connect('text_edited', self.on_text_edited)
+        widget.connect('text_changed', self.on_text_changed)
+        widget.connect('return_pressed', self.on_return_pressed)
+        widget.connect('selection_changed', self.on_selection_changed)
+        widget.connect('cursor_position_changed', self.on_cursor_changed)
+
+    #--------------------------------------------------------------------------
+    # Shell Object Change Handlers
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size hint of a line edit, which is wide enough
+        for twenty characters regardless of the text.
+
+        """
+        return (20 * CHAR_WIDTH, LINE_HEIGHT + 6)
+
+    def shell_max_length_changed(self, max_length):
+        """ The change handler for the 'max_length' attribute on the 
+        shell object.
+
+        """
+        self.set_max_length(max_length)
+
+    def shell_read_only_changed(self, read_only):
+        """ The change handler for the 'read_only' attribute on the
+        shell object.
+
+        """
+        self.set_read_only(read_only)
+
+    def shell_placeholder_text_changed(self, placeholder_text):
+        """ The change handler for the 'placeholder_text' attribute
+        on the shell object.
+
+        """
+        self.set_placeholder_text(placeholder_text)
+
+    def shell_cursor_position_changed(self, cursor_position):
+        """ The change handler for the 'cursor_position' attribute on 
+        the shell object.
+
+        """
+        if not guard.guarded(self, 'updating_cursor'):
+            self.set_cursor_position(cursor_position)
+
+    def shell_field_text_changed(self, text):
+        """ The change handler for the 'field_text' attribute on the shell 
+        object.
+
+        """
+        if text is not None:
+            if not guard.guarded(self, 'updating_text'):
+                self.set_text(text)
+                self.shell_obj._modified = False
+
+    def shell_password_mode_changed(self, mode):
+        """ The change handler for the 'password_mode' attribute on the 
+        shell object.
+        
+        """
+        self.set_password_mode(mode)
+
+    #--------------------------------------------------------------------------
+    # Manipulation Methods 
+    #--------------------------------------------------------------------------
+    def set_selection(self, start, end):
+        """ Sets the selection in the widget between the start and 
+        end positions, inclusive.
+
+        """
+        self.widget.set_selection(start, end - start)
+
+    def select_all(self):
+        """ Select all the text in the line edit.
+
+        If there is no text in the line edit, the selection will be
+        empty.
+
+        """
+        self.widget.select_all()
+
+    def deselect(self):
+        """ Deselect any selected text.
+
+        """
+        self.widget.deselect()
+
+    def clear(self):
+        """ Clear the line edit of all text.
+
+        """
+        self.widget.clear()
+
+    def backspace(self):
+        """ Simple backspace functionality.
+
+        If no text is selected, deletes the character to the left
+        of the cursor. Otherwise, it deletes the selected text.
+
+        """
+        self.widget.backspace()
+
+    def delete(self):
+        """ Simple delete functionality.
+
+        If no text is selected, deletes the character to the right
+        of the cursor. Otherwise, it deletes the selected text.
+
+        """
+        self.widget.delete()
+
+    def end(self, mark=False):
+        """ Moves the cursor to the end of the line.
+
+        Arguments
+        ---------
+        mark : bool, optional
+            If True, select the text from the current position to the end of
+            the line edit. Defaults to False.
+
+        """
+        self.widget.end(mark)
+
+    def home(self, mark=False):
+        """ Moves the cursor to the beginning of the line.
+
+        Arguments
+        ---------
+        mark : bool, optional
+            If True, select the text from the current position to
+            the beginning of the line edit. Defaults to False.
+
+        """
+        self.widget.home(mark)
+
+    def cut(self):
+        """ Cuts the selected text from the line edit.
+
+        Copies the selected text to the clipboard then deletes the selected
+        text from the line edit.
+
+        """
+        self.widget.cut()
+
+    def copy(self):
+        """ Copies the selected text to the clipboard.
+
+        """
+        self.widget.copy()
+
+    def paste(self):
+        """ Paste the contents of the clipboard into the line edit.
+
+        Inserts the contents of the clipboard into the line edit at
+        the current cursor position, replacing any selected text.
+
+        """
+        self.widget.paste()
+
+    def insert(self, text):
+        """ Insert the text into the line edit.
+
+        Inserts the given text at the current cursor position,
+        replacing any selected text.
+
+        Arguments
+        ---------
+        text : str
+            The text to insert into the line edit.
+
+        """
+        self.widget.insert(text)
+
+    def undo(self):
+        """ Undoes the last operation.
+
+        """
+        self.widget.undo()
+
+    def redo(self):
+        """ Redoes the last operation
+
+        """
+        self.widget.redo()
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers 
+    #--------------------------------------------------------------------------
+    def on_text_edited(self):
+        """ The event handler for when the user edits the text through 
+        the ui.
+
+        """
+        # The text_edited signal will be emitted along with the 
+        # text_changed signal if the user edits from the ui. In 
+        # that case, we only want to do one update.
+        if not guard.guarded(self, 'updating_text'):
+            with guard(self, 'updating_text'):
+                shell = self.shell_obj
+                text = self.widget.text
+                shell.field_text = text
+                shell.text_edited = text
+                shell._modified = True
+
+    def on_text_changed(self):
+        """ The event handler for when the user edits the text 
+        programmatically.
+
+        """
+        if not guard.guarded(self, 'updating_text'):
+            with guard(self, 'updating_text'):
+                shell = self.shell_obj
+                text = self.widget.text
+                shell.field_text = text
+
+    def on_return_pressed(self):
+        """ The event handler for the return pressed event.
+
+        """
+        self.shell_obj.return_pressed = True
+
+    def on_selection_changed(self):
+        """ The event handler for a selection event.
+
+        """
+        with guard(self, 'updating_selection'):
+            self.shell_obj._selected_text = self.widget.selected_text()
+
+    def on_cursor_changed(self):
+        """ The event handler for a cursor change event.
+
+        """
+        with guard(self, 'updating_cursor'):
+            self.shell_obj.cursor_position = self.widget.cursor
+
+    #--------------------------------------------------------------------------
+    # Update methods 
+    #--------------------------------------------------------------------------
+    def set_text(self, text):
+        """ Updates the text control with the new text from the shell
+        object.
+
+        """
+        self.widget.set_text(text)
+
+    def set_max_length(self, max_length):
+        """ Set the max length of the control to max_length. If the max 
+        length is <= 0 or > 32767 then the control will be set to hold 
+        32kb of text.
+
+        """
+        if (max_length <= 0) or (max_length > MAX_LENGTH):
+            max_length = MAX_LENGTH
+        self.widget.set_max_length(max_length)
+
+    def set_read_only(self, read_only):
+        """ Sets read only state of the widget.
+
+        """
+        self.widget.read_only = read_only
+
+    def set_placeholder_text(self, placeholder_text):
+        """ Sets the placeholder text in the widget.
+
+        """
+        self.widget.placeholder_text = placeholder_text
+
+    def set_cursor_position(self, cursor_position):
+        """ Sets the cursor position of the widget.
+
+        """
+        self.widget.set_cursor_position(cursor_position)
+
+    def set_password_mode(self, password_mode):
+        """ Sets the password mode of the wiget.
+
+        """
+        self.widget.password_mode = password_mode
+
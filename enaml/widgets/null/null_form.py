@@ -0,0 +1,16 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_container import NullContainer
+
+from ..form import AbstractTkForm
+
+
+class NullForm(NullContainer, AbstractTkForm):
+    """ A null implementation of Form.
+
+    """
+    # The NullContainer implementation is enough.
+    pass
+
@@ -0,0 +1,95 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_container import NullContainer
+from .null_widget import LINE_HEIGHT
+
+from ..group_box import AbstractTkGroupBox
+
+
+#: The width in pixels of the frame of a group box which is not flat.
+FRAME_WIDTH = 4
+
+
+class NullGroupBox(NullContainer, AbstractTkGroupBox):
+    """ A null implementation of GroupBox.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Intializes the widget with the attributes of this instance.
+
+        """
+        super(NullGroupBox, self).initialize()
+        shell = self.shell_obj
+        self._set_title(shell.title)
+        self._set_flat(shell.flat)
+        self._set_title_align(shell.title_align)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def shell_title_changed(self, title):
+        """ Update the title of the group box with the new value from the
+        shell object.
+
+        """
+        self._set_title(title)
+        # We need to call update constraints since the margins may 
+        # have changed. Using the size_hint_updated event here is
+        # not sufficient.
+        self.shell_obj.set_needs_update_constraints()
+
+    def shell_flat_changed(self, flat):
+        """ Update the flat flag of the group box with the new value from
+        the shell object.
+
+        """
+        self._set_flat(flat)
+        # We need to call update constraints since the margins may 
+        # have changed. Using the size_hint_updated event here is
+        # not sufficient.
+        self.shell_obj.set_needs_update_constraints()
+
+    def shell_title_align_changed(self, align):
+        """ Update the title alignment to the new value from the shell 
+        object.
+
+        """
+        self._set_title_align(align)
+
+    def get_contents_margins(self):
+        """ Return the (top, left, right, bottom) margin values for the
+        widget. The title adds a line to the top margin, and the frame
+        is drawn on all sides unless the group box is flat.
+
+        """
+        widget = self.widget
+        frame = 0 if widget.flat else FRAME_WIDTH
+        top = frame + (LINE_HEIGHT if widget.title else 0)
+        return (top, frame, frame, frame)
+
+    #--------------------------------------------------------------------------
+    # Widget Update methods 
+    #--------------------------------------------------------------------------
+    def _set_title(self, title):
+        """ Updates the title of group box.
+
+        """
+        self.widget.title = title
+
+    def _set_flat(self, flat):
+        """ Updates the flattened appearance of the group box.
+
+        """
+        self.widget.flat = flat
+
+    def _set_title_align(self, align):
+        """ Updates the alignment of the title of the group box.
+
+        """
+        self.widget.title_align = align
+
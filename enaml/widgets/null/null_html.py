@@ -0,0 +1,45 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..html import AbstractTkHtml
+
+
+class NullHtml(NullControl, AbstractTkHtml):
+    """ A null implementation of Html.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes of the control.
+
+        """
+        super(NullHtml, self).initialize()
+        self.set_page_source(self.shell_obj.source)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the fixed size hint of an html view, which does not
+        depend on its source.
+
+        """
+        return (256, 192)
+
+    def shell_source_changed(self, source):
+        """ The change handler for the 'source' attribute.
+
+        """
+        self.set_page_source(source)
+
+    def set_page_source(self, source):
+        """ Sets the page source for the underlying control.
+
+        """
+        self.widget.source = source
+
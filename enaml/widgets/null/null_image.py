@@ -0,0 +1,50 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..image import AbstractTkImage
+
+
+class NullImage(NullControl, AbstractTkImage):
+    """ A null implementation of Image.
+
+    The image is not loaded, since it would never be drawn. The size
+    hint is the requested size of the image.
+
+    """
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the (img_width, img_height) of the shell object.
+
+        """
+        shell = self.shell_obj
+        return (shell.img_width, shell.img_height)
+
+    def shell_value_changed(self, *args):
+        """ The change handler for the 'value' attribute.
+
+        """
+        pass
+
+    def shell_loader_changed(self, *args):
+        """ The change handler for the 'loader' attribute.
+
+        """
+        pass
+
+    def shell_width_changed(self, *args):
+        """ The change handler for the 'width' attribute.
+
+        """
+        self.shell_obj.size_hint_updated = True
+
+    def shell_height_changed(self, *args):
+        """ The change handler for the 'height' attribute.
+
+        """
+        self.shell_obj.size_hint_updated = True
+
@@ -0,0 +1,49 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+from .null_widget import text_size
+
+from ..label import AbstractTkLabel
+
+
+class NullLabel(NullControl, AbstractTkLabel):
+    """ A null implementation of Label.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes on the underlying control.
+
+        """
+        super(NullLabel, self).initialize()
+        self.set_label(self.shell_obj.text)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size of the text of the label.
+
+        """
+        return text_size(self.widget.text)
+
+    def shell_text_changed(self, text):
+        """ The change handler for the 'text' attribute.
+
+        """
+        self.set_label(text)
+        # If the text in the label changes, then the size hint of
+        # label will have changed, and the layout system needs to
+        # be informed.
+        self.shell_obj.size_hint_updated = True
+
+    def set_label(self, label):
+        """ Sets the label on the underlying control.
+
+        """
+        self.widget.text = label
+
@@ -0,0 +1,15 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_abstract_item_view import NullAbstractItemView
+
+from ..list_view import AbstractTkListView
+
+
+class NullListView(NullAbstractItemView, AbstractTkListView):
+    """ A null implementation of ListView.
+
+    """
+    pass
+
@@ -0,0 +1,77 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..progress_bar import AbstractTkProgressBar
+
+
+class NullProgressBar(NullControl, AbstractTkProgressBar):
+    """ A null implementation of ProgressBar.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initialize the attributes of the progress bar.
+
+        """
+        super(NullProgressBar, self).initialize()
+        shell = self.shell_obj
+        self._set_minimum(shell.minimum)
+        self._set_maximum(shell.maximum)
+        self._set_value(shell.value)
+
+    #--------------------------------------------------------------------------
+    # Abstract Implementation Methods
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the fixed size hint of a progress bar.
+
+        """
+        return (100, 20)
+
+    def shell_value_changed(self, value):
+        """ The change handler for the 'value' attribute of the shell
+        object.
+
+        """
+        self._set_value(value)
+
+    def shell_minimum_changed(self, minimum):
+        """ The change handler for the 'minimum' attribute of the shell
+        object.
+
+        """
+        self._set_minimum(minimum)
+            
+    def shell_maximum_changed(self, maximum):
+        """ The change handler for the 'maximum' attribute of the shell
+        object
+
+        """
+        self._set_maximum(maximum)
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def _set_value(self, value):
+        """ Sets the value of the progress bar.
+
+        """
+        self.widget.value = value
+
+    def _set_minimum(self, minimum):
+        """ Sets the minimum value of the progress bar.
+
+        """
+        self.widget.minimum = minimum
+    
+    def _set_maximum(self, maximum):
+        """ Sets the maximum value of the progress bar.
+
+        """
+        self.widget.maximum = maximum
+
@@ -0,0 +1,92 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+from .null_widget import text_size
+
+from ..push_button import AbstractTkPushButton
+
+
+#: The padding in pixels around the label of a button.
+BUTTON_PADDING = (16, 8)
+
+
+class NullPushButton(NullControl, AbstractTkPushButton):
+    """ A null implementation of PushButton.
+
+    A click is simulated by emitting the 'pressed', 'released' and
+    'clicked' signals of the widget.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Intializes the widget with the attributes of this instance.
+
+        """
+        super(NullPushButton, self).initialize()
+        self.set_label(self.shell_obj.text)
+
+    def bind(self):
+        """ Connects the event handlers for the push button.
+
+        """
+        super(NullPushButton, self).bind()
+        widget = self.widget
+        widget.connect('clicked', self.on_clicked)
+        widget.connect('pressed', self.on_pressed)
+        widget.connect('released', self.on_released)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size of the label plus the button padding.
+
+        """
+        width, height = text_size(self.widget.text)
+        pad_width, pad_height = BUTTON_PADDING
+        return (width + pad_width, height + pad_height)
+
+    def shell_text_changed(self, text):
+        """ The change handler for the 'text' attribute.
+
+        """
+        self.set_label(text)
+        # If the text of the button changes, the size hint has likely
+        # change and the layout system needs to be informed.
+        self.shell_obj.size_hint_updated = True
+
+    def on_clicked(self):
+        """ The event handler for the button's clicked event.
+
+        """
+        shell = self.shell_obj
+        shell._down = False
+        shell.clicked = True
+
+    def on_pressed(self):
+        """ The event handlers for the button's pressed event.
+
+        """
+        shell = self.shell_obj
+        shell._down = True
+        shell.pressed = True
+
+    def on_released(self):
+        """ The event handler for the button's released event.
+
+        """
+        shell = self.shell_obj
+        if shell._down:
+            shell._down = False
+            shell.released = True
+
+    def set_label(self, label):
+        """ Sets the label on the button control.
+
+        """
+        self.widget.text = label
+
@@ -0,0 +1,39 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_toggle_control import NullToggleControl
+
+from ..radio_button import AbstractTkRadioButton
+
+
+class NullRadioButton(NullToggleControl, AbstractTkRadioButton):
+    """ A null implementation of RadioButton.
+
+    The radio buttons which share a parent widget are exclusive, as for
+    the other toolkits: checking one unchecks the others.
+
+    """
+    def create(self, parent):
+        """ Creates the underlying widget and marks it as exclusive.
+
+        """
+        super(NullRadioButton, self).create(parent)
+        self.widget.exclusive = True
+
+    def set_checked(self, checked):
+        """ Sets the widget's checked state with the provided value, 
+        unchecking the sibling radio buttons. Not meant for public
+        consumption.
+
+        """
+        widget = self.widget
+        widget.checked = checked
+        parent = widget.parent
+        if checked and parent is not None:
+            for sibling in parent.children:
+                if (sibling is not widget and 
+                    getattr(sibling, 'exclusive', False) and sibling.checked):
+                    sibling.checked = False
+                    sibling.emit('toggled')
+
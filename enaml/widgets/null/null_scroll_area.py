@@ -0,0 +1,130 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2011, Enthought, Inc.
+# All rights reserved.
+#------------------------------------------------------------------------------
+from .null_container import NullContainer
+
+from ..scroll_area import AbstractTkScrollArea
+
+
+#: The extent in pixels of a scroll bar.
+SCROLLBAR_EXTENT = 16
+
+
+class NullScrollArea(NullContainer, AbstractTkScrollArea):
+    """ A null implementation of the ScrollArea Container.
+
+    The child is resized to fill the scroll area, but no smaller than
+    its minimum size, as for a resizable QScrollArea.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Intializes the widget with the attributes of this instance.
+
+        """
+        super(NullScrollArea, self).initialize()
+        self.widget.child = None
+        shell = self.shell_obj
+        self._set_horiz_policy(shell.horizontal_scrollbar_policy)
+        self._set_vert_policy(shell.vertical_scrollbar_policy)
+        self._update_children()
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def shell_horizontal_scrollbar_policy_changed(self, policy):
+        """ The change handler for the 'horizontal_scrollbar_policy'
+        attribute of the shell object.
+
+        """
+        self._set_horiz_policy(policy)
+
+    def shell_vertical_scrollbar_policy_changed(self, policy):
+        """ The change handler for the 'vertical_scrollbar_policy'
+        attribute of the shell object.
+
+        """
+        self._set_vert_policy(policy)
+
+    def shell_children_changed(self, children):
+        """ The change handler for the children of the shell object.
+
+        """
+        self._update_children()
+
+    def shell_children_items_changed(self, event):
+        """ The change handler for the children items event of the
+        shell object.
+
+        """
+        self._update_children()
+
+    def on_resize(self):
+        """ Resizes the child to fill the scroll area, rather than
+        running a layout.
+
+        """
+        self._layout_child()
+
+    def size_hint(self):
+        """ Returns a (width, height) tuple of integers which represent
+        the suggested size of the widget for its current state. This
+        value is used by the layout manager to determine how much
+        space to allocate the widget.
+
+        Overriden to ask the child widget for its size hint. Fall back 
+        to the minimum size if there is no size hint. If we use a 
+        constraints-based Container as the child widget, it will only have
+        a minimum size set, not a size hint.
+
+        """
+        shell = self.shell_obj
+        if not shell.children:
+            return (256, 192)
+        child = shell.children[0]
+        width, height = child.size_hint()
+        if (width, height) == (-1, -1):
+            width, height = child.toolkit_widget.min_size
+        # Add scrollbar extents to allow room for the scrollbars.
+        return (width + SCROLLBAR_EXTENT, height + SCROLLBAR_EXTENT)
+
+    #--------------------------------------------------------------------------
+    # Widget Update
+    #--------------------------------------------------------------------------
+    def _set_horiz_policy(self, policy):
+        """ Set the horizontal scrollbar policy of the widget.
+
+        """
+        self.widget.horizontal_policy = policy
+
+    def _set_vert_policy(self, policy):
+        """ Set the vertical scrollbar policy of the widget.
+
+        """
+        self.widget.vertical_policy = policy
+
+    def _layout_child(self):
+        """ Sets the geometry of the child of the scroll area.
+
+        """
+        child = self.widget.child
+        if child is not None:
+            width, height = self.widget.size()
+            child.set_geometry(0, 0, width, height)
+
+    def _update_children(self):
+        """ Update the child of the widget with the current children.
+
+        """
+        shell = self.shell_obj
+        widget = self.widget
+        if len(shell.children) == 0:
+            widget.child = None
+        else:
+            child = widget.child = shell.children[0].toolkit_widget
+            child.set_parent(widget)
+            self._layout_child()
+
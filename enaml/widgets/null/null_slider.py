@@ -0,0 +1,294 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+from .null_widget import NullWidget
+
+from ..slider import AbstractTkSlider
+
+
+#: The tick positions which are not compatible with an orientation,
+#: mapped to the position they are adapted to, as for a QSlider.
+_TICK_ADAPTATION = {
+    'horizontal': {'left': 'top', 'right': 'bottom'},
+    'vertical': {'top': 'left', 'bottom': 'right'},
+}
+
+
+#: The (length, thickness) of the size hint of a slider, and the extra
+#: thickness added by its tick marks.
+SLIDER_SIZE = (84, 20)
+TICK_SIZE = 6
+
+
+class NullSliderWidget(NullWidget):
+    """ An in-memory slider.
+
+    The trigger_action method simulates the keyboard actions of a user
+    and emits the 'value_changed' signal if the value changes.
+
+    """
+    def __init__(self, parent=None):
+        super(NullSliderWidget, self).__init__(parent)
+        self.minimum = 0
+        self.maximum = 99
+        self.value = 0
+        self.single_step = 1
+        self.page_step = 10
+        self.tick_interval = 0
+        self.tick_position = 'no_ticks'
+        self.orientation = 'horizontal'
+        self.tracking = True
+
+    def trigger_action(self, action):
+        """ Moves the slider by one of the actions 'single_step_add', 
+        'single_step_sub', 'page_step_add', 'page_step_sub', 
+        'to_minimum' or 'to_maximum'.
+
+        """
+        value = self.value
+        if action == 'to_minimum':
+            value = self.minimum
+        elif action == 'to_maximum':
+            value = self.maximum
+        else:
+            kind, _, direction = action.rpartition('_')
+            step = self.single_step if kind == 'single_step' else self.page_step
+            value += step if direction == 'add' else -step
+        value = max(self.minimum, min(value, self.maximum))
+        if value != self.value:
+            self.value = value
+            self.emit('value_changed')
+
+
+class NullSlider(NullControl, AbstractTkSlider):
+    """ A null implementation of Slider.
+
+    The keyboard actions of a user are simulated by the trigger_action
+    method of the widget. A drag is simulated by setting its 'value'
+    attribute and emitting its 'pressed', 'moved', 'value_changed' and
+    'released' signals.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def create(self, parent):
+        """ Creates the underlying NullSliderWidget.
+
+        """
+        self.widget = NullSliderWidget(parent)
+
+    def initialize(self):
+        """ Initializes the attributes of the toolkit widget.
+
+        """
+        super(NullSlider, self).initialize()
+        shell = self.shell_obj
+        shell._down = False
+        self.set_range(shell.minimum, shell.maximum)
+        self.set_position(shell.value)
+        self.set_tick_position(shell.tick_position)
+        self.set_orientation(shell.orientation)
+        self.set_tick_frequency(shell.tick_interval)
+        self.set_single_step(shell.single_step)
+        self.set_page_step(shell.page_step)
+        self.set_tracking(shell.tracking)
+
+    def bind(self):
+        """ Connect the event handlers for the slider widget signals.
+
+        """
+        super(NullSlider, self).bind()
+        widget = self.widget
+        widget.connect('value_changed', self._on_slider_changed)
+        widget.connect('moved', self._on_slider_moved)
+        widget.connect('pressed', self._on_pressed)
+        widget.connect('released', self._on_released)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size of the slider for its orientation, with
+        room for the tick marks.
+
+        """
+        widget = self.widget
+        length, thickness = SLIDER_SIZE
+        if widget.tick_position != 'no_ticks':
+            thickness += TICK_SIZE
+        if widget.orientation == 'vertical':
+            return (thickness, length)
+        return (length, thickness)
+
+    def shell_minimum_changed(self, minimum):
+        """ The change handler for the 'minimum' attribute on the shell
+        object.
+
+        """
+        self.set_range(minimum, self.shell_obj.maximum)
+
+    def shell_maximum_changed(self, maximum):
+        """ The change handler for the 'maximum' attribute on the shell
+        object.
+        
+        """
+        self.set_range(self.shell_obj.minimum, maximum)
+
+    def shell_value_changed(self, value):
+        """ The change handler for the 'value' attribute on the shell
+        object.
+        
+        """
+        self.set_position(value)
+
+    def shell_tracking_changed(self, tracking):
+        """ The change handler for the 'tracking' attribute on the shell
+        object.
+
+        """
+        self.set_tracking(tracking)
+
+    def shell_single_step_changed(self, single_step):
+        """ The change handler for the 'single_step' attribute on the 
+        shell object.
+        
+        """
+        self.set_single_step(single_step)
+
+    def shell_page_step_changed(self, page_step):
+        """ The change handler for the 'page_step' attribute on the 
+        shell object.
+
+        """
+        self.set_page_step(page_step)
+
+    def shell_tick_interval_changed(self, tick_interval):
+        """ The change handler for the 'tick_interval' attribute on the
+        shell object.
+
+        """
+        shell = self.shell_obj
+        self.set_tick_frequency(tick_interval)
+        # This extra calls are made since the range trait on 
+        # shell object may clip the values to fit within the 
+        # range without firing a changed notification.
+        self.set_single_step(shell.single_step)
+        self.set_page_step(shell.page_step)
+
+    def shell_tick_position_changed(self, tick_position):
+        """ The change handler for the 'tick_position' attribute on the
+        shell object.
+
+        """
+        self.set_tick_position(tick_position)
+        self.shell_obj.size_hint_updated = True
+        
+    def shell_orientation_changed(self, orientation):
+        """ The change handler for the 'orientation' attribute on the 
+        shell object.
+
+        """
+        self.set_orientation(orientation)
+        self.shell_obj.size_hint_updated = True
+
+    #--------------------------------------------------------------------------
+    # Event Handlers 
+    #--------------------------------------------------------------------------
+    def _on_slider_changed(self):
+        """ The event handler for the slider value changed event.
+
+        """
+        self.shell_obj.value = self.widget.value
+
+    def _on_slider_moved(self):
+        """ The event handler for a slider moved event.
+
+        """
+        self.shell_obj.moved = self.widget.value
+
+    def _on_pressed(self):
+        """ The event handler for a slider pressed event.
+
+        """
+        shell = self.shell_obj
+        shell._down = True
+        shell.pressed = True
+
+    def _on_released(self):
+        """ The event handler for a slider released event.
+
+        """
+        shell = self.shell_obj
+        if shell._down:
+            shell._down = False
+            shell.released = True
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods 
+    #--------------------------------------------------------------------------
+    def set_single_step(self, step):
+        """ Set the single step attribute of the widget.
+
+        """
+        self.widget.single_step = step
+
+    def set_page_step(self, step):
+        """ Set the page step attribute of the widget.
+
+        """
+        self.widget.page_step = step
+
+    def set_tick_position(self, ticks):
+        """ Apply the tick position in the widget.
+
+        """
+        self.widget.tick_position = ticks
+        self.sync_tick_position()
+
+    def set_orientation(self, orientation):
+        """ Set the slider orientation.
+
+        """
+        self.widget.orientation = orientation
+        self.sync_tick_position()
+
+    def set_tracking(self, tracking):
+        """ Set the tracking state of the slider.
+
+        """
+        self.widget.tracking = tracking
+
+    def set_range(self, minimum, maximum):
+        """ Set the range of the slider widget.
+
+        """
+        widget = self.widget
+        widget.minimum = minimum
+        widget.maximum = maximum
+
+    def set_tick_frequency(self, interval):
+        """ Set the slider widget tick mark fequency.
+
+        """
+        self.widget.tick_interval = interval
+
+    def set_position(self, value):
+        """ Set the position of the slider.
+
+        """
+        self.widget.value = value
+
+    def sync_tick_position(self):
+        """ Adapts the tick position of the widget to its orientation
+        and synchronizes the shell object, as a QSlider does.
+
+        """
+        widget = self.widget
+        adaptation = _TICK_ADAPTATION[widget.orientation]
+        tick_pos = adaptation.get(widget.tick_position, widget.tick_position)
+        widget.tick_position = tick_pos
+        self.shell_obj.tick_position = tick_pos
+
@@ -0,0 +1,235 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+from .null_widget import NullWidget, CHAR_WIDTH, LINE_HEIGHT
+
+from ..spin_box import AbstractTkSpinBox
+
+from ...converters import IntConverter
+
+
+#: The width in pixels of the arrows of a spin box.
+ARROW_WIDTH = 16
+
+
+class NullSpinWidget(NullWidget):
+    """ An in-memory spin box.
+
+    The step_up and step_down methods simulate a click on the arrows
+    and emit the 'value_changed' signal if the value changes.
+
+    """
+    def __init__(self, parent=None):
+        super(NullSpinWidget, self).__init__(parent)
+        self.low = 0
+        self.high = 99
+        self.step = 1
+        self.value = 0
+        self.wrap = False
+        self.tracking = False
+        self.converter = IntConverter()
+
+    def text(self):
+        """ Returns the displayed text of the value. If the conversion
+        fails then simple str(...) conversion is used.
+
+        """
+        return self.text_for(self.value)
+
+    def text_for(self, value):
+        """ Returns the displayed text of a value.
+
+        """
+        try:
+            return self.converter.to_component(value)
+        except ValueError:
+            return str(value)
+
+    def step_by(self, steps):
+        """ Changes the value by a number of steps, wrapping around or
+        stopping at the extremes.
+
+        """
+        low = self.low
+        high = self.high
+        value = self.value + steps * self.step
+        if self.wrap:
+            if value > high:
+                value = low
+            elif value < low:
+                value = high
+        else:
+            value = max(low, min(value, high))
+        if value != self.value:
+            self.value = value
+            self.emit('value_changed')
+
+    def step_up(self):
+        """ Increases the value by one step.
+
+        """
+        self.step_by(1)
+
+    def step_down(self):
+        """ Decreases the value by one step.
+
+        """
+        self.step_by(-1)
+
+
+class NullSpinBox(NullControl, AbstractTkSpinBox):
+    """ A null implementation of SpinBox.
+
+    A change by the user is simulated by calling the step_up and
+    step_down methods of the widget, or by setting its 'value' attribute
+    and emitting its 'value_changed' signal.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def create(self, parent):
+        """ Creates the underlying NullSpinWidget.
+
+        """
+        self.widget = NullSpinWidget(parent)
+
+    def initialize(self):
+        """ Intializes the widget with the attributes of this instance.
+
+        """
+        super(NullSpinBox, self).initialize()
+        shell = self.shell_obj
+        self.set_spin_low(shell.low)
+        self.set_spin_high(shell.high)
+        self.set_spin_step(shell.step)
+        self.set_spin_converter(shell.converter)
+        self.set_spin_wrap(shell.wrap)
+        self.set_spin_value(shell.value)
+        self.set_spin_tracking(shell.tracking)
+
+    def bind(self):
+        """ Binds the event handlers for the spin control.
+
+        """
+        super(NullSpinBox, self).bind()
+        self.widget.connect('value_changed', self.on_value_changed)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size needed for the text of the widest of the
+        low and high values, plus the arrows.
+
+        """
+        widget = self.widget
+        chars = max(len(widget.text_for(widget.low)),
+                    len(widget.text_for(widget.high)))
+        return (chars * CHAR_WIDTH + ARROW_WIDTH, LINE_HEIGHT + 6)
+
+    def shell_value_changed(self, value):
+        """ The change handler for the 'value' attribute of the shell
+        object.
+
+        """
+        self.set_spin_value(value)
+
+    def shell_low_changed(self, low):
+        """ The change handler for the 'low' attribute of the shell
+        object.
+
+        """
+        self.set_spin_low(low)
+
+    def shell_high_changed(self, high):
+        """ The change handler for the 'high' attribute of the shell
+        object.
+
+        """
+        self.set_spin_high(high)
+
+    def shell_step_changed(self, step):
+        """ The change handler for the 'step' attribute of the shell
+        object.
+
+        """
+        self.set_spin_step(step)
+
+    def shell_converter_changed(self, converter):
+        """ The change handler for the 'converter' attribute of the shell
+        object.
+
+        """
+        self.set_spin_converter(converter)
+
+    def shell_wrap_changed(self, wrap):
+        """ The change handler for the 'wrap' attribute of the shell 
+        object.
+
+        """
+        self.set_spin_wrap(wrap)
+
+    def shell_tracking_changed(self, tracking):
+        """ The change handler for the 'tracking' attribute of the shell
+        object.
+
+        """
+        self.set_spin_tracking(tracking)
+
+    #--------------------------------------------------------------------------
+    # Event Handlers
+    #--------------------------------------------------------------------------
+    def on_value_changed(self):
+        """ The event handler for the widget's spin event.
+
+        """
+        self.shell_obj.value = self.widget.value
+
+    #--------------------------------------------------------------------------
+    # Widget update methods 
+    #--------------------------------------------------------------------------
+    def set_spin_value(self, value):
+        """ Sets the value of the widget.
+
+        """
+        self.widget.value = value
+
+    def set_spin_low(self, low):
+        """ Sets the minimum value of the widget.
+
+        """
+        self.widget.low = low
+
+    def set_spin_high(self, high):
+        """ Sets the maximum value of the widget.
+
+        """
+        self.widget.high = high
+
+    def set_spin_step(self, step):
+        """ Sets the step size of the widget.
+
+        """
+        self.widget.step = step
+
+    def set_spin_converter(self, converter):
+        """ Sets the coverter for the widget.
+
+        """
+        self.widget.converter = converter
+
+    def set_spin_wrap(self, wrap):
+        """ Sets the wrap mode of the widget.
+
+        """
+        self.widget.wrap = wrap
+
+    def set_spin_tracking(self, tracking):
+        """ Sets the keyboard tracking of the widget.
+
+        """
+        self.widget.tracking = tracking
+
@@ -0,0 +1,165 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2011, Enthought, Inc.
+# All rights reserved.
+#------------------------------------------------------------------------------
+from .null_container import NullContainer
+
+from ..splitter import AbstractTkSplitter
+
+
+class NullSplitter(NullContainer, AbstractTkSplitter):
+    """ A null implementation of the Splitter Container.
+
+    The widget keeps the sizes of its panes along the orientation of
+    the splitter. When the widget is resized, the sizes are scaled to
+    fill it. A drag of a handle by the user is simulated by setting the
+    'sizes' attribute of the widget and emitting its 'resized' signal.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Intializes the widget with the attributes of this instance.
+
+        """
+        super(NullSplitter, self).initialize()
+        widget = self.widget
+        widget.panes = []
+        widget.sizes = []
+        shell = self.shell_obj
+        self.set_orientation(shell.orientation)
+        self.set_live_drag(shell.live_drag)
+        self.update_children()
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def shell_orientation_changed(self, orientation):
+        """ Update the orientation of the widget.
+
+        """
+        self.set_orientation(orientation)
+        self.layout_panes()
+
+    def shell_live_drag_changed(self, live_drag):
+        """ The change handler for the 'live_drag' attribut of the shell
+        object.
+
+        """
+        self.set_live_drag(live_drag)
+
+    def shell_children_changed(self, children):
+        """ Update the widget with new children.
+
+        """
+        self.update_children()
+
+    def shell_children_items_changed(self, event):
+        """ Update the widget with new children.
+
+        """
+        self.update_children()
+
+    def on_resize(self):
+        """ Resizes the panes to fill the widget, rather than running a
+        layout.
+
+        """
+        self.layout_panes()
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods 
+    #--------------------------------------------------------------------------
+    def set_orientation(self, orientation):
+        """ Update the orientation of the splitter.
+
+        """
+        self.widget.orientation = orientation
+
+    def set_live_drag(self, live_drag):
+        """ Update the dragging mode of the splitter.
+
+        """
+        self.widget.live_drag = live_drag
+
+    def update_children(self):
+        """ Update the panes of the splitter with the current children.
+
+        """
+        widget = self.widget
+        for pane in widget.panes:
+            pane.set_parent(None)
+        shell = self.shell_obj
+        panes = widget.panes = []
+        for child in shell.children:
+            pane = child.toolkit_widget
+            pane.set_parent(widget)
+            panes.append(pane)
+        self.set_initial_sizes()
+
+    def layout_panes(self):
+        """ Scales the sizes of the panes to fill the widget, and sets
+        their geometry.
+
+        """
+        widget = self.widget
+        panes = widget.panes
+        if not panes:
+            return
+        width, height = widget.size()
+        horizontal = widget.orientation == 'horizontal'
+        length = width if horizontal else height
+        sizes = widget.sizes
+        total = sum(sizes)
+        if total > 0:
+            sizes = [size * length // total for size in sizes]
+        else:
+            sizes = [length // len(panes)] * len(panes)
+        # The last pane takes up the rounding error.
+        sizes[-1] += length - sum(sizes)
+        widget.sizes = sizes
+        offset = 0
+        for pane, size in zip(panes, sizes):
+            if horizontal:
+                pane.set_geometry(offset, 0, size, height)
+            else:
+                pane.set_geometry(0, offset, width, size)
+            offset += size
+
+    def size_hint(self):
+        """ Return a size hint for the widget.
+
+        """
+        along_hint = 0
+        ortho_hint = 0
+        shell = self.shell_obj
+        i = ['horizontal', 'vertical'].index(shell.orientation)
+        j = 1 - i
+        for child in shell.children:
+            if child.visible:
+                size_hint = child.size_hint()
+                if size_hint == (-1, -1):
+                    size_hint = child.toolkit_widget.min_size
+                along_hint += size_hint[i]
+                ortho_hint = max(ortho_hint, size_hint[j])
+        if shell.orientation == 'horizontal':
+            return (along_hint, ortho_hint)
+        else:
+            return (ortho_hint, along_hint)
+
+    def set_initial_sizes(self):
+        """ Set the initial sizes for the children.
+
+        """
+        shell = self.shell_obj
+        i = ['horizontal', 'vertical'].index(shell.orientation)
+        sizes = []
+        for child in shell.children:
+            hint = child.size_hint()[i]
+            if hint <= 0:
+                hint = child.toolkit_widget.min_size[i]
+            sizes.append(hint)
+        self.widget.sizes = sizes
+        self.layout_panes()
+
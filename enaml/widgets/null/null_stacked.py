@@ -0,0 +1,126 @@
+#------------------------------------------------------------------------------
+# Copyright (c) 2011, Enthought, Inc.
+# All rights reserved.
+#------------------------------------------------------------------------------
+from .null_container import NullContainer
+
+from ..stacked import AbstractTkStacked
+
+
+class NullStacked(NullContainer, AbstractTkStacked):
+    """ A null implementation of the Stacked Container.
+
+    The widget keeps a list of its pages. Since a Stacked container
+    does not use a constraints layout, the pages are sized to fill the
+    widget whenever it is resized, and only the current page is shown.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Intializes the widget with the attributes of this instance.
+
+        """
+        super(NullStacked, self).initialize()
+        self.widget.pages = []
+        self.widget.index = -1
+        self.update_children()
+        self.set_index(self.shell_obj.index)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def shell_index_changed(self, index):
+        """ Update the widget index with the new value from the shell 
+        object.
+
+        """
+        self.set_index(index)
+        self.shell_obj.size_hint_updated = True
+
+    def shell_children_changed(self, children):
+        """ Update the widget with new children.
+
+        """
+        self.update_children()
+
+    def shell_children_items_changed(self, event):
+        """ Update the widget with new children.
+
+        """
+        self.update_children()
+
+    def on_resize(self):
+        """ Resizes the pages to fill the widget, rather than running
+        a layout.
+
+        """
+        self.layout_pages()
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods 
+    #--------------------------------------------------------------------------
+    def set_index(self, index):
+        """ Set the current visible index of the widget.
+
+        """
+        widget = self.widget
+        widget.index = index
+        for idx, page in enumerate(widget.pages):
+            page.visible = (idx == index)
+
+    def size_hint(self):
+        """ Returns a (width, height) tuple of integers which represent
+        the suggested size of the widget for its current state. This
+        value is used by the layout manager to determine how much
+        space to allocate the widget.
+
+        Override to ask the currently displayed widget for its size hint. 
+        Fall back to the minimum size if there is no size hint. If we use
+        a constraints-based Container as a child widget, it will only have
+        a minimum size set, not a size hint.
+
+        """
+        shell = self.shell_obj
+        if not shell.children:
+            return (-1, -1)
+        curr_shell = shell.children[shell.index]
+        size_hint = curr_shell.size_hint()
+        if size_hint == (-1, -1):
+            size_hint = curr_shell.toolkit_widget.min_size
+        return size_hint
+
+    def page_rect(self):
+        """ Returns the (x, y, width, height) of the area of the widget
+        which is filled by the pages.
+
+        """
+        width, height = self.widget.size()
+        return (0, 0, width, height)
+
+    def layout_pages(self):
+        """ Sets the geometry of the pages to the page area.
+
+        """
+        rect = self.page_rect()
+        for page in self.widget.pages:
+            page.set_geometry(*rect)
+
+    def update_children(self):
+        """ Update the pages of the widget with the current children.
+
+        """
+        shell = self.shell_obj
+        widget = self.widget
+        pages = widget.pages = []
+        for child in shell.children:
+            page = child.toolkit_widget
+            page.set_parent(widget)
+            pages.append(page)
+        # Finally, update the selected index of the of the widget 
+        # and notify the layout of the size hint update
+        self.set_index(shell.index)
+        self.layout_pages()
+        shell.size_hint_updated = True
+
@@ -0,0 +1,122 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_stacked import NullStacked
+from .null_widget import LINE_HEIGHT, text_size
+
+from ..tabbed import AbstractTkTabbed
+
+
+#: The padding in pixels around the title of a tab.
+TAB_PADDING = (16, 8)
+
+
+class NullTabbed(NullStacked, AbstractTkTabbed):
+    """ A null implementation of the Tabbed container.
+
+    A click on a tab is simulated by setting the 'index' attribute of
+    the widget and emitting its 'current_changed' signal.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup Methods 
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initialize the attributes of the Tabbed container.
+
+        """
+        self.widget.titles = []
+        super(NullTabbed, self).initialize()
+        self._set_tab_position(self.shell_obj.tab_position)
+
+    def bind(self):
+        """ Bind to the events emitted by the underlying control.
+
+        """
+        super(NullTabbed, self).bind()
+        self.widget.connect('current_changed', self._on_current_changed)
+
+    #--------------------------------------------------------------------------
+    # Implementation 
+    #--------------------------------------------------------------------------
+    def shell_tab_position_changed(self, tab_position):
+        """ The change handler for the 'tab_position' attribute of the
+        shell object.
+
+        """
+        self._set_tab_position(tab_position)
+        self.layout_pages()
+        self.shell_obj.size_hint_updated = True
+
+    def tab_bar_size(self):
+        """ Returns the (width, height) of the tab bar for the titles
+        of the tabs, when laid out horizontally.
+
+        """
+        pad_width, pad_height = TAB_PADDING
+        width = sum(text_size(title)[0] + pad_width
+                    for title in self.widget.titles)
+        return (width, LINE_HEIGHT + pad_height)
+
+    def size_hint(self):
+        """ Returns a (width, height) tuple of integers which represent
+        the suggested size of the widget for its current state. This
+        value is used by the layout manager to determine how much
+        space to allocate the widget.
+
+        Override to add the size of the tab bar to the size hint.
+
+        """
+        width_hint, height_hint = super(NullTabbed, self).size_hint()
+        bar_width, bar_height = self.tab_bar_size()
+        if self.shell_obj.tab_position in ('top', 'bottom'):
+            height_hint += bar_height
+            width_hint = max(width_hint, bar_width)
+        else:
+            width_hint += bar_height
+            height_hint = max(height_hint, bar_width)
+        return (width_hint, height_hint)
+
+    def page_rect(self):
+        """ Returns the area of the widget not covered by the tab bar.
+
+        """
+        width, height = self.widget.size()
+        bar = self.tab_bar_size()[1]
+        position = self.widget.tab_position
+        if position == 'top':
+            return (0, bar, width, height - bar)
+        if position == 'bottom':
+            return (0, 0, width, height - bar)
+        if position == 'left':
+            return (bar, 0, width - bar, height)
+        return (0, 0, width - bar, height)
+
+    #--------------------------------------------------------------------------
+    # Event Handlers 
+    #--------------------------------------------------------------------------
+    def _on_current_changed(self):
+        """ The event handler for the 'current_changed' signal of the 
+        underlying control. Synchronizes the index of the shell object.
+
+        """
+        self.shell_obj.index = self.widget.index
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods 
+    #--------------------------------------------------------------------------
+    def _set_tab_position(self, tab_position):
+        """ Sets the position of the tabs on the underlying tab widget.
+
+        """
+        self.widget.tab_position = tab_position
+
+    def update_children(self):
+        """ Update the pages and titles of the widget with the current
+        children. This is an overridden parent class method.
+
+        """
+        self.widget.titles = [child.title for child in self.shell_obj.children]
+        super(NullTabbed, self).update_children()
+
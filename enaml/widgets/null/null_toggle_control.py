@@ -0,0 +1,123 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+from .null_widget import LINE_HEIGHT, text_size
+
+from ..toggle_control import AbstractTkToggleControl
+
+
+#: The size in pixels of the check indicator, and its spacing from the
+#: label.
+INDICATOR_SIZE = 16
+INDICATOR_SPACING = 4
+
+
+class NullToggleControl(NullControl, AbstractTkToggleControl):
+    """ A base class for null toggle widgets.
+
+    A toggle is simulated by setting the 'checked' attribute of the
+    widget and emitting its 'toggled' signal. The 'pressed' and
+    'released' signals are bound as for the other toolkits.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def create(self, parent):
+        """ Creates the underlying widget, unchecked, since sibling
+        controls may look at its state before it is initialized.
+
+        """
+        super(NullToggleControl, self).create(parent)
+        widget = self.widget
+        widget.text = u''
+        widget.checked = False
+
+    def initialize(self):
+        """ Initializes the attributes of the underlying control.
+
+        """
+        super(NullToggleControl, self).initialize()
+        shell = self.shell_obj
+        self.set_label(shell.text)
+        self.set_checked(shell.checked)
+
+    def bind(self):
+        """ Binds the event handlers for the toggle control.
+
+        """
+        super(NullToggleControl, self).bind()
+        widget = self.widget
+        widget.connect('toggled', self.on_toggled)
+        widget.connect('pressed', self.on_pressed)
+        widget.connect('released', self.on_released)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def size_hint(self):
+        """ Returns the size of the indicator followed by the label.
+
+        """
+        width, height = text_size(self.widget.text)
+        width += INDICATOR_SIZE + INDICATOR_SPACING
+        return (width, max(height, INDICATOR_SIZE, LINE_HEIGHT))
+
+    def shell_checked_changed(self, checked):
+        """ The change handler for the 'checked' attribute.
+
+        """
+        self.set_checked(checked)
+
+    def shell_text_changed(self, text):
+        """ The change handler for the 'text' attribute.
+
+        """
+        self.set_label(text)
+        # If the label of the control changes, its size hint has likely
+        # updated and the layout system needs to be informed
+        self.shell_obj.size_hint_updated = True
+        
+    def on_toggled(self):
+        """ The event handler for the toggled event.
+
+        """
+        shell = self.shell_obj
+        shell.checked = self.widget.checked
+        shell.toggled = True
+
+    def on_pressed(self):
+        """ The event handler for the pressed event. Not meant for
+        public consumption.
+
+        """
+        shell = self.shell_obj
+        shell._down = True
+        shell.pressed = True
+
+    def on_released(self):
+        """ The event handler for the released event. Not meant for
+        public consumption.
+
+        """
+        shell = self.shell_obj
+        if shell._down:
+            shell._down = False
+            shell.released = True
+
+    def set_label(self, label):
+        """ Sets the widget's label with the provided value. Not
+        meant for public consumption.
+
+        """
+        self.widget.text = label
+
+    def set_checked(self, checked):
+        """ Sets the widget's checked state with the provided value.
+        Not meant for public consumption.
+
+        """
+        self.widget.checked = checked
+
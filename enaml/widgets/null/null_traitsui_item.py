@@ -0,0 +1,46 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_control import NullControl
+
+from ..traitsui_item import AbstractTkTraitsUIItem
+
+
+class NullTraitsUIItem(NullControl, AbstractTkTraitsUIItem):
+    """ A null implementation of TraitsUIItem.
+
+    There is no traits ui backend for the null toolkit, so the model,
+    view and handler are kept on the widget but no ui is created.
+
+    See Also
+    --------
+    TraitsUIItem
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initializes the attributes of the control.
+
+        """
+        super(NullTraitsUIItem, self).initialize()
+        shell = self.shell_obj
+        widget = self.widget
+        widget.model = shell.model
+        widget.view = shell.view
+        widget.handler = shell.handler
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def shell_model_changed(self, model):
+        raise NotImplementedError
+    
+    def shell_view_changed(self, view):
+        raise NotImplementedError
+
+    def shell_handler_changed(self, handler):
+        raise NotImplementedError
+
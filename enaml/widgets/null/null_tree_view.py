@@ -0,0 +1,42 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_abstract_item_view import NullAbstractItemView
+
+from ..tree_view import AbstractTkTreeView
+
+
+class NullTreeView(NullAbstractItemView, AbstractTkTreeView):
+    """ A null implementation of TreeView.
+
+    """
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Initialize the widget with the attributes of this instance.
+
+        """
+        super(NullTreeView, self).initialize()
+        self.set_header_visible(self.shell_obj.header_visible)
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def shell_header_visible_changed(self, visible):
+        """ The change handler for the 'header_visible' attribute of
+        the shell object.
+
+        """
+        self.set_header_visible(visible)
+    
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_header_visible(self, visible):
+        """ Sets the visibility of the header for the widget.
+
+        """
+        self.widget.header_visible = visible
+
@@ -0,0 +1,154 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" The in-memory widget used by the null toolkit.
+
+"""
+
+
+#: The width in pixels of a character of text.
+CHAR_WIDTH = 7
+
+#: The height in pixels of a line of text.
+LINE_HEIGHT = 16
+
+
+#: The tokens of a display format for a date or time, longest first,
+#: with the strftime directives which render them.
+_FORMAT_TOKENS = (
+    ('yyyy', '%Y'), ('yy', '%y'), ('MMMM', '%B'), ('MMM', '%b'),
+    ('MM', '%m'), ('dddd', '%A'), ('ddd', '%a'), ('dd', '%d'),
+    ('hh', '%H'), ('mm', '%M'), ('ss', '%S'), ('AP', '%p'),
+)
+
+
+def text_size(text):
+    """ Returns the deterministic (width, height) of a line of text.
+
+    """
+    return (CHAR_WIDTH * len(text), LINE_HEIGHT)
+
+
+def format_datetime(value, display_format):
+    """ Returns the text of a date or datetime for a display format
+    such as 'MMM dd yyyy hh:mm', which is the format understood by the
+    date edits of the other toolkits. An empty format renders the
+    value with str().
+
+    """
+    if not display_format:
+        return unicode(value)
+    parts = []
+    idx = 0
+    size = len(display_format)
+    while idx < size:
+        for token, directive in _FORMAT_TOKENS:
+            if display_format.startswith(token, idx):
+                parts.append(directive)
+                idx += len(token)
+                break
+        else:
+            char = display_format[idx]
+            parts.append('%%' if char == '%' else char)
+            idx += 1
+    return unicode(value.strftime(''.join(parts)), encoding='utf-8')
+
+
+class NullWidget(object):
+    """ A widget which keeps its state in memory instead of drawing it.
+
+    The null components store the state of their shell objects on
+    their widget as plain attributes. The actions of a user are
+    simulated by changing the state of a widget and emitting the
+    signal which the component has connected to its handler, e.g.
+    widget.emit('clicked') for a push button.
+
+    """
+    def __init__(self, parent=None):
+        self.parent = None
+        self.children = []
+        self.geometry = (0, 0, 0, 0)
+        self.min_size = (0, 0)
+        self.visible = True
+        self.enabled = True
+        self.destroyed = False
+        self._handlers = {}
+        self.set_parent(parent)
+
+    def set_parent(self, parent):
+        """ Moves the widget to a new parent widget, which may be None.
+
+        """
+        old = self.parent
+        if old is not None:
+            old.children.remove(self)
+        self.parent = parent
+        if parent is not None:
+            parent.children.append(self)
+
+    def connect(self, signal, handler):
+        """ Connects a handler to the named signal.
+
+        """
+        self._handlers.setdefault(signal, []).append(handler)
+
+    def emit(self, signal, *args):
+        """ Calls the handlers connected to the named signal.
+
+        """
+        for handler in self._handlers.get(signal, ()):
+            handler(*args)
+
+    def size(self):
+        """ Returns the (width, height) of the widget.
+
+        """
+        return self.geometry[2:]
+
+    def set_geometry(self, x, y, width, height):
+        """ Sets the geometry of the widget. The size is bounded by the
+        minimum size, and the 'resized' signal is emitted if the size
+        has changed.
+
+        """
+        min_width, min_height = self.min_size
+        width = max(width, min_width)
+        height = max(height, min_height)
+        old_size = self.geometry[2:]
+        self.geometry = (x, y, width, height)
+        if (width, height) != old_size:
+            self.emit('resized')
+
+    def resize(self, width, height):
+        """ Sets the size of the widget.
+
+        """
+        x, y = self.geometry[:2]
+        self.set_geometry(x, y, width, height)
+
+    def move(self, x, y):
+        """ Sets the position of the widget.
+
+        """
+        width, height = self.geometry[2:]
+        self.geometry = (x, y, width, height)
+
+    def set_min_size(self, min_width, min_height):
+        """ Sets the minimum size of the widget, growing the widget if
+        it is smaller.
+
+        """
+        self.min_size = (min_width, min_height)
+        width, height = self.geometry[2:]
+        if width < min_width or height < min_height:
+            self.resize(width, height)
+
+    def destroy(self):
+        """ Detaches the widget from its parent and disconnects its
+        handlers.
+
+        """
+        self.set_parent(None)
+        self._handlers.clear()
+        self.destroyed = True
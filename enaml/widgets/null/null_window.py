@@ -0,0 +1,56 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .null_container import NullContainer
+
+from ..window import AbstractTkWindow
+
+
+class NullWindow(NullContainer, AbstractTkWindow):
+    """ A null implementation of a Window.
+
+    """
+    _initializing = False
+
+    #--------------------------------------------------------------------------
+    # Setup methods
+    #--------------------------------------------------------------------------
+    def initialize(self):
+        """ Intializes the attributes on the window.
+
+        """
+        self._initializing = True
+        try:
+            super(NullWindow, self).initialize()
+            self.set_title(self.shell_obj.title)
+        finally:
+            self._initializing = False
+
+    #--------------------------------------------------------------------------
+    # Implementation
+    #--------------------------------------------------------------------------
+    def shell_title_changed(self, title):
+        """ The change handler for the 'title' attribute.
+
+        """
+        self.set_title(title)
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_title(self, title):
+        """ Sets the title of the window.
+
+        """
+        self.widget.title = title
+
+    def set_visible(self, visible):
+        """ Overridden from the parent class since a window has no
+        parent whose constraints depend on its visibility.
+
+        """
+        # Don't show the window if we're not initializing.
+        if not self._initializing:
+            self.widget.visible = visible
+
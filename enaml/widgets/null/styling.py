@@ -0,0 +1,12 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from ...styling.style_sheet import StyleSheet
+
+
+#-------------------------------------------------------------------------------
+# Default null style sheet definition
+#-------------------------------------------------------------------------------
+# The null toolkit draws nothing, so it has no default styles.
+NULL_STYLE_SHEET = StyleSheet()
@@ -0,0 +1,155 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Null toolkit utilities.
+
+The null toolkit has no gui library, so its event loop is driven by
+hand. Calls made with invoke_later are queued until the events are
+processed, and the timers of invoke_timer run against a virtual clock
+which is only advanced on request. This makes the behavior of an
+application deterministic, which is what is wanted for benchmarks and
+tests.
+
+"""
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
+
+
+class NullApplication(object):
+    """ A manually driven event loop for the null toolkit.
+
+    """
+    def __init__(self):
+        #: The calls to run on the next turn of the event loop, as
+        #: (callback, args, kwds) tuples.
+        self.pending = deque()
+
+        #: A heap of (due_time, counter, callback, args, kwds) tuples
+        #: for the timers which have not yet fired.
+        self.timers = []
+
+        #: A counter which keeps the timers stable for equal due times.
+        self.counter = count()
+
+        #: The current time of the virtual clock, in milliseconds.
+        self.time = 0
+
+        #: The text of the clipboard used by the fields.
+        self.clipboard = u''
+
+    def invoke_later(self, callback, *args, **kwds):
+        """ Queues a call for the next turn of the event loop.
+
+        """
+        self.pending.append((callback, args, kwds))
+
+    def invoke_timer(self, ms, callback, *args, **kwds):
+        """ Queues a call to run once the virtual clock has advanced by
+        the given number of milliseconds.
+
+        """
+        item = (self.time + ms, self.counter.next(), callback, args, kwds)
+        heappush(self.timers, item)
+
+    def process_events(self):
+        """ Runs one turn of the event loop. The calls queued during
+        the turn are left for the next one.
+
+        Returns
+        -------
+        result : int
+            The number of calls which were run.
+
+        """
+        pending = self.pending
+        ncalls = len(pending)
+        for i in xrange(ncalls):
+            callback, args, kwds = pending.popleft()
+            callback(*args, **kwds)
+        return ncalls
+
+    def flush(self):
+        """ Runs turns of the event loop until no call is pending.
+
+        """
+        while self.pending:
+            self.process_events()
+
+    def advance(self, ms):
+        """ Advances the virtual clock by the given number of
+        milliseconds. The timers fire in order of their due time, and
+        the pending calls are flushed after each of them.
+
+        """
+        end = self.time + ms
+        timers = self.timers
+        self.flush()
+        while timers and timers[0][0] <= end:
+            due, _, callback, args, kwds = heappop(timers)
+            self.time = due
+            callback(*args, **kwds)
+            self.flush()
+        self.time = end
+
+    def run(self):
+        """ Runs the event loop until no call or timer is pending. The
+        virtual clock jumps from one timer to the next rather than
+        waiting for them.
+
+        """
+        timers = self.timers
+        self.flush()
+        while timers:
+            self.advance(timers[0][0] - self.time)
+
+
+#: The application object shared by the null toolkit.
+_app = NullApplication()
+
+
+def get_app_null(*args, **kwargs):
+    """ Returns the application object of the null toolkit.
+
+    """
+    return _app
+
+
+def start_event_loop_null(app=None):
+    """ Runs the event loop of the null toolkit until it is idle.
+
+    """
+    if app is None:
+        app = _app
+    app.run()
+
+
+def invoke_later(callback, *args, **kwds):
+    """ Invoke a function on the next turn of the event loop.
+
+    """
+    _app.invoke_later(callback, *args, **kwds)
+
+
+def invoke_timer(ms, callback, *args, **kwds):
+    """ Invoke a function once the virtual clock has advanced by the
+    given number of milliseconds.
+
+    """
+    _app.invoke_timer(ms, callback, *args, **kwds)
+
+
+def clock():
+    """ Returns the time of the virtual clock in seconds.
+
+    """
+    return _app.time / 1000.0
+
+
+def process_events():
+    """ Runs the calls queued on the event loop of the null toolkit
+    until none is pending.
+
+    """
+    _app.flush()
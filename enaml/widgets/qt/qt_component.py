@@ -54,6 +54,19 @@ class QtComponent(QtBaseComponent, AbstractTkComponent):
             # visible=True.
             self.set_visible(shell.visible)
 
+    def destroy(self):
+        """ Detaches the Qt widget from its parent and schedules it for
+        deletion.
+
+        """
+        super(QtComponent, self).destroy()
+        widget = self.widget
+        if widget is not None:
+            widget.setParent(None)
+            widget.deleteLater()
+            self.widget = None
+            self.layout_item = None
+
     #--------------------------------------------------------------------------
     # Abstract Implementation
     #--------------------------------------------------------------------------
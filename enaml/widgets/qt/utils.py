@@ -22,10 +22,10 @@ class _FutureCall(QObject):
     # A new Qt event type for _FutureCalls
     _call_event = QEvent.Type(QEvent.registerEventType())
 
-    def __init__(self, ms, callable, *args, **kw):
+    def __init__(self, ms, callback, *args, **kw):
         super(_FutureCall, self).__init__()
         self._ms = ms
-        self._callable = callable
+        self._callback = callback
         self._args = args
         self._kw = kw
 
@@ -47,8 +47,8 @@ class _FutureCall(QObject):
         QApplication.postEvent(self, event)
 
     def event(self, event):
-        """ QObject event handler. Dispatches to the callable immediately
-        or via a Timer if the callable should happen some milliseconds
+        """ QObject event handler. Dispatches to the callback immediately
+        or via a Timer if the callback should happen some milliseconds
         later.
 
         """
@@ -63,12 +63,12 @@ class _FutureCall(QObject):
         return super(_FutureCall, self).event(event)
 
     def _dispatch(self):
-        """ Invokes the callable and removes the instance from the
+        """ Invokes the callback and removes the instance from the
         list of calls so that it can be garbage collected.
 
         """
         try:
-            self._callable(*self._args, **self._kw)
+            self._callback(*self._args, **self._kw)
         finally:
             mutex = self._calls_mutex
             mutex.lock()
@@ -78,16 +78,16 @@ class _FutureCall(QObject):
                 mutex.unlock()
 
 
-def invoke_later(callable, *args, **kwds):
+def invoke_later(callback, *args, **kwds):
     """ Invoke a function at some point later in the event loop.
 
     """
-    _FutureCall(0, callable, *args, **kwds)
+    _FutureCall(0, callback, *args, **kwds)
     
 
-def invoke_timer(ms, callable, *args, **kwds):
+def invoke_timer(ms, callback, *args, **kwds):
     """ Invoke a function some milliseconds from now.
 
     """
-    _FutureCall(ms, callable, *args, **kwds)
+    _FutureCall(ms, callback, *args, **kwds)
 
@@ -0,0 +1,185 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2011, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" An iterative engine which runs the setup process of a component tree.
+
+The tree is collected once into a flat list of the components in
+preorder, and each setup pass is run as a loop over that list. Since
+preorder visits every parent before its children, the passes see the
+tree in the same top down order as the recursive setup methods of
+BaseComponent, without the cost of the recursive calls and without the
+risk of exceeding the recursion limit on deep trees.
+
+"""
+from timeit import default_timer
+
+from .setup_hooks import evaluate_defaults
+from ..expressions import invalidate_component_scopes
+
+
+class SetupEngine(object):
+    """ Runs the setup passes of a tree of BaseComponent instances and
+    records the wall time spent in each pass.
+
+    """
+    def __init__(self, root):
+        """ Initialize a setup engine.
+
+        Parameters
+        ----------
+        root : BaseComponent
+            The root of the tree to setup.
+
+        """
+        self.root = root
+
+        #: The components of the tree in preorder.
+        self.components = []
+
+        #: The index in `components` of the parent of each component,
+        #: or -1 for the root.
+        self.parents = []
+
+        #: The (phase, seconds) pairs recorded for each pass run by
+        #: the engine, in order.
+        self.timings = []
+
+        self.collect()
+
+    def collect(self):
+        """ Collects the tree into the flat preorder list.
+
+        """
+        components = self.components
+        parents = self.parents
+        stack = [(self.root, -1)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            cmpnt, parent_idx = pop()
+            idx = len(components)
+            components.append(cmpnt)
+            parents.append(parent_idx)
+            for child in reversed(cmpnt.children):
+                push((child, idx))
+
+    def run(self, parent=None, ordered_defaults=False):
+        """ Runs the setup passes in the order of BaseComponent.setup.
+
+        Parameters
+        ----------
+        parent : native toolkit widget, optional
+            The toolkit widget to use as the parent of the root widget.
+
+        ordered_defaults : bool, optional
+            Whether to compute the default values of the bound
+            expressions with setup_hooks.evaluate_defaults.
+
+        """
+        self.timed('set_parent_refs', self.set_parent_refs)
+        self.timed('set_shell_refs', self.set_shell_refs)
+        if ordered_defaults:
+            self.timed('evaluate_defaults', evaluate_defaults, self.root,
+                       self.components)
+        self.timed('create', self.run_hooks, 'create', self.create, parent)
+        self.timed('initialize', self.run_hooks, 'initialize',
+                   self.initialize)
+        self.timed('bind', self.run_hooks, 'bind', self.bind)
+        self.timed('set_listeners', self.set_listeners)
+
+    def timed(self, phase, func, *args):
+        """ Calls the function with the given arguments and records the
+        elapsed time under the given phase name.
+
+        """
+        t0 = default_timer()
+        func(*args)
+        self.timings.append((phase, default_timer() - t0))
+
+    def run_hooks(self, method_name, func, *args):
+        """ Runs a setup pass between the two steps of the setup hook
+        generators, as with the SetupContext of the recursive methods.
+        The first step of the generators of every hook in the tree runs
+        before the pass, and the second step runs after it, unless the
+        pass raises an exception.
+
+        """
+        gens = []
+        for cmpnt in self.components:
+            for hook in cmpnt.setup_hooks:
+                gens.append(getattr(hook, method_name)(cmpnt))
+        for gen in gens:
+            gen.next()
+        func(*args)
+        for gen in gens:
+            try:
+                gen.next()
+            except StopIteration:
+                pass
+
+    def set_parent_refs(self):
+        """ Assigns to each component a reference to its parent.
+
+        The references are assigned quietly, since the change handler of
+        each component would invalidate the scopes of its whole subtree,
+        which is quadratic in the depth of the tree. The scopes of the 
+        tree are invalidated once instead.
+
+        """
+        components = self.components
+        for cmpnt, parent_idx in zip(components, self.parents):
+            if parent_idx >= 0:
+                cmpnt.trait_setq(parent=components[parent_idx])
+        invalidate_component_scopes(components)
+
+    def set_shell_refs(self):
+        """ Assigns a reference to each component to its abstract obj.
+
+        """
+        for cmpnt in self.components:
+            cmpnt.abstract_obj.shell_obj = cmpnt
+
+    def create(self, parent):
+        """ Tells the abstract objects to create their toolkit objects.
+        The toolkit widget of each parent is created before those of its
+        children.
+
+        """
+        # FIXME: technically, we allow toolkit_widget to be something
+        # that is not precisely a real toolkit widget (e.g. a QLayout).
+        widgets = []
+        for cmpnt, parent_idx in zip(self.components, self.parents):
+            if parent_idx < 0:
+                cmpnt.abstract_obj.create(parent)
+            else:
+                cmpnt.abstract_obj.create(widgets[parent_idx])
+            # FIXME: toolkit_widget is defined on Component, not
+            # BaseComponent, so it is only fetched for the parents.
+            if cmpnt.children:
+                widgets.append(cmpnt.toolkit_widget)
+            else:
+                widgets.append(None)
+
+    def initialize(self):
+        """ Tells the abstract objects to initialize their toolkit
+        objects.
+
+        """
+        for cmpnt in self.components:
+            cmpnt.abstract_obj.initialize()
+
+    def bind(self):
+        """ Tells the abstract objects to bind their event handlers.
+
+        """
+        for cmpnt in self.components:
+            cmpnt.abstract_obj.bind()
+
+    def set_listeners(self):
+        """ Adds the abstract objects as traits listeners for their
+        components with a prefix of 'shell'.
+
+        """
+        for cmpnt in self.components:
+            cmpnt.add_shell_listeners()
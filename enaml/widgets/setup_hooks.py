@@ -1,6 +1,10 @@
 from abc import ABCMeta, abstractmethod
+import weakref
 
-from traits.api import Any, TraitChangeNotifyWrapper, TraitType
+from traits.api import Any, HasTraits, TraitChangeNotifyWrapper, TraitType
+
+from ..exceptions import EnamlRuntimeError
+from ..expressions import AttributeTracer
 
 
 #------------------------------------------------------------------------------
@@ -77,6 +81,14 @@ class AbstractSetupHook(object):
     def bind(self, component):
         raise NotImplementedError
 
+    def destroy(self, component):
+        """ Called when the component is destroyed to release any
+        resources held by the hook. This is a plain method rather than
+        a generator, and the default implementation does nothing.
+
+        """
+        pass
+
 
 class NullSetupHook(AbstractSetupHook):
     """ An AbstractSetupHook implementation that does nothing. This 
@@ -98,12 +110,13 @@ class NullSetupHook(AbstractSetupHook):
 
 class ExpressionSetupHook(NullSetupHook):
 
-    __slots__ = ('name', 'expression', 'eval_default')
+    __slots__ = ('name', 'expression', 'eval_default', 'default_ready')
 
     def __init__(self, name, expression, eval_default=True):
         self.name = name
         self.expression = expression
         self.eval_default = eval_default
+        self.default_ready = False
 
     def create(self, component):
         """ A setup hook method which sets up the expression yields
@@ -111,6 +124,13 @@ class ExpressionSetupHook(NullSetupHook):
         the expression.
 
         """
+        # If the default value has already been assigned by the
+        # dependency ordered pass of evaluate_defaults, there is 
+        # nothing left to do.
+        if self.default_ready:
+            yield
+            return
+
         # We want to setup the expressions before we create and
         # initialize the widgets so that values computed from the
         # expression can be used to select an appropriate widget
@@ -140,6 +160,12 @@ class ExpressionSetupHook(NullSetupHook):
         yield
         self.expression.bind()
         
+    def destroy(self, component):
+        """ Removes the notifiers attached by the expression.
+
+        """
+        self.expression.unbind()
+
     def setup_expression(self, component):
         """ Sets up the expression for use on a component. This involves
         adding special temporary instance traits to the component so 
@@ -182,7 +208,11 @@ class ExpressionSetupHook(NullSetupHook):
             if trait is None:
                 trait = Any().as_ctrait()
             if eval_default:
-                dvf = lambda obj: expression.eval_expression()
+                # The instance trait outlives the setup process, so the
+                # expression is referenced weakly to avoid a reference 
+                # cycle through the locals of the expression.
+                expr_ref = weakref.ref(expression)
+                dvf = lambda obj: expr_ref().eval_expression()
                 trait.default_value(8, dvf)
             component.add_trait(name, trait)
 
@@ -229,14 +259,35 @@ class ExpressionSetupHook(NullSetupHook):
         if eval_default:
             component.trait_setq(**{name: val})
 
+    def assign_default(self, component, tracer):
+        """ Evaluates the expression with the given tracer and quietly
+        assigns its value to the attribute on the component. This is 
+        used by the dependency ordered pass of evaluate_defaults in 
+        place of the temporary instance traits of setup_expression.
+
+        """
+        val = self.expression.eval_traced(tracer)
+        component.trait_setq(**{self.name: val})
+
     def rebind(self, obj, name, notifier):
         """ Rebinds a HasTraits object's TraitChangeNotifyWrapper for 
         the trait of the given name.
 
         """
         if isinstance(notifier, TraitChangeNotifyWrapper):
-            call_method = notifier.call_method
-            if call_method.startswith('call_'):
+            call_method = getattr(notifier, 'call_method', None)
+            if call_method is None:
+                # Newer versions of traits keep a weakref to the object
+                # and the name of a bound method handler, or the plain
+                # function handler with a name of None.
+                if notifier.name is None:
+                    handler = notifier.handler
+                else:
+                    handler_obj = notifier.object()
+                    if handler_obj is None:
+                        return
+                    handler = getattr(handler_obj, notifier.name)
+            elif call_method.startswith('call_'):
                 handler = notifier.handler
             elif call_method.startswith('rebind_call_'):
                 # The handler object is stored as a weakref
@@ -250,3 +301,268 @@ class ExpressionSetupHook(NullSetupHook):
                 raise ValueError(msg)
             obj.on_trait_change(handler, name)
 
+
+
+#------------------------------------------------------------------------------
+# Dependency ordered default values
+#------------------------------------------------------------------------------
+#: The trait added for the user defined attributes which do not yet exist.
+#: The trait is cloned by .add_trait, so it may be shared.
+_user_trait = Any().as_ctrait()
+
+
+def _has_trait(obj, name):
+    """ Returns whether the object defines a trait of the given name.
+    The class traits are looked up in the class dictionary directly,
+    since calling .class_traits() copies it.
+
+    """
+    return name in obj._instance_traits() or name in obj.__base_traits__
+
+
+def _find_owner(obj, name, pending):
+    """ Returns the first object in the ancestry of obj which defines
+    the given attribute name, either as a trait or as a pending default
+    value, or None if there is no such object.
+
+    """
+    parent = obj
+    while parent is not None:
+        if (parent, name) in pending or _has_trait(parent, name):
+            return parent
+        parent = parent.parent
+    return None
+
+
+def _default_dependencies(component, hook, pending):
+    """ Returns the list of keys in `pending` whose default values must
+    be computed before the default value of the hook's expression.
+
+    The dependencies are found from the static dependencies computed
+    by the compiler, resolved in the same order as the names in the 
+    expression: the locals, then the attribute space of the tree, and
+    then the globals.
+
+    """
+    expression = hook.expression
+    deps = expression.deps
+    if deps is None:
+        return []
+    f_locals = expression.f_locals
+    f_globals = expression.f_globals
+    res = []
+    for name in deps.names:
+        if name not in f_locals:
+            owner = _find_owner(component, name, pending)
+            if owner is not None and (owner, name) in pending:
+                res.append((owner, name))
+    for name, attr in deps.attributes:
+        if name in f_locals:
+            target = f_locals[name]
+        else:
+            owner = _find_owner(component, name, pending)
+            if owner is None:
+                target = f_globals.get(name)
+            elif (owner, name) in pending:
+                # The object is itself computed by an expression, so
+                # the attribute access cannot be resolved statically.
+                continue
+            else:
+                target = getattr(owner, name)
+        if isinstance(target, HasTraits) and (target, attr) in pending:
+            res.append((target, attr))
+    return res
+
+
+def _describe(key):
+    """ Returns a readable description of a (component, name) key.
+
+    """
+    obj, name = key
+    return '%s.%s' % (type(obj).__name__, name)
+
+
+def _cycle_error(cycle):
+    """ Returns the EnamlRuntimeError which reports the given cycle of
+    (component, name) keys.
+
+    """
+    msg = 'cyclic dependency in the default values of the bound attributes: %s'
+    return EnamlRuntimeError(
+        msg % ' -> '.join(_describe(item) for item in cycle)
+    )
+
+
+def _dependency_order(keys, edges):
+    """ Returns the keys sorted so that every key follows the keys it
+    depends upon. An EnamlRuntimeError is raised if the dependencies
+    form a cycle. The traversal is iterative so that long chains of
+    dependencies do not exhaust the recursion limit.
+
+    """
+    visiting = 1
+    done = 2
+    state = {}
+    order = []
+    for key in keys:
+        if key in state:
+            continue
+        state[key] = visiting
+        path = [key]
+        stack = [iter(edges[key])]
+        while stack:
+            for dep in stack[-1]:
+                dep_state = state.get(dep)
+                if dep_state is None:
+                    state[dep] = visiting
+                    path.append(dep)
+                    stack.append(iter(edges[dep]))
+                    break
+                elif dep_state == visiting:
+                    raise _cycle_error(path[path.index(dep):] + [dep])
+            else:
+                stack.pop()
+                item = path.pop()
+                state[item] = done
+                order.append(item)
+    return order
+
+
+class _DefaultEvaluator(object):
+    """ Computes the pending default values of evaluate_defaults, each
+    at most once.
+
+    """
+    def __init__(self, pending):
+        #: The dictionary mapping the (component, name) keys of the 
+        #: default values to compute to their setup hooks.
+        self.pending = pending
+        #: The set of keys whose default values have been assigned.
+        self.done = set()
+        #: The keys whose default values are being computed, in the
+        #: order in which they were started.
+        self.path = []
+
+    def evaluate(self, key):
+        """ Computes and assigns the default value of the given key if
+        it is pending and has not yet been computed.
+
+        """
+        hook = self.pending.get(key)
+        if hook is None or key in self.done:
+            return
+        path = self.path
+        if key in path:
+            raise _cycle_error(path[path.index(key):] + [key])
+        path.append(key)
+        try:
+            hook.assign_default(key[0], _DefaultTracer(self))
+        finally:
+            path.pop()
+        self.done.add(key)
+
+
+class _DefaultTracer(AttributeTracer):
+    """ The tracer with which the expressions are evaluated by the 
+    _DefaultEvaluator. The default value of an attribute which is read
+    before it has been computed, because the static analysis did not 
+    find the dependency, is computed on demand.
+
+    """
+    __slots__ = ('evaluator',)
+
+    def __init__(self, evaluator):
+        super(_DefaultTracer, self).__init__()
+        self.evaluator = evaluator
+
+    def load_attr(self, obj, name):
+        """ Computes the default value of the attribute if it is still 
+        pending, and then returns it.
+
+        """
+        if isinstance(obj, HasTraits):
+            self.evaluator.evaluate((obj, name))
+        return super(_DefaultTracer, self).load_attr(obj, name)
+
+
+def evaluate_defaults(component, components=None):
+    """ Computes the default values of the expressions bound to the 
+    tree of components rooted at the given component.
+
+    This is an alternative to the lazy evaluation of setup_expression
+    which does not add or remove any temporary instance traits. The
+    expressions are evaluated in the order of their static dependencies
+    and their values are quietly assigned to the components. Only the 
+    user defined attributes which do not yet exist are added, as plain
+    Any traits. The setup hooks are marked as ready so that they skip
+    their own initialization in the create pass.
+
+    Since the dependencies are static, an expression which reads an
+    attribute only on some branch of a conditional is treated as 
+    depending upon it, so this may report a cycle for expressions 
+    which the lazy evaluation would handle.
+
+    The static analysis only sees the attributes of the objects named
+    in the expression. So that an attribute read through an object 
+    which is itself computed, such as `child.model.value`, is not read
+    before its default value is computed, the expressions are evaluated
+    with their attribute accesses traced, and a pending default value 
+    which is read is computed on demand. The attributes read by the 
+    functions which an expression calls, or inside its lambdas and 
+    generator expressions, are not traced, so those still see the 
+    default value of the trait.
+
+    Parameters
+    ----------
+    component : BaseComponent
+        The root of the tree of components to initialize.
+
+    components : list of BaseComponent, optional
+        The components of the tree in preorder, if they have already
+        been collected.
+
+    Raises
+    ------
+    EnamlRuntimeError
+        If the default values of the expressions depend upon each other
+        cyclically.
+
+    """
+    # Collect the hooks in tree order. A later binding of the same 
+    # attribute overrides an earlier one, as with the lazy evaluation.
+    if components is None:
+        components = []
+        stack = [component]
+        while stack:
+            cmpnt = stack.pop()
+            components.append(cmpnt)
+            stack.extend(reversed(cmpnt.children))
+    hooks = []
+    pending = {}
+    for cmpnt in components:
+        for hook in cmpnt.setup_hooks:
+            if isinstance(hook, ExpressionSetupHook):
+                hooks.append((cmpnt, hook))
+                if hook.eval_default:
+                    pending[(cmpnt, hook.name)] = hook
+
+    # The user defined attributes are added up front, so that they can
+    # be found in the attribute space by the expressions which depend 
+    # upon them.
+    for cmpnt, hook in hooks:
+        name = hook.name
+        if not _has_trait(cmpnt, name):
+            cmpnt.add_trait(name, _user_trait)
+
+    keys = [(cmpnt, hook.name) for cmpnt, hook in hooks 
+            if pending.get((cmpnt, hook.name)) is hook]
+    edges = {}
+    for key in keys:
+        edges[key] = _default_dependencies(key[0], pending[key], pending)
+
+    evaluator = _DefaultEvaluator(pending)
+    for key in _dependency_order(keys, edges):
+        evaluator.evaluate(key)
+
+    for cmpnt, hook in hooks:
+        hook.default_ready = True
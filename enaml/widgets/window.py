@@ -69,11 +69,4 @@ class Window(Container):
         """
         self.visible = False
 
-    def update_constraints(self):
-        """ Update the constraints for this component.
-
-        """
-        super(Window, self).update_constraints()
-        size = self.layout.calc_min_size()
-        self.set_min_size(*size)
 
@@ -8,16 +8,16 @@
 import wx
 
 
-def invoke_later(callable, *args, **kwds):
+def invoke_later(callback, *args, **kwds):
     """ Invoke a function later in the event loop.
 
     """
-    wx.CallAfter(callable, *args, **kwds)
+    wx.CallAfter(callback, *args, **kwds)
 
 
-def invoke_timer(ms, callable, *args, **kwds):
+def invoke_timer(ms, callback, *args, **kwds):
     """ Invoke a function some milliseconds from now.
 
     """
-    wx.CallLater(ms, callable, *args, **kwds)
+    wx.CallLater(ms, callback, *args, **kwds)
 
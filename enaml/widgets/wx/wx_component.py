@@ -46,6 +46,16 @@ class WXComponent(WXBaseComponent, AbstractTkComponent):
             # visible=True.
             self.set_visible(shell.visible)
 
+    def destroy(self):
+        """ Destroys the wx widget.
+
+        """
+        super(WXComponent, self).destroy()
+        widget = self.widget
+        if widget is not None:
+            widget.Destroy()
+            self.widget = None
+
     #--------------------------------------------------------------------------
     # Abstract Implementation
     #--------------------------------------------------------------------------
@@ -20,6 +20,7 @@ setup(name='enaml',
     entry_points = dict(
         console_scripts = [
             "enaml-run = enaml.runner:main",
+            "enaml-compile = enaml.compile_all:main",
         ],
     ),
     test_suite = "enaml.test_collector"